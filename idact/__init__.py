@@ -20,12 +20,15 @@ from idact.core.jupyter_deployment import JupyterDeployment
 from idact.core.node_resource_status import NodeResourceStatus
 from idact.core.node import Node
 from idact.core.nodes import Nodes
+from idact.core.nodes_monitor import NodeResourceHistory, NodesMonitor
 from idact.core.remove_cluster import remove_cluster
 from idact.core.retry import Retry
+from idact.core.run_results import RunResult, RunResults
 from idact.core.set_log_level import set_log_level
 from idact.core.set_retry import set_retry
 from idact.core.show_clusters import show_cluster, show_clusters
 from idact.core.synchronized_deployments import SynchronizedDeployments
+from idact.core.transfer_stats import TransferStats
 from idact.core.tunnel import Tunnel
 from idact.core.walltime import Walltime
 from idact.core.add_cluster import add_cluster
@@ -62,7 +65,12 @@ _IMPORTED = {add_cluster,
              RetryConfig,
              get_default_retries,
              Retry,
-             set_retry}
+             set_retry,
+             RunResult,
+             RunResults,
+             TransferStats,
+             NodeResourceHistory,
+             NodesMonitor}
 """List of the public API members imported into the top level package
     for convenience."""
 
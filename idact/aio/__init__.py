@@ -0,0 +1,31 @@
+"""Asyncio API.
+
+    Wraps :class:`.Cluster`, :class:`.Nodes` and :class:`.Node`, so that
+    a single event loop can manage many concurrent operations.
+    Every operation can be cancelled.
+
+    Commands are run over pooled SSH connections, and their output is
+    awaited on the event loop. Other operations are run in the default
+    executor of the loop. A cancelled executor operation completes
+    in the background, and anything it allocated or deployed is cancelled.
+
+    Example:
+
+    .. code-block:: python
+
+        cluster = AsyncCluster(show_cluster("hpc"))
+        nodes = await cluster.allocate_nodes(nodes=16)
+        await nodes.wait()
+        results = await nodes.run_all("hostname")
+
+"""
+
+from idact.aio.async_cluster import AsyncCluster
+from idact.aio.async_node import AsyncNode
+from idact.aio.async_nodes import AsyncNodes
+from idact.aio.deploy_dask import deploy_dask
+
+_IMPORTED = {AsyncCluster,
+             AsyncNode,
+             AsyncNodes,
+             deploy_dask}
@@ -0,0 +1,111 @@
+"""This module contains the asyncio wrapper of a cluster."""
+
+from typing import Union, Optional, Dict
+
+import bitmath
+
+from idact.aio.async_node import AsyncNode
+from idact.aio.async_nodes import AsyncNodes
+from idact.core.cluster import Cluster
+from idact.core.config import ClusterConfig
+from idact.core.dask_deployment import DaskDeployment
+from idact.core.jupyter_deployment import JupyterDeployment
+from idact.core.nodes import Nodes
+from idact.core.synchronized_deployments import SynchronizedDeployments
+from idact.core.transfer_stats import TransferStats
+from idact.core.walltime import Walltime
+from idact.detail.aio.run_blocking import run_blocking
+
+
+class AsyncCluster:
+    """Asyncio wrapper of a cluster, see :class:`.Cluster`.
+
+        :param cluster: Cluster to wrap.
+
+    """
+
+    def __init__(self, cluster: Cluster):
+        self._cluster = cluster
+
+    @property
+    def cluster(self) -> Cluster:
+        """Wrapped synchronous cluster."""
+        return self._cluster
+
+    @property
+    def name(self) -> str:
+        """Cluster name."""
+        return self._cluster.name
+
+    @property
+    def config(self) -> ClusterConfig:
+        """Client-side cluster config."""
+        return self._cluster.config
+
+    async def allocate_nodes(self,
+                             nodes: int = 1,
+                             cores: int = 1,
+                             memory_per_node: Union[str, bitmath.Byte] = None,
+                             walltime: Union[str, Walltime] = None,
+                             native_args: Optional[Dict[str, Optional[
+                                 str]]] = None) -> AsyncNodes:  # noqa, pylint: disable=bad-whitespace,line-too-long
+        """Allocates nodes, see :meth:`.Cluster.allocate_nodes`.
+
+            If the task is cancelled, the allocation is cancelled
+            once it is submitted.
+
+        """
+        allocated = await run_blocking(
+            lambda: self._cluster.allocate_nodes(
+                nodes=nodes,
+                cores=cores,
+                memory_per_node=memory_per_node,
+                walltime=walltime,
+                native_args=native_args),
+            on_abandoned=lambda abandoned: abandoned.cancel())
+        return AsyncNodes(nodes=allocated)
+
+    def get_access_node(self) -> AsyncNode:
+        """Returns the cluster head node, see :meth:`.Cluster.get_access_node`.
+        """
+        return AsyncNode(node=self._cluster.get_access_node())
+
+    async def push_deployment(self, deployment: Union[AsyncNodes,
+                                                      Nodes,
+                                                      JupyterDeployment,
+                                                      DaskDeployment]):
+        """Pushes the deployment, see :meth:`.Cluster.push_deployment`.
+
+            :param deployment: Deployment to push.
+
+        """
+        if isinstance(deployment, AsyncNodes):
+            deployment = deployment.nodes
+        await run_blocking(
+            lambda: self._cluster.push_deployment(deployment=deployment))
+
+    async def pull_deployments(self) -> SynchronizedDeployments:
+        """Pulls deployments, see :meth:`.Cluster.pull_deployments`."""
+        return await run_blocking(self._cluster.pull_deployments)
+
+    async def clear_pushed_deployments(self):
+        """Clears pushed deployments,
+            see :meth:`.Cluster.clear_pushed_deployments`."""
+        await run_blocking(self._cluster.clear_pushed_deployments)
+
+    async def sync_directory(self,
+                             local_path: str,
+                             remote_path: str,
+                             delete: bool = False) -> TransferStats:
+        """Synchronizes a local directory to the cluster,
+            see :meth:`.Cluster.sync_directory`."""
+        return await run_blocking(
+            lambda: self._cluster.sync_directory(local_path=local_path,
+                                                 remote_path=remote_path,
+                                                 delete=delete))
+
+    def __str__(self):
+        return "Async{cluster}".format(cluster=self._cluster)
+
+    def __repr__(self):
+        return str(self)
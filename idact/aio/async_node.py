@@ -0,0 +1,134 @@
+"""This module contains the asyncio wrapper of a cluster node."""
+
+from typing import Callable, Optional
+
+from idact.core.jupyter_deployment import JupyterDeployment
+from idact.core.node import Node
+from idact.core.transfer_stats import TransferStats
+from idact.core.tunnel import Tunnel
+from idact.detail.aio.run_blocking import run_blocking
+from idact.detail.aio.run_on_node_async import run_on_node_async
+
+
+class AsyncNode:
+    """Asyncio wrapper of a cluster node, see :class:`.Node`.
+
+        :param node: Node to wrap.
+
+    """
+
+    def __init__(self, node: Node):
+        self._node = node
+
+    @property
+    def node(self) -> Node:
+        """Wrapped synchronous node."""
+        return self._node
+
+    @property
+    def host(self) -> Optional[str]:
+        """Node hostname, or None if the node is not allocated."""
+        return self._node.host
+
+    @property
+    def port(self) -> Optional[int]:
+        """SSH port, or None if the node is not allocated."""
+        return self._node.port
+
+    async def connect(self, timeout: Optional[float] = None):
+        """Connects to the node, see :meth:`.Node.connect`.
+
+            :param timeout: Timeout in seconds.
+
+        """
+        result = await self.run("echo 'Testing connection...'",
+                                timeout=timeout)
+        if result != 'Testing connection...':
+            raise RuntimeError("Unexpected test command output.")
+
+    async def run(self, command: str, timeout: Optional[float] = None) -> str:
+        """Runs the command on the node, see :meth:`.Node.run`.
+
+            If the task is cancelled, the SSH channel is closed.
+
+            :param command: Command to run.
+
+            :param timeout: Execution timeout in seconds.
+
+        """
+        return await run_on_node_async(node=self._node,
+                                       command=command,
+                                       timeout=timeout)
+
+    async def tunnel(self,
+                     there: int,
+                     here: Optional[int] = None) -> Tunnel:
+        """Opens a tunnel, see :meth:`.Node.tunnel`.
+
+            :param there: Remote port.
+
+            :param here: Local port.
+
+        """
+        return await run_blocking(
+            lambda: self._node.tunnel(there=there, here=here),
+            on_abandoned=lambda tunnel: tunnel.close())
+
+    async def deploy_notebook(self,
+                              local_port: int = 8080) -> JupyterDeployment:
+        """Deploys a Jupyter Notebook, see :meth:`.Node.deploy_notebook`.
+
+            :param local_port: Local tunnel port.
+
+        """
+        return await run_blocking(
+            lambda: self._node.deploy_notebook(local_port=local_port),
+            on_abandoned=lambda deployment: deployment.cancel())
+
+    async def upload(self,
+                     local_path: str,
+                     remote_path: str,
+                     compress: bool = False,
+                     resume: bool = False,
+                     max_parallel: Optional[int] = None,
+                     on_progress: Optional[Callable[[str, int, int], None]] = None) -> TransferStats:  # noqa, pylint: disable=bad-continuation,line-too-long
+        """Uploads files, see :meth:`.Node.upload`.
+
+            If the task is cancelled, the upload still finishes
+            in the background.
+
+        """
+        return await run_blocking(
+            lambda: self._node.upload(local_path=local_path,
+                                      remote_path=remote_path,
+                                      compress=compress,
+                                      resume=resume,
+                                      max_parallel=max_parallel,
+                                      on_progress=on_progress))
+
+    async def download(self,
+                       remote_path: str,
+                       local_path: str,
+                       compress: bool = False,
+                       resume: bool = False,
+                       max_parallel: Optional[int] = None,
+                       on_progress: Optional[Callable[[str, int, int], None]] = None) -> TransferStats:  # noqa, pylint: disable=bad-continuation,line-too-long
+        """Downloads files, see :meth:`.Node.download`.
+
+            If the task is cancelled, the download still finishes
+            in the background.
+
+        """
+        return await run_blocking(
+            lambda: self._node.download(remote_path=remote_path,
+                                        local_path=local_path,
+                                        compress=compress,
+                                        resume=resume,
+                                        max_parallel=max_parallel,
+                                        on_progress=on_progress))
+
+    def __str__(self):
+        return "Async{node}".format(node=self._node)
+
+    def __repr__(self):
+        return str(self)
@@ -0,0 +1,154 @@
+"""This module contains the asyncio wrapper of a collection of nodes."""
+
+import asyncio
+import time
+from typing import List, Optional
+
+from idact.aio.async_node import AsyncNode
+from idact.core.nodes import Nodes
+from idact.core.run_results import RunResults
+from idact.detail.aio.run_blocking import run_blocking
+from idact.detail.aio.run_on_node_async import run_on_node_async
+from idact.detail.helper.run_in_parallel import DEFAULT_MAX_PARALLEL
+from idact.detail.log.get_logger import get_logger
+from idact.detail.nodes.run_results_impl import RunResultImpl, \
+    RunResultsImpl
+
+WAIT_SLICE = 5.0
+"""Longest blocking wait in an executor thread, after which
+    a cancelled :meth:`.AsyncNodes.wait` returns the thread."""
+
+
+class AsyncNodes:
+    """Asyncio wrapper of a collection of nodes, see :class:`.Nodes`.
+
+        :param nodes: Nodes to wrap.
+
+    """
+
+    def __init__(self, nodes: Nodes):
+        self._nodes = nodes
+
+    @property
+    def nodes(self) -> Nodes:
+        """Wrapped synchronous nodes."""
+        return self._nodes
+
+    @property
+    def waited(self) -> bool:
+        """True, if :meth:`wait` completed successfully."""
+        return self._nodes.waited
+
+    async def wait(self, timeout: Optional[float] = None):
+        """Waits until the nodes are allocated, see :meth:`.Nodes.wait`.
+
+            The wait is split into short blocking waits, so that
+            a cancelled wait does not hold an executor thread for long.
+
+            :param timeout: Maximum number of seconds to wait for allocation.
+                            None is treated as no limit.
+
+        """
+        end = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait_slice = WAIT_SLICE
+            if end is not None:
+                wait_slice = max(0.0, min(wait_slice, end - time.monotonic()))
+            try:
+                await run_blocking(
+                    lambda: self._nodes.wait(timeout=wait_slice))
+                return
+            except TimeoutError:
+                if end is not None and time.monotonic() >= end:
+                    raise
+
+    async def cancel(self):
+        """Deallocates the nodes, see :meth:`.Nodes.cancel`."""
+        await run_blocking(self._nodes.cancel)
+
+    async def running(self) -> bool:
+        """Returns True if the nodes are running."""
+        return await run_blocking(self._nodes.running)
+
+    async def run_all(self,
+                      command: str,
+                      timeout: Optional[float] = None,
+                      max_parallel: Optional[int] = None) -> RunResults:
+        """Runs the command on each node, see :meth:`.Nodes.run_all`.
+
+            :param command: Command to run.
+
+            :param timeout: Execution timeout on each node.
+
+            :param max_parallel: Maximum number of concurrent commands.
+                                 Default: :attr:`.DEFAULT_MAX_PARALLEL`.
+
+        """
+        return await self.run_many(commands=[command] * len(self._nodes),
+                                   timeout=timeout,
+                                   max_parallel=max_parallel)
+
+    async def run_many(self,
+                       commands: List[str],
+                       timeout: Optional[float] = None,
+                       max_parallel: Optional[int] = None) -> RunResults:
+        """Runs each command on the corresponding node,
+            see :meth:`.Nodes.run_many`.
+
+            :param commands: Command for each node.
+
+            :param timeout: Execution timeout on each node.
+
+            :param max_parallel: Maximum number of concurrent commands.
+                                 Default: :attr:`.DEFAULT_MAX_PARALLEL`.
+
+        """
+        nodes = list(self._nodes)
+        if len(commands) != len(nodes):
+            raise ValueError(
+                "Expected {nodes} commands, got {commands}.".format(
+                    nodes=len(nodes),
+                    commands=len(commands)))
+        if max_parallel is None:
+            max_parallel = DEFAULT_MAX_PARALLEL
+        if max_parallel < 1:
+            raise ValueError("Parallelism limit must be positive.")
+
+        log = get_logger(__name__)
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def run(node, command: str) -> RunResultImpl:
+            async with semaphore:
+                try:
+                    output = await run_on_node_async(node=node,
+                                                     command=command,
+                                                     timeout=timeout)
+                    return RunResultImpl(node=node,
+                                         command=command,
+                                         output=output)
+                except Exception as e:  # pylint: disable=broad-except
+                    log.debug("Command failed on %s.", node, exc_info=1)
+                    return RunResultImpl(node=node,
+                                         command=command,
+                                         error=e)
+
+        results = await asyncio.gather(*[run(node, command)
+                                         for node, command
+                                         in zip(nodes, commands)])
+        return RunResultsImpl(results=list(results))
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __getitem__(self, i: int) -> AsyncNode:
+        return AsyncNode(node=self._nodes[i])
+
+    def __iter__(self):
+        for node in self._nodes:
+            yield AsyncNode(node=node)
+
+    def __str__(self):
+        return "Async{nodes}".format(nodes=self._nodes)
+
+    def __repr__(self):
+        return str(self)
@@ -0,0 +1,30 @@
+"""This module contains the asyncio equivalent of :func:`.deploy_dask`."""
+
+from typing import Sequence, Union
+
+from idact.aio.async_nodes import AsyncNodes
+from idact.core.dask_deployment import DaskDeployment
+from idact.core.deploy_dask import deploy_dask as deploy_dask_sync
+from idact.core.nodes import Node
+from idact.detail.aio.run_blocking import run_blocking
+from idact.detail.helper.run_in_parallel import DEFAULT_MAX_PARALLEL
+
+
+async def deploy_dask(nodes: Union[AsyncNodes, Sequence[Node]],
+                      max_parallel: int = DEFAULT_MAX_PARALLEL) -> DaskDeployment:  # noqa, pylint: disable=bad-continuation,line-too-long
+    """Deploys Dask on cluster nodes, see :func:`idact.deploy_dask`.
+
+        If the task is cancelled, the deployment is cancelled
+        once it completes.
+
+        :param nodes: Nodes for Dask to be deployed on.
+
+        :param max_parallel: Maximum number of nodes to connect to,
+                             or deploy workers on at the same time.
+
+    """
+    if isinstance(nodes, AsyncNodes):
+        nodes = nodes.nodes
+    return await run_blocking(
+        lambda: deploy_dask_sync(nodes=nodes, max_parallel=max_parallel),
+        on_abandoned=lambda deployment: deployment.cancel())
@@ -3,18 +3,16 @@
 
    See :func:`.add_cluster`.
 """
-import os
 from typing import Optional, Union, Dict
 
 from idact.core.config import SetupActionsConfig, RetryConfig
 from idact.core.auth import AuthMethod, KeyType
 from idact.core.cluster import Cluster
 from idact.core.retry import Retry
-from idact.detail.auth.generate_key import generate_key
+from idact.detail.auth.get_auth_and_key import get_auth_and_key
 from idact.detail.config.client. \
     client_cluster_config import ClusterConfigImpl
 from idact.detail.environment.environment_provider import EnvironmentProvider
-from idact.detail.log.get_logger import get_logger
 
 
 def add_cluster(name: str,
@@ -28,7 +26,8 @@ def add_cluster(name: str,
                 setup_actions: Optional[SetupActionsConfig] = None,
                 scratch: Optional[str] = None,
                 retries: Optional[Dict[Retry, RetryConfig]] = None,
-                use_jupyter_lab: bool = True) -> Cluster:
+                use_jupyter_lab: bool = True,
+                **kwargs) -> Cluster:
     """Adds a new cluster.
 
         :param name:
@@ -70,23 +69,43 @@ def add_cluster(name: str,
         :param use_jupyter_lab:
             Use Jupyter Lab instead of Jupyter Notebook.
             Default: True.
+        :param kwargs:
+            Further config options, passed by keyword. They are listed
+            below. Unknown options raise :class:`TypeError`.
+        :param watch_squeue:
+            Wait for allocations using one long-running `squeue` process
+            per cluster, instead of polling.
+            Default: False.
+        :param squeue_cache_ttl:
+            Seconds for which `squeue` output is shared between
+            all allocations on the cluster.
+            Default: 1.
+        :param use_agent:
+            Answer simple queries with a persistent idact agent running
+            on the access node, instead of starting a shell for each.
+            Default: False.
+        :param remote_shell:
+            Shell invocation that runs each remote command. For example,
+            `/bin/bash -c` for a non-login shell, or an empty string
+            to run commands in the user's default shell. Must be the `-c`
+            invocation of a POSIX shell, and an empty string requires
+            a POSIX login shell, e.g. not csh. Commands that need bash
+            run it explicitly. Startup overhead can be compared with
+            `idact-shell-startup`.
+            Default: `/bin/bash --noprofile -l -c`.
+        :param shell_environment:
+            Environment variables exported before each remote command.
+            Default: None.
+        :param reserve_ports:
+            Keep free remote ports bound until the deployed program
+            is about to start, so they cannot be taken in the meantime.
+            Default: False.
+        :param health_check_interval:
+            Seconds between background health checks of deployments,
+            see :attr:`.Nodes.is_alive`. Zero disables health checks.
+            Default: 0.
        """
-    log = get_logger(__name__)
-    environment = EnvironmentProvider().environment
-    if auth is None:
-        log.info("No auth method specified, defaulting to password-based.")
-        auth = AuthMethod.ASK
-
-    if auth is AuthMethod.PUBLIC_KEY:
-        if isinstance(key, KeyType):
-            log.info("Generating public-private key pair.")
-            key = generate_key(host=host, key_type=key)
-        elif isinstance(key, str):
-            key = os.path.expanduser(key)
-        else:
-            raise ValueError("Invalid key argument for public key"
-                             " authentication.")
-
+    auth, key = get_auth_and_key(host=host, auth=auth, key=key)
     config = ClusterConfigImpl(host=host,
                                port=port,
                                user=user,
@@ -97,6 +116,7 @@ def add_cluster(name: str,
                                setup_actions=setup_actions,
                                scratch=scratch,
                                retries=retries,
-                               use_jupyter_lab=use_jupyter_lab)
-    return environment.add_cluster(name=name,
-                                   config=config)
+                               use_jupyter_lab=use_jupyter_lab,
+                               **kwargs)
+    return EnvironmentProvider().environment.add_cluster(name=name,
+                                                         config=config)
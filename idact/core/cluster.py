@@ -14,6 +14,7 @@ from idact.core.dask_deployment import DaskDeployment
 from idact.core.config import ClusterConfig
 from idact.core.nodes import Nodes, Node
 from idact.core.synchronized_deployments import SynchronizedDeployments
+from idact.core.transfer_stats import TransferStats
 from idact.core.walltime import Walltime
 
 
@@ -89,7 +90,14 @@ class Cluster(ABC):
 
     @abstractmethod
     def pull_deployments(self) -> SynchronizedDeployments:
-        """Pulls all pushed deployments from the cluster."""
+        """Pulls all pushed deployments from the cluster.
+
+            Allocations that are no longer running are discarded.
+            Jupyter and Dask deployments are returned without being checked.
+            They open their tunnels and check whether they are still
+            functional on first access, and raise :class:`RuntimeError`
+            if they are not, e.g. were cancelled.
+        """
         pass
 
     @abstractmethod
@@ -100,3 +108,35 @@ class Cluster(ABC):
             After this, :meth:`.pull_deployments` will return no deployments.
         """
         pass
+
+    @abstractmethod
+    def close_connections(self):
+        """Closes all pooled SSH connections to the cluster.
+
+            Connections are reopened when needed, and are closed
+            automatically at interpreter exit.
+        """
+        pass
+
+    @abstractmethod
+    def sync_directory(self,
+                       local_path: str,
+                       remote_path: str,
+                       delete: bool = False) -> TransferStats:
+        """Synchronizes a local directory to the cluster, through the access
+            node. Only changed blocks of changed files are transferred,
+            like with `rsync`.
+
+            The state of synchronized files is cached locally, so files
+            that did not change on either side are skipped without hashing.
+            Requires Python on the access node. Empty directories
+            are not synchronized.
+
+            :param local_path: Local directory.
+
+            :param remote_path: Remote directory. Created if missing.
+
+            :param delete: Remove remote files that are missing locally.
+
+        """
+        pass
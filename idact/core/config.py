@@ -179,3 +179,92 @@ class ClusterConfig(ABC):
     @abstractmethod
     def use_jupyter_lab(self, value: bool):
         pass
+
+    @property
+    @abstractmethod
+    def watch_squeue(self) -> bool:
+        """Wait for allocations using one long-running `squeue` process
+            per cluster, instead of polling."""
+        pass
+
+    @watch_squeue.setter
+    @abstractmethod
+    def watch_squeue(self, value: bool):
+        pass
+
+    @property
+    @abstractmethod
+    def squeue_cache_ttl(self) -> int:
+        """Seconds for which `squeue` output is shared between
+            all allocations on the cluster."""
+        pass
+
+    @squeue_cache_ttl.setter
+    @abstractmethod
+    def squeue_cache_ttl(self, value: int):
+        pass
+
+    @property
+    @abstractmethod
+    def use_agent(self) -> bool:
+        """Answer simple queries with a persistent idact agent running
+            on the access node, instead of starting a shell for each."""
+        pass
+
+    @use_agent.setter
+    @abstractmethod
+    def use_agent(self, value: bool):
+        pass
+
+    @property
+    @abstractmethod
+    def remote_shell(self) -> str:
+        """Shell invocation that runs each remote command, which is appended
+            quoted. If empty, commands are run by the user's default shell.
+
+            Commands are POSIX shell commands, so this must be the `-c`
+            invocation of a POSIX shell, and the default shell must be
+            a POSIX shell if this is empty. Commands that need bash
+            features run `bash -c` explicitly.
+        """
+        pass
+
+    @remote_shell.setter
+    @abstractmethod
+    def remote_shell(self, value: str):
+        pass
+
+    @property
+    @abstractmethod
+    def shell_environment(self) -> Dict[str, str]:
+        """Environment variables exported before each remote command."""
+        pass
+
+    @shell_environment.setter
+    @abstractmethod
+    def shell_environment(self, value: Dict[str, str]):
+        pass
+
+    @property
+    @abstractmethod
+    def reserve_ports(self) -> bool:
+        """Keep free remote ports bound until the deployed program
+            is about to start, so they cannot be taken in the meantime."""
+        pass
+
+    @reserve_ports.setter
+    @abstractmethod
+    def reserve_ports(self, value: bool):
+        pass
+
+    @property
+    @abstractmethod
+    def health_check_interval(self) -> int:
+        """Seconds between background health checks of deployments,
+            see :attr:`.Nodes.is_alive`. Zero disables health checks."""
+        pass
+
+    @health_check_interval.setter
+    @abstractmethod
+    def health_check_interval(self, value: int):
+        pass
@@ -4,9 +4,10 @@
    See :class:`.DaskDiagnostics`, :class:`.DaskDeployment`.
 """
 
+import datetime
 from abc import ABC, abstractmethod
 
-from typing import List
+from typing import List, Optional
 
 import dask.distributed
 
@@ -50,3 +51,22 @@ class DaskDeployment(ABC):
     def cancel_local(self):
         """Closes tunnels, but does not cancel the deployment."""
         pass
+
+    @property
+    @abstractmethod
+    def is_alive(self) -> Optional[bool]:
+        """Cached result of the latest background health check: True if
+            the scheduler diagnostics server responded through the tunnel.
+
+            Returns None if :attr:`.ClusterConfig.health_check_interval`
+            is zero, the tunnels were not opened, or the first check has
+            not completed yet. Health checks start on first access.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def last_seen(self) -> Optional[datetime.datetime]:
+        """UTC datetime of the latest health check that found
+            the deployment alive, see :attr:`is_alive`."""
+        pass
@@ -14,12 +14,14 @@ from idact.detail.dask.deploy_dask_impl import connect_to_each_node, \
     deploy_scheduler_on_first_node, deploy_workers_on_each_node, \
     discard_invalid_workers, check_scheduler_reachable_from_nodes
 from idact.detail.deployment.cancel_on_failure import cancel_on_failure
+from idact.detail.helper.run_in_parallel import DEFAULT_MAX_PARALLEL
 from idact.detail.helper.stage_info import stage_info
 from idact.detail.log.get_logger import get_logger
 from idact.detail.nodes.node_internal import NodeInternal
 
 
-def deploy_dask(nodes: Sequence[Node]) -> DaskDeployment:
+def deploy_dask(nodes: Sequence[Node],
+                max_parallel: int = DEFAULT_MAX_PARALLEL) -> DaskDeployment:
     """Deploys Dask on cluster nodes.
 
         Dask scheduler will be deployed on the first node.
@@ -27,6 +29,9 @@ def deploy_dask(nodes: Sequence[Node]) -> DaskDeployment:
 
         :param nodes: Nodes for Dask to be deployed on.
 
+        :param max_parallel: Maximum number of nodes to connect to,
+                             or deploy workers on at the same time.
+
     """
     if not nodes:
         raise ValueError("At least one node is required for Dask deployment.")
@@ -42,22 +47,26 @@ def deploy_dask(nodes: Sequence[Node]) -> DaskDeployment:
         config = first_node.config
 
         connect_to_each_node(nodes=nodes,
-                             config=first_node.config)
+                             config=first_node.config,
+                             max_parallel=max_parallel)
 
         scheduler = deploy_scheduler_on_first_node(nodes)
         stack.enter_context(cancel_on_failure(scheduler))
 
         check_scheduler_reachable_from_nodes(nodes=nodes,
                                              scheduler=scheduler,
-                                             config=config)
+                                             config=config,
+                                             max_parallel=max_parallel)
 
         workers = deploy_workers_on_each_node(nodes=nodes,
                                               scheduler=scheduler,
-                                              stack=stack)
+                                              stack=stack,
+                                              max_parallel=max_parallel)
 
         valid_workers, nodes_to_redeploy = discard_invalid_workers(
             workers=workers,
-            stack=stack)
+            stack=stack,
+            max_parallel=max_parallel)
 
         if nodes_to_redeploy:
             retries_with_no_improvement = 0
@@ -70,11 +79,13 @@ def deploy_dask(nodes: Sequence[Node]) -> DaskDeployment:
                     redeployed_workers = deploy_workers_on_each_node(
                         nodes=nodes_to_redeploy,
                         scheduler=scheduler,
-                        stack=stack)
+                        stack=stack,
+                        max_parallel=max_parallel)
 
                     redeploy_succeeded, nodes_to_redeploy = \
                         discard_invalid_workers(workers=redeployed_workers,
-                                                stack=stack)
+                                                stack=stack,
+                                                max_parallel=max_parallel)
 
                     valid_workers.extend(redeploy_succeeded)
 
@@ -3,7 +3,9 @@
 
    See :class:`.JupyterDeployment`.
 """
+import datetime
 from abc import ABC, abstractmethod
+from typing import Optional
 
 
 class JupyterDeployment(ABC):
@@ -35,3 +37,22 @@ class JupyterDeployment(ABC):
     def cancel_local(self):
         """Closes the tunnel, but does not cancel the deployment."""
         pass
+
+    @property
+    @abstractmethod
+    def is_alive(self) -> Optional[bool]:
+        """Cached result of the latest background health check: True if
+            the notebook server responded through the tunnel.
+
+            Returns None if :attr:`.ClusterConfig.health_check_interval`
+            is zero, the tunnel was not opened, or the first check has
+            not completed yet. Health checks start on first access.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def last_seen(self) -> Optional[datetime.datetime]:
+        """UTC datetime of the latest health check that found
+            the deployment alive, see :attr:`is_alive`."""
+        pass
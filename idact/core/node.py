@@ -6,10 +6,11 @@
 
 from abc import ABC, abstractmethod
 
-from typing import Optional
+from typing import Callable, Optional
 
 from idact.core.jupyter_deployment import JupyterDeployment
 from idact.core.node_resource_status import NodeResourceStatus
+from idact.core.transfer_stats import TransferStats
 from idact.detail.tunnel.tunnel_internal import TunnelInternal
 
 
@@ -70,6 +71,72 @@ class Node(ABC):
         """
         pass
 
+    @abstractmethod
+    def upload(self,
+               local_path: str,
+               remote_path: str,
+               compress: bool = False,
+               resume: bool = False,
+               max_parallel: Optional[int] = None,
+               on_progress: Optional[Callable[[str, int, int], None]] = None) -> TransferStats:  # noqa, pylint: disable=bad-continuation,line-too-long
+        """Uploads a file, or the contents of a directory, to the node
+            over SFTP. Files are streamed in chunks, with pipelined writes.
+            Files of a directory tree are uploaded in parallel.
+
+            :param local_path: Local file or directory.
+
+            :param remote_path: Remote file or directory path.
+                                Parent directories must exist.
+
+            :param compress: Compress files on the fly, through `gzip`
+                             on the node. Faster for compressible files
+                             on slow connections.
+
+            :param resume: Skip files that are already complete,
+                           and continue partially uploaded files.
+
+            :param max_parallel: Maximum number of files to upload
+                                 at the same time.
+                                 Default: 16.
+
+            :param on_progress: Called with the remote path, bytes uploaded
+                                and file size, after each chunk.
+                                May be called from multiple threads.
+        """
+        pass
+
+    @abstractmethod
+    def download(self,
+                 remote_path: str,
+                 local_path: str,
+                 compress: bool = False,
+                 resume: bool = False,
+                 max_parallel: Optional[int] = None,
+                 on_progress: Optional[Callable[[str, int, int], None]] = None) -> TransferStats:  # noqa, pylint: disable=bad-continuation,line-too-long
+        """Downloads a file, or the contents of a directory, from the node
+            over SFTP, see :meth:`upload`.
+
+            :param remote_path: Remote file or directory.
+
+            :param local_path: Local file or directory path.
+                               Parent directories must exist.
+
+            :param compress: Compress files on the fly, through `gzip`
+                             on the node.
+
+            :param resume: Skip files that are already complete,
+                           and continue partially downloaded files.
+
+            :param max_parallel: Maximum number of files to download
+                                 at the same time.
+                                 Default: 16.
+
+            :param on_progress: Called with the local path, bytes downloaded
+                                and file size, after each chunk.
+                                May be called from multiple threads.
+        """
+        pass
+
     @property
     @abstractmethod
     def resources(self) -> NodeResourceStatus:
@@ -24,8 +24,8 @@ class NodeResourceStatus(ABC):
     @property
     @abstractmethod
     def memory_usage(self) -> bitmath.GiB:
-        """Sum of RES (Resident Memory Size) of all user processes on the node
-            as reported by top.
+        """Sum of resident memory size (VmRSS) of all user processes
+            on the node.
             Can be greater than memory_total, if multiple allocations
             of the same user are running on the node."""
         pass
@@ -41,7 +41,10 @@ class NodeResourceStatus(ABC):
     @property
     @abstractmethod
     def cpu_usage(self) -> float:
-        """Sum of %CPU of all user processes as reported by top.
+        """Sum of %CPU of all user processes since the previous sample
+            for this node, or over a fraction of a second, if there is none
+            or it is older than a minute. Sampled together with
+            memory_usage, on first access.
             Can be greater than 100.0, if multiple cores are used, or multiple
             allocations of the same user are running on the node.
         """
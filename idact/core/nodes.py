@@ -4,12 +4,15 @@
    See :class:`.Nodes`.
 """
 
+import datetime
 from abc import abstractmethod
 from collections.abc import Sequence
 
-from typing import Optional
+from typing import Optional, List
 
 from idact.core.node import Node
+from idact.core.nodes_monitor import NodesMonitor
+from idact.core.run_results import RunResults
 
 
 class Nodes(Sequence):
@@ -39,6 +42,89 @@ class Nodes(Sequence):
         """Returns True if the nodes are running."""
         pass
 
+    @property
+    @abstractmethod
+    def is_alive(self) -> Optional[bool]:
+        """Cached result of the latest background health check: True if
+            the allocation was running, or pending before waiting.
+
+            Returns None if :attr:`.ClusterConfig.health_check_interval`
+            is zero, or the first check has not completed yet.
+            Health checks start on first access.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def last_seen(self) -> Optional[datetime.datetime]:
+        """UTC datetime of the latest health check that found
+            the allocation alive, see :attr:`is_alive`."""
+        pass
+
+    @abstractmethod
+    def run_all(self,
+                command: str,
+                timeout: Optional[int] = None,
+                max_parallel: Optional[int] = None) -> RunResults:
+        """Runs the command on each node concurrently.
+            Connections to compute nodes are tunneled through a single
+            connection to the access node, and reused.
+
+            A command failing on one node does not affect other nodes.
+            See :meth:`.RunResults.raise_on_error`.
+
+            :param command: Command to run.
+
+            :param timeout: Execution timeout on each node.
+
+            :param max_parallel: Maximum number of nodes to run the command
+                                 on at the same time.
+                                 Default: 16.
+        """
+        pass
+
+    @abstractmethod
+    def run_many(self,
+                 commands: List[str],
+                 timeout: Optional[int] = None,
+                 max_parallel: Optional[int] = None) -> RunResults:
+        """Runs a different command on each node concurrently,
+            see :meth:`run_all`.
+
+            :param commands: Command for each node, in node order.
+
+            :param timeout: Execution timeout on each node.
+
+            :param max_parallel: Maximum number of nodes to run commands
+                                 on at the same time.
+                                 Default: 16.
+
+            :raises ValueError: If the command count does not match
+                                the node count.
+        """
+        pass
+
+    @abstractmethod
+    def monitor(self,
+                interval: float = 1.0,
+                capacity: int = 3600) -> NodesMonitor:
+        """Starts sampling CPU and memory usage of each node
+            in the background, until stopped.
+
+            Each node runs a single sampler process, which streams
+            samples back over one channel, so refreshing the view
+            does not run any commands.
+
+            :param interval: Seconds between samples.
+
+            :param capacity: Number of most recent samples kept
+                             for each node.
+
+            :raises ValueError: If the interval or capacity
+                                is not positive.
+        """
+        pass
+
     @property
     @abstractmethod
     def waited(self) -> bool:
@@ -0,0 +1,150 @@
+"""Contents of this module are intended to be imported into
+   the top-level package.
+
+   See :class:`.NodesMonitor`.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Optional
+
+import bitmath
+import numpy
+
+from idact.core.node import Node
+
+
+class NodeResourceHistory(ABC):
+    """Recent resource usage samples of a single node, oldest first.
+
+        Only the most recent samples are kept, up to the monitor capacity.
+        Aggregates are None, if there are no samples yet.
+    """
+
+    @property
+    @abstractmethod
+    def node(self) -> Node:
+        """Monitored node."""
+        pass
+
+    @property
+    @abstractmethod
+    def timestamps(self) -> numpy.ndarray:
+        """Local time of each sample, in seconds since the epoch."""
+        pass
+
+    @property
+    @abstractmethod
+    def cpu_usage(self) -> numpy.ndarray:
+        """Sum of %CPU of all user processes on the node
+            for each sample, see :attr:`.NodeResourceStatus.cpu_usage`."""
+        pass
+
+    @property
+    @abstractmethod
+    def memory_usage(self) -> numpy.ndarray:
+        """Sum of resident memory size of all user processes
+            on the node for each sample, in GiB,
+            see :attr:`.NodeResourceStatus.memory_usage`."""
+        pass
+
+    @property
+    @abstractmethod
+    def mean_cpu_usage(self) -> Optional[float]:
+        """Mean of :attr:`cpu_usage`."""
+        pass
+
+    @property
+    @abstractmethod
+    def peak_cpu_usage(self) -> Optional[float]:
+        """Maximum of :attr:`cpu_usage`."""
+        pass
+
+    @property
+    @abstractmethod
+    def mean_memory_usage(self) -> Optional[bitmath.GiB]:
+        """Mean of :attr:`memory_usage`."""
+        pass
+
+    @property
+    @abstractmethod
+    def peak_memory_usage(self) -> Optional[bitmath.GiB]:
+        """Maximum of :attr:`memory_usage`."""
+        pass
+
+    @property
+    @abstractmethod
+    def error(self) -> Optional[Exception]:
+        """Set if monitoring of this node failed."""
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of samples."""
+        pass
+
+
+class NodesMonitor(Sequence):
+    """Resource usage of multiple nodes, sampled continuously
+        in the background, in the same order as the nodes.
+
+        Aggregates over all nodes are computed from the samples
+        of every node, and are None, if there are no samples yet.
+
+        Stops when used as a context manager.
+    """
+
+    @property
+    @abstractmethod
+    def interval(self) -> float:
+        """Seconds between samples."""
+        pass
+
+    @property
+    @abstractmethod
+    def running(self) -> bool:
+        """True, if the monitor was not stopped."""
+        pass
+
+    @property
+    @abstractmethod
+    def mean_cpu_usage(self) -> Optional[float]:
+        """Mean %CPU of a node."""
+        pass
+
+    @property
+    @abstractmethod
+    def peak_cpu_usage(self) -> Optional[float]:
+        """Maximum %CPU of any node."""
+        pass
+
+    @property
+    @abstractmethod
+    def mean_memory_usage(self) -> Optional[bitmath.GiB]:
+        """Mean memory usage of a node."""
+        pass
+
+    @property
+    @abstractmethod
+    def peak_memory_usage(self) -> Optional[bitmath.GiB]:
+        """Maximum memory usage of any node."""
+        pass
+
+    @abstractmethod
+    def stop(self):
+        """Stops sampling. Collected samples are kept."""
+        pass
+
+    def __enter__(self) -> 'NodesMonitor':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def __getitem__(self, i: int) -> NodeResourceHistory:
+        pass
@@ -11,7 +11,8 @@ class Retry(Enum):
     """Retry action names."""
 
     PORT_INFO = 0
-    """Fetch port info after deployment from a dir on NFS."""
+    """Wait for sshd ports reported by entry points after deployment.
+       Count times seconds between is the total timeout."""
 
     JUPYTER_JSON = 1
     """Fetch Jupyter nbserver.json from a dir on NFS."""
@@ -0,0 +1,86 @@
+"""Contents of this module are intended to be imported into
+   the top-level package.
+
+   See :class:`.RunResults`.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import List, Optional
+
+from idact.core.node import Node
+
+
+class RunResult(ABC):
+    """Result of running a command on a single node."""
+
+    @property
+    @abstractmethod
+    def node(self) -> Node:
+        """Node the command was run on."""
+        pass
+
+    @property
+    @abstractmethod
+    def command(self) -> str:
+        """Command that was run."""
+        pass
+
+    @property
+    @abstractmethod
+    def output(self) -> Optional[str]:
+        """Command output, as returned by :meth:`.Node.run`,
+            or None if the command failed."""
+        pass
+
+    @property
+    @abstractmethod
+    def error(self) -> Optional[Exception]:
+        """Exception raised by :meth:`.Node.run`, or None on success."""
+        pass
+
+    @property
+    @abstractmethod
+    def succeeded(self) -> bool:
+        """True, if the command succeeded."""
+        pass
+
+
+class RunResults(Sequence):
+    """Results of running commands on multiple nodes,
+        in the same order as the nodes."""
+
+    @property
+    @abstractmethod
+    def outputs(self) -> List[Optional[str]]:
+        """Command output for each node, None for failed commands."""
+        pass
+
+    @property
+    @abstractmethod
+    def failed(self) -> List[RunResult]:
+        """Results of failed commands."""
+        pass
+
+    @property
+    @abstractmethod
+    def succeeded(self) -> bool:
+        """True, if the commands succeeded on all nodes."""
+        pass
+
+    @abstractmethod
+    def raise_on_error(self):
+        """Raises an exception if the command failed on any node.
+
+            :raises RuntimeError: If the command failed on any node.
+
+        """
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def __getitem__(self, i: int) -> RunResult:
+        pass
@@ -0,0 +1,49 @@
+"""Contents of this module are intended to be imported into
+   the top-level package.
+
+   See :class:`.TransferStats`.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class TransferStats(ABC):
+    """Summary of a file transfer, see :meth:`.Node.upload`
+        and :meth:`.Node.download`."""
+
+    @property
+    @abstractmethod
+    def files(self) -> int:
+        """Number of files transferred or found complete."""
+        pass
+
+    @property
+    @abstractmethod
+    def transferred_bytes(self) -> int:
+        """File contents sent during this transfer, before compression."""
+        pass
+
+    @property
+    @abstractmethod
+    def skipped_bytes(self) -> int:
+        """File contents already present at the destination,
+            when resuming."""
+        pass
+
+    @property
+    @abstractmethod
+    def wire_bytes(self) -> int:
+        """File contents sent over the connection, after compression."""
+        pass
+
+    @property
+    @abstractmethod
+    def seconds(self) -> float:
+        """Total transfer time."""
+        pass
+
+    @property
+    @abstractmethod
+    def throughput(self) -> float:
+        """Transferred bytes per second."""
+        pass
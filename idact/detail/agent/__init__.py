@@ -0,0 +1,2 @@
+"""This package contains internal functionality related to the persistent
+    idact agent running on the cluster."""
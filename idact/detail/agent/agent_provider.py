@@ -0,0 +1,53 @@
+"""This module contains the implementation of a provider of idact agents
+    for each node."""
+
+import atexit
+import threading
+
+from idact.detail.agent.remote_agent import RemoteAgent
+from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.ssh.get_connection_key import get_connection_key
+
+
+class AgentProvider:
+    """Stores one idact agent per node.
+
+        All agents are stopped at interpreter exit.
+
+    """
+    _state = {}
+
+    def __init__(self):
+        if AgentProvider._state:
+            self.__dict__ = AgentProvider._state
+            return
+
+        self._lock = threading.Lock()
+        self._agents = {}
+        atexit.register(self.close_all)
+
+        AgentProvider._state = self.__dict__
+
+    def get_agent(self, node: NodeInternal) -> RemoteAgent:
+        """Returns the agent for the node.
+
+            :param node: Node to run the agent on.
+
+        """
+        key = get_connection_key(host=node.host,
+                                 port=node.port,
+                                 config=node.config)
+        with self._lock:
+            agent = self._agents.get(key, None)
+            if agent is None:
+                agent = RemoteAgent(node=node)
+                self._agents[key] = agent
+            return agent
+
+    def close_all(self):
+        """Stops all agents."""
+        with self._lock:
+            agents = list(self._agents.values())
+            self._agents.clear()
+        for agent in agents:
+            agent.close()
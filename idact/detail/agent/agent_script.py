@@ -0,0 +1,118 @@
+"""This module contains the idact agent script run on the cluster.
+    It is compatible with Python 2.7 and 3."""
+
+from idact.detail.nodes.sample_resources_script import \
+    SAMPLE_RESOURCES_FUNCTION
+
+AGENT_VERSION = 1
+"""Protocol version, part of the uploaded script name."""
+
+AGENT_SCRIPT = r"""
+import json, os, pwd, socket, subprocess, sys, time
+
+VERSION = {version}
+
+
+def list_children():
+    children = {{}}
+    for name in os.listdir('/proc'):
+        if not name.isdigit():
+            continue
+        try:
+            with open('/proc/' + name + '/stat') as file:
+                stat = file.read()
+        except (IOError, OSError):
+            continue
+        # The process name may contain spaces and parentheses.
+        ppid = int(stat[stat.rindex(')') + 2:].split()[1])
+        children.setdefault(ppid, []).append(int(name))
+    return children
+
+
+def ptree(pid):
+    children = list_children()
+    result = []
+    pending = [pid]
+    while pending:
+        parent = pending.pop()
+        result.append(parent)
+        pending.extend(children.get(parent, []))
+    return result
+
+
+def free_ports(count):
+    sockets = []
+    try:
+        for _ in range(count):
+            sock = socket.socket()
+            sockets.append(sock)
+            sock.bind(('', 0))
+        return [sock.getsockname()[1] for sock in sockets]
+    finally:
+        for sock in sockets:
+            sock.close()
+
+
+def squeue(output_format, job_ids):
+    user = os.environ.get('USER') or pwd.getpwuid(os.getuid()).pw_name
+    args = ['squeue', '--user', user, '--format', output_format]
+    if job_ids is not None:
+        args += ['--jobs', ','.join(str(job_id) for job_id in job_ids)]
+    process = subprocess.Popen(args,
+                               stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE)
+    output, error = process.communicate()
+    if process.returncode != 0:
+        # Finished jobs make squeue fail with 'Invalid job id specified'.
+        if job_ids is not None:
+            return ''
+        raise RuntimeError(error.decode('utf-8', 'replace').strip())
+    return output.decode('utf-8', 'replace')
+
+
+def file_exists(path):
+    return os.path.exists(os.path.expanduser(os.path.expandvars(path)))
+
+{sample_resources}
+
+
+OPERATIONS = {{'ptree': ptree,
+              'free_ports': free_ports,
+              'squeue': squeue,
+              'file_exists': file_exists,
+              'sample_resources': sample_resources}}
+
+
+def respond(response):
+    sys.stdout.write(json.dumps(response, separators=(',', ':')) + '\n')
+    sys.stdout.flush()
+
+
+respond({{'version': VERSION, 'pid': os.getpid()}})
+while True:
+    line = sys.stdin.readline()
+    if not line:
+        break
+    request = json.loads(line)
+    try:
+        result = OPERATIONS[request['op']](**request.get('args', {{}}))
+        respond({{'id': request['id'], 'result': result}})
+    except Exception as e:
+        respond({{'id': request['id'], 'error': '%s: %s' % (
+            type(e).__name__, e)}})
+""".format(version=AGENT_VERSION,
+           sample_resources=SAMPLE_RESOURCES_FUNCTION)
+"""Answers requests until its input is closed.
+
+   Requests and responses are JSON objects, one per line.
+   A request contains `id`, `op` (operation name) and `args`.
+   A response contains `id` and either `result` or `error`.
+   The first line written is a greeting with `version` and `pid`.
+
+   Operations:
+
+   - `ptree(pid)`: the process and its descendants, read from `/proc`,
+   - `free_ports(count)`: distinct free ports, bound at the same time,
+   - `squeue(output_format, job_ids)`: `squeue` output for the current user,
+   - `file_exists(path)`: True, if the file exists,
+   - `sample_resources(interval)`: see :attr:`.SAMPLE_RESOURCES_FUNCTION`."""
@@ -0,0 +1,23 @@
+"""This module contains a function for getting the idact agent
+    for a node."""
+
+from typing import Optional
+
+from idact.core.node import Node
+from idact.detail.agent.agent_provider import AgentProvider
+from idact.detail.agent.remote_agent import RemoteAgent
+from idact.detail.nodes.node_internal import NodeInternal
+
+
+def get_remote_agent(node: Node) -> Optional[RemoteAgent]:
+    """Returns the agent for the node, or None if agents are disabled
+        in the cluster config, see :attr:`.ClusterConfig.use_agent`.
+
+        See :class:`.AgentProvider`.
+
+        :param node: Node to run the agent on.
+
+    """
+    if not isinstance(node, NodeInternal) or not node.config.use_agent:
+        return None
+    return AgentProvider().get_agent(node=node)
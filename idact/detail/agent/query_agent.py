@@ -0,0 +1,36 @@
+"""This module contains a function for answering a query with the idact
+    agent, if it is enabled."""
+
+from typing import Callable, TypeVar
+
+from idact.core.node import Node
+from idact.detail.agent.get_remote_agent import get_remote_agent
+from idact.detail.agent.remote_agent import RemoteAgent
+from idact.detail.log.get_logger import get_logger
+
+T = TypeVar('T')
+
+
+def query_agent(node: Node,
+                query: Callable[[RemoteAgent], T],
+                fallback: Callable[[], T]) -> T:
+    """Returns the query result from the agent, if it is enabled
+        for the node. Otherwise, or if the agent fails, returns
+        the fallback result.
+
+        :param node: Node to query.
+
+        :param query: Query to send to the agent.
+
+        :param fallback: Computes the result with shell commands.
+
+    """
+    agent = get_remote_agent(node=node)
+    if agent is not None:
+        try:
+            return query(agent)
+        except RuntimeError:
+            log = get_logger(__name__)
+            log.debug("Agent query failed, falling back to shell.",
+                      exc_info=1)
+    return fallback()
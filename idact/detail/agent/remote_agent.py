@@ -0,0 +1,209 @@
+"""This module contains a client of the persistent idact agent."""
+
+import hashlib
+import json
+import shlex
+import socket
+import threading
+from typing import Any, List, Optional
+
+import paramiko
+
+from idact.detail.agent.agent_script import AGENT_SCRIPT, AGENT_VERSION
+from idact.detail.helper.stage_info import stage_debug
+from idact.detail.log.get_logger import get_logger
+from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.ssh.exec_on_channel import exec_on_channel
+from idact.detail.ssh.run_command import RECEIVE_BUFFER_SIZE
+
+AGENT_LOCATION = "~/.idact"
+AGENT_FILE_NAME_FORMAT = "agent-{version}-{digest}.py"
+AGENT_TIMEOUT = 60
+"""Seconds to wait for the agent to start, or to answer a request."""
+
+
+def get_agent_path() -> str:
+    """Returns the agent script path on the cluster, unique to the script
+        contents, so an outdated agent is never reused."""
+    digest = hashlib.sha1(AGENT_SCRIPT.encode()).hexdigest()[:12]
+    return "{location}/{file_name}".format(
+        location=AGENT_LOCATION,
+        file_name=AGENT_FILE_NAME_FORMAT.format(version=AGENT_VERSION,
+                                                digest=digest))
+
+
+def get_agent_command() -> str:
+    """Returns a command that uploads the agent script if it is missing,
+        and replaces the shell with the agent."""
+    agent_path = get_agent_path()
+    return ("mkdir -p {location}"
+            " && chmod 700 {location}"
+            " && {{ test -e {agent_path}"
+            " || {{ printf '%s' {script} > {agent_path}.$$"
+            " && mv {agent_path}.$$ {agent_path}; }}; }}"
+            " && exec python -u {agent_path}".format(
+                location=AGENT_LOCATION,
+                agent_path=agent_path,
+                script=shlex.quote(AGENT_SCRIPT)))
+
+
+class RemoteAgent:
+    """Sends requests to the idact agent, over one SSH channel.
+
+        The agent is uploaded and started on first request, and restarted
+        if its channel or connection was closed. Requests are sent one
+        at a time, each is a single round trip without starting a shell.
+
+        See :attr:`.AGENT_SCRIPT`.
+
+        :param node: Node to run the agent on.
+
+    """
+
+    def __init__(self, node: NodeInternal):
+        self._node = node
+        self._client = None  # type: Optional[paramiko.SSHClient]
+        self._channel = None  # type: Optional[paramiko.Channel]
+        self._output = None
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def _start(self, client: paramiko.SSHClient):
+        """Starts the agent on a new channel and reads the greeting.
+
+            :param client: Connected client.
+
+        """
+        log = get_logger(__name__)
+        with stage_debug(log, "Starting agent on %s.", self._node.host):
+            self._client = client
+            self._channel = exec_on_channel(client=client,
+                                            command=get_agent_command(),
+                                            config=self._node.config)
+            self._channel.settimeout(AGENT_TIMEOUT)
+            self._output = self._channel.makefile('rb')
+            greeting = self._read_response()
+            if greeting.get('version') != AGENT_VERSION:
+                raise RuntimeError(
+                    "Unexpected agent greeting: {}".format(greeting))
+            log.debug("Agent pid: %s", greeting.get('pid'))
+
+    def _read_response(self) -> dict:
+        """Reads a single response line."""
+        line = self._output.readline()
+        if not line:
+            error = b''
+            if self._channel.recv_stderr_ready():
+                error = self._channel.recv_stderr(RECEIVE_BUFFER_SIZE)
+            raise RuntimeError("Agent exited: {}".format(
+                error.decode('utf-8', 'replace').strip()))
+        return json.loads(line.decode('utf-8'))
+
+    def _stop(self):
+        """Closes the agent channel, which makes the agent exit."""
+        if self._output is not None:
+            self._output.close()
+        if self._channel is not None:
+            try:
+                self._channel.close()
+            except (paramiko.SSHException, OSError, EOFError):
+                pass  # The connection is already closed.
+        self._client = None
+        self._channel = None
+        self._output = None
+
+    def request(self, operation: str, **kwargs) -> Any:
+        """Sends a request to the agent and returns the result.
+
+            :param operation: Operation name.
+
+            :param kwargs: Operation arguments.
+
+            :raises RuntimeError: If the agent failed to answer,
+                                  or the operation failed.
+
+        """
+        with self._lock:
+            try:
+                with self._node.connection() as client:
+                    if (self._client is not client
+                            or self._channel is None
+                            or self._channel.closed):
+                        self._stop()
+                        self._start(client=client)
+                    self._next_id += 1
+                    request_id = self._next_id
+                    self._channel.sendall(json.dumps(
+                        {'id': request_id,
+                         'op': operation,
+                         'args': kwargs},
+                        separators=(',', ':')).encode() + b'\n')
+                    response = self._read_response()
+            except (socket.timeout, OSError, paramiko.SSHException,
+                    RuntimeError, ValueError) as e:
+                self._stop()
+                raise RuntimeError(
+                    "Agent request failed: '{}'.".format(operation)) from e
+
+        if response.get('id') != request_id:
+            raise RuntimeError("Unexpected agent response: {}".format(
+                response))
+        if 'error' in response:
+            raise RuntimeError("Agent operation '{operation}' failed:"
+                               " {error}".format(operation=operation,
+                                                 error=response['error']))
+        return response['result']
+
+    def ptree(self, pid: int) -> List[int]:
+        """Returns a list containing this PID and all its descendants.
+
+            :param pid: Parent process pid.
+
+        """
+        return self.request('ptree', pid=pid)
+
+    def get_free_ports(self, count: int) -> List[int]:
+        """Returns distinct free ports.
+
+            :param count: Free port count.
+
+        """
+        return self.request('free_ports', count=count)
+
+    def squeue(self,
+               output_format: str,
+               job_ids: Optional[List[int]] = None) -> str:
+        """Returns `squeue` output for the current user's jobs.
+
+            :param output_format: Output format.
+
+            :param job_ids: If not None, only these jobs are queried.
+                            Empty output is returned if they finished.
+
+        """
+        return self.request('squeue',
+                            output_format=output_format,
+                            job_ids=job_ids)
+
+    def file_exists(self, path: str) -> bool:
+        """Returns True, if the file exists.
+
+            :param path: File path, `~` and variables are expanded.
+
+        """
+        return self.request('file_exists', path=path)
+
+    def sample_resources(self, interval: float) -> List[dict]:
+        """Returns resource usage samples of user processes,
+            see :attr:`.SAMPLE_RESOURCES_FUNCTION`.
+
+            :param interval: Seconds between two samples, or zero
+                             for a single sample.
+
+        """
+        return self.request('sample_resources', interval=interval)
+
+    def close(self):
+        """Stops the agent."""
+        with self._lock:
+            self._stop()
@@ -0,0 +1 @@
+"""This package contains the internal implementation of the asyncio API."""
@@ -0,0 +1,41 @@
+"""This module contains a function for awaiting a blocking call
+    in an executor thread."""
+
+import asyncio
+from typing import Callable, Any, Optional
+
+from idact.detail.log.get_logger import get_logger
+
+
+async def run_blocking(fun: Callable[[], Any],
+                       on_abandoned: Optional[Callable[[Any], None]] = None) -> Any:  # noqa, pylint: disable=bad-continuation,line-too-long
+    """Calls the function in the default executor of the event loop,
+        and returns its result.
+
+        A blocking call cannot be interrupted. If the awaiting task is
+        cancelled, the call completes in the background, and its result
+        is passed to `on_abandoned` in an executor thread, e.g. to cancel
+        an allocation that is no longer needed.
+
+        :param fun: Blocking function to call.
+
+        :param on_abandoned: Called with the result of a call
+                             that completed after cancellation.
+
+    """
+    loop = asyncio.get_event_loop()
+    future = loop.run_in_executor(None, fun)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        if on_abandoned is not None:
+            def clean_up(done: asyncio.Future):
+                if done.cancelled() or done.exception() is not None:
+                    return
+                log = get_logger(__name__)
+                log.debug("Cleaning up after cancelled call: %s",
+                          done.result())
+                loop.run_in_executor(None, on_abandoned, done.result())
+
+            future.add_done_callback(clean_up)
+        raise
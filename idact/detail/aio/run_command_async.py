@@ -0,0 +1,100 @@
+"""This module contains a coroutine for running a command over an open
+    SSH connection without blocking the event loop."""
+
+import asyncio
+from typing import Optional
+
+import paramiko
+
+from idact.core.config import ClusterConfig
+from idact.detail.aio.run_blocking import run_blocking
+from idact.detail.log.capture_fabric_output_to_log import FABRIC_LOGGER_NAME
+from idact.detail.log.get_logger import get_logger
+from idact.detail.ssh.get_remote_command import get_remote_command
+from idact.detail.ssh.run_command import RECEIVE_BUFFER_SIZE
+
+
+async def receive_output_async(channel: paramiko.Channel) -> bytes:
+    """Receives the command output until the channel reaches EOF,
+        waiting for data with the event loop.
+
+        :param channel: Channel the command was executed on.
+
+    """
+    loop = asyncio.get_event_loop()
+    readable = asyncio.Event()
+    file_descriptor = channel.fileno()
+    loop.add_reader(file_descriptor, readable.set)
+    chunks = []
+    try:
+        while True:
+            readable.clear()
+            while channel.recv_ready():
+                chunks.append(channel.recv(RECEIVE_BUFFER_SIZE))
+            if channel.eof_received or channel.closed:
+                if not channel.recv_ready():
+                    return b''.join(chunks)
+                continue
+            await readable.wait()
+    finally:
+        loop.remove_reader(file_descriptor)
+
+
+async def run_command_async(client: paramiko.SSHClient,
+                            host: str,
+                            command: str,
+                            timeout: Optional[float] = None,
+                            config: Optional[ClusterConfig] = None) -> str:
+    """Runs the command in the remote shell and returns its output,
+        like :func:`.run_command`.
+
+        If the awaiting task is cancelled, the channel is closed.
+
+        :param client: Connected client.
+
+        :param host: Host name for the log.
+
+        :param command: Command to run.
+
+        :param timeout: Command timeout in seconds, or None.
+
+        :param config: Cluster config with the remote shell,
+                       see :func:`.get_remote_command`.
+
+        :raises TimeoutError: On command timeout.
+
+        :raises RuntimeError: On non-zero exit status.
+
+    """
+    log = get_logger(FABRIC_LOGGER_NAME)
+    transport = client.get_transport()
+    if transport is None or not transport.is_active():
+        raise RuntimeError("Connection is closed.")
+    log.debug("[%s] run: %s", host, command)
+
+    channel = await run_blocking(transport.open_session,
+                                 on_abandoned=lambda opened: opened.close())
+    try:
+        channel.set_combine_stderr(True)
+        await run_blocking(lambda: channel.exec_command(
+            get_remote_command(command=command, config=config)))
+        try:
+            output = await asyncio.wait_for(receive_output_async(channel),
+                                            timeout=timeout)
+        except asyncio.TimeoutError as e:
+            raise TimeoutError(
+                "Command timed out after {timeout} seconds.".format(
+                    timeout=timeout)) from e
+        exit_status = await run_blocking(channel.recv_exit_status)
+    finally:
+        channel.close()
+
+    result = output.decode('utf-8', 'replace').strip()
+    for line in result.splitlines():
+        log.debug("[%s] out: %s", host, line)
+
+    if exit_status != 0:
+        raise RuntimeError(
+            "Command returned non-zero exit status {status}.".format(
+                status=exit_status))
+    return result
@@ -0,0 +1,48 @@
+"""This module contains a coroutine for running a command on a node
+    without blocking the event loop."""
+
+from typing import Optional
+
+from idact.core.node import Node
+from idact.detail.aio.run_blocking import run_blocking
+from idact.detail.aio.run_command_async import run_command_async
+from idact.detail.nodes.node_internal import NodeInternal
+
+
+async def run_on_node_async(node: Node,
+                            command: str,
+                            timeout: Optional[float] = None) -> str:
+    """Runs the command on the node, like :meth:`.Node.run`.
+
+        The connection is acquired from the connection pool in an executor
+        thread, then the output is awaited on the event loop.
+        Other node implementations are run entirely in an executor thread.
+
+        :param node: Node to run the command on.
+
+        :param command: Command to run.
+
+        :param timeout: Command timeout in seconds, or None.
+
+    """
+    if not isinstance(node, NodeInternal):
+        return await run_blocking(lambda: node.run(command, timeout=timeout))
+
+    connection = node.connection()
+    client = await run_blocking(
+        connection.__enter__,
+        on_abandoned=lambda _: connection.__exit__(None, None, None))
+    try:
+        return await run_command_async(client=client,
+                                       host=node.host,
+                                       command=command,
+                                       timeout=timeout,
+                                       config=node.config)
+    except TimeoutError as e:
+        raise TimeoutError("Command timed out: '{command}'".format(
+            command=command)) from e
+    except RuntimeError as e:
+        raise RuntimeError("Cannot run '{command}'".format(
+            command=command)) from e
+    finally:
+        connection.__exit__(None, None, None)
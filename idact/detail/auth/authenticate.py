@@ -1,6 +1,7 @@
 """This module contains a context manager that performs node authentication
     according to the configuration."""
 
+import threading
 from contextlib import contextmanager
 from typing import Tuple
 
@@ -17,6 +18,10 @@ from idact.detail.entry_point.get_entry_point_script_contents import \
     COMPUTE_NODE_AUTHORIZED_KEYS
 from idact.detail.helper.stage_info import stage_info
 from idact.detail.log.get_logger import get_logger
+from idact.detail.ssh.get_remote_command import DEFAULT_REMOTE_SHELL
+
+FABRIC_ENV_LOCK = threading.RLock()
+"""Serializes all code that modifies the global Fabric environment."""
 
 
 def get_host_strings(host: str,
@@ -93,6 +98,7 @@ def authenticate(host: str,
                  config: ClusterConfig,
                  install_shared_keys: bool = False):
     """Authenticates the user in Fabric.
+        Holds :attr:`.FABRIC_ENV_LOCK` until the context exits.
 
         :param host: SSH host.
 
@@ -109,46 +115,50 @@ def authenticate(host: str,
             "Authentication method not implemented: '{}'.".format(
                 config.auth))
 
-    previous_gateway, previous_host = env.gateway, env.host_string
-    env.gateway, env.host_string = get_host_strings(host=host,
-                                                    port=port,
-                                                    config=config)
-
-    previous_abort_on_prompts = env.abort_on_prompts
-    env.shell = "/bin/bash --noprofile -l -c"
-    env.pop('key', None)  # Do not use an in-memory key.
-    env.user = config.user
-    env.abort_on_prompts = True
-    log = get_logger(__name__)
-    try:
-        if config.auth == AuthMethod.ASK:
-            env.password = get_password(config=config)
-        elif config.auth == AuthMethod.PUBLIC_KEY:
-            if config.install_key:
-                with stage_info(log, "Installing key using password"
-                                     " authentication."):
-                    install_key_using_password_authentication(config=config)
-                env.key_filename = config.key
-                config.install_key = False
-                env.password = None
-
-        access_node = get_host_string(config=config)
-        if install_shared_keys:
-            with stage_info(log, "Installing key in '%s' for access to compute"
-                                 " nodes.",
-                            COMPUTE_NODE_AUTHORIZED_KEYS):
-                install_keys_using_current_authentication(
-                    access_node=access_node,
-                    config=config)
-
-        # Key is needed between gateway and compute nodes even when using
-        # password-based authentication.
-        env.key_filename = config.key
-        with disable_getpass():
-            yield
-    finally:
-        env.gateway, env.host_string = previous_gateway, previous_host
-
-        env.password = None
-        env.key_filename = None
-        env.abort_on_prompts = previous_abort_on_prompts
+    with FABRIC_ENV_LOCK:
+        previous_gateway, previous_host = env.gateway, env.host_string
+        env.gateway, env.host_string = get_host_strings(host=host,
+                                                        port=port,
+                                                        config=config)
+
+        previous_abort_on_prompts = env.abort_on_prompts
+        env.use_shell = bool(config.remote_shell)
+        env.shell = config.remote_shell or DEFAULT_REMOTE_SHELL
+        env.shell_env = dict(config.shell_environment)
+        env.pop('key', None)  # Do not use an in-memory key.
+        env.user = config.user
+        env.abort_on_prompts = True
+        log = get_logger(__name__)
+        try:
+            if config.auth == AuthMethod.ASK:
+                env.password = get_password(config=config)
+            elif config.auth == AuthMethod.PUBLIC_KEY:
+                if config.install_key:
+                    with stage_info(log, "Installing key using password"
+                                         " authentication."):
+                        install_key_using_password_authentication(
+                            config=config)
+                    env.key_filename = config.key
+                    config.install_key = False
+                    env.password = None
+
+            access_node = get_host_string(config=config)
+            if install_shared_keys:
+                with stage_info(log, "Installing key in '%s' for access"
+                                     " to compute nodes.",
+                                COMPUTE_NODE_AUTHORIZED_KEYS):
+                    install_keys_using_current_authentication(
+                        access_node=access_node,
+                        config=config)
+
+            # Key is needed between gateway and compute nodes even when
+            # using password-based authentication.
+            env.key_filename = config.key
+            with disable_getpass():
+                yield
+        finally:
+            env.gateway, env.host_string = previous_gateway, previous_host
+
+            env.password = None
+            env.key_filename = None
+            env.abort_on_prompts = previous_abort_on_prompts
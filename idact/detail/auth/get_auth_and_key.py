@@ -0,0 +1,45 @@
+"""This module contains a function for determining the authentication
+    method and private key of a new cluster."""
+
+import os
+from typing import Optional, Tuple, Union
+
+from idact.core.auth import AuthMethod, KeyType
+from idact.detail.auth.generate_key import generate_key
+from idact.detail.log.get_logger import get_logger
+
+
+def get_auth_and_key(
+        host: str,
+        auth: Optional[AuthMethod],
+        key: Union[None, str, KeyType]) -> Tuple[AuthMethod,
+                                                 Optional[str]]:
+    """Returns the authentication method and private key path.
+        Defaults to password-based authentication, and generates
+        a key if a key type is specified.
+
+        :param host: Cluster access node hostname.
+
+        :param auth: Authentication method, or None.
+
+        :param key: Private key path, key type to generate, or None.
+
+        :raises ValueError: If the key is missing for public key
+                            authentication.
+
+    """
+    log = get_logger(__name__)
+    if auth is None:
+        log.info("No auth method specified, defaulting to password-based.")
+        auth = AuthMethod.ASK
+
+    if auth is AuthMethod.PUBLIC_KEY:
+        if isinstance(key, KeyType):
+            log.info("Generating public-private key pair.")
+            key = generate_key(host=host, key_type=key)
+        elif isinstance(key, str):
+            key = os.path.expanduser(key)
+        else:
+            raise ValueError("Invalid key argument for public key"
+                             " authentication.")
+    return auth, key
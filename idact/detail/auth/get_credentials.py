@@ -0,0 +1,37 @@
+"""This module contains a function for obtaining SSH credentials
+    according to the configuration, without using the Fabric environment."""
+
+from typing import Optional, Tuple
+
+from idact.core.auth import AuthMethod
+from idact.core.config import ClusterConfig
+from idact.detail.auth.authenticate import authenticate, FABRIC_ENV_LOCK
+from idact.detail.auth.get_password import get_password
+
+
+def get_credentials(config: ClusterConfig) -> Tuple[Optional[str],
+                                                    Optional[str]]:
+    """Returns the password and private key path to authenticate with.
+
+        If the public key still needs to be installed, it is installed
+        first using password authentication.
+
+        :param config: Cluster config.
+
+    """
+    if config.auth == AuthMethod.ASK:
+        # Key is needed between gateway and compute nodes even when using
+        # password-based authentication.
+        return get_password(config=config), config.key
+
+    if config.auth == AuthMethod.PUBLIC_KEY:
+        with FABRIC_ENV_LOCK:
+            if config.install_key:
+                with authenticate(host=config.host,
+                                  port=config.port,
+                                  config=config):
+                    pass
+        return None, config.key
+
+    raise NotImplementedError(
+        "Authentication method not implemented: '{}'.".format(config.auth))
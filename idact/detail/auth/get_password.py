@@ -2,19 +2,24 @@
     or by prompting the user."""
 
 import getpass
+import threading
 
 from idact.core.config import ClusterConfig
 from idact.detail.auth.get_host_string import get_host_string
 from idact.detail.auth.set_password import PasswordCache
 
+PASSWORD_PROMPT_LOCK = threading.Lock()
+
 
 def get_password(config: ClusterConfig) -> str:
     """Obtains the password from user input or password cache.
+        Only one thread at a time may prompt the user.
 
         :param config: Cluster config.
     """
-    if PasswordCache().password is not None:
-        return PasswordCache().password
+    with PASSWORD_PROMPT_LOCK:
+        if PasswordCache().password is not None:
+            return PasswordCache().password
 
-    return getpass.getpass("Password for {host_string}: ".format(
-        host_string=get_host_string(config=config)))
+        return getpass.getpass("Password for {host_string}: ".format(
+            host_string=get_host_string(config=config)))
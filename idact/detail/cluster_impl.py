@@ -10,16 +10,13 @@ from idact.core.config import ClusterConfig
 from idact.core.cluster import Cluster
 from idact.core.nodes import Nodes
 from idact.core.synchronized_deployments import SynchronizedDeployments
+from idact.core.transfer_stats import TransferStats
 from idact.core.walltime import Walltime
 from idact.detail.allocation.allocation_parameters import AllocationParameters
-from idact.detail.deployment_sync.add_deployment_definition import \
-    add_deployment_definition
-from idact.detail.deployment_sync.deployment_definitions import \
-    DeploymentDefinitions
 from idact.detail.deployment_sync.deployment_definitions_serialization import \
-    deserialize_deployment_definitions_from_cluster, \
-    deployment_definitions_file_exists, \
-    serialize_deployment_definitions_to_cluster, \
+    append_deployment_definition_to_cluster, \
+    compact_deployment_definitions_on_cluster, \
+    discard_deployment_definitions_on_cluster, \
     remove_serialized_deployment_definitions
 from idact.detail.deployment_sync.discard_expired_deployments import \
     discard_expired_deployments
@@ -36,6 +33,9 @@ from idact.detail.log.get_logger import get_logger
 from idact.detail.nodes.get_access_node import get_access_node
 from idact.detail.nodes.node_internal import NodeInternal
 from idact.detail.slurm.allocate_slurm_nodes import allocate_slurm_nodes
+from idact.detail.ssh.get_connection_key import get_connection_key
+from idact.detail.ssh.get_connection_pool import get_connection_pool
+from idact.detail.sync.sync_directory import sync_directory
 
 
 class ClusterImpl(Cluster):
@@ -105,43 +105,36 @@ class ClusterImpl(Cluster):
                                                 DaskDeployment]):
         log = get_logger(__name__)
         with stage_info(log, "Pushing deployment: %s", deployment):
-            log = get_logger(__name__)
             node = self.get_access_node()
-            if deployment_definitions_file_exists(node=node):
-                deployments = deserialize_deployment_definitions_from_cluster(
-                    node=node)
-            else:
-                log.debug(
-                    "No deployment definitions file, defaulting to empty.")
-                deployments = DeploymentDefinitions()
-
-            deployments = discard_expired_deployments(deployments)
-
-            add_deployment_definition(deployments=deployments,
-                                      deployment=deployment)
-
-            serialize_deployment_definitions_to_cluster(
-                node=node,
-                deployments=deployments)
+            append_deployment_definition_to_cluster(node=node,
+                                                    deployment=deployment)
 
     def pull_deployments(self) -> SynchronizedDeployments:
         log = get_logger(__name__)
         with stage_info(log, "Pulling deployments."):
             access_node = self.get_access_node()
-            if not deployment_definitions_file_exists(node=access_node):
+            all_deployments = compact_deployment_definitions_on_cluster(
+                node=access_node)
+            deployments = discard_expired_deployments(all_deployments)
+            discard_deployment_definitions_on_cluster(
+                node=access_node,
+                deployments=all_deployments,
+                kept=deployments)
+            if (not deployments.nodes
+                    and not deployments.jupyter_deployments
+                    and not deployments.dask_deployments):
                 log.info("No deployment definitions were found.")
                 return SynchronizedDeploymentsImpl(nodes=[])
 
-            deployments = deserialize_deployment_definitions_from_cluster(
-                node=access_node)
-            deployments = discard_expired_deployments(deployments)
             install_compute_node_access_key(access_node=access_node)
             materialized_deployments = materialize_deployments(
                 config=self._config,
                 access_node=access_node,
-                deployments=deployments)
+                deployments=deployments,
+                lazy=True)
             materialized_deployments = discard_non_functional_deployments(
-                deployments=materialized_deployments)
+                deployments=materialized_deployments,
+                access_node=access_node)
             return materialized_deployments
 
     def clear_pushed_deployments(self):
@@ -149,3 +142,23 @@ class ClusterImpl(Cluster):
         with stage_info(log, "Clearing deployments."):
             node = self.get_access_node()
             remove_serialized_deployment_definitions(node=node)
+
+    def close_connections(self):
+        log = get_logger(__name__)
+        log.debug("Closing connections to cluster: %s", self._name)
+        access_node = get_connection_key(host=self._config.host,
+                                         port=self._config.port,
+                                         config=self._config)
+        get_connection_pool().close_all(gateway=access_node)
+
+    def sync_directory(self,
+                       local_path: str,
+                       remote_path: str,
+                       delete: bool = False) -> TransferStats:
+        log = get_logger(__name__)
+        with stage_info(log, "Synchronizing %s to %s.",
+                        local_path, remote_path):
+            return sync_directory(node=self.get_access_node(),
+                                  local_path=local_path,
+                                  remote_path=remote_path,
+                                  delete=delete)
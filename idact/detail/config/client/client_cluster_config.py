@@ -7,19 +7,27 @@ from idact.core.config import ClusterConfig, RetryConfig
 from idact.core.retry import Retry
 from idact.detail.config.client.setup_actions_config import \
     SetupActionsConfigImpl
+from idact.detail.config.defaults.provide_defaults_for_options import \
+    provide_defaults_for_options
 from idact.detail.config.defaults.provide_defaults_for_retries import \
     provide_defaults_for_retries
 from idact.detail.config.validation.validate_hostname import validate_hostname
 from idact.detail.config.validation.validate_bool import validate_bool
 from idact.detail.config.validation.validate_key_path import validate_key_path
+from idact.detail.config.validation.validate_non_negative_int import \
+    validate_non_negative_int
 from idact.detail.config.validation.validate_notebook_defaults import \
     validate_notebook_defaults
 from idact.detail.config.validation.validate_port import validate_port
+from idact.detail.config.validation.validate_remote_shell import \
+    validate_remote_shell
 from idact.detail.config.validation.validate_retry_config_dict import \
     validate_retry_config_dict
 from idact.detail.config.validation.validate_scratch import validate_scratch
 from idact.detail.config.validation.validate_setup_actions_config import \
     validate_setup_actions_config
+from idact.detail.config.validation.validate_shell_environment import \
+    validate_shell_environment
 from idact.detail.config.validation.validate_username import validate_username
 
 
@@ -32,6 +40,9 @@ class ClusterConfigImpl(ClusterConfig):
 
         For notebook defaults, see :mod:`.jupyter_app.main`
 
+        Options following `use_jupyter_lab` are passed by keyword,
+        for their defaults see :func:`.provide_defaults_for_options`.
+
     """
 
     def __init__(self,
@@ -46,7 +57,8 @@ class ClusterConfigImpl(ClusterConfig):
                  scratch: Optional[str] = None,
                  notebook_defaults: Optional[dict] = None,
                  retries: Optional[Dict[Retry, RetryConfig]] = None,
-                 use_jupyter_lab: bool = True):
+                 use_jupyter_lab: bool = True,
+                 **kwargs):
         if install_key is None:
             install_key = True
         if disable_sshd is None:
@@ -63,6 +75,7 @@ class ClusterConfigImpl(ClusterConfig):
             use_jupyter_lab = True
 
         retries = provide_defaults_for_retries(retries)
+        options = provide_defaults_for_options(kwargs)
 
         self._host = None
         self.host = host
@@ -98,6 +111,21 @@ class ClusterConfigImpl(ClusterConfig):
         self._use_jupyter_lab = None
         self.use_jupyter_lab = use_jupyter_lab
 
+        self._watch_squeue = validate_bool(options['watch_squeue'],
+                                           'watch_squeue')
+        self._squeue_cache_ttl = validate_non_negative_int(
+            options['squeue_cache_ttl'],
+            'squeue_cache_ttl')
+        self._use_agent = validate_bool(options['use_agent'], 'use_agent')
+        self._remote_shell = validate_remote_shell(options['remote_shell'])
+        self._shell_environment = validate_shell_environment(
+            options['shell_environment'])
+        self._reserve_ports = validate_bool(options['reserve_ports'],
+                                            'reserve_ports')
+        self._health_check_interval = validate_non_negative_int(
+            options['health_check_interval'],
+            'health_check_interval')
+
     @property
     def host(self) -> str:
         return self._host
@@ -208,3 +236,62 @@ class ClusterConfigImpl(ClusterConfig):
     @use_jupyter_lab.setter
     def use_jupyter_lab(self, value: bool):
         self._use_jupyter_lab = validate_bool(value, 'use_jupyter_lab')
+
+    @property
+    def watch_squeue(self) -> bool:
+        return self._watch_squeue
+
+    @watch_squeue.setter
+    def watch_squeue(self, value: bool):
+        self._watch_squeue = validate_bool(value, 'watch_squeue')
+
+    @property
+    def squeue_cache_ttl(self) -> int:
+        return self._squeue_cache_ttl
+
+    @squeue_cache_ttl.setter
+    def squeue_cache_ttl(self, value: int):
+        self._squeue_cache_ttl = validate_non_negative_int(value,
+                                                           'squeue_cache_ttl')
+
+    @property
+    def use_agent(self) -> bool:
+        return self._use_agent
+
+    @use_agent.setter
+    def use_agent(self, value: bool):
+        self._use_agent = validate_bool(value, 'use_agent')
+
+    @property
+    def remote_shell(self) -> str:
+        return self._remote_shell
+
+    @remote_shell.setter
+    def remote_shell(self, value: str):
+        self._remote_shell = validate_remote_shell(value)
+
+    @property
+    def shell_environment(self) -> Dict[str, str]:
+        return self._shell_environment
+
+    @shell_environment.setter
+    def shell_environment(self, value: Dict[str, str]):
+        self._shell_environment = validate_shell_environment(value)
+
+    @property
+    def reserve_ports(self) -> bool:
+        return self._reserve_ports
+
+    @reserve_ports.setter
+    def reserve_ports(self, value: bool):
+        self._reserve_ports = validate_bool(value, 'reserve_ports')
+
+    @property
+    def health_check_interval(self) -> int:
+        return self._health_check_interval
+
+    @health_check_interval.setter
+    def health_check_interval(self, value: int):
+        self._health_check_interval = validate_non_negative_int(
+            value,
+            'health_check_interval')
@@ -43,7 +43,15 @@ def serialize_client_config_to_json(config: ClientConfig) -> dict:
                    'scratch': cluster_config.scratch,
                    'notebookDefaults': get_notebook_defaults(cluster_config),
                    'retries': serialize_retries(cluster_config.retries),
-                   'useJupyterLab': cluster_config.use_jupyter_lab}
+                   'useJupyterLab': cluster_config.use_jupyter_lab,
+                   'watchSqueue': cluster_config.watch_squeue,
+                   'squeueCacheTtl': cluster_config.squeue_cache_ttl,
+                   'useAgent': cluster_config.use_agent,
+                   'remoteShell': cluster_config.remote_shell,
+                   'shellEnvironment': cluster_config.shell_environment,
+                   'reservePorts': cluster_config.reserve_ports,
+                   'healthCheckInterval':
+                       cluster_config.health_check_interval}
             for name, cluster_config in config.clusters.items()},
         'logLevel': config.log_level}
 
@@ -70,13 +78,20 @@ def use_defaults_in_missing_fields(data: dict) -> bool:
                     'installKey',
                     'disableSshd',
                     'scratch',
-                    'useJupyterLab']:
+                    'useJupyterLab',
+                    'watchSqueue',
+                    'squeueCacheTtl',
+                    'useAgent',
+                    'remoteShell',
+                    'reservePorts',
+                    'healthCheckInterval']:
             default(cluster, key, None)
         default(cluster, 'setupActions', {})
         default(cluster['setupActions'], 'jupyter', None)
         default(cluster['setupActions'], 'dask', None)
         default(cluster, 'notebookDefaults', {})
         default(cluster, 'retries', {})
+        default(cluster, 'shellEnvironment', {})
 
     return len(modified) != 0
 
@@ -108,7 +123,14 @@ def deserialize_client_config_from_json(data: dict) -> ClientConfig:
             notebook_defaults=value['notebookDefaults'],
             retries=provide_defaults_for_retries(
                 deserialize_retries(value['retries'])),
-            use_jupyter_lab=value['useJupyterLab']
+            use_jupyter_lab=value['useJupyterLab'],
+            watch_squeue=value['watchSqueue'],
+            squeue_cache_ttl=value['squeueCacheTtl'],
+            use_agent=value['useAgent'],
+            remote_shell=value['remoteShell'],
+            shell_environment=value['shellEnvironment'],
+            reserve_ports=value['reservePorts'],
+            health_check_interval=value['healthCheckInterval']
         ) for name, value in data['clusters'].items()}
     return ClientConfig(clusters=clusters,
                         log_level=data['logLevel'])
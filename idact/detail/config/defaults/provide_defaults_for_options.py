@@ -0,0 +1,36 @@
+"""This module contains a function for providing defaults for cluster
+    config options passed by keyword."""
+
+import copy
+from typing import Any, Dict
+
+from idact.detail.ssh.get_remote_command import DEFAULT_REMOTE_SHELL
+
+CLUSTER_OPTION_DEFAULTS = {'watch_squeue': False,
+                           'squeue_cache_ttl': 1,
+                           'use_agent': False,
+                           'remote_shell': DEFAULT_REMOTE_SHELL,
+                           'shell_environment': {},
+                           'reserve_ports': False,
+                           'health_check_interval': 0}
+"""Defaults of cluster config options passed by keyword,
+   see :class:`.ClusterConfigImpl`."""
+
+
+def provide_defaults_for_options(options: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns cluster config options with defaults for missing options,
+        and options set to None.
+
+        :param options: Options passed by keyword.
+
+        :raises TypeError: On an unknown option.
+
+    """
+    unknown = sorted(set(options) - set(CLUSTER_OPTION_DEFAULTS))
+    if unknown:
+        raise TypeError("Unknown cluster config options: {}.".format(
+            ', '.join(unknown)))
+    return {name: (copy.deepcopy(default)
+                   if options.get(name) is None
+                   else options[name])
+            for name, default in CLUSTER_OPTION_DEFAULTS.items()}
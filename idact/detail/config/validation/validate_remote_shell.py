@@ -0,0 +1,40 @@
+"""This module contains a function for validating a remote shell
+    config entry."""
+
+import re
+
+from idact.detail.config.validation.validation_error_message import \
+    validation_error_message
+
+VALID_REMOTE_SHELL_REGEX = r"^([^\n]* -[a-zA-Z]*c)?\Z"
+VALID_REMOTE_SHELL_DESCRIPTION = ("Empty, or one line ending with the"
+                                  " `-c` option of a POSIX shell.")
+__COMPILED = re.compile(pattern=VALID_REMOTE_SHELL_REGEX)
+
+
+def validate_remote_shell(value) -> str:
+    """Returns the parameter, if it's a valid remote shell invocation,
+        otherwise raises an exception.
+
+        A valid remote shell invocation is a string matching
+        :attr:`.VALID_REMOTE_SHELL_REGEX`.
+
+        :param value: Object to validate.
+
+        :raises TypeError: On wrong type.
+
+        :raises ValueError: On regex mismatch.
+
+    """
+    if not isinstance(value, str):
+        raise TypeError(validation_error_message(
+            label='remote_shell',
+            value=value))
+
+    if not __COMPILED.match(value):
+        raise ValueError(validation_error_message(
+            label='remote_shell',
+            value=value,
+            expected=VALID_REMOTE_SHELL_DESCRIPTION,
+            regex=VALID_REMOTE_SHELL_REGEX))
+    return value
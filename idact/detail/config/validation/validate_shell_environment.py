@@ -0,0 +1,44 @@
+"""This module contains a function for validating a shell environment
+    config entry."""
+
+import re
+from typing import Dict
+
+from idact.detail.config.validation.validation_error_message import \
+    validation_error_message
+
+VALID_SHELL_ENVIRONMENT_DESCRIPTION = 'Dict of strings, by variable name.'
+
+VALID_VARIABLE_NAME_REGEX = r"^[A-Za-z_][A-Za-z0-9_]*$"
+__COMPILED = re.compile(pattern=VALID_VARIABLE_NAME_REGEX)
+
+
+def validate_shell_environment(value) -> Dict[str, str]:
+    """Returns the parameter, if it's a valid shell environment, otherwise
+        raises an exception.
+
+        A valid shell environment is a dict of strings, with keys
+        matching :attr:`.VALID_VARIABLE_NAME_REGEX`.
+
+        :param value: Object to validate.
+
+        :raises TypeError: On wrong type.
+
+        :raises ValueError: On invalid variable name.
+
+    """
+    if not isinstance(value, dict) or not all(
+            isinstance(name, str) and isinstance(variable, str)
+            for name, variable in value.items()):
+        raise TypeError(validation_error_message(
+            label='shell_environment',
+            value=value,
+            expected=VALID_SHELL_ENVIRONMENT_DESCRIPTION))
+
+    for name in value:
+        if not __COMPILED.match(name):
+            raise ValueError(validation_error_message(
+                label='shell_environment',
+                value=name,
+                regex=VALID_VARIABLE_NAME_REGEX))
+    return value
@@ -3,23 +3,45 @@
 
 import shlex
 
+from idact.core.config import ClusterConfig
 from idact.detail.nodes.node_internal import NodeInternal
 
 SCRATCH_SUBDIR = ".idact-scratch"
 
 
-def get_scratch_from_environment_variable(node: NodeInternal) -> str:
-    """Returns the scratch path by getting the value of the environment
-        variable defined in config.
+def get_scratch_subdir_expression(config: ClusterConfig) -> str:
+    """Returns a shell expression that evaluates to the scratch subdir path.
 
-        :param node: Node to get the environment variable from.
+        If the scratch is an environment variable, it is expanded
+        on the node, and must be set.
+
+        :param config: Cluster config.
 
     """
-    assert node.config.scratch.startswith('$')
-    variable_name = node.config.scratch[1:]
-    variable_name_quoted = shlex.quote(variable_name)
-    scratch = node.run("printenv {}".format(variable_name_quoted))
-    return scratch
+    if config.scratch.startswith('/'):
+        return shlex.quote("{scratch}/{subdir}".format(
+            scratch=config.scratch,
+            subdir=SCRATCH_SUBDIR))
+
+    assert config.scratch.startswith('$')
+    variable_name = config.scratch[1:]
+    return '"${{{variable_name}:?}}"/{subdir}'.format(
+        variable_name=variable_name,
+        subdir=SCRATCH_SUBDIR)
+
+
+def get_create_scratch_subdir_command(config: ClusterConfig) -> str:
+    """Returns a command that creates the scratch subdir and prints
+        its canonical path.
+
+        :param config: Cluster config.
+
+    """
+    scratch_subdir = get_scratch_subdir_expression(config=config)
+    return ("mkdir -p {scratch_subdir}"
+            " && chmod 700 {scratch_subdir}"
+            " && readlink -vf {scratch_subdir}".format(
+                scratch_subdir=scratch_subdir))
 
 
 def create_scratch_subdir(node: NodeInternal) -> str:
@@ -31,20 +53,4 @@ def create_scratch_subdir(node: NodeInternal) -> str:
         :param node: Node to create the scratch subdir on.
 
     """
-    if node.config.scratch.startswith('/'):
-        scratch = node.config.scratch
-    else:
-        scratch = get_scratch_from_environment_variable(node=node)
-
-    scratch_subdir = shlex.quote(
-        "{scratch}/{subdir}".format(
-            scratch=scratch,
-            subdir=SCRATCH_SUBDIR))
-    node.run(
-        "mkdir -p {scratch_subdir}"
-        " && chmod 700 {scratch_subdir}".format(
-            scratch_subdir=scratch_subdir))
-    scratch_subdir_realpath = node.run("readlink -vf {}".format(
-        scratch_subdir))
-
-    return scratch_subdir_realpath
+    return node.run(get_create_scratch_subdir_command(config=node.config))
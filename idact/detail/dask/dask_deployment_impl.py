@@ -1,5 +1,6 @@
 """This module contains the implementation of the Dask deployment interface."""
 
+import datetime
 from contextlib import ExitStack
 
 from typing import List, Optional
@@ -13,12 +14,18 @@ from idact.detail.dask.dask_scheduler_deployment import DaskSchedulerDeployment
 from idact.detail.dask.dask_worker_deployment import DaskWorkerDeployment
 from idact.detail.deployment.cancel_on_exit import cancel_on_exit, \
     cancel_local_on_exit
+from idact.detail.health.get_health_status import get_health_status
+from idact.detail.health.health_checkable import HealthCheckable
 from idact.detail.helper.get_uuid import get_uuid
 from idact.detail.serialization.serializable import Serializable
 from idact.detail.serialization.serializable_types import SerializableTypes
+from idact.detail.tunnel.probe_tunnel_http_connection import \
+    probe_tunnel_http_connection
 
 
-class DaskDeploymentImpl(DaskDeployment, Serializable):
+class DaskDeploymentImpl(DaskDeployment,
+                         Serializable,
+                         HealthCheckable):
     """Implementation of :class:`DaskDeployment`.
 
         :param scheduler: Scheduler deployment.
@@ -54,6 +61,24 @@ class DaskDeploymentImpl(DaskDeployment, Serializable):
         """Scheduler deployment."""
         return self._scheduler
 
+    @property
+    def is_alive(self) -> Optional[bool]:
+        return get_health_status(
+            deployment=self,
+            uuid=self._uuid,
+            config=self._scheduler.deployment.node.config).is_alive
+
+    @property
+    def last_seen(self) -> Optional[datetime.datetime]:
+        return get_health_status(
+            deployment=self,
+            uuid=self._uuid,
+            config=self._scheduler.deployment.node.config).last_seen
+
+    def check_health(self) -> Optional[bool]:
+        return probe_tunnel_http_connection(
+            tunnel=self._scheduler.bokeh_tunnel)
+
     def cancel(self):
         with ExitStack() as stack:
             stack.enter_context(cancel_on_exit(self._scheduler))
@@ -14,13 +14,16 @@ from idact.detail.dask.validate_worker import validate_worker
 from idact.detail.deployment.cancel_on_exit import cancel_on_exit
 from idact.detail.deployment.cancel_on_failure import cancel_on_failure
 from idact.detail.helper.retry import retry_with_config
+from idact.detail.helper.run_in_parallel import run_in_parallel, \
+    DEFAULT_MAX_PARALLEL
 from idact.detail.helper.stage_info import stage_info
 from idact.detail.log.get_logger import get_logger
 from idact.detail.nodes.node_internal import NodeInternal
 
 
 def connect_to_each_node(nodes: Sequence[Node],
-                         config: ClusterConfig):
+                         config: ClusterConfig,
+                         max_parallel: int = DEFAULT_MAX_PARALLEL):
     """Connects to each node to make sure any connection issues come up
         before attempting to actually deploy anything.
 
@@ -28,10 +31,15 @@ def connect_to_each_node(nodes: Sequence[Node],
 
          :param config: Cluster config.
 
+         :param max_parallel: Maximum number of nodes to connect to
+                              at the same time.
+
     """
     log = get_logger(__name__)
     node_count = len(nodes)
-    for i, node in enumerate(nodes):
+
+    def connect(i: int):
+        node = nodes[i]
         with stage_info(log,
                         "Connecting to %s:%d (%d/%d).",
                         node.host, node.port,
@@ -40,10 +48,16 @@ def connect_to_each_node(nodes: Sequence[Node],
                               name=Retry.DASK_NODE_CONNECT,
                               config=config)
 
+    run_in_parallel(connect,
+                    range(node_count),
+                    max_parallel=max_parallel)
+
 
-def check_scheduler_reachable_from_nodes(nodes: Sequence[Node],
-                                         scheduler: DaskSchedulerDeployment,
-                                         config: ClusterConfig):
+def check_scheduler_reachable_from_nodes(
+        nodes: Sequence[Node],
+        scheduler: DaskSchedulerDeployment,
+        config: ClusterConfig,
+        max_parallel: int = DEFAULT_MAX_PARALLEL):  # noqa, pylint: disable=bad-continuation
     """Checks whether connection to the scheduler is possible from each node,
         before deploying workers.
 
@@ -53,20 +67,29 @@ def check_scheduler_reachable_from_nodes(nodes: Sequence[Node],
 
          :param config: Cluster config.
 
+         :param max_parallel: Maximum number of nodes to check
+                              at the same time.
+
     """
     log = get_logger(__name__)
     node_count = len(nodes)
-    for i, node in enumerate(nodes):
+
+    def check(i: int):
+        node = nodes[i]
         with stage_info(log,
                         "Checking scheduler connectivity from %s (%d/%d).",
                         node.host,
                         i + 1, node_count):
-            retry_with_config(lambda n=node:
-                              check_scheduler_reachable(node=n,
+            retry_with_config(lambda:
+                              check_scheduler_reachable(node=node,
                                                         scheduler=scheduler),
                               name=Retry.SCHEDULER_CONNECT,
                               config=config)
 
+    run_in_parallel(check,
+                    range(node_count),
+                    max_parallel=max_parallel)
+
 
 # pylint: disable=bad-continuation,bad-whitespace
 def deploy_scheduler_on_first_node(
@@ -119,7 +142,8 @@ def deploy_worker_on_node(node: Node,
 
 def deploy_workers_on_each_node(nodes: Sequence[Node],
                                 scheduler: DaskSchedulerDeployment,
-                                stack: ExitStack) \
+                                stack: ExitStack,
+                                max_parallel: int = DEFAULT_MAX_PARALLEL) \
     -> List[
         DaskWorkerDeployment]:
     """Deploys workers on each node.
@@ -128,25 +152,35 @@ def deploy_workers_on_each_node(nodes: Sequence[Node],
 
         :param scheduler: Scheduler for workers.
 
-        :param stack: Exit stack. Workers will be cancelled on failure.
+        :param stack: Exit stack. Workers will be cancelled on failure,
+                      including workers deployed successfully while
+                      deployment on another node failed.
+
+        :param max_parallel: Maximum number of workers to deploy
+                             at the same time.
 
     """
     log = get_logger(__name__)
-    workers = []
     with stage_info(log, "Deploying workers."):
         total = len(nodes)
-        for i, node in enumerate(nodes):
-            worker = deploy_worker_on_node(node=node,
-                                           scheduler=scheduler,
-                                           worker_number=i + 1,
-                                           worker_count=total)
-            stack.enter_context(cancel_on_failure(worker))
-            workers.append(worker)
-    return workers
+
+        def deploy(i: int) -> DaskWorkerDeployment:
+            return deploy_worker_on_node(node=nodes[i],
+                                         scheduler=scheduler,
+                                         worker_number=i + 1,
+                                         worker_count=total)
+
+        return run_in_parallel(
+            deploy,
+            range(total),
+            max_parallel=max_parallel,
+            on_result=lambda worker: stack.enter_context(
+                cancel_on_failure(worker)))
 
 
 def discard_invalid_workers(workers: List[DaskWorkerDeployment],
-                            stack: ExitStack) \
+                            stack: ExitStack,
+                            max_parallel: int = DEFAULT_MAX_PARALLEL) \
     -> Tuple[
         List[DaskWorkerDeployment],
         List[Node]]:
@@ -157,19 +191,33 @@ def discard_invalid_workers(workers: List[DaskWorkerDeployment],
 
         :param stack: Exit stack. Failed workers will be cancelled on exit.
 
+        :param max_parallel: Maximum number of workers to validate
+                             at the same time.
+
     """
     log = get_logger(__name__)
-    valid_workers = []
-    nodes_to_redeploy = []
     worker_count = len(workers)
-    for i, worker in enumerate(workers):
+
+    def is_valid(i: int) -> bool:
         try:
             with stage_info(log, "Validating worker %d/%d.",
                             i + 1, worker_count):
-                validate_worker(worker=worker)
-            valid_workers.append(worker)
+                validate_worker(worker=workers[i])
+            return True
         except Exception:  # noqa, pylint: disable=broad-except
             log.debug("Failed to validate worker. Exception:", exc_info=1)
+            return False
+
+    validation_results = run_in_parallel(is_valid,
+                                         range(worker_count),
+                                         max_parallel=max_parallel)
+
+    valid_workers = []
+    nodes_to_redeploy = []
+    for worker, valid in zip(workers, validation_results):
+        if valid:
+            valid_workers.append(worker)
+        else:
             nodes_to_redeploy.append(worker.deployment.node)
             stack.enter_context(cancel_on_exit(worker))
 
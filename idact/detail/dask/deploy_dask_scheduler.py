@@ -3,27 +3,25 @@
 import re
 from contextlib import ExitStack
 
-import fabric.decorators
-
 from idact.core.retry import Retry
-from idact.detail.dask.create_scratch_dir import create_scratch_subdir
+from idact.detail.dask.create_scratch_dir import \
+    get_create_scratch_subdir_command
 from idact.detail.dask.dask_scheduler_deployment import DaskSchedulerDeployment
 from idact.detail.dask.get_scheduler_deployment_script import \
     get_scheduler_deployment_script
 from idact.detail.deployment.cancel_on_failure import cancel_on_failure
-from idact.detail.deployment.create_deployment_dir import create_runtime_dir
-from idact.detail.deployment.create_log_file import create_log_file
+from idact.detail.deployment.create_deployment_dir import \
+    get_random_runtime_dir
 from idact.detail.deployment.deploy_generic import deploy_generic
-from idact.detail.helper.get_free_remote_port import get_free_remote_ports
-from idact.detail.helper.get_remote_file import get_remote_file
+from idact.detail.deployment.deployment_resources import DeploymentResources
+from idact.detail.helper.get_remote_file import get_file_from_node
 from idact.detail.helper.remove_runtime_dir \
     import remove_runtime_dir_on_failure
 from idact.detail.helper.retry import retry_with_config
 from idact.detail.helper.stage_info import stage_debug
-from idact.detail.log.capture_fabric_output_to_log import \
-    capture_fabric_output_to_log
 from idact.detail.log.get_logger import get_logger
 from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.ssh.command_batch import CommandBatch
 from idact.detail.tunnel.close_tunnel_on_failure import close_tunnel_on_failure
 
 SCHEDULER_AT_REGEX = r"Scheduler at:\s+?([^\s]+)$"
@@ -53,46 +51,51 @@ def deploy_dask_scheduler(node: NodeInternal) -> DaskSchedulerDeployment:
     log = get_logger(__name__)
 
     with ExitStack() as stack:
-        with stage_debug(log, "Creating a runtime dir."):
-            runtime_dir = create_runtime_dir(node=node)
+        with stage_debug(log, "Creating a runtime dir, a log file,"
+                              " a scratch subdirectory and obtaining"
+                              " free remote ports."):
+            batch = CommandBatch()
+            unresolved_runtime_dir = get_random_runtime_dir()
             stack.enter_context(
-                remove_runtime_dir_on_failure(node=node,
-                                              runtime_dir=runtime_dir))
-
-        with stage_debug(log, "Obtaining free remote ports."):
-            remote_port, bokeh_port = get_free_remote_ports(count=2, node=node)
-
-        with stage_debug(log, "Creating a scratch subdirectory."):
-            scratch_subdir = create_scratch_subdir(node=node)
-
-        log_file = create_log_file(node=node, runtime_dir=runtime_dir)
+                remove_runtime_dir_on_failure(
+                    node=node,
+                    runtime_dir=unresolved_runtime_dir))
+            resources = DeploymentResources(
+                batch=batch,
+                runtime_dir=unresolved_runtime_dir,
+                port_count=2,
+                reserve_ports=node.config.reserve_ports)
+            create_scratch_subdir = batch.add(
+                get_create_scratch_subdir_command(config=node.config))
+            batch.run(node=node)
+            remote_port, bokeh_port = resources.ports
 
         script_contents = get_scheduler_deployment_script(
             remote_port=remote_port,
             bokeh_port=bokeh_port,
-            scratch_subdir=scratch_subdir,
-            log_file=log_file,
-            config=node.config)
+            scratch_subdir=create_scratch_subdir.output,
+            log_file=resources.log_file,
+            config=node.config,
+            reservation_file=resources.reservation_file)
 
         log.debug("Deployment script contents: %s", script_contents)
 
         with stage_debug(log, "Deploying script."):
             deployment = deploy_generic(node=node,
                                         script_contents=script_contents,
-                                        runtime_dir=runtime_dir)
+                                        runtime_dir=resources.runtime_dir)
             stack.enter_context(cancel_on_failure(deployment))
 
-        @fabric.decorators.task
         def extract_address_from_log() -> str:
             """Extracts scheduler address from a log file."""
-            with capture_fabric_output_to_log():
-                output = get_remote_file(remote_path=log_file)
+            output = get_file_from_node(node=node,
+                                        remote_path=resources.log_file)
             log.debug("Log file: %s", output)
             return extract_address_from_output(output=output)
 
         with stage_debug(log, "Obtaining scheduler address."):
             address = retry_with_config(
-                lambda: node.run_task(task=extract_address_from_log),
+                extract_address_from_log,
                 name=Retry.GET_SCHEDULER_ADDRESS,
                 config=node.config)
 
@@ -2,19 +2,23 @@
     script."""
 
 import shlex
+from typing import Optional
 
 from idact.core.config import ClusterConfig
 from idact.detail.deployment.get_command_to_append_local_bin import \
     get_command_to_append_local_bin
 from idact.detail.deployment.get_deployment_script_contents import \
     get_deployment_script_contents
+from idact.detail.helper.get_free_remote_port import \
+    get_release_remote_ports_command
 
 
 def get_scheduler_deployment_script(remote_port: int,
                                     bokeh_port: int,
                                     scratch_subdir: str,
                                     log_file: str,
-                                    config: ClusterConfig) -> str:
+                                    config: ClusterConfig,
+                                    reservation_file: Optional[str] = None) -> str:  # noqa, pylint: disable=line-too-long
     """Returns the deployment script for dask scheduler.
 
         :param remote_port:    Scheduler port.
@@ -22,10 +26,15 @@ def get_scheduler_deployment_script(remote_port: int,
         :param scratch_subdir: Scratch directory.
         :param log_file:       Log file path.
         :param config:         Cluster config.
+        :param reservation_file: Reservation file of the ports to release
+                                 before starting the scheduler.
 
     """
-    deployment_commands = [
-        get_command_to_append_local_bin(),
+    deployment_commands = [get_command_to_append_local_bin()]
+    if reservation_file is not None:
+        deployment_commands.append(get_release_remote_ports_command(
+            reservation_file=reservation_file))
+    deployment_commands.append(
         'dask-scheduler'
         ' --host 0.0.0.0'
         ' --port {remote_port}'
@@ -37,7 +46,7 @@ def get_scheduler_deployment_script(remote_port: int,
             remote_port=remote_port,
             bokeh_port=bokeh_port,
             scratch_subdir=shlex.quote(scratch_subdir),
-            log_file=log_file)]
+            log_file=log_file))
 
     script_contents = get_deployment_script_contents(
         deployment_commands=deployment_commands,
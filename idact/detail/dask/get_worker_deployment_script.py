@@ -2,6 +2,7 @@
     script."""
 
 import shlex
+from typing import Optional
 import bitmath
 
 from idact.core.config import ClusterConfig
@@ -9,6 +10,8 @@ from idact.detail.deployment.get_command_to_append_local_bin import \
     get_command_to_append_local_bin
 from idact.detail.deployment.get_deployment_script_contents import \
     get_deployment_script_contents
+from idact.detail.helper.get_free_remote_port import \
+    get_release_remote_ports_command
 
 
 def get_worker_deployment_script(scheduler_address: str,
@@ -17,7 +20,8 @@ def get_worker_deployment_script(scheduler_address: str,
                                  log_file: str,
                                  cores: int,
                                  memory_limit: bitmath.Byte,
-                                 config: ClusterConfig) -> str:
+                                 config: ClusterConfig,
+                                 reservation_file: Optional[str] = None) -> str:  # noqa, pylint: disable=line-too-long
     """Returns the deployment script for dask worker.
 
         :param scheduler_address: Scheduler address.
@@ -27,10 +31,15 @@ def get_worker_deployment_script(scheduler_address: str,
         :param cores:             Node core count / worker thread count.
         :param memory_limit:      Node allocated memory / worker memory limit.
         :param config:            Cluster config.
+        :param reservation_file:  Reservation file of the port to release
+                                  before starting the worker.
 
     """
-    deployment_commands = [
-        get_command_to_append_local_bin(),
+    deployment_commands = [get_command_to_append_local_bin()]
+    if reservation_file is not None:
+        deployment_commands.append(get_release_remote_ports_command(
+            reservation_file=reservation_file))
+    deployment_commands.append(
         'dask-worker'
         ' {scheduler_address}'
         ' --host 0.0.0.0'
@@ -48,7 +57,7 @@ def get_worker_deployment_script(scheduler_address: str,
             cores=cores,
             bytes=memory_limit.bytes,
             scratch_subdir=shlex.quote(scratch_subdir),
-            log_file=log_file)]
+            log_file=log_file))
 
     script_contents = get_deployment_script_contents(
         deployment_commands=deployment_commands,
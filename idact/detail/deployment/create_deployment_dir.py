@@ -7,6 +7,28 @@ DEPLOYMENT_ID_LENGTH = 32
 DEPLOYMENT_RUNTIME_DIR_FORMAT = "~/.idact/runtime/{deployment_id}"
 
 
+def get_random_runtime_dir() -> str:
+    """Returns a random runtime dir path, with `~` not expanded.
+
+        See :attr:`.DEPLOYMENT_RUNTIME_DIR_FORMAT`.
+
+    """
+    deployment_id = get_random_file_name(length=DEPLOYMENT_ID_LENGTH)
+    return DEPLOYMENT_RUNTIME_DIR_FORMAT.format(deployment_id=deployment_id)
+
+
+def get_create_runtime_dir_command(runtime_dir: str) -> str:
+    """Returns a command that creates the runtime dir and prints
+        its canonical path.
+
+        :param runtime_dir: Runtime dir, see :func:`.get_random_runtime_dir`.
+
+    """
+    return ("mkdir -p {runtime_dir}"
+            " && chmod 700 {runtime_dir}"
+            " && readlink -vf {runtime_dir}".format(runtime_dir=runtime_dir))
+
+
 def create_runtime_dir(node: NodeInternal) -> str:
     """Creates and returns the path to a random dir on node.
 
@@ -16,14 +38,5 @@ def create_runtime_dir(node: NodeInternal) -> str:
         :param node: Node to create a runtime dir on.
 
     """
-    deployment_id = get_random_file_name(length=DEPLOYMENT_ID_LENGTH)
-    formatted_runtime_dir = DEPLOYMENT_RUNTIME_DIR_FORMAT.format(
-        deployment_id=deployment_id)
-
-    node.run(
-        "mkdir -p {formatted_runtime_dir}"
-        " && chmod 700 {formatted_runtime_dir}".format(
-            formatted_runtime_dir=formatted_runtime_dir))
-    runtime_dir = node.run("readlink -vf {}".format(formatted_runtime_dir))
-
-    return runtime_dir
+    return node.run(get_create_runtime_dir_command(
+        runtime_dir=get_random_runtime_dir()))
@@ -3,6 +3,26 @@ from idact.detail.helper.stage_info import stage_debug
 from idact.detail.log.get_logger import get_logger
 
 
+def get_log_file_path(runtime_dir: str) -> str:
+    """Returns the log file path in the runtime dir.
+
+        :param runtime_dir: Runtime dir path.
+
+    """
+    return '{runtime_dir}/log'.format(runtime_dir=runtime_dir)
+
+
+def get_create_log_file_command(log_file: str) -> str:
+    """Returns a command that creates the log file.
+
+        :param log_file: Log file path. Quoted, unless it starts with `~`.
+
+    """
+    if log_file.startswith('~'):
+        return "touch {}".format(log_file)
+    return "touch '{}'".format(log_file)
+
+
 def create_log_file(node: Node, runtime_dir: str) -> str:
     """Creates a log file in the runtime dir.
 
@@ -12,7 +32,7 @@ def create_log_file(node: Node, runtime_dir: str) -> str:
 
     """
     log = get_logger(__name__)
-    log_file = '{runtime_dir}/log'.format(runtime_dir=runtime_dir)
+    log_file = get_log_file_path(runtime_dir=runtime_dir)
     with stage_debug(log, "Creating log file: '%s'.", log_file):
-        node.run("touch '{}'".format(log_file))
+        node.run(get_create_log_file_command(log_file=log_file))
         return log_file
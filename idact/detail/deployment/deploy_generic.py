@@ -3,10 +3,13 @@
 from idact.detail.deployment.generic_deployment import GenericDeployment
 from idact.detail.deployment.get_deployment_command import \
     get_deployment_command
-from idact.detail.entry_point.upload_entry_point import upload_entry_point
+from idact.detail.entry_point.upload_entry_point import \
+    add_upload_entry_point, get_entry_point_path, \
+    warn_if_entry_point_overwritten
 from idact.detail.helper.stage_info import stage_debug
 from idact.detail.log.get_logger import get_logger
 from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.ssh.command_batch import CommandBatch
 
 
 def deploy_generic(node: NodeInternal,
@@ -14,6 +17,9 @@ def deploy_generic(node: NodeInternal,
                    runtime_dir: str) -> GenericDeployment:
     """Deploys a program on the node.
 
+        Uploads the entry point and executes the deployment command
+        in a single batch, see :class:`.CommandBatch`.
+
         :param node: Node to deploy the program on.
 
         :param script_contents: Deployment script contents.
@@ -22,16 +28,20 @@ def deploy_generic(node: NodeInternal,
 
     """
     log = get_logger(__name__)
-    with stage_debug(log, "Uploading entry point."):
-        script_path = upload_entry_point(contents=script_contents,
-                                         node=node,
-                                         runtime_dir=runtime_dir)
-
-    with stage_debug(log, "Executing the deployment command."):
-        output = node.run(get_deployment_command(
+    script_path = get_entry_point_path(runtime_dir=runtime_dir)
+    with stage_debug(log, "Uploading entry point and executing"
+                          " the deployment command."):
+        batch = CommandBatch()
+        upload = add_upload_entry_point(batch=batch,
+                                        contents=script_contents,
+                                        script_path=script_path)
+        deployment_command = batch.add(get_deployment_command(
             script_path=script_path))
+        batch.run(node=node)
 
-    lines = output.splitlines()
+    warn_if_entry_point_overwritten(upload=upload,
+                                    script_path=script_path)
+    lines = deployment_command.output.splitlines()
     pid = int(lines[0])
     return GenericDeployment(node=node,
                              pid=pid,
@@ -0,0 +1,75 @@
+"""This module contains the resources prepared on a node before
+    a deployment."""
+
+from typing import List, Optional
+
+from idact.detail.deployment.create_deployment_dir import \
+    get_create_runtime_dir_command
+from idact.detail.deployment.create_log_file import \
+    get_create_log_file_command, get_log_file_path
+from idact.detail.helper.get_free_remote_port import \
+    get_free_remote_ports_command, get_port_reservation_file_path, \
+    parse_free_remote_ports
+from idact.detail.ssh.command_batch import CommandBatch
+
+
+class DeploymentResources:
+    """Runtime dir, log file and free remote ports for a deployment,
+        queued in a command batch.
+
+        Properties are available after the batch is run.
+
+        :param batch: Batch to queue the commands in.
+
+        :param runtime_dir: Unresolved runtime dir path,
+                            see :func:`.get_random_runtime_dir`.
+
+        :param port_count: Number of free remote ports to obtain.
+
+        :param reserve_ports: Reserve the ports until released by the
+                              deployment, see :attr:`.reservation_file`.
+
+    """
+
+    def __init__(self,
+                 batch: CommandBatch,
+                 runtime_dir: str,
+                 port_count: int,
+                 reserve_ports: bool):
+        self._port_count = port_count
+        self._reserve_ports = reserve_ports
+        self._create_runtime_dir = batch.add(get_create_runtime_dir_command(
+            runtime_dir=runtime_dir))
+        batch.add(get_create_log_file_command(
+            log_file=get_log_file_path(runtime_dir=runtime_dir)))
+        reservation_file = None
+        if reserve_ports:
+            reservation_file = get_port_reservation_file_path(
+                runtime_dir=runtime_dir)
+        self._free_remote_ports = batch.add(get_free_remote_ports_command(
+            count=port_count,
+            reservation_file=reservation_file))
+
+    @property
+    def runtime_dir(self) -> str:
+        """Resolved runtime dir path."""
+        return self._create_runtime_dir.output
+
+    @property
+    def log_file(self) -> str:
+        """Log file path in the runtime dir."""
+        return get_log_file_path(runtime_dir=self.runtime_dir)
+
+    @property
+    def ports(self) -> List[int]:
+        """Free remote ports."""
+        return parse_free_remote_ports(output=self._free_remote_ports.output,
+                                       count=self._port_count)
+
+    @property
+    def reservation_file(self) -> Optional[str]:
+        """File holding the port reservation in the runtime dir,
+            or None if ports are not reserved."""
+        if not self._reserve_ports:
+            return None
+        return get_port_reservation_file_path(runtime_dir=self.runtime_dir)
@@ -1,18 +1,47 @@
-from typing import Union
+from typing import Tuple, Union
 
 from idact.core.nodes import Nodes
 from idact.core.jupyter_deployment import JupyterDeployment
 from idact.core.dask_deployment import DaskDeployment
 from idact.detail.dask.dask_deployment_impl import DaskDeploymentImpl
+from idact.detail.deployment_sync.dask_deployments.lazy_dask_deployment \
+    import LazyDaskDeployment
 from idact.detail.deployment_sync.get_deployment_definition \
     import get_deployment_definition
 from idact.detail.deployment_sync.deployment_definitions import \
     DeploymentDefinitions
+from idact.detail.deployment_sync.jupyter_deployments. \
+    lazy_jupyter_deployment import LazyJupyterDeployment
 from idact.detail.jupyter.jupyter_deployment_impl import JupyterDeploymentImpl
 from idact.detail.log.get_logger import get_logger
 from idact.detail.nodes.nodes_impl import NodesImpl
 
 
+def get_deployment_kind_and_uuid(deployment: Union[Nodes,
+                                                   JupyterDeployment,
+                                                   DaskDeployment]) -> Tuple[str, str]:  # noqa, pylint: disable=line-too-long
+    """Returns the deployment kind, see
+        :meth:`.DeploymentDefinitions.get_definitions`,
+        and the unique deployment id.
+
+        :param deployment: Deployment to examine.
+
+    """
+    if isinstance(deployment, Nodes):
+        assert isinstance(deployment, NodesImpl)
+        return 'nodes', deployment.uuid
+    if isinstance(deployment, JupyterDeployment):
+        assert isinstance(deployment, (JupyterDeploymentImpl,
+                                       LazyJupyterDeployment))
+        return 'jupyter_deployments', deployment.uuid
+    if isinstance(deployment, DaskDeployment):
+        assert isinstance(deployment, (DaskDeploymentImpl,
+                                       LazyDaskDeployment))
+        return 'dask_deployments', deployment.uuid
+
+    raise NotImplementedError()
+
+
 def add_deployment_definition(deployments: DeploymentDefinitions,
                               deployment: Union[Nodes,
                                                 JupyterDeployment,
@@ -27,20 +56,8 @@ def add_deployment_definition(deployments: DeploymentDefinitions,
     """
 
     deployment_definition = get_deployment_definition(deployment=deployment)
-    if isinstance(deployment, Nodes):
-        assert isinstance(deployment, NodesImpl)
-        target = deployments.nodes
-        uuid = deployment.uuid
-    elif isinstance(deployment, JupyterDeployment):
-        assert isinstance(deployment, JupyterDeploymentImpl)
-        target = deployments.jupyter_deployments
-        uuid = deployment.uuid
-    elif isinstance(deployment, DaskDeployment):
-        assert isinstance(deployment, DaskDeploymentImpl)
-        target = deployments.dask_deployments
-        uuid = deployment.uuid
-    else:
-        raise NotImplementedError()
+    kind, uuid = get_deployment_kind_and_uuid(deployment=deployment)
+    target = deployments.get_definitions(kind=kind)
 
     if uuid in target:
         log = get_logger(__name__)
@@ -0,0 +1,60 @@
+"""This module contains a Dask deployment materialized on first access."""
+
+import dask.distributed
+
+from idact.core.config import ClusterConfig
+from idact.core.dask_deployment import DaskDeployment, DaskDiagnostics
+from idact.detail.dask.dask_deployment_impl import DaskDeploymentImpl
+from idact.detail.dask.dask_scheduler_deployment import DaskSchedulerDeployment
+from idact.detail.deployment_sync.dask_deployments. \
+    materialize_dask_deployment import materialize_dask_deployment
+from idact.detail.deployment_sync.deployment_definition import \
+    DeploymentDefinition
+from idact.detail.deployment_sync.lazy_deployment import LazyDeployment
+from idact.detail.tunnel.tunnel_internal import TunnelInternal
+
+
+class LazyDaskDeployment(LazyDeployment, DaskDeployment):
+    """Pulled Dask deployment, which opens the tunnels and validates
+        the scheduler diagnostics server on first access,
+        e.g. to :meth:`.get_client` or :attr:`.diagnostics`.
+
+        See :class:`.LazyDeployment`.
+
+        :param config: Cluster config.
+
+        :param uuid: Unique deployment id.
+
+        :param definition: Deployment definition to materialize.
+
+    """
+
+    def __init__(self,
+                 config: ClusterConfig,
+                 uuid: str,
+                 definition: DeploymentDefinition):
+        super().__init__(config=config,
+                         uuid=uuid,
+                         definition=definition,
+                         kind='Dask')
+
+    def _materialize_deployment(self) -> DaskDeploymentImpl:
+        return materialize_dask_deployment(config=self._config,
+                                           uuid=self._uuid,
+                                           definition=self._definition)
+
+    def _get_tunnel_to_validate(
+            self, deployment: DaskDeploymentImpl) -> TunnelInternal:
+        return deployment.scheduler.bokeh_tunnel
+
+    @property
+    def scheduler(self) -> DaskSchedulerDeployment:
+        """Scheduler deployment."""
+        return self.materialize().scheduler
+
+    def get_client(self) -> dask.distributed.Client:
+        return self.materialize().get_client()
+
+    @property
+    def diagnostics(self) -> DaskDiagnostics:
+        return self.materialize().diagnostics
@@ -42,6 +42,22 @@ class DeploymentDefinitions(Serializable):
         """Dask deployments by unique deployment id."""
         return self._dask_deployments
 
+    def get_definitions(self, kind: str) -> Dict[str, DeploymentDefinition]:
+        """Returns deployments of a kind by unique deployment id.
+
+            :param kind: Serialized kind name: `nodes`,
+                         `jupyter_deployments` or `dask_deployments`.
+
+        """
+        if kind == 'nodes':
+            return self._nodes
+        if kind == 'jupyter_deployments':
+            return self._jupyter_deployments
+        if kind == 'dask_deployments':
+            return self._dask_deployments
+        raise ValueError("Unknown deployment kind: '{kind}'.".format(
+            kind=kind))
+
     def serialize(self) -> dict:
         return {'type': str(SerializableTypes.DEPLOYMENT_DEFINITIONS),
                 'nodes': {uuid: node.serialize()
@@ -1,99 +1,149 @@
-import json
+"""This module contains functions for synchronizing deployment definitions
+    with the cluster, through an append-only journal.
+
+    See :attr:`.DEPLOYMENT_JOURNAL_SCRIPT`.
+"""
 
-from idact.core.node import Node
+import json
+import shlex
+from typing import List, Union
+
+from idact.core.dask_deployment import DaskDeployment
+from idact.core.jupyter_deployment import JupyterDeployment
+from idact.core.nodes import Nodes
+from idact.detail.deployment_sync.add_deployment_definition import \
+    get_deployment_kind_and_uuid
 from idact.detail.deployment_sync.deployment_definitions import \
     DeploymentDefinitions
-from idact.detail.helper.file_exists_on_node import file_exists_on_node
-from idact.detail.helper.get_remote_file import get_file_from_node
-from idact.detail.helper.put_remote_file import put_file_on_node
+from idact.detail.deployment_sync.deployment_journal_script import \
+    DEPLOYMENT_JOURNAL_SCRIPT
+from idact.detail.deployment_sync.get_deployment_definition import \
+    get_deployment_definition
 from idact.detail.helper.stage_info import stage_debug
 from idact.detail.log.get_logger import get_logger
 from idact.detail.nodes.node_internal import NodeInternal
 
 DEPLOYMENT_DEFINITIONS_PATH = '~/.idact'
-DEPLOYMENT_DEFINITIONS_FILENAME = '.deployments'
-
-
-def get_deployment_definitions_parent_path(node: Node) -> str:
-    """Returns the parent dir path of the deployment definitions file.
 
-        :param node: Node to run commands on.
 
-    """
-    return node.run("readlink -vf {}".format(DEPLOYMENT_DEFINITIONS_PATH))
+def get_deployment_journal_command(operation: str,
+                                   args: List[str],
+                                   path: str) -> str:
+    """Returns a command that performs a deployment journal operation.
 
+        :param operation: Operation name.
 
-def get_deployment_definitions_file_path(node: Node) -> str:
-    """Returns the path to the deployment definitions file.
+        :param args: Operation arguments.
 
-        :param node: Node to run commands on.
+        :param path: Deployment definitions dir path.
 
     """
-    return node.run("readlink -vf {}/{}".format(
-        DEPLOYMENT_DEFINITIONS_PATH,
-        DEPLOYMENT_DEFINITIONS_FILENAME))
+    return "python -c {script} {operation} {path}{args}".format(
+        script=shlex.quote(DEPLOYMENT_JOURNAL_SCRIPT),
+        operation=operation,
+        path=shlex.quote(path),
+        args=''.join(' ' + shlex.quote(arg) for arg in args))
 
 
-def deployment_definitions_file_exists(node: NodeInternal) -> bool:
-    """Returns True, if the deployment definitions file exists.
+def append_deployment_definition_to_cluster(
+        node: NodeInternal,
+        deployment: Union[Nodes, JupyterDeployment, DaskDeployment],
+        path: str = DEPLOYMENT_DEFINITIONS_PATH):
+    """Appends a deployment definition to the journal on the cluster
+        in one command. Replaces the deployment with the same unique id
+        on the next compaction.
 
         :param node: Node to run commands on.
 
-    """
-    path = get_deployment_definitions_file_path(node=node)
-    return file_exists_on_node(node=node,
-                               path=path)
+        :param deployment: Deployment to append.
 
+        :param path: Deployment definitions dir path.
 
-# pylint: disable=bad-continuation
-def deserialize_deployment_definitions_from_cluster(
-    node: NodeInternal) -> DeploymentDefinitions:  # noqa
-    """Downloads deployment definitions from the cluster.
+    """
+    log = get_logger(__name__)
+    with stage_debug(log, "Appending deployment definition to cluster."):
+        kind, uuid = get_deployment_kind_and_uuid(deployment=deployment)
+        definition = get_deployment_definition(deployment=deployment)
+        record = json.dumps({'kind': kind,
+                             'uuid': uuid,
+                             'definition': definition.serialize()},
+                            sort_keys=True)
+        node.run(get_deployment_journal_command(operation='append',
+                                                args=[record],
+                                                path=path))
+
+
+def compact_deployment_definitions_on_cluster(
+        node: NodeInternal,
+        path: str = DEPLOYMENT_DEFINITIONS_PATH) -> DeploymentDefinitions:
+    """Applies the journal to the deployment definitions on the cluster
+        and returns the result, in one command.
+
+        :param node: Node to run commands on.
 
-        :param node: Node to deserialize deployment definitions from.
+        :param path: Deployment definitions dir path.
 
     """
     log = get_logger(__name__)
-    with stage_debug(log, "Deserializing deployment definitions"
-                          " from cluster."):
-        path = get_deployment_definitions_file_path(node=node)
-        file_contents = get_file_from_node(
-            node=node,
-            remote_path=path)
+    with stage_debug(log, "Compacting deployment definitions on cluster."):
+        output = node.run(get_deployment_journal_command(operation='compact',
+                                                         args=[],
+                                                         path=path))
+        return DeploymentDefinitions.deserialize(
+            serialized=json.loads(output))
 
-        serialized = json.loads(file_contents)
-        return DeploymentDefinitions.deserialize(serialized=serialized)
 
+def discard_deployment_definitions_on_cluster(
+        node: NodeInternal,
+        deployments: DeploymentDefinitions,
+        kept: DeploymentDefinitions,
+        path: str = DEPLOYMENT_DEFINITIONS_PATH):
+    """Removes deployment definitions that were not kept from the cluster.
+        Does nothing, if all were kept.
 
-# pylint: disable=bad-continuation
-def serialize_deployment_definitions_to_cluster(
-    node: NodeInternal,
-    deployments: DeploymentDefinitions):  # noqa
-    """Uploads deployment definitions to the cluster, replacing
-        any definitions file already there.
+        A definition is not removed, if it was pushed again with
+        a different expiration date since compaction.
+
+        :param node: Node to run commands on.
 
-        :param node: Node to serialize definitions to.
+        :param deployments: Compacted deployment definitions.
 
-        :param deployments: Deployments to upload.
+        :param kept: Deployment definitions to keep.
+
+        :param path: Deployment definitions dir path.
 
     """
+    keys = []
+    for kind in ['nodes', 'jupyter_deployments', 'dask_deployments']:
+        kept_definitions = kept.get_definitions(kind=kind)
+        for uuid, definition in deployments.get_definitions(
+                kind=kind).items():
+            if uuid not in kept_definitions:
+                keys.append('{kind}:{uuid}:{expiration_date}'.format(
+                    kind=kind,
+                    uuid=uuid,
+                    expiration_date=definition.expiration_date.isoformat()))
+    if not keys:
+        return
+
     log = get_logger(__name__)
-    with stage_debug(log, "Serializing deployment definitions to cluster."):
-        serialized = deployments.serialize()
-        file_contents = json.dumps(serialized, sort_keys=True, indent=4)
-        parent_path = get_deployment_definitions_parent_path(node=node)
-        node.run("mkdir -p {parent_path}"
-                 " && chmod 700 {parent_path}".format(parent_path=parent_path))
-        path = get_deployment_definitions_file_path(node=node)
-        put_file_on_node(node=node,
-                         remote_path=path,
-                         contents=file_contents)
+    with stage_debug(log, "Discarding %d deployment definitions on cluster.",
+                     len(keys)):
+        node.run(get_deployment_journal_command(operation='discard',
+                                                args=keys,
+                                                path=path))
 
 
-def remove_serialized_deployment_definitions(node: NodeInternal):
-    """Removes the deployment definitions file, if it exists.
+def remove_serialized_deployment_definitions(
+        node: NodeInternal,
+        path: str = DEPLOYMENT_DEFINITIONS_PATH):
+    """Removes all deployment definitions and journal records.
 
         :param node: Node to run commands on.
+
+        :param path: Deployment definitions dir path.
+
     """
-    path = get_deployment_definitions_file_path(node=node)
-    node.run("rm -f '{path}'".format(path=path))
+    node.run(get_deployment_journal_command(operation='clear',
+                                            args=[],
+                                            path=path))
@@ -0,0 +1,135 @@
+"""This module contains the deployment journal code run on the cluster.
+    It is compatible with Python 2.7 and 3."""
+
+from idact.detail.serialization.serializable_types import SerializableTypes
+
+DEPLOYMENT_DEFINITIONS_FILENAME = '.deployments'
+"""Compacted deployment definitions file name."""
+
+DEPLOYMENT_JOURNAL_FILENAME = '.deployments.journal'
+"""Deployment journal file name."""
+
+DEPLOYMENT_JOURNAL_LOCK_TIMEOUT = 60
+"""Seconds to wait for the journal lock held by another client."""
+
+DEPLOYMENT_JOURNAL_SCRIPT = r"""
+import errno, fcntl, json, os, sys, time
+
+operation = sys.argv[1]
+directory = os.path.expanduser(sys.argv[2])
+definitions_path = os.path.join(directory, '{definitions_filename}')
+journal_path = os.path.join(directory, '{journal_filename}')
+
+
+def lock_journal():
+    try:
+        os.makedirs(directory, 448)
+    except OSError as e:
+        if e.errno != errno.EEXIST:
+            raise
+    fd = os.open(journal_path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 384)
+    deadline = time.time() + {lock_timeout}
+    while True:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return fd
+        except (IOError, OSError) as e:
+            if e.errno not in (errno.EAGAIN, errno.EACCES):
+                raise
+        if time.time() > deadline:
+            sys.stderr.write('Timed out waiting for lock: %s\n' % journal_path)
+            sys.exit(1)
+        time.sleep(0.01)
+
+
+def load_definitions():
+    try:
+        with open(definitions_path) as file:
+            return json.load(file)
+    except (IOError, OSError, ValueError):
+        return {{'type': '{definitions_type}'}}
+
+
+def save_definitions(definitions):
+    temporary_path = definitions_path + '.tmp'
+    fd = os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 384)
+    with os.fdopen(fd, 'w') as file:
+        json.dump(definitions, file, sort_keys=True, indent=4)
+    os.rename(temporary_path, definitions_path)
+
+
+def read_journal(fd):
+    os.lseek(fd, 0, os.SEEK_SET)
+    chunks = []
+    while True:
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    records = []
+    for line in b''.join(chunks).decode('utf-8').splitlines():
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            continue
+    return records
+
+
+fd = lock_journal()
+try:
+    if operation == 'append':
+        data = (sys.argv[3] + '\n').encode('utf-8')
+        while data:
+            data = data[os.write(fd, data):]
+    elif operation == 'compact':
+        definitions = load_definitions()
+        records = read_journal(fd)
+        for record in records:
+            definitions.setdefault(record['kind'], {{}})[record['uuid']] = \
+                record['definition']
+        if records:
+            save_definitions(definitions)
+            os.ftruncate(fd, 0)
+        print(json.dumps(definitions))
+    elif operation == 'discard':
+        definitions = load_definitions()
+        discarded = 0
+        for key in sys.argv[3:]:
+            kind, uuid, expiration_date = key.split(':', 2)
+            definitions_of_kind = definitions.get(kind, {{}})
+            definition = definitions_of_kind.get(uuid)
+            if (definition is not None
+                    and definition['expiration_date'] == expiration_date):
+                del definitions_of_kind[uuid]
+                discarded += 1
+        if discarded:
+            save_definitions(definitions)
+    elif operation == 'clear':
+        try:
+            os.remove(definitions_path)
+        except OSError:
+            pass
+        os.ftruncate(fd, 0)
+finally:
+    os.close(fd)
+""".format(definitions_filename=DEPLOYMENT_DEFINITIONS_FILENAME,
+           journal_filename=DEPLOYMENT_JOURNAL_FILENAME,
+           definitions_type=str(SerializableTypes.DEPLOYMENT_DEFINITIONS),
+           lock_timeout=DEPLOYMENT_JOURNAL_LOCK_TIMEOUT)
+"""Operates on the deployment definitions in a directory, while holding
+    an exclusive `flock` on the journal file, see
+    :attr:`.DEPLOYMENT_JOURNAL_LOCK_TIMEOUT`.
+
+    Arguments: `operation directory [args...]`, where operation is one of:
+
+    - `append record`: appends a JSON record with the `kind`, `uuid`
+      and `definition` of a deployment to the journal.
+    - `compact`: applies journal records to the definitions file in order,
+      empties the journal and prints the definitions as JSON.
+    - `discard kind:uuid:expiration_date...`: removes definitions from
+      the definitions file, unless they were replaced with a different
+      expiration date in the meantime, so a concurrent push always wins.
+    - `clear`: removes all definitions.
+
+    Journal lines that cannot be parsed, e.g. after an interrupted write,
+    are skipped."""
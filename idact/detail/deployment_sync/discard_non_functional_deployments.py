@@ -1,42 +1,82 @@
+from typing import Dict, Optional  # noqa, pylint: disable=unused-import
+
 from idact.core.synchronized_deployments import SynchronizedDeployments
 from idact.detail.dask.dask_deployment_impl import DaskDeploymentImpl
+from idact.detail.deployment_sync.dask_deployments.lazy_dask_deployment \
+    import LazyDaskDeployment
+from idact.detail.deployment_sync.jupyter_deployments. \
+    lazy_jupyter_deployment import LazyJupyterDeployment
 from idact.detail.deployment_sync.synchronized_deployments_impl import \
     SynchronizedDeploymentsImpl
+from idact.detail.helper.run_in_parallel import run_in_parallel, \
+    DEFAULT_MAX_PARALLEL
 from idact.detail.helper.stage_info import stage_debug
 from idact.detail.jupyter.jupyter_deployment_impl import JupyterDeploymentImpl
 from idact.detail.log.get_logger import get_logger
+from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.nodes.nodes_impl import NodesImpl
+from idact.detail.slurm.get_squeue_cache import get_squeue_cache
+from idact.detail.slurm.slurm_allocation import SlurmAllocation
+from idact.detail.slurm.squeue_result import SqueueResult  # noqa, pylint: disable=unused-import
 from idact.detail.tunnel.validate_tunnel_http_connection import \
     validate_tunnel_http_connection
 
 
 # pylint: disable=bad-continuation
 def discard_non_functional_deployments(
-    deployments: SynchronizedDeployments) -> SynchronizedDeployments:  # noqa
+    deployments: SynchronizedDeployments,
+    access_node: NodeInternal,
+    max_parallel: int = DEFAULT_MAX_PARALLEL) -> SynchronizedDeployments:  # noqa
     """Discards deployments that were not expired, but are no longer
-        functional, e.g. were cancelled."""
+        functional, e.g. were cancelled.
+
+        Deployments are checked concurrently. Allocations are checked
+        against a single `squeue` result shared by all of them.
+        Lazy deployments are validated on first access instead.
+
+        :param deployments: Deployments to check.
+
+        :param access_node: Cluster access node, to run `squeue` on.
+
+        :param max_parallel: Maximum number of deployments to check
+                             at the same time.
+
+    """
 
     log = get_logger(__name__)
-    all_nodes = []
-    for nodes in deployments.nodes:
+
+    squeue = None  # type: Optional[Dict[int, SqueueResult]]
+    if any(nodes.waited for nodes in deployments.nodes):
+        with stage_debug(log, "Obtaining squeue results for all"
+                              " allocation deployments."):
+            squeue = get_squeue_cache(node=access_node).get(node=access_node)
+
+    def check_nodes(nodes) -> bool:
         with stage_debug(log, "Checking whether allocation deployment"
                               " is functional: %s.", nodes):
-            nodes_functional = not nodes.waited or nodes.running()
+            if not nodes.waited:
+                nodes_functional = True
+            else:
+                assert isinstance(nodes, NodesImpl)
+                allocation = nodes.allocation
+                assert isinstance(allocation, SlurmAllocation)
+                nodes_functional = allocation.running_in(squeue=squeue)
 
-        if nodes_functional:
-            all_nodes.append(nodes)
-        else:
+        if not nodes_functional:
             log.info("Discarding an allocation deployment,"
                      " because it is no longer functional: %s.", nodes)
+        return nodes_functional
 
-    all_jupyter_deployments = []
-    for jupyter in deployments.jupyter_deployments:
+    def check_jupyter(jupyter) -> bool:
+        if isinstance(jupyter, LazyJupyterDeployment):
+            return True
         jupyter_impl = jupyter
         assert isinstance(jupyter_impl, JupyterDeploymentImpl)
         with stage_debug(log, "Checking whether Jupyter deployment"
                               " is functional: %s.", jupyter_impl):
             try:
                 validate_tunnel_http_connection(tunnel=jupyter_impl.tunnel)
-                all_jupyter_deployments.append(jupyter_impl)
+                return True
             except Exception:  # pylint: disable=broad-except
                 log.info("Discarding a Jupyter deployment,"
                          " because it is no longer functional: %s.",
@@ -45,9 +85,11 @@ def discard_non_functional_deployments(
                 with stage_debug(log,
                                  "Cancelling tunnel to discarded notebook."):
                     jupyter_impl.cancel_local()
+                return False
 
-    all_dask_deployments = []
-    for dask in deployments.dask_deployments:
+    def check_dask(dask) -> bool:
+        if isinstance(dask, LazyDaskDeployment):
+            return True
         dask_impl = dask
         assert isinstance(dask_impl, DaskDeploymentImpl)
         with stage_debug(log, "Checking whether Dask deployment"
@@ -55,7 +97,7 @@ def discard_non_functional_deployments(
             try:
                 validate_tunnel_http_connection(
                     tunnel=dask_impl.scheduler.bokeh_tunnel)
-                all_dask_deployments.append(dask_impl)
+                return True
             except Exception:  # pylint: disable=broad-except
                 log.info("Discarding a Dask deployment,"
                          " because it is no longer functional: %s.",
@@ -65,8 +107,24 @@ def discard_non_functional_deployments(
                                  "Cancelling tunnels for discarded Dask"
                                  " deployment."):
                     dask_impl.cancel_local()
+                return False
+
+    checks = ([(check_nodes, nodes) for nodes in deployments.nodes]
+              + [(check_jupyter, jupyter)
+                 for jupyter in deployments.jupyter_deployments]
+              + [(check_dask, dask)
+                 for dask in deployments.dask_deployments])
+    functional = run_in_parallel(lambda check: check[0](check[1]),
+                                 checks,
+                                 max_parallel=max_parallel)
+
+    def get_functional(check_fun):
+        return [deployment
+                for (fun, deployment), deployment_functional
+                in zip(checks, functional)
+                if fun is check_fun and deployment_functional]
 
     return SynchronizedDeploymentsImpl(
-        nodes=all_nodes,
-        jupyter_deployments=all_jupyter_deployments,
-        dask_deployments=all_dask_deployments)
+        nodes=get_functional(check_nodes),
+        jupyter_deployments=get_functional(check_jupyter),
+        dask_deployments=get_functional(check_dask))
@@ -6,10 +6,14 @@ from idact.core.nodes import Nodes
 from idact.detail.dask.dask_deployment_impl import DaskDeploymentImpl
 from idact.detail.deployment_sync.dask_deployments. \
     get_dask_deployment_definition import get_dask_deployment_definition
+from idact.detail.deployment_sync.dask_deployments.lazy_dask_deployment \
+    import LazyDaskDeployment
 from idact.detail.deployment_sync.deployment_definition import \
     DeploymentDefinition
 from idact.detail.deployment_sync.jupyter_deployments. \
     get_jupyter_deployment_definition import get_jupyter_deployment_definition
+from idact.detail.deployment_sync.jupyter_deployments. \
+    lazy_jupyter_deployment import LazyJupyterDeployment
 from idact.detail.deployment_sync.nodes.get_nodes_deployment_definition \
     import get_nodes_deployment_definition
 from idact.detail.jupyter.jupyter_deployment_impl import JupyterDeploymentImpl
@@ -22,9 +26,14 @@ def get_deployment_definition(deployment: Union[Nodes,
     """Obtains a definition of the deployment, that can be materialized
         later.
 
+        Pulled deployments that were not materialized yet return
+        their original definition.
+
         :param deployment: Deployment, which definition to get.
 
     """
+    if isinstance(deployment, (LazyJupyterDeployment, LazyDaskDeployment)):
+        return deployment.definition
     if isinstance(deployment, Nodes):
         assert isinstance(deployment, NodesImpl)
         return get_nodes_deployment_definition(deployment)
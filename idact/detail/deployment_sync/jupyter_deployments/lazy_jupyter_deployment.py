@@ -0,0 +1,61 @@
+"""This module contains a Jupyter deployment materialized on first access."""
+
+from idact.core.config import ClusterConfig
+from idact.core.jupyter_deployment import JupyterDeployment
+from idact.detail.deployment_sync.deployment_definition import \
+    DeploymentDefinition
+from idact.detail.deployment_sync.jupyter_deployments. \
+    materialize_jupyter_deployment import materialize_jupyter_deployment
+from idact.detail.deployment_sync.lazy_deployment import LazyDeployment
+from idact.detail.jupyter.jupyter_deployment_impl import JupyterDeploymentImpl
+from idact.detail.tunnel.tunnel_internal import TunnelInternal
+
+
+class LazyJupyterDeployment(LazyDeployment, JupyterDeployment):
+    """Pulled Jupyter deployment, which opens the tunnel and validates
+        the notebook server on first access, e.g. to :attr:`.local_port`
+        or :meth:`.open_in_browser`.
+
+        See :class:`.LazyDeployment`.
+
+        :param config: Cluster config.
+
+        :param uuid: Unique deployment id.
+
+        :param definition: Deployment definition to materialize.
+
+    """
+
+    def __init__(self,
+                 config: ClusterConfig,
+                 uuid: str,
+                 definition: DeploymentDefinition):
+        super().__init__(config=config,
+                         uuid=uuid,
+                         definition=definition,
+                         kind='Jupyter')
+
+    def _materialize_deployment(self) -> JupyterDeploymentImpl:
+        return materialize_jupyter_deployment(config=self._config,
+                                              uuid=self._uuid,
+                                              definition=self._definition)
+
+    def _get_tunnel_to_validate(
+            self, deployment: JupyterDeploymentImpl) -> TunnelInternal:
+        return deployment.tunnel
+
+    @property
+    def tunnel(self) -> TunnelInternal:
+        """Tunnel to notebook server."""
+        return self.materialize().tunnel
+
+    @property
+    def local_port(self) -> int:
+        return self.materialize().local_port
+
+    @property
+    def address(self) -> str:
+        return self.materialize().address
+
+    def open_in_browser(self):
+        self.materialize().open_in_browser()
@@ -0,0 +1,158 @@
+"""This module contains the common part of deployments materialized
+    on first access."""
+
+import datetime
+import threading
+from abc import abstractmethod
+from typing import Any, Optional  # noqa, pylint: disable=unused-import
+
+from idact.core.config import ClusterConfig
+from idact.detail.deployment_sync.deployment_definition import \
+    DeploymentDefinition
+from idact.detail.health.get_health_status import get_health_status
+from idact.detail.health.health_checkable import HealthCheckable
+from idact.detail.helper.stage_info import stage_debug
+from idact.detail.log.get_logger import get_logger
+from idact.detail.tunnel.tunnel_internal import TunnelInternal
+from idact.detail.tunnel.validate_tunnel_http_connection import \
+    validate_tunnel_http_connection
+
+
+class LazyDeployment(HealthCheckable):
+    """Pulled deployment, which opens its tunnels and validates them
+        on first access.
+
+        If the deployment no longer responds, the tunnels are closed,
+        and a :class:`RuntimeError` is raised on each access.
+
+        Subclasses forward the deployment properties to
+        :meth:`.materialize`.
+
+        :param config: Cluster config.
+
+        :param uuid: Unique deployment id.
+
+        :param definition: Deployment definition to materialize.
+
+        :param kind: Deployment kind, e.g. `'Jupyter'`, for messages.
+
+    """
+
+    def __init__(self,
+                 config: ClusterConfig,
+                 uuid: str,
+                 definition: DeploymentDefinition,
+                 kind: str):
+        self._config = config
+        self._uuid = uuid
+        self._definition = definition
+        self._kind = kind
+        self._lock = threading.Lock()
+        self._deployment = None  # type: Optional[Any]
+        self._validated = False
+        self._error = None  # type: Optional[RuntimeError]
+
+    @abstractmethod
+    def _materialize_deployment(self):
+        """Opens the tunnels and returns the deployment."""
+        pass
+
+    @abstractmethod
+    def _get_tunnel_to_validate(self, deployment) -> TunnelInternal:
+        """Returns the tunnel to an HTTP server of the deployment,
+            which should respond if the deployment is functional.
+
+            :param deployment: Materialized deployment.
+
+        """
+        pass
+
+    @property
+    def uuid(self) -> str:
+        """Unique deployment id."""
+        return self._uuid
+
+    @property
+    def definition(self) -> DeploymentDefinition:
+        """Deployment definition, available without materializing."""
+        return self._definition
+
+    @property
+    def materialized(self) -> bool:
+        """True, if the tunnels were opened."""
+        return self._deployment is not None
+
+    def materialize(self, validate: bool = True):
+        """Opens the tunnels and validates the deployment, if it was not
+            done yet, and returns the deployment.
+
+            :param validate: Check that the deployment responds.
+
+        """
+        with self._lock:
+            if validate and self._error is not None:
+                raise self._error
+            if self._deployment is None:
+                self._deployment = self._materialize_deployment()
+            if validate and not self._validated:
+                self._validate()
+                self._validated = True
+            return self._deployment
+
+    def _validate(self):
+        """Checks that the materialized deployment responds, closes
+            the tunnels and stores the error otherwise."""
+        log = get_logger(__name__)
+        with stage_debug(log, "Checking whether %s deployment"
+                              " is functional: %s.", self._kind, self._uuid):
+            try:
+                validate_tunnel_http_connection(
+                    tunnel=self._get_tunnel_to_validate(self._deployment))
+            except Exception as e:  # pylint: disable=broad-except
+                log.debug("Exception", exc_info=1)
+                self._deployment.cancel_local()
+                self._error = RuntimeError(
+                    "{kind} deployment is no longer functional:"
+                    " {uuid}.".format(kind=self._kind,
+                                      uuid=self._uuid))
+                raise self._error from e
+
+    @property
+    def is_alive(self) -> Optional[bool]:
+        return get_health_status(deployment=self,
+                                 uuid=self._uuid,
+                                 config=self._config).is_alive
+
+    @property
+    def last_seen(self) -> Optional[datetime.datetime]:
+        return get_health_status(deployment=self,
+                                 uuid=self._uuid,
+                                 config=self._config).last_seen
+
+    def check_health(self) -> Optional[bool]:
+        with self._lock:
+            if self._error is not None:
+                return False
+            deployment = self._deployment
+        if deployment is None:
+            return None
+        return deployment.check_health()
+
+    def cancel(self):
+        self.materialize(validate=False).cancel()
+
+    def cancel_local(self):
+        with self._lock:
+            if self._deployment is not None:
+                self._deployment.cancel_local()
+
+    def __str__(self):
+        with self._lock:
+            if self._deployment is not None:
+                return str(self._deployment)
+        return "{kind}Deployment({uuid}, not opened)".format(
+            kind=self._kind,
+            uuid=self._uuid)
+
+    def __repr__(self):
+        return str(self)
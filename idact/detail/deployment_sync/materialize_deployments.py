@@ -1,22 +1,39 @@
 import datetime
-from typing import Tuple, Any, List
+import functools
+from typing import Tuple, Any, List, Callable, Optional
 
 from idact.core.config import ClusterConfig
 from idact.core.synchronized_deployments import SynchronizedDeployments
+from idact.detail.deployment_sync.dask_deployments.lazy_dask_deployment \
+    import LazyDaskDeployment
 from idact.detail.deployment_sync.dask_deployments. \
     materialize_dask_deployment import materialize_dask_deployment
+from idact.detail.deployment_sync.deployment_definition import \
+    DeploymentDefinition
 from idact.detail.deployment_sync.deployment_definitions import \
     DeploymentDefinitions
+from idact.detail.deployment_sync.jupyter_deployments. \
+    lazy_jupyter_deployment import LazyJupyterDeployment
 from idact.detail.deployment_sync.jupyter_deployments. \
     materialize_jupyter_deployment import materialize_jupyter_deployment
 from idact.detail.deployment_sync.nodes.materialize_nodes import \
     materialize_nodes
 from idact.detail.deployment_sync.synchronized_deployments_impl import \
     SynchronizedDeploymentsImpl
+from idact.detail.helper.run_in_parallel import run_in_parallel, \
+    DEFAULT_MAX_PARALLEL
 from idact.detail.log.get_logger import get_logger
 from idact.detail.nodes.node_internal import NodeInternal
 
 
+NODES_INDEX = 0
+JUPYTER_INDEX = 1
+DASK_INDEX = 2
+
+MaterializeTask = Tuple[int, str, str, DeploymentDefinition,
+                        Callable[[], Any]]
+
+
 # pylint: disable=bad-continuation
 def sorted_by_expiration_date(
     to_sort: List[Tuple[Any, datetime.datetime]]) -> List[Any]:  # noqa
@@ -40,12 +57,131 @@ def report_pulled_deployments(deployments: SynchronizedDeploymentsImpl):
         log.info("Pulled Dask deployment: %s", dask)
 
 
+def materialize_jupyter_definition(config: ClusterConfig,
+                                   uuid: str,
+                                   definition: DeploymentDefinition,
+                                   lazy: bool):
+    """Materializes a Jupyter deployment.
+
+        :param config: Cluster config.
+
+        :param uuid: Deployment uuid.
+
+        :param definition: Definition to materialize.
+
+        :param lazy: Return a :class:`.LazyJupyterDeployment`.
+
+    """
+    if lazy:
+        return LazyJupyterDeployment(config=config,
+                                     uuid=uuid,
+                                     definition=definition)
+    return materialize_jupyter_deployment(config=config,
+                                          uuid=uuid,
+                                          definition=definition)
+
+
+def materialize_dask_definition(config: ClusterConfig,
+                                uuid: str,
+                                definition: DeploymentDefinition,
+                                lazy: bool):
+    """Materializes a Dask deployment.
+
+        :param config: Cluster config.
+
+        :param uuid: Deployment uuid.
+
+        :param definition: Definition to materialize.
+
+        :param lazy: Return a :class:`.LazyDaskDeployment`.
+
+    """
+    if lazy:
+        return LazyDaskDeployment(config=config,
+                                  uuid=uuid,
+                                  definition=definition)
+    return materialize_dask_deployment(config=config,
+                                       uuid=uuid,
+                                       definition=definition)
+
+
+def get_materialize_tasks(config: ClusterConfig,
+                          access_node: NodeInternal,
+                          deployments: DeploymentDefinitions,
+                          lazy: bool) -> List[MaterializeTask]:
+    """Returns a task for each definition: the index of its kind,
+        kind name, uuid, the definition and a function materializing it.
+
+        :param config: Cluster config.
+
+        :param access_node: Cluster access node.
+
+        :param deployments: Definitions to materialize.
+
+        :param lazy: Defer opening tunnels until first access.
+
+    """
+    tasks = []
+    for uuid, definition in deployments.nodes.items():
+        tasks.append((NODES_INDEX, "synchronized allocation",
+                      uuid, definition,
+                      functools.partial(materialize_nodes,
+                                        config=config,
+                                        access_node=access_node,
+                                        uuid=uuid,
+                                        definition=definition)))
+    for uuid, definition in deployments.jupyter_deployments.items():
+        tasks.append((JUPYTER_INDEX, "Jupyter",
+                      uuid, definition,
+                      functools.partial(materialize_jupyter_definition,
+                                        config=config,
+                                        uuid=uuid,
+                                        definition=definition,
+                                        lazy=lazy)))
+    for uuid, definition in deployments.dask_deployments.items():
+        tasks.append((DASK_INDEX, "Dask",
+                      uuid, definition,
+                      functools.partial(materialize_dask_definition,
+                                        config=config,
+                                        uuid=uuid,
+                                        definition=definition,
+                                        lazy=lazy)))
+    return tasks
+
+
+def try_materialize(task: MaterializeTask) -> Optional[Any]:
+    """Materializes a deployment, or returns None if it cannot be
+        materialized.
+
+        :param task: Task returned by :func:`.get_materialize_tasks`.
+
+    """
+    _, kind, uuid, _, materialize = task
+    try:
+        return materialize()
+    except RuntimeError:
+        log = get_logger(__name__)
+        log.warning("Discarding a %s deployment,"
+                    " unable to materialize: %s", kind, uuid)
+        log.debug("Exception", exc_info=1)
+        return None
+
+
 # pylint: disable=bad-continuation
 def materialize_deployments(
     config: ClusterConfig,
     access_node: NodeInternal,
-    deployments: DeploymentDefinitions) -> SynchronizedDeployments:  # noqa
-    """Creates deployment objects from definitions.
+    deployments: DeploymentDefinitions,
+    max_parallel: int = DEFAULT_MAX_PARALLEL,
+    lazy: bool = False) -> SynchronizedDeployments:  # noqa
+    """Creates deployment objects from definitions, materializing
+        up to `max_parallel` deployments at the same time.
+
+        Deployments that cannot be materialized are discarded.
+
+        With `lazy`, Jupyter and Dask deployments are returned as handles
+        that open their tunnels on first access, see
+        :class:`.LazyJupyterDeployment` and :class:`.LazyDaskDeployment`.
 
         :param config: Cluster config.
 
@@ -53,60 +189,33 @@ def materialize_deployments(
 
         :param deployments: Definitions to materialize.
 
-    """
-    log = get_logger(__name__)
-
-    nodes_index = 0
-    jupyter_index = 1
-    dask_index = 2
-    deployments_by_date = ([], [], [])
+        :param max_parallel: Maximum number of deployments to materialize
+                             at the same time, e.g. opening tunnels.
 
-    for uuid, definition in deployments.nodes.items():
-        try:
-            materialized_nodes = materialize_nodes(config=config,
-                                                   access_node=access_node,
-                                                   uuid=uuid,
-                                                   definition=definition)
-            deployments_by_date[nodes_index].append(
-                (materialized_nodes, definition.expiration_date))
-        except RuntimeError:
-            log.warning("Discarding a synchronized allocation deployment,"
-                        " unable to materialize: %s", uuid)
-            log.debug("Exception", exc_info=1)
+        :param lazy: Defer opening tunnels until first access.
 
-    for uuid, definition in deployments.jupyter_deployments.items():
-        try:
-            materialized_jupyter = materialize_jupyter_deployment(
-                config=config,
-                uuid=uuid,
-                definition=definition)
-            deployments_by_date[jupyter_index].append(
-                (materialized_jupyter, definition.expiration_date))
-        except RuntimeError:
-            log.warning("Discarding a Jupyter deployment,"
-                        " unable to materialize: %s", uuid)
-            log.debug("Exception", exc_info=1)
+    """
+    tasks = get_materialize_tasks(config=config,
+                                  access_node=access_node,
+                                  deployments=deployments,
+                                  lazy=lazy)
+    results = run_in_parallel(try_materialize,
+                              tasks,
+                              max_parallel=max_parallel)
 
-    for uuid, definition in deployments.dask_deployments.items():
-        try:
-            materialized_dask = materialize_dask_deployment(
-                config=config,
-                uuid=uuid,
-                definition=definition)
-            deployments_by_date[dask_index].append(
-                (materialized_dask, definition.expiration_date))
-        except RuntimeError:
-            log.warning("Discarding a Dask deployment,"
-                        " unable to materialize: %s", uuid)
-            log.debug("Exception", exc_info=1)
+    deployments_by_date = ([], [], [])
+    for (index, _, _, definition, _), result in zip(tasks, results):
+        if result is not None:
+            deployments_by_date[index].append(
+                (result, definition.expiration_date))
 
     deployments_sorted = tuple(map(sorted_by_expiration_date,
                                    deployments_by_date))
 
     synchronized_deployments = SynchronizedDeploymentsImpl(
-        nodes=deployments_sorted[nodes_index],
-        jupyter_deployments=deployments_sorted[jupyter_index],
-        dask_deployments=deployments_sorted[dask_index])
+        nodes=deployments_sorted[NODES_INDEX],
+        jupyter_deployments=deployments_sorted[JUPYTER_INDEX],
+        dask_deployments=deployments_sorted[DASK_INDEX])
 
     report_pulled_deployments(deployments=synchronized_deployments)
 
@@ -0,0 +1,96 @@
+"""This module contains a function for collecting sshd deployment ports
+    reported by entry points and cleaning up after them, in a single
+    command."""
+
+from idact.core.config import ClusterConfig
+from idact.core.retry import Retry
+from idact.detail.entry_point.sshd_port_info \
+    import PORT_INFO_FILE_NAME_FORMAT, PORT_INFO_LOCATION
+from idact.detail.log.get_logger import get_logger
+from idact.detail.nodes.get_access_node import get_access_node
+from idact.detail.ssh.get_remote_command import get_bash_command
+
+PORT_INFO_FOLLOW_INTERVAL = 0.2
+"""Seconds between checks for new lines in the port info file."""
+
+
+def get_collect_port_info_command(allocation_id: int,
+                                  expected_count: int,
+                                  timeout: int,
+                                  entry_point_script_path: str) -> str:
+    """Returns a command that follows the port info file on the remote
+        side until the expected number of lines is appended, prints them
+        on one line, then removes the port info file and the entry point
+        script. It runs in bash, regardless of the remote shell.
+
+        :param allocation_id: Allocation id, e.g. Slurm job id.
+
+        :param expected_count: Number of lines to wait for.
+
+        :param timeout: Seconds to wait for the lines.
+
+        :param entry_point_script_path: Entry point script to remove.
+
+    """
+    port_info_file = PORT_INFO_FILE_NAME_FORMAT.format(
+        allocation_id=allocation_id)
+
+    script = ("file={port_info_location}/{port_info_file}\n"
+              "exec 3< <(timeout {timeout}"
+              " tail -n +1 -F -s {follow_interval} --pid=$$ \"$file\""
+              " 2> /dev/null < /dev/null)\n"
+              "count=0\n"
+              "while [ $count -lt {expected_count} ]"
+              " && read -r line <&3; do\n"
+              "  printf '%s ' \"$line\"\n"
+              "  count=$((count + 1))\n"
+              "done\n"
+              "echo\n"
+              "rm -f \"$file\"\n"
+              "rm -f {entry_point_script_path}\n"
+              "exit 0").format(
+                  port_info_location=PORT_INFO_LOCATION,
+                  port_info_file=port_info_file,
+                  timeout=max(timeout, 1),
+                  follow_interval=PORT_INFO_FOLLOW_INTERVAL,
+                  expected_count=expected_count,
+                  entry_point_script_path=entry_point_script_path)
+    return get_bash_command(script)
+
+
+def collect_port_info(allocation_id: int,
+                      expected_count: int,
+                      entry_point_script_path: str,
+                      config: ClusterConfig,
+                      multiplier: int = 1) -> str:
+    """Waits for the port info files on the remote side, returns their names
+        separated by spaces, and removes them along with the entry point
+        script. Returns an empty string, if none were found in time.
+
+        Waiting is based on :attr:`.Retry.PORT_INFO`, but all checks
+        are done within one command on the access node.
+
+        :param allocation_id: Allocation id, e.g. Slurm job id.
+
+        :param expected_count: Number of port info files to wait for.
+
+        :param entry_point_script_path: Entry point script to remove.
+
+        :param config: Cluster config.
+
+        :param multiplier: Retry count multiplier.
+
+    """
+    log = get_logger(__name__)
+    retries = config.retries[Retry.PORT_INFO]
+    command = get_collect_port_info_command(
+        allocation_id=allocation_id,
+        expected_count=expected_count,
+        timeout=retries.count * retries.seconds_between * multiplier,
+        entry_point_script_path=entry_point_script_path)
+
+    node = get_access_node(config=config)
+    lines = node.run(command).strip()
+    if not lines:
+        log.warning("Port info not reported.")
+    return lines
@@ -3,18 +3,46 @@
 from idact.core.config import ClusterConfig
 from idact.detail.auth.install_shared_home_key import SHARED_HOST_KEY_PATH
 from idact.detail.entry_point.sshd_port_info \
-    import PORT_INFO_DIR_NAME_FORMAT, PORT_INFO_LOCATION
+    import PORT_INFO_FILE_NAME_FORMAT, PORT_INFO_LOCATION
 
 COMPUTE_NODE_AUTHORIZED_KEYS = ".ssh/authorized_keys.idact"
 
+SSHD_LISTEN_CHECKS = 100
+"""Maximum number of checks whether sshd is listening, before reporting
+   its port anyway."""
+
+SSHD_LISTEN_CHECK_INTERVAL = 0.1
+"""Seconds between checks whether sshd is listening."""
+
+
+def get_port_info_append_command(port_info_file: str) -> str:
+    """Returns a command that appends `$(hostname):$SSHD_PORT` to the port
+        info file, while holding an exclusive `flock` on it.
+
+        Appends from different NFS clients are not atomic, so without
+        the lock, lines reported by nodes at the same time could
+        overwrite each other.
+
+        :param port_info_file: Port info file path.
+
+    """
+    return ("python -c 'import fcntl, sys;"
+            " f = open(sys.argv[1], \"a\");"
+            " fcntl.flock(f, fcntl.LOCK_EX);"
+            " f.write(sys.argv[2] + \"\\n\");"
+            " f.close()' {port_info_file} \"$(hostname):$SSHD_PORT\"").format(
+                port_info_file=port_info_file)
+
 
 def get_entry_point_script_contents(config: ClusterConfig) -> str:
     """Formats an entry point script and returns its contents.
 
         The entry point script can either deploy an ssh server, or do nothing.
-        If it deploys sshd, it will save its port in a file at
+        If it deploys sshd, it will append `host:port` to a file at
         :attr:`.PORT_INFO_LOCATION`, named according to
-        :attr:`.PORT_INFO_FILE_FORMAT`.
+        :attr:`.PORT_INFO_FILE_NAME_FORMAT`, as soon as sshd is listening,
+        see :func:`.get_port_info_append_command`.
+        The file is followed by :func:`.collect_port_info`.
 
         :param config: Cluster config.
 
@@ -24,16 +52,15 @@ def get_entry_point_script_contents(config: ClusterConfig) -> str:
         entry_point = ("#!/usr/bin/env bash\n"
                        "trap : TERM INT; sleep infinity & wait")
     else:
-        port_info_file = PORT_INFO_DIR_NAME_FORMAT.format(
+        port_info_file = PORT_INFO_FILE_NAME_FORMAT.format(
             allocation_id="$IDACT_ALLOCATION_ID")
         entry_point = \
             ("#!/usr/bin/env bash\n"
              "SSHD_PORT=$(python -c 'import socket; s=socket.socket();"
              " s.bind((str(), 0)); print(s.getsockname()[1]);"
              " s.close()')\n"
-             "mkdir -p {port_info_location}/{port_info_file}\n"
-             "chmod 700 {port_info_location}/{port_info_file}\n"
-             "touch {port_info_location}/{port_info_file}/$(hostname):$SSHD_PORT\n"  # noqa, pylint: disable=line-too-long
+             "mkdir -p {port_info_location}\n"
+             "chmod 700 {port_info_location}\n"
              "export PATH=\"$PATH:/usr/sbin\"\n"
              " $(which sshd)"
              " -D "
@@ -53,10 +80,24 @@ def get_entry_point_script_contents(config: ClusterConfig) -> str:
              " -oGSSAPIAuthentication=no"
              " -oUsePAM=no"
              " -oSubsystem='sftp internal-sftp'"
-             " -oX11Forwarding=yes\n"
+             " -oX11Forwarding=yes &\n"
+             "SSHD_PID=$!\n"
+             "for i in $(seq {listen_checks}); do\n"
+             "  python -c 'import socket, sys;"
+             " socket.create_connection((\"127.0.0.1\", int(sys.argv[1])),"
+             " 1).close()' $SSHD_PORT 2> /dev/null && break\n"
+             "  kill -0 $SSHD_PID 2> /dev/null || break\n"
+             "  sleep {listen_check_interval}\n"
+             "done\n"
+             "{append_port_info}\n"
+             "wait $SSHD_PID\n"
              "exit $?").format(shared_host_key_path=SHARED_HOST_KEY_PATH,
                                port_info_location=PORT_INFO_LOCATION,
-                               port_info_file=port_info_file,
-                               compute_node_authorized_keys=COMPUTE_NODE_AUTHORIZED_KEYS)  # noqa, pylint: disable=line-too-long
+                               append_port_info=get_port_info_append_command(
+                                   port_info_file="{}/{}".format(
+                                       PORT_INFO_LOCATION, port_info_file)),
+                               compute_node_authorized_keys=COMPUTE_NODE_AUTHORIZED_KEYS,  # noqa, pylint: disable=line-too-long
+                               listen_checks=SSHD_LISTEN_CHECKS,
+                               listen_check_interval=SSHD_LISTEN_CHECK_INTERVAL)  # noqa, pylint: disable=line-too-long
 
     return entry_point
@@ -6,18 +6,18 @@ from collections import defaultdict
 from idact.detail.log.get_logger import get_logger
 
 PORT_INFO_LOCATION = "~/.idact/sshd_ports"
-PORT_INFO_DIR_NAME_FORMAT = "alloc-{allocation_id}"
+PORT_INFO_FILE_NAME_FORMAT = "alloc-{allocation_id}"
 
 NODE_DEFAULT_PORT = 22
 
 
 class SshdPortInfo:
-    """Determines the sshd listening port based on the contents of a directory
-        written to by entry points.
+    """Determines the sshd listening port based on the lines appended
+        to a port info file by entry points.
 
         See :func:`.get_entry_point_script_contents`.
 
-        :param contents: Directory contents.
+        :param contents: Port info file lines, separated by spaces.
 
     """
 
@@ -25,7 +25,7 @@ class SshdPortInfo:
         self._hosts = defaultdict(list)
 
         log = get_logger(__name__)
-        log.debug("Sshd port directory contents: %s", contents)
+        log.debug("Sshd port info contents: %s", contents)
 
         lines = [i for i in contents.split(' ') if i]
         for line in lines:
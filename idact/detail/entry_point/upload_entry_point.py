@@ -1,22 +1,78 @@
 """This module contains a function for uploading an entry point script."""
 
-from io import BytesIO
+import shlex
 from typing import Optional
 
-import fabric.tasks
-from fabric.contrib.files import exists
-import fabric.decorators
-from fabric.operations import run, put
-
 from idact.detail.helper.get_random_file_name import get_random_file_name
 from idact.detail.helper.stage_info import stage_debug
-from idact.detail.log.capture_fabric_output_to_log import \
-    capture_fabric_output_to_log
 from idact.detail.log.get_logger import get_logger
 from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.ssh.batched_command import BatchedCommand
+from idact.detail.ssh.command_batch import CommandBatch
 
 ENTRY_POINT_LOCATION = "~/.idact/entry_points"
 ENTRY_POINT_FILE_NAME_LENGTH = 32
+ENTRY_POINT_EXISTS = "exists"
+
+
+def get_entry_point_path(runtime_dir: Optional[str] = None) -> str:
+    """Returns a random entry point script path.
+
+        :param runtime_dir: Runtime dir for deployment script.
+                            Default: ~/.idact/entry_points.
+
+    """
+    entry_point_location = runtime_dir if runtime_dir else ENTRY_POINT_LOCATION
+    file_name = get_random_file_name(length=ENTRY_POINT_FILE_NAME_LENGTH)
+    return "{entry_point_location}/{file_name}".format(
+        entry_point_location=entry_point_location,
+        file_name=file_name)
+
+
+def add_upload_entry_point(batch: CommandBatch,
+                           contents: str,
+                           script_path: str) -> BatchedCommand:
+    """Queues a command that uploads the entry point script, and returns it.
+
+        The script is written with `printf`, so no separate SFTP session
+        is needed. The command prints :attr:`.ENTRY_POINT_EXISTS`, if the
+        file was overwritten, see :func:`.warn_if_entry_point_overwritten`.
+
+        :param batch: Batch to add the command to.
+
+        :param contents: Script contents.
+
+        :param script_path: Script path, see :func:`.get_entry_point_path`.
+                            Must not need quoting, apart from a leading `~`.
+
+    """
+    entry_point_location = script_path.rsplit('/', 1)[0]
+    return batch.add(
+        "mkdir -p {entry_point_location}"
+        " && chmod 700 {entry_point_location}"
+        " && {{ test ! -e {script_path} || echo {exists}; }}"
+        " && printf '%s' {contents} > {script_path}"
+        " && chmod 700 {script_path}".format(
+            entry_point_location=entry_point_location,
+            script_path=script_path,
+            exists=ENTRY_POINT_EXISTS,
+            contents=shlex.quote(contents)))
+
+
+def warn_if_entry_point_overwritten(upload: BatchedCommand,
+                                    script_path: str):
+    """Logs a warning if the randomly named entry point overwrote
+        an existing file.
+
+        :param upload: Command returned by :func:`.add_upload_entry_point`.
+
+        :param script_path: Script path.
+
+    """
+    if upload.output == ENTRY_POINT_EXISTS:
+        log = get_logger(__name__)
+        log.warning("Overwriting randomly named entry point file:"
+                    " %s", script_path)
 
 
 def upload_entry_point(contents: str,
@@ -33,44 +89,17 @@ def upload_entry_point(contents: str,
 
     """
     log = get_logger(__name__)
-
-    result = []
-
-    entry_point_location = runtime_dir if runtime_dir else ENTRY_POINT_LOCATION
-
-    @fabric.decorators.task
-    def task():
-        """Creates the entry point dir and file.
-            Fails if it couldn't be created."""
-        with capture_fabric_output_to_log():
-            run(
-                "mkdir -p {entry_point_location}"
-                " && chmod 700 {entry_point_location}".format(
-                    entry_point_location=entry_point_location))
-
-            file_name = get_random_file_name(
-                length=ENTRY_POINT_FILE_NAME_LENGTH)
-            file_path = run("echo {entry_point_location}/{file_name}".format(
-                entry_point_location=entry_point_location,
-                file_name=file_name))
-            file_exists = exists(file_path)
-
-        if file_exists:
-            log.warning("Overwriting randomly named entry point file:"
-                        " %s", file_path)
-
-        with stage_debug(log, "Uploading the entry point script."):
-            with capture_fabric_output_to_log():
-                real_path = run("echo {file_path}".format(file_path=file_path))
-                file = BytesIO(contents.encode('ascii'))
-                put(file, real_path, mode=0o700)
-
-        with stage_debug(log, "Checking the entry point script was uploaded."):
-            with capture_fabric_output_to_log():
-                run("cat {real_path} > /dev/null".format(
-                    real_path=real_path))
-        result.append(real_path)
-
-    node.run_task(task)
-
-    return result[0]
+    script_path = get_entry_point_path(runtime_dir=runtime_dir)
+
+    with stage_debug(log, "Uploading the entry point script."):
+        batch = CommandBatch()
+        upload = add_upload_entry_point(batch=batch,
+                                        contents=contents,
+                                        script_path=script_path)
+        real_path = batch.add("echo {script_path}".format(
+            script_path=script_path))
+        batch.run(node=node)
+
+    warn_if_entry_point_overwritten(upload=upload,
+                                    script_path=real_path.output)
+    return real_path.output
@@ -51,7 +51,8 @@ class EnvironmentImpl(Environment):
         try:
             self.config.remove_cluster(name=name)
         finally:
-            self.clusters.pop(name)
+            cluster = self.clusters.pop(name)
+            cluster.close_connections()
 
     def set_log_level(self, level: int):
         self._config.log_level = level
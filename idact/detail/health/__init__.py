@@ -0,0 +1,2 @@
+"""This package contains internal functionality related to background
+    health checks of deployments."""
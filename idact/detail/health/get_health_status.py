@@ -0,0 +1,28 @@
+"""This module contains a function for getting the cached health status
+    of a deployment."""
+
+from idact.core.config import ClusterConfig
+from idact.detail.health.health_checkable import HealthCheckable
+from idact.detail.health.health_checker_provider import HealthCheckerProvider
+from idact.detail.health.health_status import HealthStatus
+
+
+def get_health_status(deployment: HealthCheckable,
+                      uuid: str,
+                      config: ClusterConfig) -> HealthStatus:
+    """Returns the cached health status of the deployment, and starts
+        checking it in the background, if health checks are enabled.
+
+        See :class:`.HealthChecker`.
+
+        :param deployment: Deployment to check.
+
+        :param uuid: Unique deployment id.
+
+        :param config: Config of the cluster the deployment is running on.
+
+    """
+    if not config.health_check_interval:
+        return HealthStatus()
+    checker = HealthCheckerProvider().get_checker(config=config)
+    return checker.get_status(uuid=uuid, deployment=deployment)
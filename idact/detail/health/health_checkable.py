@@ -0,0 +1,19 @@
+"""This module contains the interface of deployments that can be checked
+    by a :class:`.HealthChecker`."""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class HealthCheckable(ABC):
+    """Deployment that can be checked in the background."""
+
+    @abstractmethod
+    def check_health(self) -> Optional[bool]:
+        """Returns True if the deployment is alive, or None if it cannot
+            be checked right now, e.g. its tunnel was not opened yet.
+
+            Allocations should use the shared `squeue` results,
+            see :class:`.SqueueCache`.
+        """
+        pass
@@ -0,0 +1,107 @@
+"""This module contains the implementation of a background health checker
+    of deployments on a cluster."""
+
+import threading
+import weakref
+from typing import Dict, Optional  # noqa, pylint: disable=unused-import
+
+from idact.core.config import ClusterConfig
+from idact.detail.health.health_checkable import HealthCheckable
+from idact.detail.health.health_status import HealthStatus
+from idact.detail.helper.run_in_parallel import run_in_parallel
+from idact.detail.helper.utc_now import utc_now
+from idact.detail.log.get_logger import get_logger
+
+
+class HealthChecker:
+    """Checks registered deployments in a background thread every
+        :attr:`.ClusterConfig.health_check_interval` seconds, and caches
+        the results, so they can be read without blocking.
+
+        Deployments are checked in parallel, so all allocations share
+        one `squeue` call per round, see :class:`.SqueueCache`.
+        Jupyter and Dask deployments are probed through their existing
+        tunnels.
+
+        Deployments are referenced weakly, and the thread stops when
+        no registered deployments are left, or health checks are disabled.
+
+        :param config: Cluster config.
+
+    """
+
+    def __init__(self, config: ClusterConfig):
+        self._config = config
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._deployments = weakref.WeakValueDictionary()
+        self._statuses = {}  # type: Dict[str, HealthStatus]
+        self._thread = None  # type: Optional[threading.Thread]
+
+    def get_status(self,
+                   uuid: str,
+                   deployment: HealthCheckable) -> HealthStatus:
+        """Returns the cached status of the deployment, and registers it
+            for checks, if it was not registered yet.
+
+            :param uuid: Unique deployment id.
+
+            :param deployment: Deployment to check.
+
+        """
+        with self._lock:
+            if self._deployments.get(uuid, None) is not deployment:
+                self._deployments[uuid] = deployment
+                self._wake.set()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run,
+                                                daemon=True)
+                self._thread.start()
+            return self._statuses.get(uuid, HealthStatus())
+
+    def check_now(self):
+        """Checks all registered deployments once, in the calling thread."""
+        with self._lock:
+            deployments = list(self._deployments.items())
+
+        log = get_logger(__name__)
+
+        def check(item) -> Optional[bool]:
+            uuid, deployment = item
+            try:
+                return deployment.check_health()
+            except Exception:  # pylint: disable=broad-except
+                log.debug("Unable to check deployment health: %s", uuid)
+                log.debug("Exception", exc_info=1)
+                return None
+
+        results = run_in_parallel(check, deployments)
+
+        now = utc_now()
+        with self._lock:
+            for (uuid, _), is_alive in zip(deployments, results):
+                if is_alive is None:
+                    continue
+                previous = self._statuses.get(uuid, HealthStatus())
+                self._statuses[uuid] = HealthStatus(
+                    is_alive=is_alive,
+                    last_seen=now if is_alive else previous.last_seen)
+            for uuid in list(self._statuses):
+                if uuid not in self._deployments:
+                    del self._statuses[uuid]
+
+    def _run(self):
+        """Checks deployments until there are none left to check."""
+        log = get_logger(__name__)
+        log.debug("Starting health checks on %s.", self._config.host)
+        while True:
+            with self._lock:
+                interval = self._config.health_check_interval
+                if not self._deployments or not interval:
+                    self._thread = None
+                    log.debug("Stopping health checks on %s.",
+                              self._config.host)
+                    return
+                self._wake.clear()
+            self.check_now()
+            self._wake.wait(timeout=interval)
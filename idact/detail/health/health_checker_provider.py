@@ -0,0 +1,39 @@
+"""This module contains the implementation of a provider of health checkers
+    for each cluster."""
+
+import threading
+
+from idact.core.config import ClusterConfig
+from idact.detail.health.health_checker import HealthChecker
+from idact.detail.ssh.get_connection_key import get_connection_key
+
+
+class HealthCheckerProvider:
+    """Stores one health checker per cluster."""
+    _state = {}
+
+    def __init__(self):
+        if HealthCheckerProvider._state:
+            self.__dict__ = HealthCheckerProvider._state
+            return
+
+        self._lock = threading.Lock()
+        self._checkers = {}
+
+        HealthCheckerProvider._state = self.__dict__
+
+    def get_checker(self, config: ClusterConfig) -> HealthChecker:
+        """Returns the health checker for the cluster.
+
+            :param config: Cluster config.
+
+        """
+        key = get_connection_key(host=config.host,
+                                 port=config.port,
+                                 config=config)
+        with self._lock:
+            checker = self._checkers.get(key, None)
+            if checker is None:
+                checker = HealthChecker(config=config)
+                self._checkers[key] = checker
+            return checker
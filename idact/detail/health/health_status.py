@@ -0,0 +1,42 @@
+"""This module contains the cached result of a deployment health check."""
+
+import datetime
+from typing import Optional
+
+
+class HealthStatus:
+    """Cached result of the latest health check of a deployment.
+
+        :param is_alive: True if the deployment was alive, or None
+                         if it was not checked.
+
+        :param last_seen: UTC datetime of the latest check that found
+                          the deployment alive.
+
+    """
+
+    def __init__(self,
+                 is_alive: Optional[bool] = None,
+                 last_seen: Optional[datetime.datetime] = None):
+        self._is_alive = is_alive
+        self._last_seen = last_seen
+
+    @property
+    def is_alive(self) -> Optional[bool]:
+        """True if the deployment was alive, or None if it was not checked.
+        """
+        return self._is_alive
+
+    @property
+    def last_seen(self) -> Optional[datetime.datetime]:
+        """UTC datetime of the latest check that found the deployment alive.
+        """
+        return self._last_seen
+
+    def __str__(self):
+        return ("HealthStatus(is_alive={is_alive},"
+                " last_seen={last_seen})").format(is_alive=self._is_alive,
+                                                  last_seen=self._last_seen)
+
+    def __repr__(self):
+        return str(self)
@@ -1,24 +1,29 @@
-import fabric.decorators
-from fabric.contrib.files import exists
+"""This module contains a function for checking if a file exists
+    on a node."""
 
-from idact.detail.log.capture_fabric_output_to_log import \
-    capture_fabric_output_to_log
+from idact.detail.agent.query_agent import query_agent
 from idact.detail.nodes.node_internal import NodeInternal
 
 
 def file_exists_on_node(node: NodeInternal,
-                        path: str):
+                        path: str) -> bool:
     """Returns True, if the file exists on the node.
 
+        Uses the agent if it is enabled, see :func:`.query_agent`.
+
         :param node: Node to run commands on.
 
         :param path: File path.
 
     """
 
-    @fabric.decorators.task
-    def task():
-        with capture_fabric_output_to_log():
-            return exists(path)
+    def test_exists() -> bool:
+        """Tests if the file exists in a shell."""
+        result = node.run('test -e "$(echo {path})"'
+                          " && echo exists"
+                          " || echo missing".format(path=path))
+        return result == 'exists'
 
-    return node.run_task(task=task)
+    return query_agent(node=node,
+                       query=lambda agent: agent.file_exists(path=path),
+                       fallback=test_exists)
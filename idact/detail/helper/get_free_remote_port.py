@@ -1,40 +1,194 @@
 """This module contains functions for obtaining free port numbers
     on a cluster."""
 
-from typing import List
+import shlex
+from typing import List, Optional
 
 from idact.core.nodes import Node
+from idact.detail.agent.query_agent import query_agent
+
+PORT_RESERVATION_TIMEOUT = 600
+"""Seconds after which reserved ports are released, if the deployment
+    did not take them over."""
+
+FREE_REMOTE_PORTS_SCRIPT = r"""
+import os, signal, socket, sys, time
+sockets = []
+for _ in range(int(sys.argv[1])):
+    sock = socket.socket()
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(('', 0))
+    sockets.append(sock)
+ports = ' '.join(str(sock.getsockname()[1]) for sock in sockets)
+if len(sys.argv) < 4:
+    print(ports)
+    sys.exit(0)
+timeout, path = float(sys.argv[2]), sys.argv[3]
+read_end, write_end = os.pipe()
+if os.fork():
+    os.close(write_end)
+    if not os.read(read_end, 1):
+        sys.exit(1)
+    print(ports)
+    sys.exit(0)
+os.close(read_end)
+os.setsid()
+null = os.open(os.devnull, os.O_RDWR)
+for fd in (0, 1, 2):
+    os.dup2(null, fd)
+with open(path, 'w') as file:
+    file.write('%d\n' % os.getpid())
+os.write(write_end, b'.')
+os.close(write_end)
+
+
+def stop(signum, frame):
+    raise SystemExit(0)
+
+
+signal.signal(signal.SIGTERM, stop)
+deadline = time.time() + timeout
+try:
+    while time.time() < deadline and os.path.exists(path):
+        time.sleep(0.05)
+finally:
+    for sock in sockets:
+        sock.close()
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+"""
+"""Binds the requested number of sockets at the same time, so the ports
+    are distinct, and prints the ports on one line.
+
+    Arguments: `count [timeout reservation_file]`.
+
+    With a reservation file, the sockets are kept bound by a detached
+    process, which writes its pid to the file. It releases the ports
+    when it is terminated, when the file is removed, or after the timeout,
+    and then removes the file. The sockets use `SO_REUSEADDR`, so a program
+    that sets it too can bind the ports even before they are released."""
+
+
+def get_port_reservation_file_path(runtime_dir: str) -> str:
+    """Returns the port reservation file path in the runtime dir.
+
+        :param runtime_dir: Runtime dir path.
+
+    """
+    return '{runtime_dir}/reserved-ports'.format(runtime_dir=runtime_dir)
+
+
+def quote_reservation_file(reservation_file: str) -> str:
+    """Quotes the reservation file path, unless it starts with `~`.
+
+        :param reservation_file: Reservation file path.
+
+    """
+    if reservation_file.startswith('~'):
+        return reservation_file
+    return shlex.quote(reservation_file)
+
+
+def get_free_remote_ports_command(
+        count: int,
+        reservation_file: Optional[str] = None,
+        timeout: int = PORT_RESERVATION_TIMEOUT) -> str:
+    """Returns a command that prints distinct free ports on one line,
+        using a single Python process.
+
+        See :attr:`.FREE_REMOTE_PORTS_SCRIPT`.
+
+        :param count: Free port count.
+
+        :param reservation_file: If not None, the ports stay bound until
+                                 released with the command from
+                                 :func:`.get_release_remote_ports_command`.
+                                 Quoted, unless it starts with `~`.
+
+        :param timeout: Seconds after which reserved ports are released.
+
+    """
+    command = "python -c {script} {count}".format(
+        script=shlex.quote(FREE_REMOTE_PORTS_SCRIPT),
+        count=count)
+    if reservation_file is None:
+        return command
+    return "{command} {timeout} {reservation_file}".format(
+        command=command,
+        timeout=timeout,
+        reservation_file=quote_reservation_file(reservation_file))
+
+
+def get_release_remote_ports_command(reservation_file: str) -> str:
+    """Returns a command that releases reserved ports, and waits
+        up to five seconds until they are released.
+
+        It is meant to be run right before the program that binds them.
+
+        :param reservation_file: Reservation file path.
+
+    """
+    path = quote_reservation_file(reservation_file)
+    return ('pid="$(cat {path} 2>/dev/null)" && kill "$pid" 2>/dev/null;'
+            ' for i in $(seq 100); do'
+            ' [ -e {path} ] || break; sleep 0.05;'
+            ' done').format(path=path)
+
+
+def parse_free_remote_ports(output: str, count: int) -> List[int]:
+    """Parses the output of the free ports command.
+
+        :param output: Command output.
+
+        :param count: Expected free port count.
+
+        :raises RuntimeError: If the ports are not distinct,
+                              or their count is different.
+
+    """
+    try:
+        ports = [int(port) for port in output.split()]
+    except ValueError as e:
+        raise RuntimeError(
+            "Unable to parse free ports: '{}'.".format(output)) from e
+    if len(set(ports)) != count or len(ports) != count:
+        raise RuntimeError(
+            "Unable to obtain free ports on node, count: '{}'.".format(count))
+    return ports
 
 
 def get_free_remote_port(node: Node) -> int:
     """Returns a free remote port.
 
-        Uses a Python snippet to determine a free port by binding a socket
-        to port 0 and immediately releasing it.
+        See :func:`.get_free_remote_ports`.
 
         :param node: Node to find a port on.
 
     """
-    output = node.run("python -c 'import socket; s=socket.socket();"
-                      " s.bind((str(), 0)); print(s.getsockname()[1]);"
-                      " s.close()'")
-    return int(output)
+    return get_free_remote_ports(count=1, node=node)[0]
 
 
 def get_free_remote_ports(count: int, node: Node) -> List[int]:
-    """Returns several free remote ports.
+    """Returns distinct free remote ports, in a single command.
 
-        See :func:`.get_free_remote_port`.
+        See :func:`.get_free_remote_ports_command`. Uses the agent if it is
+        enabled, see :func:`.query_agent`.
 
         :param count: Free port count.
 
-        :param node: Node to find a port on.
+        :param node: Node to find ports on.
 
     """
+    ports = query_agent(
+        node=node,
+        query=lambda agent: agent.get_free_ports(count=count),
+        fallback=lambda: parse_free_remote_ports(
+            output=node.run(get_free_remote_ports_command(count=count)),
+            count=count))
 
-    result = {get_free_remote_port(node=node) for _ in range(count)}
-
-    if len(result) != count:
+    if len(set(ports)) != count:
         raise RuntimeError(
             "Unable to obtain free ports on node, count: '{}'.".format(count))
-    return list(result)
+    return ports
@@ -3,6 +3,7 @@
 from typing import List
 
 from idact.core.nodes import Node
+from idact.detail.agent.query_agent import query_agent
 
 # https://unix.stackexchange.com/questions/124127/kill-all-descendant-processes
 LIST_DESCENDANTS = (
@@ -17,6 +18,22 @@ LIST_DESCENDANTS = (
 def ptree(pid: int, node: Node) -> List[int]:
     """Returns a list containing this PID and all its descendants.
 
+        Uses the agent if it is enabled, see :func:`.query_agent`.
+
+        :param pid: Parent process pid.
+
+        :param node: Node to run pgrep on.
+
+    """
+    return query_agent(node=node,
+                       query=lambda agent: agent.ptree(pid=pid),
+                       fallback=lambda: ptree_with_pgrep(pid=pid, node=node))
+
+
+def ptree_with_pgrep(pid: int, node: Node) -> List[int]:
+    """Returns a list containing this PID and all its descendants,
+        listed with pgrep.
+
         :param pid: Parent process pid.
 
         :param node: Node to run pgrep on.
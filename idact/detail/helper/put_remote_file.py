@@ -1,36 +1,22 @@
-"""This module contains a function for downloading a file from cluster
-    in a Fabric task."""
+"""This module contains a function for uploading a file to cluster
+    over SFTP."""
 
 from io import BytesIO
 
-import fabric.decorators
-from fabric.operations import put
+import paramiko
 
 from idact.detail.helper.stage_info import stage_debug
-from idact.detail.log.capture_fabric_output_to_log import \
-    capture_fabric_output_to_log
 from idact.detail.log.get_logger import get_logger
 from idact.detail.nodes.node_internal import NodeInternal
-
-
-def put_remote_file(remote_path: str, contents: str):
-    """Uploads a remote file from string with r/w user permissions only.
-
-        Expects authentication to have been performed already.
-
-        :param remote_path: Remote file path.
-
-        :param contents: File contents.
-
-    """
-    file = BytesIO(contents.encode())
-    put(file, remote_path, mode=0o600)
+from idact.detail.ssh.get_sftp_path import get_sftp_path
 
 
 def put_file_on_node(node: NodeInternal,
                      remote_path: str,
-                     contents: str):
-    """Runs a task on the node that uploads a file.
+                     contents: str,
+                     mode: int = 0o600):
+    """Uploads a file to the node, by default with r/w user
+        permissions only.
 
         :param node: Node to upload the file to.
 
@@ -38,14 +24,19 @@ def put_file_on_node(node: NodeInternal,
 
         :param contents: File contents.
 
+        :param mode: File permissions.
+
     """
     log = get_logger(__name__)
     with stage_debug(log, "Putting file on node %s: %s",
                      node.host, remote_path):
-        @fabric.decorators.task
-        def file_upload_task():
-            with capture_fabric_output_to_log():
-                put_remote_file(remote_path=remote_path,
-                                contents=contents)
-
-        node.run_task(task=file_upload_task)
+        file = BytesIO(contents.encode())
+        sftp_path = get_sftp_path(remote_path)
+        try:
+            with node.connection() as client:
+                with client.open_sftp() as sftp:
+                    sftp.putfo(file, sftp_path)
+                    sftp.chmod(sftp_path, mode)
+        except (paramiko.SSHException, OSError) as e:
+            raise RuntimeError("Cannot put file '{remote_path}'.".format(
+                remote_path=remote_path)) from e
@@ -0,0 +1,66 @@
+"""This module contains a function for calling a function for each item
+    in a thread pool."""
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+from typing import Callable, Sequence, Any, List, Optional
+
+DEFAULT_MAX_PARALLEL = 16
+"""Default limit of concurrent operations on cluster nodes."""
+
+
+def run_in_parallel(fun: Callable[[Any], Any],
+                    items: Sequence[Any],
+                    max_parallel: int = DEFAULT_MAX_PARALLEL,
+                    on_result: Optional[Callable[[Any], None]] = None) -> List[Any]:  # noqa, pylint: disable=bad-continuation,line-too-long
+    """Calls the function for each item, with at most `max_parallel` calls
+        at the same time. Returns the results in item order.
+
+        If any call fails, calls that have not started yet are skipped,
+        and the first exception is raised after the calls in progress
+        finish.
+
+        :param fun: Function to call for each item.
+
+        :param items: Items to call the function for.
+
+        :param max_parallel: Maximum number of concurrent calls.
+
+        :param on_result: Called in the calling thread for each successful
+                          result, even if another call failed,
+                          e.g. to register cleanup.
+
+    """
+    if max_parallel < 1:
+        raise ValueError("Parallelism limit must be positive.")
+
+    if max_parallel == 1 or len(items) <= 1:
+        results = []
+        for item in items:
+            result = fun(item)
+            if on_result is not None:
+                on_result(result)
+            results.append(result)
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(max_parallel,
+                                            len(items))) as executor:
+        futures = [executor.submit(fun, item) for item in items]
+        _, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in not_done:
+            future.cancel()
+        wait(futures)
+
+    first_exception = None
+    for future in futures:
+        if future.cancelled():
+            continue
+        exception = future.exception()
+        if exception is not None:
+            if first_exception is None:
+                first_exception = exception
+        elif on_result is not None:
+            on_result(future.result())
+
+    if first_exception is not None:
+        raise first_exception
+    return [future.result() for future in futures]
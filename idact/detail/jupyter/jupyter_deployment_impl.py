@@ -1,6 +1,7 @@
 """This module contains the implementation of a Jupyter deployment interface.
 """
 
+import datetime
 import webbrowser
 from contextlib import ExitStack
 from typing import Optional
@@ -8,15 +9,21 @@ from typing import Optional
 from idact.core.jupyter_deployment import JupyterDeployment
 from idact.detail.deployment.cancel_on_exit import cancel_on_exit
 from idact.detail.deployment.generic_deployment import GenericDeployment
+from idact.detail.health.get_health_status import get_health_status
+from idact.detail.health.health_checkable import HealthCheckable
 from idact.detail.helper.get_uuid import get_uuid
 from idact.detail.helper.stage_info import stage_info
 from idact.detail.log.get_logger import get_logger
 from idact.detail.serialization.serializable import Serializable
 from idact.detail.serialization.serializable_types import SerializableTypes
+from idact.detail.tunnel.probe_tunnel_http_connection import \
+    probe_tunnel_http_connection
 from idact.detail.tunnel.tunnel_internal import TunnelInternal
 
 
-class JupyterDeploymentImpl(JupyterDeployment, Serializable):
+class JupyterDeploymentImpl(JupyterDeployment,
+                            Serializable,
+                            HealthCheckable):
     """Jupyter Notebook deployment on a node.
 
         :param deployment: Generic deployment of the notebook process.
@@ -67,6 +74,21 @@ class JupyterDeploymentImpl(JupyterDeployment, Serializable):
     def open_in_browser(self):
         webbrowser.open(self.address)
 
+    @property
+    def is_alive(self) -> Optional[bool]:
+        return get_health_status(deployment=self,
+                                 uuid=self._uuid,
+                                 config=self._deployment.node.config).is_alive
+
+    @property
+    def last_seen(self) -> Optional[datetime.datetime]:
+        return get_health_status(deployment=self,
+                                 uuid=self._uuid,
+                                 config=self._deployment.node.config).last_seen
+
+    def check_health(self) -> Optional[bool]:
+        return probe_tunnel_http_connection(tunnel=self._tunnel)
+
     def cancel(self):
         log = get_logger(__name__)
         with ExitStack() as stack:
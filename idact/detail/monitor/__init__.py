@@ -0,0 +1,2 @@
+"""This package contains internal functionality related to continuous
+    resource monitoring of nodes."""
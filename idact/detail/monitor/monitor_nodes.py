@@ -0,0 +1,60 @@
+"""This module contains a function for starting continuous resource
+    monitoring of multiple nodes."""
+
+from typing import List
+
+from idact.core.nodes_monitor import NodesMonitor
+from idact.detail.helper.stage_info import stage_debug
+from idact.detail.log.get_logger import get_logger
+from idact.detail.monitor.node_resource_history_impl import \
+    NodeResourceHistoryImpl
+from idact.detail.monitor.nodes_monitor_impl import NodesMonitorImpl
+from idact.detail.monitor.resource_ring_buffer import ResourceRingBuffer
+from idact.detail.monitor.resource_stream import ResourceStream
+from idact.detail.nodes.node_internal import NodeInternal
+
+DEFAULT_MONITOR_INTERVAL = 1.0
+"""Default seconds between resource usage samples."""
+
+DEFAULT_MONITOR_CAPACITY = 3600
+"""Default number of most recent samples kept for each node."""
+
+
+def monitor_nodes(nodes: List[NodeInternal],
+                  interval: float = DEFAULT_MONITOR_INTERVAL,
+                  capacity: int = DEFAULT_MONITOR_CAPACITY) -> NodesMonitor:
+    """Starts a resource sampler on each node, streaming samples
+        over one channel per node, in the background.
+
+        :param nodes: Nodes to monitor.
+
+        :param interval: Seconds between samples.
+
+        :param capacity: Number of most recent samples kept for each node.
+
+    """
+    if interval <= 0:
+        raise ValueError("Interval must be positive.")
+    if capacity < 1:
+        raise ValueError("Capacity must be positive.")
+
+    log = get_logger(__name__)
+    with stage_debug(log, "Starting resource monitor on %d nodes.",
+                     len(nodes)):
+        histories = []
+        streams = []
+        for node in nodes:
+            buffer = ResourceRingBuffer(capacity=capacity)
+            stream = ResourceStream(node=node,
+                                    interval=interval,
+                                    buffer=buffer)
+            histories.append(NodeResourceHistoryImpl(node=node,
+                                                     buffer=buffer,
+                                                     stream=stream))
+            streams.append(stream)
+        for stream in streams:
+            stream.start()
+
+    return NodesMonitorImpl(histories=histories,
+                            streams=streams,
+                            interval=interval)
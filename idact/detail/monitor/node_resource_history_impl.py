@@ -0,0 +1,118 @@
+"""This module contains the implementation of the resource usage history
+    of a single node."""
+
+from typing import Optional
+
+import bitmath
+import numpy
+
+from idact.core.node import Node
+from idact.core.nodes_monitor import NodeResourceHistory
+from idact.detail.monitor.resource_ring_buffer import ResourceRingBuffer, \
+    TIMESTAMP_COLUMN, CPU_USAGE_COLUMN, MEMORY_USAGE_COLUMN
+from idact.detail.monitor.resource_stream import ResourceStream
+
+
+class NodeResourceHistoryImpl(NodeResourceHistory):
+    """Implementation of :class:`.NodeResourceHistory`.
+
+        :param node: Monitored node.
+
+        :param buffer: Sample buffer.
+
+        :param stream: Stream that fills the buffer.
+
+    """
+
+    def __init__(self,
+                 node: Node,
+                 buffer: ResourceRingBuffer,
+                 stream: ResourceStream):
+        self._node = node
+        self._buffer = buffer
+        self._stream = stream
+
+    @property
+    def node(self) -> Node:
+        return self._node
+
+    @property
+    def samples(self) -> numpy.ndarray:
+        """All columns of the samples, see :class:`.ResourceRingBuffer`."""
+        return self._buffer.to_array()
+
+    @property
+    def timestamps(self) -> numpy.ndarray:
+        return self.samples[:, TIMESTAMP_COLUMN]
+
+    @property
+    def cpu_usage(self) -> numpy.ndarray:
+        return self.samples[:, CPU_USAGE_COLUMN]
+
+    @property
+    def memory_usage(self) -> numpy.ndarray:
+        return self.samples[:, MEMORY_USAGE_COLUMN]
+
+    @property
+    def mean_cpu_usage(self) -> Optional[float]:
+        return get_mean(self.cpu_usage)
+
+    @property
+    def peak_cpu_usage(self) -> Optional[float]:
+        return get_peak(self.cpu_usage)
+
+    @property
+    def mean_memory_usage(self) -> Optional[bitmath.GiB]:
+        return to_gib(get_mean(self.memory_usage))
+
+    @property
+    def peak_memory_usage(self) -> Optional[bitmath.GiB]:
+        return to_gib(get_peak(self.memory_usage))
+
+    @property
+    def error(self) -> Optional[Exception]:
+        return self._stream.error
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __str__(self):
+        return "NodeResourceHistory({node}, samples={count})".format(
+            node=self._node,
+            count=len(self))
+
+    def __repr__(self):
+        return str(self)
+
+
+def get_mean(values: numpy.ndarray) -> Optional[float]:
+    """Returns the mean, or None for no values.
+
+        :param values: Values to aggregate.
+
+    """
+    if not values.size:
+        return None
+    return float(numpy.mean(values))
+
+
+def get_peak(values: numpy.ndarray) -> Optional[float]:
+    """Returns the maximum, or None for no values.
+
+        :param values: Values to aggregate.
+
+    """
+    if not values.size:
+        return None
+    return float(numpy.max(values))
+
+
+def to_gib(value: Optional[float]) -> Optional[bitmath.GiB]:
+    """Converts a GiB value, if it is not None.
+
+        :param value: Value in GiB.
+
+    """
+    if value is None:
+        return None
+    return bitmath.GiB(value)
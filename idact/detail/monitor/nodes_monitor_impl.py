@@ -0,0 +1,92 @@
+"""This module contains the implementation of continuous resource
+    monitoring of multiple nodes."""
+
+from typing import List, Optional
+
+import bitmath
+import numpy
+
+from idact.core.nodes_monitor import NodesMonitor, NodeResourceHistory
+from idact.detail.monitor.node_resource_history_impl import \
+    NodeResourceHistoryImpl, get_mean, get_peak, to_gib
+from idact.detail.monitor.resource_ring_buffer import CPU_USAGE_COLUMN, \
+    MEMORY_USAGE_COLUMN
+from idact.detail.monitor.resource_stream import ResourceStream
+
+MONITOR_STOP_TIMEOUT = 5
+"""Seconds to wait for each stream to end after stopping."""
+
+
+class NodesMonitorImpl(NodesMonitor):  # pylint: disable=too-many-ancestors
+    """Implementation of :class:`.NodesMonitor`.
+
+        :param histories: History of each node.
+
+        :param streams: Stream of each node.
+
+        :param interval: Seconds between samples.
+
+    """
+
+    def __init__(self,
+                 histories: List[NodeResourceHistoryImpl],
+                 streams: List[ResourceStream],
+                 interval: float):
+        self._histories = histories
+        self._streams = streams
+        self._interval = interval
+        self._running = True
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def _get_all_samples(self) -> numpy.ndarray:
+        """Returns the samples of all nodes."""
+        samples = [history.samples for history in self._histories]
+        if not samples:
+            return numpy.zeros((0, 3))
+        return numpy.concatenate(samples)
+
+    @property
+    def mean_cpu_usage(self) -> Optional[float]:
+        return get_mean(self._get_all_samples()[:, CPU_USAGE_COLUMN])
+
+    @property
+    def peak_cpu_usage(self) -> Optional[float]:
+        return get_peak(self._get_all_samples()[:, CPU_USAGE_COLUMN])
+
+    @property
+    def mean_memory_usage(self) -> Optional[bitmath.GiB]:
+        return to_gib(get_mean(
+            self._get_all_samples()[:, MEMORY_USAGE_COLUMN]))
+
+    @property
+    def peak_memory_usage(self) -> Optional[bitmath.GiB]:
+        return to_gib(get_peak(
+            self._get_all_samples()[:, MEMORY_USAGE_COLUMN]))
+
+    def stop(self):
+        self._running = False
+        for stream in self._streams:
+            stream.stop()
+        for stream in self._streams:
+            stream.join(timeout=MONITOR_STOP_TIMEOUT)
+
+    def __len__(self) -> int:
+        return len(self._histories)
+
+    def __getitem__(self, i: int) -> NodeResourceHistory:
+        return self._histories[i]
+
+    def __str__(self):
+        return "NodesMonitor([{histories}], interval={interval})".format(
+            histories=','.join(str(history) for history in self._histories),
+            interval=self._interval)
+
+    def __repr__(self):
+        return str(self)
@@ -0,0 +1,61 @@
+"""This module contains a bounded buffer of resource usage samples."""
+
+import threading
+
+import numpy
+
+TIMESTAMP_COLUMN = 0
+CPU_USAGE_COLUMN = 1
+MEMORY_USAGE_COLUMN = 2
+
+
+class ResourceRingBuffer:
+    """Keeps the most recent resource usage samples in a preallocated
+        array, overwriting the oldest ones when full.
+
+        Each row contains a timestamp, %CPU and memory usage in GiB,
+        see :attr:`.TIMESTAMP_COLUMN`, :attr:`.CPU_USAGE_COLUMN`
+        and :attr:`.MEMORY_USAGE_COLUMN`.
+
+        :param capacity: Maximum number of samples.
+
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("Capacity must be positive.")
+        self._samples = numpy.zeros((capacity, 3), dtype=numpy.float64)
+        self._next = 0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of samples."""
+        return self._samples.shape[0]
+
+    def append(self, timestamp: float, cpu_usage: float, memory_usage: float):
+        """Adds a sample, overwriting the oldest one if the buffer is full.
+
+            :param timestamp: Seconds since the epoch.
+
+            :param cpu_usage: %CPU.
+
+            :param memory_usage: Memory usage in GiB.
+
+        """
+        with self._lock:
+            self._samples[self._next] = (timestamp, cpu_usage, memory_usage)
+            self._next = (self._next + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+
+    def to_array(self) -> numpy.ndarray:
+        """Returns a copy of the samples, oldest first."""
+        with self._lock:
+            if self._count < self.capacity:
+                return self._samples[:self._count].copy()
+            return numpy.roll(self._samples, -self._next, axis=0)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count
@@ -0,0 +1,121 @@
+"""This module contains the implementation of a stream of resource usage
+    samples from a long-running sampler on a node."""
+
+import json
+import shlex
+import threading
+import time
+
+import bitmath
+
+from idact.detail.log.get_logger import get_logger
+from idact.detail.monitor.resource_ring_buffer import ResourceRingBuffer
+from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.nodes.sample_resources_script import \
+    MONITOR_RESOURCES_SCRIPT
+from idact.detail.ssh.get_remote_command import get_remote_command
+from idact.detail.ssh.run_command import RECEIVE_BUFFER_SIZE
+
+
+def get_monitor_command(interval: float) -> str:
+    """Returns the command that prints resource usage of user processes
+        every `interval` seconds.
+
+        See :attr:`.MONITOR_RESOURCES_SCRIPT`.
+
+        :param interval: Seconds between samples.
+
+    """
+    return "python -u -c {script} {interval}".format(
+        script=shlex.quote(MONITOR_RESOURCES_SCRIPT),
+        interval=interval)
+
+
+class ResourceStream:
+    """Runs the resource sampler on a node over a single channel,
+        and appends each sample to the buffer, in a background thread.
+
+        :param node: Node to monitor.
+
+        :param interval: Seconds between samples.
+
+        :param buffer: Buffer to append samples to.
+
+    """
+
+    def __init__(self,
+                 node: NodeInternal,
+                 interval: float,
+                 buffer: ResourceRingBuffer):
+        self._node = node
+        self._interval = interval
+        self._buffer = buffer
+        self._lock = threading.Lock()
+        self._channel = None
+        self._stopped = False
+        self.error = None
+        """Set if the stream ended unexpectedly."""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        """Starts the sampler in a background thread."""
+        self._thread.start()
+
+    def stop(self):
+        """Stops the sampler."""
+        with self._lock:
+            self._stopped = True
+            if self._channel is not None:
+                self._channel.close()
+
+    def join(self, timeout: float):
+        """Waits for the background thread to finish.
+
+            :param timeout: Timeout in seconds.
+
+        """
+        self._thread.join(timeout=timeout)
+
+    @property
+    def done(self) -> bool:
+        """True, if the stream ended."""
+        return not self._thread.is_alive()
+
+    def _run(self):
+        log = get_logger(__name__)
+        try:
+            with self._node.connection() as client:
+                channel = client.get_transport().open_session()
+                with self._lock:
+                    self._channel = channel
+                    if self._stopped:
+                        channel.close()
+                        return
+                channel.exec_command(get_remote_command(
+                    command=get_monitor_command(interval=self._interval),
+                    config=self._node.config))
+                self._read_samples(channel=channel)
+                if not self._stopped:
+                    error = b''
+                    if channel.recv_stderr_ready():
+                        error = channel.recv_stderr(RECEIVE_BUFFER_SIZE)
+                    raise RuntimeError("Resource monitor ended: {}".format(
+                        error.decode('utf-8', 'replace').strip()))
+        except Exception as e:  # pylint: disable=broad-except
+            if not self._stopped:
+                log.debug("Resource monitor failed on %s.", self._node,
+                          exc_info=1)
+                self.error = e
+
+    def _read_samples(self, channel):
+        """Reads samples until the output ends. Other lines,
+            e.g. printed by shell startup scripts, are skipped."""
+        for line in channel.makefile('r'):
+            try:
+                cpu_usage, memory_kib = json.loads(line)
+            except ValueError:
+                continue
+            self._buffer.append(
+                timestamp=time.time(),
+                cpu_usage=cpu_usage,
+                memory_usage=bitmath.KiB(memory_kib).to_GiB().value)
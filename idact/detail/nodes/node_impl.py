@@ -1,40 +1,41 @@
 """This module contains the implementation of the cluster node interface."""
 
 import datetime
-from typing import Optional, Any, Callable
+from contextlib import contextmanager
+from typing import Optional, Callable, Iterator
 
 import bitmath
-import fabric.operations
-import fabric.tasks
-import fabric.decorators
-from fabric.exceptions import CommandTimeout
-from fabric.state import env
+import paramiko
 
 from idact.core.retry import Retry
 from idact.core.config import ClusterConfig
 from idact.core.jupyter_deployment import JupyterDeployment
 from idact.core.node_resource_status import NodeResourceStatus
+from idact.core.transfer_stats import TransferStats
 from idact.detail.auth.authenticate import authenticate
-from idact.detail.helper.raise_on_remote_fail import raise_on_remote_fail
+from idact.detail.auth.get_credentials import get_credentials
 from idact.detail.helper.retry import retry_with_config
 from idact.detail.helper.stage_info import stage_debug
 from idact.detail.helper.utc_from_str import utc_from_str
 from idact.detail.helper.utc_now import utc_now
 from idact.detail.jupyter.deploy_jupyter import deploy_jupyter
-from idact.detail.log.capture_fabric_output_to_log import \
-    capture_fabric_output_to_log
 from idact.detail.log.get_logger import get_logger
 from idact.detail.nodes.node_internal import NodeInternal
 from idact.detail.nodes.node_resource_status_impl import NodeResourceStatusImpl
 from idact.detail.serialization.serializable_types import SerializableTypes
-from idact.detail.tunnel.build_tunnel import build_tunnel
-from idact.detail.tunnel.get_bindings_with_single_gateway import \
-    get_bindings_with_single_gateway
+from idact.detail.ssh.connection_to_node import connection_to_node
+from idact.detail.ssh.run_command import run_command
+from idact.detail.tunnel.binding import Binding
+from idact.detail.tunnel.get_tunnel_multiplexer import get_tunnel_multiplexer
 from idact.detail.tunnel.ssh_tunnel import SshTunnel
 from idact.detail.tunnel.tunnel_internal import TunnelInternal
+from idact.detail.transfer.download_from_node import download_from_node
+from idact.detail.transfer.upload_to_node import upload_to_node
 from idact.detail.tunnel.validate_tunnel_ports import validate_tunnel_ports
 
 ANY_TUNNEL_PORT = 0
+LOCAL_BINDING_ADDRESS = ""
+REMOTE_BINDING_ADDRESS = "127.0.0.1"
 
 
 class NodeImpl(NodeInternal):
@@ -80,41 +81,37 @@ class NodeImpl(NodeInternal):
                  timeout: Optional[int] = None,
                  install_keys: bool = False) -> str:
         try:
-            @fabric.decorators.task
-            def task():
-                """Runs the command with a timeout."""
-                with capture_fabric_output_to_log():
-                    return fabric.operations.run(command,
-                                                 pty=False,
-                                                 timeout=timeout)
-
-            return self.run_task(task=task,
-                                 install_keys=install_keys)
-        except CommandTimeout as e:
+            with self.connection(install_keys=install_keys) as client:
+                return run_command(client=client,
+                                   host=self._host,
+                                   command=command,
+                                   timeout=timeout,
+                                   config=self._config)
+        except TimeoutError as e:
             raise TimeoutError("Command timed out: '{command}'".format(
                 command=command)) from e
         except RuntimeError as e:
             raise RuntimeError("Cannot run '{command}'".format(
                 command=command)) from e
 
-    def run_task(self,
-                 task: Callable,
-                 install_keys: bool = False) -> Any:
-        try:
-            self._ensure_allocated()
-
-            with raise_on_remote_fail(exception=RuntimeError):
-                with authenticate(host=self._host,
-                                  port=self._port,
-                                  config=self._config,
-                                  install_shared_keys=install_keys):
-                    result = fabric.tasks.execute(task)
-
-            output = next(iter(result.values()))
-
-            return output
-        except RuntimeError as e:
-            raise RuntimeError("Cannot run task.") from e
+    @contextmanager
+    def connection(self,
+                   install_keys: bool = False) -> Iterator[paramiko.SSHClient]:  # noqa, pylint: disable=bad-continuation,line-too-long
+        self._ensure_allocated()
+        if install_keys:
+            with authenticate(host=self._host,
+                              port=self._port,
+                              config=self._config,
+                              install_shared_keys=True):
+                pass
+
+        with connection_to_node(
+                host=self._host,
+                port=self._port,
+                config=self._config,
+                get_credentials=lambda: get_credentials(
+                    config=self._config)) as client:
+            yield client
 
     def make_allocated(self,
                        host: str,
@@ -176,27 +173,24 @@ class NodeImpl(NodeInternal):
 
                 first_try = [True]
 
-                def get_bindings_and_build_tunnel() -> TunnelInternal:
-                    bindings = get_bindings_with_single_gateway(
-                        here=here if first_try[0] else ANY_TUNNEL_PORT,
-                        node_host=self._host,
-                        node_port=self._port,
-                        there=there)
+                def open_tunnel() -> TunnelInternal:
+                    local_port = here if first_try[0] else ANY_TUNNEL_PORT
                     first_try[0] = False
-                    return build_tunnel(config=self._config,
-                                        bindings=bindings,
-                                        ssh_password=env.password,
-                                        ssh_pkey=env.key_filename)
-
-                with authenticate(host=self._host,
-                                  port=self._port,
-                                  config=self._config):
-                    if here == ANY_TUNNEL_PORT:
-                        return get_bindings_and_build_tunnel()
-                    return retry_with_config(
-                        get_bindings_and_build_tunnel,
-                        name=Retry.TUNNEL_TRY_AGAIN_WITH_ANY_PORT,
-                        config=self._config)
+                    return get_tunnel_multiplexer().tunnel(
+                        host=self._host,
+                        port=self._port,
+                        config=self._config,
+                        get_credentials=lambda: get_credentials(
+                            config=self._config),
+                        here=Binding(LOCAL_BINDING_ADDRESS, local_port),
+                        there=Binding(REMOTE_BINDING_ADDRESS, there))
+
+                if here == ANY_TUNNEL_PORT:
+                    return open_tunnel()
+                return retry_with_config(
+                    open_tunnel,
+                    name=Retry.TUNNEL_TRY_AGAIN_WITH_ANY_PORT,
+                    config=self._config)
 
         except RuntimeError as e:
             raise RuntimeError(
@@ -212,6 +206,36 @@ class NodeImpl(NodeInternal):
         return deploy_jupyter(node=self,
                               local_port=local_port)
 
+    def upload(self,
+               local_path: str,
+               remote_path: str,
+               compress: bool = False,
+               resume: bool = False,
+               max_parallel: Optional[int] = None,
+               on_progress: Optional[Callable[[str, int, int], None]] = None) -> TransferStats:  # noqa, pylint: disable=bad-continuation,line-too-long
+        return upload_to_node(node=self,
+                              local_path=local_path,
+                              remote_path=remote_path,
+                              compress=compress,
+                              resume=resume,
+                              max_parallel=max_parallel,
+                              on_progress=on_progress)
+
+    def download(self,
+                 remote_path: str,
+                 local_path: str,
+                 compress: bool = False,
+                 resume: bool = False,
+                 max_parallel: Optional[int] = None,
+                 on_progress: Optional[Callable[[str, int, int], None]] = None) -> TransferStats:  # noqa, pylint: disable=bad-continuation,line-too-long
+        return download_from_node(node=self,
+                                  remote_path=remote_path,
+                                  local_path=local_path,
+                                  compress=compress,
+                                  resume=resume,
+                                  max_parallel=max_parallel,
+                                  on_progress=on_progress)
+
     @property
     def config(self) -> ClusterConfig:
         return self._config
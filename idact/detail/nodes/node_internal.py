@@ -1,10 +1,12 @@
 """This module contains the internal cluster node interface."""
 import datetime
 from abc import abstractmethod
+from contextlib import contextmanager
 
-from typing import Optional, Callable, Any
+from typing import Optional, Iterator
 
 import bitmath
+import paramiko
 
 from idact.core.nodes import Node
 from idact.detail.config.client.client_cluster_config \
@@ -26,18 +28,18 @@ class NodeInternal(Node, Serializable):
 
             :param timeout: See :meth:`.Node.run`
 
-            :param install_keys: See :meth:`.NodeInternal.run_task`
+            :param install_keys: See :meth:`.NodeInternal.connection`
 
         """
         pass
 
     @abstractmethod
-    def run_task(self,
-                 task: Callable,
-                 install_keys: bool = False) -> Any:
-        """Internal run task.
-
-            :param task: Fabric task to run.
+    @contextmanager
+    def connection(self,
+                   install_keys: bool = False) -> Iterator[paramiko.SSHClient]:  # noqa, pylint: disable=bad-continuation,line-too-long
+        """Yields a pooled SSH connection to the node.
+            Authentication is only performed when a new connection
+            must be opened. Safe to use from multiple threads.
 
             :param install_keys: If True, shared SSH keys will be installed
                             after authentication (see :func:`.install_key`,
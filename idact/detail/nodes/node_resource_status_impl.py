@@ -1,18 +1,33 @@
-from typing import Optional
+from typing import Optional, Tuple
 
 import bitmath
 
 from idact.core.node_resource_status import NodeResourceStatus
-from idact.detail.nodes.get_node_cpu_usage import get_node_cpu_usage
-from idact.detail.nodes.get_node_memory_usage import get_node_memory_usage
 from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.nodes.resource_sampler_provider import \
+    ResourceSamplerProvider
 
 
 class NodeResourceStatusImpl(NodeResourceStatus):
-    """Implementation of the cluster node resource status interface."""
+    """Implementation of the cluster node resource status interface.
+
+        CPU and memory usage are sampled together, on first access.
+        See :class:`.ResourceSampler`.
+
+        :param node: Node to report on.
+
+    """
 
     def __init__(self, node: NodeInternal):
         self._node = node
+        self._usage = None  # type: Optional[Tuple[float, bitmath.KiB]]
+
+    def _get_usage(self) -> Tuple[float, bitmath.KiB]:
+        """Samples resource usage, if it was not sampled yet."""
+        if self._usage is None:
+            sampler = ResourceSamplerProvider().get_sampler(node=self._node)
+            self._usage = sampler.sample(node=self._node)
+        return self._usage
 
     @property
     def memory_total(self) -> Optional[bitmath.GiB]:
@@ -23,7 +38,7 @@ class NodeResourceStatusImpl(NodeResourceStatus):
 
     @property
     def memory_usage(self) -> bitmath.GiB:
-        memory = get_node_memory_usage(node=self._node)
+        _, memory = self._get_usage()
         return memory.to_GiB()
 
     @property
@@ -32,4 +47,5 @@ class NodeResourceStatusImpl(NodeResourceStatus):
 
     @property
     def cpu_usage(self) -> float:
-        return get_node_cpu_usage(node=self._node)
+        cpu_usage, _ = self._get_usage()
+        return cpu_usage
@@ -1,19 +1,31 @@
 """This module contains the implementation of the interface for a collection
     of nodes."""
+import datetime
 from typing import List, Optional
 
 from idact.core.config import ClusterConfig
 from idact.core.nodes import Nodes, Node
+from idact.core.nodes_monitor import NodesMonitor
+from idact.core.run_results import RunResults
 from idact.detail.allocation.allocation import Allocation
+from idact.detail.health.get_health_status import get_health_status
+from idact.detail.health.health_checkable import HealthCheckable
+from idact.detail.health.health_status import HealthStatus
 from idact.detail.helper.get_uuid import get_uuid
+from idact.detail.monitor.monitor_nodes import monitor_nodes, \
+    DEFAULT_MONITOR_INTERVAL, DEFAULT_MONITOR_CAPACITY
 from idact.detail.nodes.node_internal import NodeInternal
 from idact.detail.serialization.serializable import Serializable
 from idact.detail.nodes.node_impl import NodeImpl
+from idact.detail.nodes.run_on_nodes import run_on_nodes
 from idact.detail.serialization.serializable_types import SerializableTypes
+from idact.detail.slurm.get_squeue_cache import get_squeue_cache
 from idact.detail.slurm.slurm_allocation import SlurmAllocation
 
 
-class NodesImpl(Nodes, Serializable):  # pylint: disable=too-many-ancestors
+class NodesImpl(Nodes,  # pylint: disable=too-many-ancestors
+                Serializable,
+                HealthCheckable):
     """Implementation of a collection of nodes.
 
         :param nodes: Nodes to be part of the collection.
@@ -37,6 +49,11 @@ class NodesImpl(Nodes, Serializable):  # pylint: disable=too-many-ancestors
         """Unique deployment id."""
         return self._uuid
 
+    @property
+    def allocation(self) -> Allocation:
+        """Allocation request for the nodes."""
+        return self._allocation
+
     def wait(self,
              timeout: Optional[float] = None):
         self._allocation.wait(timeout=timeout)
@@ -47,10 +64,60 @@ class NodesImpl(Nodes, Serializable):  # pylint: disable=too-many-ancestors
     def running(self) -> bool:
         return self._allocation.running()
 
+    def run_all(self,
+                command: str,
+                timeout: Optional[int] = None,
+                max_parallel: Optional[int] = None) -> RunResults:
+        return run_on_nodes(nodes=self._nodes,
+                            commands=[command] * len(self._nodes),
+                            timeout=timeout,
+                            max_parallel=max_parallel)
+
+    def run_many(self,
+                 commands: List[str],
+                 timeout: Optional[int] = None,
+                 max_parallel: Optional[int] = None) -> RunResults:
+        return run_on_nodes(nodes=self._nodes,
+                            commands=list(commands),
+                            timeout=timeout,
+                            max_parallel=max_parallel)
+
+    def monitor(self,
+                interval: float = DEFAULT_MONITOR_INTERVAL,
+                capacity: int = DEFAULT_MONITOR_CAPACITY) -> NodesMonitor:
+        return monitor_nodes(nodes=self._nodes,
+                             interval=interval,
+                             capacity=capacity)
+
     @property
     def waited(self) -> bool:
         return self._allocation.waited
 
+    @property
+    def is_alive(self) -> Optional[bool]:
+        return self._get_health_status().is_alive
+
+    @property
+    def last_seen(self) -> Optional[datetime.datetime]:
+        return self._get_health_status().last_seen
+
+    def _get_health_status(self) -> HealthStatus:
+        """Returns the cached health status of the allocation."""
+        if not isinstance(self._allocation, SlurmAllocation):
+            return HealthStatus()
+        return get_health_status(deployment=self,
+                                 uuid=self._uuid,
+                                 config=self._allocation.access_node.config)
+
+    def check_health(self) -> Optional[bool]:
+        if not isinstance(self._allocation, SlurmAllocation):
+            return None
+        access_node = self._allocation.access_node
+        squeue = get_squeue_cache(node=access_node).get(node=access_node)
+        if self._allocation.waited:
+            return self._allocation.running_in(squeue=squeue)
+        return self._allocation.job_id in squeue
+
     def __len__(self) -> int:
         return len(self._nodes)
 
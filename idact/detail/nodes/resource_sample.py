@@ -0,0 +1,147 @@
+"""This module contains a function for sampling the resource usage
+    of user processes on a node."""
+
+import json
+import shlex
+from typing import Dict, List, Optional, Tuple
+
+import bitmath
+
+from idact.detail.agent.query_agent import query_agent
+from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.nodes.sample_resources_script import \
+    SAMPLE_RESOURCES_SCRIPT
+
+
+class ResourceSample:
+    """Resource usage of user processes on a node at one point in time.
+
+        See :attr:`.SAMPLE_RESOURCES_FUNCTION`.
+
+        :param boot_time: Node boot time, identifies the node and its uptime.
+
+        :param cpu_ticks: Total time of all cores, in clock ticks.
+
+        :param cpu_count: Core count.
+
+        :param processes: Start time and CPU time in clock ticks, by pid.
+
+        :param memory_usage: Sum of resident memory size.
+
+    """
+
+    def __init__(self,
+                 boot_time: int,
+                 cpu_ticks: int,
+                 cpu_count: int,
+                 processes: Dict[str, Tuple[int, int]],
+                 memory_usage: bitmath.KiB):
+        self._boot_time = boot_time
+        self._cpu_ticks = cpu_ticks
+        self._cpu_count = cpu_count
+        self._processes = processes
+        self._memory_usage = memory_usage
+
+    @property
+    def boot_time(self) -> int:
+        """Node boot time, identifies the node and its uptime."""
+        return self._boot_time
+
+    @property
+    def cpu_ticks(self) -> int:
+        """Total time of all cores, in clock ticks."""
+        return self._cpu_ticks
+
+    @property
+    def cpu_count(self) -> int:
+        """Core count."""
+        return self._cpu_count
+
+    @property
+    def processes(self) -> Dict[str, Tuple[int, int]]:
+        """Start time and CPU time in clock ticks, by pid."""
+        return self._processes
+
+    @property
+    def memory_usage(self) -> bitmath.KiB:
+        """Sum of resident memory size."""
+        return self._memory_usage
+
+    @staticmethod
+    def from_dict(sample: dict) -> 'ResourceSample':
+        """Creates a sample from the remote function result.
+
+            :param sample: Sample dict.
+
+        """
+        return ResourceSample(
+            boot_time=sample['boot_time'],
+            cpu_ticks=sample['cpu_ticks'],
+            cpu_count=sample['cpu_count'],
+            processes={pid: (start_time, cpu_time)
+                       for pid, (start_time, cpu_time)
+                       in sample['processes'].items()},
+            memory_usage=bitmath.KiB(sample['memory_kib']))
+
+
+def get_sample_resources_command(interval: float) -> str:
+    """Returns a command that prints resource samples as JSON.
+
+        See :attr:`.SAMPLE_RESOURCES_SCRIPT`.
+
+        :param interval: Seconds between two samples, or zero
+                         for a single sample.
+
+    """
+    return "python -c {script} {interval}".format(
+        script=shlex.quote(SAMPLE_RESOURCES_SCRIPT),
+        interval=interval)
+
+
+def sample_node_resources(node: NodeInternal,
+                          interval: float) -> List[ResourceSample]:
+    """Samples the resource usage of user processes in a single command.
+
+        Uses the agent if it is enabled, see :func:`.query_agent`.
+
+        :param node: Node to sample.
+
+        :param interval: Seconds between two samples, or zero
+                         for a single sample.
+
+    """
+    samples = query_agent(
+        node=node,
+        query=lambda agent: agent.sample_resources(interval=interval),
+        fallback=lambda: json.loads(node.run(
+            get_sample_resources_command(interval=interval))))
+    return [ResourceSample.from_dict(sample) for sample in samples]
+
+
+def get_cpu_usage(previous: ResourceSample,
+                  current: ResourceSample) -> Optional[float]:
+    """Returns the sum of %CPU of user processes between two samples,
+        or None if the samples cannot be compared.
+
+        Processes that were not present in the previous sample
+        are counted with all their CPU time.
+
+        :param previous: Earlier sample.
+
+        :param current: Later sample.
+
+    """
+    if previous.boot_time != current.boot_time:
+        return None
+    elapsed = (current.cpu_ticks - previous.cpu_ticks) / current.cpu_count
+    if elapsed <= 0:
+        return None
+
+    used = 0
+    for pid, (start_time, cpu_time) in current.processes.items():
+        previous_process = previous.processes.get(pid)
+        if previous_process is not None and previous_process[0] == start_time:
+            used += cpu_time - previous_process[1]
+        else:
+            used += cpu_time
+    return 100.0 * used / elapsed
@@ -0,0 +1,75 @@
+"""This module contains a sampler of node resource usage."""
+
+import threading
+import time
+from typing import Optional, Tuple  # noqa, pylint: disable=unused-import
+
+import bitmath
+
+from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.nodes.resource_sample import ResourceSample, \
+    get_cpu_usage, sample_node_resources
+
+RESOURCE_SAMPLE_INTERVAL = 0.2
+"""Seconds between two samples taken in one command, when there is
+    no usable previous sample."""
+
+RESOURCE_SAMPLE_MAX_AGE = 60
+"""Seconds after which the previous sample is too old to compute
+    the current CPU usage."""
+
+
+class ResourceSampler:
+    """Samples the resource usage of user processes on one node.
+
+        CPU usage is computed from the difference with the previous sample,
+        so each call takes one round trip, without waiting.
+        If the previous sample is missing, too recent or too old,
+        two samples are taken in the same command,
+        see :attr:`.RESOURCE_SAMPLE_INTERVAL`.
+
+    """
+
+    def __init__(self):
+        self._previous = None  # type: Optional[ResourceSample]
+        self._previous_time = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _sample_twice(node: NodeInternal) -> Tuple[float, ResourceSample]:
+        """Takes two samples in one command, returns the CPU usage
+            between them and the last sample.
+
+            :param node: Node to sample.
+
+        """
+        previous, current = sample_node_resources(
+            node=node,
+            interval=RESOURCE_SAMPLE_INTERVAL)
+        cpu_usage = get_cpu_usage(previous=previous, current=current)
+        return (0.0 if cpu_usage is None else cpu_usage), current
+
+    def sample(self, node: NodeInternal) -> Tuple[float, bitmath.KiB]:
+        """Returns the sum of %CPU and the sum of resident memory size
+            of user processes.
+
+            :param node: Node to sample.
+
+        """
+        with self._lock:
+            age = time.monotonic() - self._previous_time
+            if (self._previous is None
+                    or age < RESOURCE_SAMPLE_INTERVAL
+                    or age > RESOURCE_SAMPLE_MAX_AGE):
+                cpu_usage, current = self._sample_twice(node=node)
+            else:
+                current = sample_node_resources(node=node,
+                                                interval=0)[0]
+                cpu_usage = get_cpu_usage(previous=self._previous,
+                                          current=current)
+                if cpu_usage is None:
+                    cpu_usage, current = self._sample_twice(node=node)
+
+            self._previous = current
+            self._previous_time = time.monotonic()
+            return cpu_usage, current.memory_usage
@@ -0,0 +1,40 @@
+"""This module contains the implementation of a provider of resource
+    samplers for each node."""
+
+import threading
+
+from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.nodes.resource_sampler import ResourceSampler
+from idact.detail.ssh.get_connection_key import get_connection_key
+
+
+class ResourceSamplerProvider:
+    """Stores one resource sampler per node, so the previous sample
+        is shared by all node objects with the same host."""
+    _state = {}
+
+    def __init__(self):
+        if ResourceSamplerProvider._state:
+            self.__dict__ = ResourceSamplerProvider._state
+            return
+
+        self._lock = threading.Lock()
+        self._samplers = {}
+
+        ResourceSamplerProvider._state = self.__dict__
+
+    def get_sampler(self, node: NodeInternal) -> ResourceSampler:
+        """Returns the resource sampler for the node.
+
+            :param node: Node to sample.
+
+        """
+        key = get_connection_key(host=node.host,
+                                 port=node.port,
+                                 config=node.config)
+        with self._lock:
+            sampler = self._samplers.get(key, None)
+            if sampler is None:
+                sampler = ResourceSampler()
+                self._samplers[key] = sampler
+            return sampler
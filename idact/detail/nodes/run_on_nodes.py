@@ -0,0 +1,62 @@
+"""This module contains a function for running commands on multiple nodes
+    concurrently."""
+
+from typing import List, Optional
+
+from idact.core.node import Node
+from idact.core.run_results import RunResults
+from idact.detail.helper.run_in_parallel import run_in_parallel, \
+    DEFAULT_MAX_PARALLEL
+from idact.detail.helper.stage_info import stage_debug
+from idact.detail.log.get_logger import get_logger
+from idact.detail.nodes.run_results_impl import RunResultImpl, \
+    RunResultsImpl
+
+
+def run_on_nodes(nodes: List[Node],
+                 commands: List[str],
+                 timeout: Optional[int] = None,
+                 max_parallel: Optional[int] = None) -> RunResults:
+    """Runs each command on the corresponding node, with at most
+        `max_parallel` commands at the same time.
+        Failures are stored in results instead of being raised.
+
+        :param nodes: Nodes to run commands on.
+
+        :param commands: Command for each node.
+
+        :param timeout: Execution timeout on each node.
+
+        :param max_parallel: Maximum number of concurrent commands.
+                             Default: :attr:`.DEFAULT_MAX_PARALLEL`.
+
+    """
+    if len(commands) != len(nodes):
+        raise ValueError(
+            "Expected {nodes} commands, got {commands}.".format(
+                nodes=len(nodes),
+                commands=len(commands)))
+    if max_parallel is None:
+        max_parallel = DEFAULT_MAX_PARALLEL
+
+    log = get_logger(__name__)
+
+    def run(i: int) -> RunResultImpl:
+        node = nodes[i]
+        command = commands[i]
+        try:
+            output = node.run(command, timeout=timeout)
+            return RunResultImpl(node=node,
+                                 command=command,
+                                 output=output)
+        except Exception as e:  # pylint: disable=broad-except
+            log.debug("Command failed on %s.", node, exc_info=1)
+            return RunResultImpl(node=node,
+                                 command=command,
+                                 error=e)
+
+    with stage_debug(log, "Running commands on %d nodes.", len(nodes)):
+        results = run_in_parallel(run,
+                                  range(len(nodes)),
+                                  max_parallel=max_parallel)
+    return RunResultsImpl(results=results)
@@ -0,0 +1,108 @@
+"""This module contains the implementation of command results
+    on multiple nodes."""
+
+from typing import List, Optional
+
+from idact.core.node import Node
+from idact.core.run_results import RunResult, RunResults
+
+
+class RunResultImpl(RunResult):
+    """Implementation of :class:`.RunResult`.
+
+        :param node: Node the command was run on.
+
+        :param command: Command that was run.
+
+        :param output: Command output, or None on failure.
+
+        :param error: Exception raised on failure, or None.
+
+    """
+
+    def __init__(self,
+                 node: Node,
+                 command: str,
+                 output: Optional[str] = None,
+                 error: Optional[Exception] = None):
+        self._node = node
+        self._command = command
+        self._output = output
+        self._error = error
+
+    @property
+    def node(self) -> Node:
+        return self._node
+
+    @property
+    def command(self) -> str:
+        return self._command
+
+    @property
+    def output(self) -> Optional[str]:
+        return self._output
+
+    @property
+    def error(self) -> Optional[Exception]:
+        return self._error
+
+    @property
+    def succeeded(self) -> bool:
+        return self._error is None
+
+    def __str__(self):
+        if self.succeeded:
+            return "RunResult({node}, succeeded)".format(node=self._node)
+        return "RunResult({node}, failed: {error})".format(node=self._node,
+                                                           error=self._error)
+
+    def __repr__(self):
+        return str(self)
+
+
+class RunResultsImpl(RunResults):
+    """Implementation of :class:`.RunResults`.
+
+        :param results: Result for each node.
+
+    """
+
+    def __init__(self, results: List[RunResult]):
+        self._results = results
+
+    @property
+    def outputs(self) -> List[Optional[str]]:
+        return [result.output for result in self._results]
+
+    @property
+    def failed(self) -> List[RunResult]:
+        return [result for result in self._results
+                if not result.succeeded]
+
+    @property
+    def succeeded(self) -> bool:
+        return not self.failed
+
+    def raise_on_error(self):
+        failed = self.failed
+        if not failed:
+            return
+        message = "Command failed on {failed}/{total} nodes: {nodes}".format(
+            failed=len(failed),
+            total=len(self._results),
+            nodes=', '.join(str(result.node.host) for result in failed))
+        raise RuntimeError(message) from failed[0].error
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __getitem__(self, i: int) -> RunResult:
+        return self._results[i]
+
+    def __str__(self):
+        return "RunResults({succeeded}/{total} succeeded)".format(
+            succeeded=len(self._results) - len(self.failed),
+            total=len(self._results))
+
+    def __repr__(self):
+        return str(self)
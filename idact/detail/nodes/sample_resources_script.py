@@ -0,0 +1,117 @@
+"""This module contains the resource sampling code run on the cluster.
+    It is compatible with Python 2.7 and 3."""
+
+READ_RESOURCE_SAMPLE_FUNCTION = r"""
+def read_resource_sample():
+    with open('/proc/stat') as file:
+        lines = file.read().splitlines()
+    cpu_ticks = sum(int(value) for value in lines[0].split()[1:9])
+    cpu_count = sum(1 for line in lines
+                    if line.startswith('cpu') and line[3:4].isdigit())
+    boot_time = [int(line.split()[1]) for line in lines
+                 if line.startswith('btime ')][0]
+    uid = os.getuid()
+    own_pid = str(os.getpid())
+    processes = {}
+    memory_kib = 0
+    for pid in os.listdir('/proc'):
+        if not pid.isdigit() or pid == own_pid:
+            continue
+        try:
+            if os.stat('/proc/' + pid).st_uid != uid:
+                continue
+            with open('/proc/' + pid + '/stat') as file:
+                stat = file.read()
+            with open('/proc/' + pid + '/status') as file:
+                status = file.read()
+        except (IOError, OSError):
+            continue
+        # The process name may contain spaces and parentheses.
+        fields = stat[stat.rindex(')') + 2:].split()
+        processes[pid] = [int(fields[19]),
+                          int(fields[11]) + int(fields[12])]
+        for line in status.splitlines():
+            if line.startswith('VmRSS:'):
+                memory_kib += int(line.split()[1])
+                break
+    return {'boot_time': boot_time,
+            'cpu_ticks': cpu_ticks,
+            'cpu_count': cpu_count,
+            'processes': processes,
+            'memory_kib': memory_kib}
+"""
+"""Defines `read_resource_sample()`, which reads `/proc/stat`,
+    and `/proc/<pid>/stat` and `/proc/<pid>/status` for each process
+    of the current user, except itself.
+
+    A sample contains the boot time, the total CPU time of all cores
+    and the core count from `/proc/stat`, the start time and CPU time
+    in clock ticks by pid, and the sum of VmRSS in KiB.
+
+    Requires `os` to be imported."""
+
+SAMPLE_RESOURCES_FUNCTION = READ_RESOURCE_SAMPLE_FUNCTION + r"""
+
+def sample_resources(interval):
+    samples = [read_resource_sample()]
+    if interval > 0:
+        time.sleep(interval)
+        samples.append(read_resource_sample())
+    return samples
+"""
+"""Defines `sample_resources(interval)`, which returns a list with one
+    sample, or two samples taken `interval` seconds apart, if it is
+    positive. See :attr:`.READ_RESOURCE_SAMPLE_FUNCTION`.
+
+    Requires `os` and `time` to be imported."""
+
+SAMPLE_RESOURCES_SCRIPT = r"""
+import json, os, sys, time
+{sample_resources}
+print(json.dumps(sample_resources(float(sys.argv[1]))))
+""".format(sample_resources=SAMPLE_RESOURCES_FUNCTION)
+"""Prints the result of :attr:`.SAMPLE_RESOURCES_FUNCTION` as JSON,
+    for the interval passed as the first argument."""
+
+MONITOR_RESOURCES_SCRIPT = r"""
+import json, os, sys, time
+{read_resource_sample}
+
+def get_cpu_usage(previous, current):
+    elapsed = float(current['cpu_ticks'] - previous['cpu_ticks'])
+    elapsed /= current['cpu_count']
+    if elapsed <= 0:
+        return None
+    used = 0
+    for pid, (start_time, cpu_time) in current['processes'].items():
+        previous_process = previous['processes'].get(pid)
+        if previous_process is not None and previous_process[0] == start_time:
+            used += cpu_time - previous_process[1]
+        else:
+            used += cpu_time
+    return 100.0 * used / elapsed
+
+
+interval = float(sys.argv[1])
+previous = read_resource_sample()
+deadline = time.time()
+while True:
+    deadline += interval
+    time.sleep(max(0.0, deadline - time.time()))
+    current = read_resource_sample()
+    cpu_usage = get_cpu_usage(previous, current)
+    previous = current
+    if cpu_usage is None:
+        continue
+    try:
+        sys.stdout.write(json.dumps([cpu_usage, current['memory_kib']]))
+        sys.stdout.write('\n')
+        sys.stdout.flush()
+    except (IOError, OSError):
+        break
+""".format(read_resource_sample=READ_RESOURCE_SAMPLE_FUNCTION)
+"""Prints the sum of %CPU since the previous sample and the sum of VmRSS
+    in KiB of user processes, as a JSON list, every `interval` seconds
+    passed as the first argument, until its output is closed.
+
+    CPU usage is computed the same way as in :func:`.get_cpu_usage`."""
@@ -0,0 +1,2 @@
+"""This package contains implementation details of the shell startup
+ measurement app, see :mod:`idact.shell_startup`."""
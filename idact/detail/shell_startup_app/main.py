@@ -0,0 +1,66 @@
+"""This module contains the :func:`main` function for the shell startup
+ measurement app, see :mod:`idact.shell_startup`.
+
+ Note: The :func:`main` function uses :func:`click.command`, so it doesn't
+ show up in API docs for this module. See help message in
+ :mod:`idact.shell_startup` instead.
+
+"""
+
+from typing import Optional
+
+import click
+
+from idact import load_environment, show_cluster
+from idact.detail.log.get_logger import get_logger
+from idact.detail.ssh.measure_shell_startup import measure_shell_startup, \
+    format_shell_startup_times, SHELL_STARTUP_REPEAT
+
+
+@click.command()
+@click.argument('cluster_name',
+                type=str)
+@click.option('--environment', '-e',
+              default=None,
+              type=str,
+              help="Environment path. Default: ~/.idact.conf"
+                   " or the value of IDACT_CONFIG_PATH.")
+@click.option('--repeat', '-r',
+              default=SHELL_STARTUP_REPEAT,
+              type=click.IntRange(min=1),
+              help="Measured runs for each shell."
+                   " Default: {}.".format(SHELL_STARTUP_REPEAT))
+def main(cluster_name: str,
+         environment: Optional[str],
+         repeat: int) -> int:
+    """A console script that measures the time of running a no-op command
+        on the cluster access node, in several remote shells and in the
+        configured one (remote_shell, shell_environment).
+
+        The overhead column is the time over running the command directly
+        in the user's default shell. Use it to choose the remote shell
+        invocation for the cluster.
+
+        CLUSTER_NAME argument is the cluster name to measure on.
+        It must already be present in the config file.
+
+    """
+    log = None
+    try:
+        click.echo("Loading environment.")
+        load_environment(path=environment)
+        log = get_logger(__name__)
+
+        cluster = show_cluster(name=cluster_name)
+        node = cluster.get_access_node()
+        node.connect()
+
+        click.echo("Measuring shell startup.")
+        times = measure_shell_startup(node=node, repeat=repeat)
+        click.echo(format_shell_startup_times(times=times))
+    except:  # noqa, pylint: disable=broad-except
+        if log is not None:
+            log.error("Exception raised.", exc_info=1)
+            return 1
+        raise
+    return 0
@@ -36,7 +36,7 @@ def allocate_slurm_nodes(parameters: AllocationParameters,
                                                      node=access_node)
 
     def run_squeue_task() -> SqueueResult:
-        job_squeue = run_squeue(node=access_node)
+        job_squeue = run_squeue(node=access_node, job_ids=[job_id])
         return job_squeue[job_id]
 
     try:
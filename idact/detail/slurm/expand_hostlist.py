@@ -0,0 +1,126 @@
+"""This module contains a function for expanding Slurm hostlists locally,
+    without calling `scontrol show hostname`."""
+
+import functools
+import itertools
+import re
+from typing import List, Tuple
+
+HOSTLIST_CACHE_SIZE = 1024
+"""Number of distinct hostlists to remember."""
+
+MAX_EXPANDED_HOSTS = 100000
+"""Largest expansion to attempt locally."""
+
+__RANGE_REGEX = re.compile(r'^(\d+)(?:-(\d+))?$')
+__PLAIN_REGEX = re.compile(r'^[A-Za-z0-9._-]*$')
+
+
+def split_hostlist(value: str) -> List[str]:
+    """Splits a hostlist on commas outside of brackets.
+
+        :param value: Hostlist, e.g. `a[1-2,4],b`.
+
+        :raises ValueError: On unbalanced brackets.
+
+    """
+    parts = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(value):
+        if char == '[':
+            depth += 1
+            if depth > 1:
+                raise ValueError("Nested brackets are not supported.")
+        elif char == ']':
+            depth -= 1
+            if depth < 0:
+                raise ValueError("Unbalanced brackets.")
+        elif char == ',' and depth == 0:
+            parts.append(value[start:i])
+            start = i + 1
+    if depth != 0:
+        raise ValueError("Unbalanced brackets.")
+    parts.append(value[start:])
+    return parts
+
+
+def expand_ranges(ranges: str) -> List[str]:
+    """Expands the contents of a bracket, e.g. `01-03,7`
+        to `['01', '02', '03', '7']`. Zero padding of the lower bound
+        is preserved.
+
+        :param ranges: Comma-separated numbers and ranges.
+
+        :raises ValueError: On unsupported syntax.
+
+    """
+    expanded = []
+    for item in ranges.split(','):
+        match = __RANGE_REGEX.match(item)
+        if match is None:
+            raise ValueError("Unsupported range: '{}'.".format(item))
+        low, high = match.group(1), match.group(2)
+        if high is None:
+            expanded.append(low)
+            continue
+        if int(high) < int(low):
+            raise ValueError("Descending range: '{}'.".format(item))
+        if int(high) - int(low) >= MAX_EXPANDED_HOSTS:
+            raise ValueError("Range too large: '{}'.".format(item))
+        width = len(low) if low.startswith('0') else 0
+        expanded.extend(str(number).zfill(width)
+                        for number in range(int(low), int(high) + 1))
+    return expanded
+
+
+def expand_host_expression(expression: str) -> List[str]:
+    """Expands a single host expression, which may contain multiple
+        bracketed ranges, e.g. `rack[1-2]-node[01-02]`.
+
+        :param expression: Host expression without top-level commas.
+
+        :raises ValueError: On unsupported syntax.
+
+    """
+    segments = re.split(r'(\[[^\]]*\])', expression)
+    choices = []
+    for segment in segments:
+        if segment.startswith('['):
+            choices.append(expand_ranges(segment[1:-1]))
+        elif __PLAIN_REGEX.match(segment):
+            choices.append([segment])
+        else:
+            raise ValueError("Unsupported segment: '{}'.".format(segment))
+
+    count = 1
+    for choice in choices:
+        count *= len(choice)
+    if count > MAX_EXPANDED_HOSTS:
+        raise ValueError("Expansion too large.")
+    return [''.join(parts) for parts in itertools.product(*choices)]
+
+
+@functools.lru_cache(maxsize=HOSTLIST_CACHE_SIZE)
+def _expand_hostlist_cached(value: str) -> Tuple[str, ...]:
+    hosts = []
+    for expression in split_hostlist(value):
+        if not expression:
+            raise ValueError("Empty host expression.")
+        hosts.extend(expand_host_expression(expression))
+    return tuple(hosts)
+
+
+def expand_hostlist(value: str) -> List[str]:
+    """Expands a Slurm hostlist like `scontrol show hostname`,
+        e.g. `node[1-3,7],gpu[01-02]` to
+        `['node1', 'node2', 'node3', 'node7', 'gpu01', 'gpu02']`.
+
+        Results are memoized.
+
+        :param value: Hostlist in the compact format.
+
+        :raises ValueError: On syntax that cannot be expanded locally.
+
+    """
+    return list(_expand_hostlist_cached(value))
@@ -0,0 +1,18 @@
+"""This module contains a function for getting the squeue cache
+    for a cluster."""
+
+from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.slurm.squeue_cache import SqueueCache
+from idact.detail.slurm.squeue_cache_provider import SqueueCacheProvider
+
+
+def get_squeue_cache(node: NodeInternal) -> SqueueCache:
+    """Returns the squeue cache shared by all allocations on the cluster
+        of the access node.
+
+        See :class:`.SqueueCacheProvider`.
+
+        :param node: Access node.
+
+    """
+    return SqueueCacheProvider().get_cache(node=node)
@@ -0,0 +1,17 @@
+"""This module contains a function for getting the squeue watcher
+    for a cluster."""
+
+from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.slurm.squeue_watcher import SqueueWatcher
+from idact.detail.slurm.squeue_watcher_provider import SqueueWatcherProvider
+
+
+def get_squeue_watcher(node: NodeInternal) -> SqueueWatcher:
+    """Returns the squeue watcher shared by all allocations on the cluster.
+
+        See :class:`.SqueueWatcherProvider`.
+
+        :param node: Access node.
+
+    """
+    return SqueueWatcherProvider().get_watcher(node=node)
@@ -5,11 +5,16 @@ import shlex
 from typing import Dict, Optional, List
 
 from idact.core.nodes import Node
+from idact.detail.agent.query_agent import query_agent
 from idact.detail.config.validation.validate_hostname import validate_hostname
 from idact.detail.helper.utc_now import utc_now
 from idact.detail.log.get_logger import get_logger
+from idact.detail.slurm.expand_hostlist import expand_hostlist
 from idact.detail.slurm.squeue_result import SqueueResult
 
+SQUEUE_FORMAT = '%A|%D|%L|%r|%R|%T'
+"""Output format of `squeue`, see :func:`.extract_squeue_line`."""
+
 
 # pylint: disable=invalid-name
 
@@ -65,8 +70,11 @@ def extract_squeue_format_r(value: str) -> Optional[str]:
 
 
 def extract_squeue_format_R(value: str, node: Node) -> Optional[List[str]]:
-    """Extracts the job node list `%R` from `squeue` output, and calls `scontrol`
-        to extract each hostname.
+    """Extracts the job node list `%R` from `squeue` output, and expands it
+        to a list of hostnames.
+
+        The list is expanded locally, see :func:`.expand_hostlist`.
+        `scontrol` is called only for syntax that cannot be expanded locally.
 
         :param value: Job node list in a compact format, e.g. `node[1-7]`.
 
@@ -75,8 +83,15 @@ def extract_squeue_format_R(value: str, node: Node) -> Optional[List[str]]:
     if value.startswith('('):
         return None
 
-    output = node.run("scontrol show hostname {}".format(shlex.quote(value)))
-    hosts = [validate_hostname(i) for i in output.splitlines()]
+    try:
+        hostnames = expand_hostlist(value)
+    except ValueError:
+        log = get_logger(__name__)
+        log.debug("Expanding hostlist with scontrol: %s", value)
+        output = node.run("scontrol show hostname {}".format(
+            shlex.quote(value)))
+        hostnames = output.splitlines()
+    hosts = [validate_hostname(i) for i in hostnames]
     return hosts if hosts else None
 
 
@@ -125,23 +140,61 @@ def extract_squeue_line(now: datetime.datetime,
                         state=state)
 
 
-def run_squeue(node: Node) -> Dict[int, SqueueResult]:
+def get_squeue_command(job_ids: Optional[List[int]] = None) -> str:
+    """Returns the `squeue` command for the current user's jobs.
+
+        :param job_ids: If not None, only these jobs are queried
+                        on the server side.
+
+    """
+    command = "squeue --user $USER --format '{}'".format(SQUEUE_FORMAT)
+    if job_ids is None:
+        return command
+    # Finished jobs make squeue fail with 'Invalid job id specified'.
+    return "{command} --jobs {job_ids} 2> /dev/null || true".format(
+        command=command,
+        job_ids=','.join(str(job_id) for job_id in job_ids))
+
+
+def extract_squeue_lines(now: datetime.datetime,
+                         lines: List[str],
+                         node: Node) -> Dict[int, SqueueResult]:
+    """Extracts job statuses from `squeue` output lines without the header.
+
+        :param now: Current time for calculating job finish time.
+
+        :param lines: `squeue` output lines.
+
+        :param node: Node to run `scontrol` on.
+
+    """
+    return {squeue_result.job_id: squeue_result
+            for squeue_result
+            in [extract_squeue_line(now=now,
+                                    line=line,
+                                    node=node)
+                for line in lines]
+            if squeue_result is not None}
+
+
+def run_squeue(node: Node,
+               job_ids: Optional[List[int]] = None) -> Dict[int, SqueueResult]:
     """Runs `squeue` and extracts job statuses as results.
 
         :param node: Node to run `squeue` on.
+
+        :param job_ids: If not None, only these jobs are queried.
+
+        Uses the agent if it is enabled, see :func:`.query_agent`.
     """
 
     now = utc_now()
-    output = node.run("squeue"
-                      " --user $USER"
-                      " --format '%A|%D|%L|%r|%R|%T'")
+    output = query_agent(
+        node=node,
+        query=lambda agent: agent.squeue(output_format=SQUEUE_FORMAT,
+                                         job_ids=job_ids),
+        fallback=lambda: node.run(get_squeue_command(job_ids=job_ids)))
     lines = output.splitlines()[1:]  # Ignore header.
-    results = {squeue_result.job_id: squeue_result
-               for squeue_result
-               in [extract_squeue_line(now=now,
-                                       line=line,
-                                       node=node)
-                   for line in lines]
-               if squeue_result is not None}
-
-    return results
+    return extract_squeue_lines(now=now,
+                                lines=lines,
+                                node=node)
@@ -3,7 +3,7 @@
 
 import datetime
 from time import sleep
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from idact.detail.allocation.allocation import Allocation
 from idact.detail.allocation.allocation_parameters import AllocationParameters
@@ -15,9 +15,15 @@ from idact.detail.nodes.node_impl import NodeImpl
 from idact.detail.nodes.node_internal import NodeInternal
 from idact.detail.serialization.serializable_types import SerializableTypes
 from idact.detail.slurm.run_scancel import run_scancel
+from idact.detail.slurm.get_squeue_cache import get_squeue_cache
+from idact.detail.slurm.get_squeue_watcher import get_squeue_watcher
 from idact.detail.slurm.run_squeue import run_squeue
+from idact.detail.slurm.squeue_result import SqueueResult
 
-WAIT_SQUEUE_INTERVAL = 0.5
+WAIT_SQUEUE_INITIAL_INTERVAL = 0.5
+WAIT_SQUEUE_MAX_INTERVAL = 10.0
+WAIT_SQUEUE_BACKOFF = 1.5
+PENDING_STATES = ['PENDING', 'CONFIGURING']
 STILL_PENDING_MESSAGE_EVERY_N_SQUEUE = 6
 STILL_PENDING_MESSAGE = "Still pending or configuring..."
 
@@ -34,7 +40,7 @@ class SlurmAllocation(Allocation):
                       changes to `RUNNING`.
 
         :param entry_point_script_path: Entry point file to remove after
-                                        job starts.
+                                        job starts, along with port info.
 
         :param parameters: Allocation parameters.
 
@@ -66,9 +72,54 @@ class SlurmAllocation(Allocation):
         if self._done_waiting:
             raise RuntimeError("Already waited.")
 
+        job = None
+        if self._access_node.config.watch_squeue:
+            try:
+                job = self._wait_with_squeue_watcher(end=end)
+            except RuntimeError:
+                log.debug("Unable to watch squeue, polling instead.",
+                          exc_info=1)
+        if job is None:
+            job = self._wait_with_squeue_polling(end=end)
+
+        if job.state != 'RUNNING':
+            self._access_node.run("rm -f {entry_point_script_path}".format(
+                entry_point_script_path=self._entry_point_script_path))
+            message = ("Unable to wait: allocation entered unsupported"
+                       " or failing state: '{}'")
+            raise RuntimeError(message.format(job.state))
+
+        self._done_waiting = True
+        finalize_allocation(
+            allocation_id=self._job_id,
+            hostnames=job.node_list,
+            nodes=self._nodes,
+            parameters=self._parameters,
+            allocated_until=job.end_time,
+            entry_point_script_path=self._entry_point_script_path,
+            config=self._access_node.config)
+
+    def _wait_with_squeue_polling(
+            self,
+            end: Optional[datetime.datetime]) -> SqueueResult:
+        """Polls squeue for the job with exponential backoff, until it's
+            no longer pending. Polls are shared with other allocations
+            through the squeue cache. If cached results miss the job,
+            e.g. they were obtained before it was submitted, only this
+            job is queried with `--jobs`.
+
+            :param end: Timeout timestamp, or None.
+
+        """
+        log = get_logger(__name__)
         iterations = 0
+        interval = WAIT_SQUEUE_INITIAL_INTERVAL
         while True:
-            squeue = run_squeue(node=self._access_node)
+            cache = get_squeue_cache(node=self._access_node)
+            squeue = cache.get(node=self._access_node)
+            if self._job_id not in squeue:
+                squeue = run_squeue(node=self._access_node,
+                                    job_ids=[self._job_id])
 
             try:
                 job = squeue[self._job_id]
@@ -76,45 +127,70 @@ class SlurmAllocation(Allocation):
                 raise RuntimeError("Unable to obtain information "
                                    "about the allocation.") from e
 
-            if job.state in ['PENDING', 'CONFIGURING']:
-                if end is not None and utc_now() >= end:
-                    raise TimeoutError("Timed out while waiting "
-                                       "for allocation.")
-                if iterations % STILL_PENDING_MESSAGE_EVERY_N_SQUEUE == 0:
-                    log.info(STILL_PENDING_MESSAGE)
-                else:
-                    log.debug(STILL_PENDING_MESSAGE)
-                iterations += 1
-                sleep(WAIT_SQUEUE_INTERVAL)
-                continue
-            try:
-                if job.state != 'RUNNING':
-                    message = ("Unable to wait: allocation entered unsupported"
-                               " or failing state: '{}'")
-                    raise RuntimeError(message.format(job.state))
-
-                self._done_waiting = True
-                finalize_allocation(allocation_id=self._job_id,
-                                    hostnames=job.node_list,
-                                    nodes=self._nodes,
-                                    parameters=self._parameters,
-                                    allocated_until=job.end_time,
-                                    config=self._access_node.config)
-            finally:
-                self._access_node.run("rm -f {entry_point_script_path}".format(
-                    entry_point_script_path=self._entry_point_script_path))
-            break
+            if job.state not in PENDING_STATES:
+                return job
+
+            now = utc_now()
+            if end is not None and now >= end:
+                raise TimeoutError("Timed out while waiting "
+                                   "for allocation.")
+            if iterations % STILL_PENDING_MESSAGE_EVERY_N_SQUEUE == 0:
+                log.info(STILL_PENDING_MESSAGE)
+            else:
+                log.debug(STILL_PENDING_MESSAGE)
+            iterations += 1
+            if end is not None:
+                interval = min(interval, (end - now).total_seconds())
+            sleep(interval)
+            interval = min(interval * WAIT_SQUEUE_BACKOFF,
+                           WAIT_SQUEUE_MAX_INTERVAL)
+
+    def _wait_with_squeue_watcher(
+            self,
+            end: Optional[datetime.datetime]) -> SqueueResult:
+        """Waits for the job to leave the pending state, using the squeue
+            stream shared by all allocations on the cluster.
+
+            :param end: Timeout timestamp, or None.
+
+            :raises RuntimeError: If the stream failed.
+
+        """
+        log = get_logger(__name__)
+        log.info("Waiting for the job to start...")
+        timeout = None
+        if end is not None:
+            timeout = max(0.0, (end - utc_now()).total_seconds())
+        job = get_squeue_watcher(node=self._access_node).wait(
+            job_id=self._job_id,
+            states=PENDING_STATES,
+            timeout=timeout)
+        if job is None:
+            raise RuntimeError("Unable to obtain information "
+                               "about the allocation.")
+        return job
 
     def cancel(self):
         log = get_logger(__name__)
         with stage_info(log, "Cancelling job %d.", self._job_id):
             run_scancel(job_id=self._job_id,
                         node=self._access_node)
+            get_squeue_cache(node=self._access_node).invalidate()
             for node in self._nodes:
                 node.make_cancelled()
 
     def running(self) -> bool:
-        squeue = run_squeue(node=self._access_node)
+        squeue = get_squeue_cache(node=self._access_node).get(
+            node=self._access_node)
+        return self.running_in(squeue=squeue)
+
+    def running_in(self, squeue: Dict[int, SqueueResult]) -> bool:
+        """Returns True, if the job is running according to `squeue`
+            results obtained earlier, e.g. shared by multiple allocations.
+
+            :param squeue: Results of `squeue` for the current user.
+
+        """
         return (self._job_id in squeue and
                 squeue[self._job_id].state == 'RUNNING')
 
@@ -122,6 +198,16 @@ class SlurmAllocation(Allocation):
     def waited(self) -> bool:
         return self._done_waiting
 
+    @property
+    def job_id(self) -> int:
+        """Slurm job ID."""
+        return self._job_id
+
+    @property
+    def access_node(self) -> NodeInternal:
+        """Access node for the cluster on which the job was requested."""
+        return self._access_node
+
     def serialize(self) -> dict:
         return {'type': str(SerializableTypes.SLURM_ALLOCATION),
                 'job_id': self._job_id,
@@ -0,0 +1,96 @@
+"""This module contains the implementation of a cache of `squeue` output
+    shared by all allocations on a cluster."""
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, Optional
+
+from idact.detail.log.get_logger import get_logger
+from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.slurm.run_squeue import run_squeue
+from idact.detail.slurm.squeue_result import SqueueResult
+
+
+class SqueueCache:
+    """Shares the latest `squeue` output for the current user's jobs.
+
+        Output younger than :attr:`.ClusterConfig.squeue_cache_ttl`
+        is reused. Concurrent refreshes are de-duplicated: callers wait
+        for the refresh already in progress, instead of running
+        `squeue` again.
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._snapshot_started = None
+        self._refresh = None
+        self._refresh_started = None
+        self._invalidated = None
+
+    def get(self,
+            node: NodeInternal,
+            max_age: Optional[float] = None) -> Dict[int, SqueueResult]:
+        """Returns `squeue` results, running `squeue` only if the latest
+            results are too old.
+
+            :param node: Access node to run `squeue` on.
+
+            :param max_age: Maximum age of the results in seconds,
+                            measured from the start of the `squeue` call.
+                            Default: :attr:`.ClusterConfig.squeue_cache_ttl`.
+
+        """
+        if max_age is None:
+            max_age = node.config.squeue_cache_ttl
+        requested = time.monotonic()
+
+        with self._lock:
+            oldest_allowed = requested - max_age
+            if self._invalidated is not None:
+                oldest_allowed = max(oldest_allowed, self._invalidated)
+            if (self._snapshot is not None
+                    and self._snapshot_started >= oldest_allowed):
+                return self._snapshot
+            if (self._refresh is not None
+                    and self._refresh_started >= oldest_allowed):
+                refresh = self._refresh
+                leader = False
+            else:
+                refresh = Future()
+                self._refresh = refresh
+                self._refresh_started = requested
+                leader = True
+
+        if not leader:
+            return refresh.result()
+
+        try:
+            snapshot = run_squeue(node=node)
+        except Exception as e:
+            with self._lock:
+                if self._refresh is refresh:
+                    self._refresh = None
+            refresh.set_exception(e)
+            raise
+
+        with self._lock:
+            if (self._snapshot_started is None
+                    or self._snapshot_started < requested):
+                self._snapshot = snapshot
+                self._snapshot_started = requested
+            if self._refresh is refresh:
+                self._refresh = None
+        log = get_logger(__name__)
+        log.debug("Refreshed squeue cache: %d jobs.", len(snapshot))
+        refresh.set_result(snapshot)
+        return snapshot
+
+    def invalidate(self):
+        """Makes the next call to :meth:`get` run `squeue`, e.g. after
+            a job was cancelled. Results of refreshes already in progress
+            are not reused either."""
+        with self._lock:
+            self._invalidated = time.monotonic()
@@ -0,0 +1,39 @@
+"""This module contains the implementation of a provider of squeue caches
+    for each cluster."""
+
+import threading
+
+from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.slurm.squeue_cache import SqueueCache
+from idact.detail.ssh.get_connection_key import get_connection_key
+
+
+class SqueueCacheProvider:
+    """Stores one squeue cache per access node."""
+    _state = {}
+
+    def __init__(self):
+        if SqueueCacheProvider._state:
+            self.__dict__ = SqueueCacheProvider._state
+            return
+
+        self._lock = threading.Lock()
+        self._caches = {}
+
+        SqueueCacheProvider._state = self.__dict__
+
+    def get_cache(self, node: NodeInternal) -> SqueueCache:
+        """Returns the squeue cache for the access node.
+
+            :param node: Access node.
+
+        """
+        key = get_connection_key(host=node.host,
+                                 port=node.port,
+                                 config=node.config)
+        with self._lock:
+            cache = self._caches.get(key, None)
+            if cache is None:
+                cache = SqueueCache()
+                self._caches[key] = cache
+            return cache
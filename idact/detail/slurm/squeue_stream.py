@@ -0,0 +1,131 @@
+"""This module contains the implementation of a stream of job status
+    snapshots from a long-running `squeue` process."""
+
+import threading
+import paramiko
+
+from idact.detail.helper.utc_now import utc_now
+from idact.detail.log.get_logger import get_logger
+from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.slurm.run_squeue import SQUEUE_FORMAT, extract_squeue_lines
+from idact.detail.ssh.get_remote_command import get_remote_command
+
+SQUEUE_STREAM_INTERVAL = 2
+"""Seconds between `squeue` snapshots."""
+
+SQUEUE_HEADER_PREFIX = 'JOBID|'
+"""Start of the header line printed before each snapshot."""
+
+
+def get_squeue_stream_command(interval: int = SQUEUE_STREAM_INTERVAL) -> str:
+    """Returns the command that prints a `squeue` snapshot
+        of the current user's jobs every `interval` seconds.
+
+        :param interval: Seconds between snapshots.
+
+    """
+    return ("squeue --user $USER --format '{format}'"
+            " --iterate {interval}").format(format=SQUEUE_FORMAT,
+                                            interval=interval)
+
+
+class SqueueStream:
+    """Runs a command that prints `squeue` snapshots on the access node,
+        each one starting with a header, and publishes each complete
+        snapshot.
+
+        State is guarded by `condition`, which is notified after each
+        snapshot, and when the stream ends.
+
+        :param node: Access node.
+
+        :param command: Command to run.
+
+        :param condition: Condition to notify.
+
+    """
+
+    def __init__(self,
+                 node: NodeInternal,
+                 command: str,
+                 condition: threading.Condition):
+        self._node = node
+        self._command = command
+        self._condition = condition
+        self._channel = None
+        self._stopped = False
+        self.started = 0
+        """Number of snapshots that started."""
+        self.completed = 0
+        """Number of complete snapshots."""
+        self.snapshot = {}
+        """Latest complete snapshot."""
+        self.error = None
+        """Set if the stream ended unexpectedly."""
+        self.done = False
+        """True, if the stream ended."""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        """Starts the command in a background thread."""
+        self._thread.start()
+
+    def stop(self):
+        """Stops the command. Must be called with the condition held."""
+        self._stopped = True
+        if self._channel is not None:
+            self._channel.close()
+
+    def _publish(self, lines, now):
+        """Parses and publishes a complete snapshot."""
+        snapshot = extract_squeue_lines(now=now,
+                                        lines=lines,
+                                        node=self._node)
+        with self._condition:
+            self.snapshot = snapshot
+            self.completed += 1
+            self._condition.notify_all()
+
+    def _run(self):
+        log = get_logger(__name__)
+        try:
+            with self._node.connection() as client:
+                channel = client.get_transport().open_session()
+                with self._condition:
+                    self._channel = channel
+                    if self._stopped:
+                        channel.close()
+                        return
+                channel.set_combine_stderr(True)
+                channel.exec_command(get_remote_command(
+                    command=self._command,
+                    config=self._node.config))
+                self._read_snapshots(channel=channel)
+                if not self._stopped:
+                    raise RuntimeError("squeue stream ended.")
+        except Exception as e:  # pylint: disable=broad-except
+            if not self._stopped:
+                log.debug("squeue stream failed.", exc_info=1)
+                with self._condition:
+                    self.error = e
+        finally:
+            with self._condition:
+                self.done = True
+                self._condition.notify_all()
+
+    def _read_snapshots(self, channel: paramiko.Channel):
+        """Reads the output, and publishes each snapshot
+            when the next one starts."""
+        lines = None
+        now = None
+        for line in channel.makefile('r'):
+            line = line.strip()
+            if line.startswith(SQUEUE_HEADER_PREFIX):
+                if lines is not None:
+                    self._publish(lines=lines, now=now)
+                with self._condition:
+                    self.started += 1
+                lines = []
+                now = utc_now()
+            elif lines is not None and '|' in line:
+                lines.append(line)
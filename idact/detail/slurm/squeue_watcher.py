@@ -0,0 +1,103 @@
+"""This module contains the implementation of a watcher that shares one
+    `squeue` stream between all threads waiting for allocations."""
+
+import threading
+import time
+from typing import Optional, Sequence
+
+from idact.detail.log.get_logger import get_logger
+from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.slurm.squeue_result import SqueueResult
+from idact.detail.slurm.squeue_stream import SqueueStream, \
+    get_squeue_stream_command
+
+
+class SqueueWatcher:
+    """Waits for job state changes using a single :class:`.SqueueStream`
+        on the access node.
+
+        The stream is started for the first waiter, and stopped after
+        the last waiter is done.
+
+        :param node: Access node.
+
+        :param command: Command that prints `squeue` snapshots.
+                        Default: :func:`.get_squeue_stream_command`.
+
+    """
+
+    def __init__(self,
+                 node: NodeInternal,
+                 command: Optional[str] = None):
+        self._node = node
+        self._command = (command if command is not None
+                         else get_squeue_stream_command())
+        self._condition = threading.Condition()
+        self._stream = None  # type: Optional[SqueueStream]
+        self._waiters = 0
+
+    def wait(self,
+             job_id: int,
+             states: Sequence[str],
+             timeout: Optional[float] = None) -> Optional[SqueueResult]:
+        """Waits until a snapshot that started after the call shows the job
+            in a state other than `states`, and returns the job.
+            Returns None, if the job is not in the snapshot.
+
+            :param job_id: Job to wait for.
+
+            :param states: States to wait through, e.g. `PENDING`.
+
+            :param timeout: Maximum number of seconds to wait.
+
+            :raises TimeoutError: On timeout.
+
+            :raises RuntimeError: If the stream ended unexpectedly.
+
+        """
+        end = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            stream = self._acquire_stream()
+            try:
+                first_snapshot = stream.started + 1
+                while True:
+                    if stream.completed >= first_snapshot:
+                        job = stream.snapshot.get(job_id, None)
+                        if job is None or job.state not in states:
+                            return job
+                        first_snapshot = stream.completed + 1
+                    if stream.done:
+                        raise RuntimeError(
+                            "squeue stream ended.") from stream.error
+                    remaining = None
+                    if end is not None:
+                        remaining = end - time.monotonic()
+                        if remaining <= 0:
+                            raise TimeoutError("Timed out while waiting "
+                                               "for allocation.")
+                    self._condition.wait(timeout=remaining)
+            finally:
+                self._release_stream()
+
+    def _acquire_stream(self) -> SqueueStream:
+        """Returns the running stream, starting a new one if needed.
+            Must be called with the condition held."""
+        self._waiters += 1
+        if self._stream is None or self._stream.done:
+            log = get_logger(__name__)
+            log.debug("Starting squeue stream on %s.", self._node)
+            self._stream = SqueueStream(node=self._node,
+                                        command=self._command,
+                                        condition=self._condition)
+            self._stream.start()
+        return self._stream
+
+    def _release_stream(self):
+        """Stops the stream after the last waiter.
+            Must be called with the condition held."""
+        self._waiters -= 1
+        if self._waiters == 0 and self._stream is not None:
+            log = get_logger(__name__)
+            log.debug("Stopping squeue stream on %s.", self._node)
+            self._stream.stop()
+            self._stream = None
@@ -0,0 +1,39 @@
+"""This module contains the implementation of a provider of squeue watchers
+    for each cluster."""
+
+import threading
+
+from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.slurm.squeue_watcher import SqueueWatcher
+from idact.detail.ssh.get_connection_key import get_connection_key
+
+
+class SqueueWatcherProvider:
+    """Stores one squeue watcher per access node."""
+    _state = {}
+
+    def __init__(self):
+        if SqueueWatcherProvider._state:
+            self.__dict__ = SqueueWatcherProvider._state
+            return
+
+        self._lock = threading.Lock()
+        self._watchers = {}
+
+        SqueueWatcherProvider._state = self.__dict__
+
+    def get_watcher(self, node: NodeInternal) -> SqueueWatcher:
+        """Returns the squeue watcher for the access node.
+
+            :param node: Access node.
+
+        """
+        key = get_connection_key(host=node.host,
+                                 port=node.port,
+                                 config=node.config)
+        with self._lock:
+            watcher = self._watchers.get(key, None)
+            if watcher is None:
+                watcher = SqueueWatcher(node=node)
+                self._watchers[key] = watcher
+            return watcher
@@ -0,0 +1,2 @@
+"""This package contains a pool of persistent SSH connections to cluster
+    nodes."""
@@ -0,0 +1,73 @@
+"""This module contains a command queued in a :class:`.CommandBatch`."""
+
+from typing import Optional
+
+
+class BatchedCommand:
+    """Command queued in a batch, with its result once the batch is run.
+
+        :param command: Command to run.
+
+    """
+
+    def __init__(self, command: str):
+        self._command = command
+        self._exit_status = None  # type: Optional[int]
+        self._output = None  # type: Optional[str]
+
+    @property
+    def command(self) -> str:
+        """Command to run."""
+        return self._command
+
+    @property
+    def exit_status(self) -> Optional[int]:
+        """Command exit status, or None if the command was not run."""
+        return self._exit_status
+
+    @property
+    def succeeded(self) -> bool:
+        """True, if the command was run and returned zero exit status."""
+        return self._exit_status == 0
+
+    @property
+    def output(self) -> str:
+        """Command output, with stderr combined into stdout,
+            and whitespace stripped.
+
+            :raises RuntimeError: If the command was not run, or failed.
+
+        """
+        self.raise_on_error()
+        return self._output
+
+    def raise_on_error(self):
+        """Raises an exception if the command was not run, or failed."""
+        if self._exit_status is None:
+            raise RuntimeError("Command was not run: '{command}'".format(
+                command=self._command))
+        if self._exit_status != 0:
+            raise RuntimeError(
+                "Cannot run '{command}': non-zero exit status {status}:"
+                " {output}".format(command=self._command,
+                                   status=self._exit_status,
+                                   output=self._output))
+
+    def complete(self, exit_status: int, output: str):
+        """Stores the command result.
+
+            :param exit_status: Command exit status.
+
+            :param output: Command output.
+
+        """
+        self._exit_status = exit_status
+        self._output = output
+
+    def __str__(self):
+        return "BatchedCommand({command}, {exit_status})".format(
+            command=self._command,
+            exit_status=self._exit_status)
+
+    def __repr__(self):
+        return str(self)
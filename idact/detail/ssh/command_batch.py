@@ -0,0 +1,147 @@
+"""This module contains a batch of commands run in a single remote shell."""
+
+import re
+from typing import List, Optional, Tuple
+
+from idact.core.node import Node
+from idact.detail.helper.get_random_file_name import get_random_file_name
+from idact.detail.ssh.batched_command import BatchedCommand
+
+BATCH_MARKER_LENGTH = 32
+BATCH_MARKER_PREFIX = "IDACT_BATCH_"
+BATCH_STATUS_VARIABLE = "IDACT_BATCH_STATUS"
+
+
+def format_batch_script(commands: List[str],
+                        marker: str,
+                        stop_on_failure: bool) -> str:
+    """Returns a script that runs each command in a subshell, and prints
+        a marker line with the command index and exit status after
+        its output.
+
+        :param commands: Commands to run.
+
+        :param marker: Marker unlikely to appear in the output.
+
+        :param stop_on_failure: Skip the remaining commands after
+                                a command fails.
+
+    """
+    lines = []
+    for index, command in enumerate(commands):
+        lines.append("( {command}\n) < /dev/null 2>&1".format(
+            command=command))
+        lines.append("{variable}=$?".format(variable=BATCH_STATUS_VARIABLE))
+        # Starts on a new line, in case the output does not end with one.
+        lines.append("printf '\\n%s %d %d\\n' {marker} {index}"
+                     " ${variable}".format(marker=marker,
+                                           index=index,
+                                           variable=BATCH_STATUS_VARIABLE))
+        if stop_on_failure:
+            lines.append("[ ${variable} -eq 0 ] || exit 0".format(
+                variable=BATCH_STATUS_VARIABLE))
+    return '\n'.join(lines)
+
+
+def parse_batch_output(output: str,
+                       marker: str,
+                       count: int) -> List[Optional[Tuple[int, str]]]:
+    """Splits the batch script output into exit statuses and outputs
+        of each command. Commands that were not run have no result.
+
+        :param output: Batch script output.
+
+        :param marker: Marker passed to :func:`.format_batch_script`.
+
+        :param count: Command count.
+
+    """
+    results = [None] * count  # type: List[Optional[Tuple[int, str]]]
+    marker_regex = re.compile(
+        r"^{marker} (\d+) (\d+)$".format(marker=re.escape(marker)),
+        re.MULTILINE)
+    begin = 0
+    for match in marker_regex.finditer(output):
+        index, exit_status = int(match.group(1)), int(match.group(2))
+        if index < count:
+            results[index] = (exit_status,
+                              output[begin:match.start()].strip())
+        begin = match.end()
+    return results
+
+
+class CommandBatch:
+    """Queues commands and runs them all in a single remote shell,
+        in one round trip.
+
+        Each command runs in its own subshell with stdin redirected
+        from `/dev/null`, so `exit` and `cd` do not affect other commands.
+        Outputs and exit statuses are separated locally.
+
+        Commands are queued with :meth:`add`, which returns a
+        :class:`.BatchedCommand` holding the result after :meth:`run`.
+
+    """
+
+    def __init__(self):
+        self._commands = []  # type: List[BatchedCommand]
+
+    def add(self, command: str) -> BatchedCommand:
+        """Queues a command and returns a handle to its result.
+
+            :param command: Command to queue.
+
+        """
+        batched = BatchedCommand(command=command)
+        self._commands.append(batched)
+        return batched
+
+    @property
+    def commands(self) -> List[BatchedCommand]:
+        """Queued commands."""
+        return list(self._commands)
+
+    def run(self,
+            node: Node,
+            stop_on_failure: bool = True,
+            check: bool = True,
+            timeout: Optional[int] = None) -> List[BatchedCommand]:
+        """Runs all queued commands on the node and returns them
+            with results.
+
+            :param node: Node to run the commands on.
+
+            :param stop_on_failure: Skip the remaining commands after
+                                    a command fails.
+
+            :param check: Raise an exception if a command failed
+                          or was not run.
+
+            :param timeout: Timeout for the whole batch in seconds.
+
+            :raises RuntimeError: If `check` is True and a command failed
+                                  or was not run.
+
+        """
+        if not self._commands:
+            return []
+        marker = BATCH_MARKER_PREFIX + get_random_file_name(
+            length=BATCH_MARKER_LENGTH)
+        script = format_batch_script(
+            commands=[batched.command for batched in self._commands],
+            marker=marker,
+            stop_on_failure=stop_on_failure)
+        output = node.run(script, timeout=timeout)
+        results = parse_batch_output(output=output,
+                                     marker=marker,
+                                     count=len(self._commands))
+        for batched, result in zip(self._commands, results):
+            if result is not None:
+                exit_status, command_output = result
+                batched.complete(exit_status=exit_status,
+                                 output=command_output)
+
+        if check:
+            for batched in self._commands:
+                batched.raise_on_error()
+        return self.commands
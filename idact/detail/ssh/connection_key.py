@@ -0,0 +1,67 @@
+"""This module contains a key identifying a pooled SSH connection."""
+
+from typing import Optional
+
+
+class ConnectionKey:
+    """Identifies a connection in the :class:`.ConnectionPool`.
+
+        :param host: Connection target.
+
+        :param port: Connection target port.
+
+        :param user: User to log in as.
+
+        :param gateway: Key of the connection to tunnel through,
+                        or None for a direct connection.
+
+    """
+
+    def __init__(self,
+                 host: str,
+                 port: int,
+                 user: str,
+                 gateway: Optional['ConnectionKey'] = None):
+        self._host = host
+        self._port = port
+        self._user = user
+        self._gateway = gateway
+
+    @property
+    def host(self) -> str:
+        """Connection target."""
+        return self._host
+
+    @property
+    def port(self) -> int:
+        """Connection target port."""
+        return self._port
+
+    @property
+    def user(self) -> str:
+        """User to log in as."""
+        return self._user
+
+    @property
+    def gateway(self) -> Optional['ConnectionKey']:
+        """Key of the connection to tunnel through, if any."""
+        return self._gateway
+
+    def __eq__(self, other):
+        return (isinstance(other, ConnectionKey)
+                and self.__dict__ == other.__dict__)
+
+    def __hash__(self):
+        return hash((self._host, self._port, self._user, self._gateway))
+
+    def __str__(self):
+        host_string = "{user}@{host}:{port}".format(user=self._user,
+                                                    host=self._host,
+                                                    port=self._port)
+        if self._gateway is None:
+            return host_string
+        return "{gateway} -> {host_string}".format(gateway=self._gateway,
+                                                   host_string=host_string)
+
+    def __repr__(self):
+        return str(self)
@@ -0,0 +1,200 @@
+"""This module contains the implementation of a pool of persistent
+    SSH connections."""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+import paramiko
+
+from idact.detail.log.get_logger import get_logger
+from idact.detail.ssh.connection_key import ConnectionKey
+from idact.detail.ssh.pooled_connection import PooledConnection
+
+CONNECTION_POOL_MAX_SIZE = 32
+"""Maximum number of open connections, after which the least recently
+    used idle connections are closed."""
+
+CONNECTION_IDLE_TIMEOUT = 300
+"""Seconds after which an unused connection is closed."""
+
+
+class ConnectionPool:
+    """Reuses authenticated SSH connections between commands.
+
+        Connections are identified by :class:`.ConnectionKey`.
+        Connections that are not used for longer than the idle timeout
+        are closed, as well as the least recently used connections
+        when the pool size is exceeded.
+        A connection is never closed while it is in use, or while
+        another pooled connection is tunneled through it.
+
+        :param max_size: Maximum number of open connections.
+
+        :param idle_timeout: Seconds after which an unused connection
+                             is closed.
+
+    """
+
+    def __init__(self,
+                 max_size: int = CONNECTION_POOL_MAX_SIZE,
+                 idle_timeout: float = CONNECTION_IDLE_TIMEOUT):
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._connections = OrderedDict()
+        self._connect_locks = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(
+            self,
+            key: ConnectionKey,
+            connect: Callable[[], paramiko.SSHClient]) -> Iterator[paramiko.SSHClient]:  # noqa, pylint: disable=bad-continuation,line-too-long
+        """Yields a pooled connection, opening it first if needed.
+
+            :param key: Connection key.
+
+            :param connect: Opens a new connection if there is no
+                            live connection for the key.
+
+        """
+        pooled = self._acquire(key=key, connect=connect)
+        try:
+            yield pooled.client
+        finally:
+            with self._lock:
+                pooled.release()
+
+    def _acquire(self,
+                 key: ConnectionKey,
+                 connect: Callable[[], paramiko.SSHClient]) -> PooledConnection:  # noqa, pylint: disable=bad-continuation,line-too-long
+        """Returns an acquired live connection for the key.
+            Only one connection is opened at a time for a given key.
+
+            :param key: Connection key.
+
+            :param connect: Opens a new connection.
+
+        """
+        with self._lock:
+            self._close_idle()
+            connect_lock = self._connect_locks.setdefault(key,
+                                                          threading.Lock())
+
+        with connect_lock:
+            with self._lock:
+                pooled = self._get_alive(key=key)
+                if pooled is not None:
+                    pooled.acquire()
+                    self._connections.move_to_end(key)
+                    return pooled
+
+            log = get_logger(__name__)
+            log.debug("Opening connection: %s", key)
+            client = connect()
+
+            with self._lock:
+                pooled = PooledConnection(key=key, client=client)
+                pooled.acquire()
+                self._connections[key] = pooled
+                self._close_least_recently_used()
+                return pooled
+
+    def _get_alive(self, key: ConnectionKey) -> Optional[PooledConnection]:
+        """Returns the connection for the key, if it's still alive.
+            Dead connections are discarded.
+
+            :param key: Connection key.
+
+        """
+        pooled = self._connections.get(key, None)
+        if pooled is None:
+            return None
+        if pooled.alive:
+            return pooled
+
+        log = get_logger(__name__)
+        log.debug("Discarding dead connection: %s", key)
+        self._close(key=key)
+        return None
+
+    def _is_gateway(self, key: ConnectionKey) -> bool:
+        """Returns True, if another pooled connection
+            is tunneled through this one.
+
+            :param key: Connection key.
+
+        """
+        return any(other.gateway == key for other in self._connections)
+
+    def _can_close(self, key: ConnectionKey) -> bool:
+        """Returns True, if the connection can be evicted.
+
+            :param key: Connection key.
+
+        """
+        return (not self._connections[key].in_use
+                and not self._is_gateway(key=key))
+
+    def _close_idle(self):
+        """Closes connections that were unused for too long."""
+        now = time.monotonic()
+        closed = True
+        while closed:
+            closed = False
+            for key, pooled in list(self._connections.items()):
+                if (now - pooled.last_used > self._idle_timeout
+                        and self._can_close(key=key)):
+                    log = get_logger(__name__)
+                    log.debug("Closing idle connection: %s", key)
+                    self._close(key=key)
+                    closed = True
+
+    def _close_least_recently_used(self):
+        """Closes least recently used connections that can be closed,
+            until the pool size is not exceeded."""
+        for key in list(self._connections.keys()):
+            if len(self._connections) <= self._max_size:
+                return
+            if self._can_close(key=key):
+                log = get_logger(__name__)
+                log.debug("Pool size exceeded, closing connection: %s", key)
+                self._close(key=key)
+
+    def _close(self, key: ConnectionKey):
+        """Removes the connection from the pool and closes it.
+
+            :param key: Connection key.
+
+        """
+        pooled = self._connections.pop(key)
+        try:
+            pooled.close()
+        except Exception:  # pylint: disable=broad-except
+            log = get_logger(__name__)
+            log.debug("Exception while closing connection: %s",
+                      key, exc_info=1)
+
+    def close_all(self, gateway: Optional[ConnectionKey] = None):
+        """Closes pooled connections, even if they are in use.
+
+            :param gateway: If not None, only closes this connection
+                            and connections tunneled through it.
+                            Otherwise, closes all connections.
+
+        """
+        with self._lock:
+            keys = [key for key in self._connections
+                    if gateway is None
+                    or key == gateway
+                    or key.gateway == gateway]
+            tunneled_first = sorted(keys,
+                                    key=lambda key: key.gateway is None)
+            for key in tunneled_first:
+                self._close(key=key)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._connections)
@@ -0,0 +1,30 @@
+"""This module contains the implementation of a global connection pool
+    provider."""
+
+import atexit
+
+from idact.detail.ssh.connection_pool import ConnectionPool
+
+
+class ConnectionPoolProvider:
+    """Stores the global SSH connection pool.
+
+        All pooled connections are closed at interpreter exit.
+
+    """
+    _state = {}
+
+    def __init__(self):
+        if ConnectionPoolProvider._state:
+            self.__dict__ = ConnectionPoolProvider._state
+            return
+
+        self._pool = ConnectionPool()
+        atexit.register(self._pool.close_all)
+
+        ConnectionPoolProvider._state = self.__dict__
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """Global connection pool."""
+        return self._pool
@@ -0,0 +1,77 @@
+"""This module contains a context manager for using a pooled connection
+    to a cluster node."""
+
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Tuple
+
+import paramiko
+
+from idact.core.config import ClusterConfig
+from idact.detail.ssh.connection_key import ConnectionKey
+from idact.detail.ssh.get_connection_key import get_connection_key
+from idact.detail.ssh.get_connection_pool import get_connection_pool
+from idact.detail.ssh.open_connection import open_connection
+
+
+@contextmanager
+def connection_to_key(
+        key: ConnectionKey,
+        get_credentials: Callable[[], Tuple[Optional[str], Optional[str]]]) -> Iterator[paramiko.SSHClient]:  # noqa, pylint: disable=bad-continuation,line-too-long
+    """Yields a pooled connection for the key. A connection with
+        a gateway is tunneled through a pooled connection to the gateway,
+        so a chain of hops needs only one TCP connection.
+
+        :param key: Connection key.
+
+        :param get_credentials: Returns the password and private key path
+                                to authenticate with. Called only when
+                                a new connection must be opened.
+
+    """
+    pool = get_connection_pool()
+
+    def connect() -> paramiko.SSHClient:
+        password, key_filename = get_credentials()
+        if key.gateway is None:
+            return open_connection(key=key,
+                                   password=password,
+                                   key_filename=key_filename)
+
+        with connection_to_key(
+                key=key.gateway,
+                get_credentials=lambda: (password,
+                                         key_filename)) as gateway:
+            return open_connection(key=key,
+                                   password=password,
+                                   key_filename=key_filename,
+                                   gateway=gateway)
+
+    with pool.connection(key=key, connect=connect) as client:
+        yield client
+
+
+@contextmanager
+def connection_to_node(
+        host: str,
+        port: int,
+        config: ClusterConfig,
+        get_credentials: Callable[[], Tuple[Optional[str], Optional[str]]]) -> Iterator[paramiko.SSHClient]:  # noqa, pylint: disable=bad-continuation,line-too-long
+    """Yields a pooled connection to the node.
+        Connections to compute nodes are tunneled through a pooled
+        connection to the access node.
+
+        :param host: Connection target.
+
+        :param port: Connection target port.
+
+        :param config: Cluster config.
+
+        :param get_credentials: Returns the password and private key path
+                                to authenticate with. Called only when
+                                a new connection must be opened.
+
+    """
+    with connection_to_key(
+            key=get_connection_key(host=host, port=port, config=config),
+            get_credentials=get_credentials) as client:
+        yield client
@@ -0,0 +1,51 @@
+"""This module contains functions for executing a command on a channel,
+    for commands that stream their input or output."""
+
+from typing import Optional
+
+import paramiko
+
+from idact.core.config import ClusterConfig
+from idact.detail.ssh.get_remote_command import get_remote_command
+from idact.detail.ssh.run_command import RECEIVE_BUFFER_SIZE
+
+
+def exec_on_channel(client: paramiko.SSHClient,
+                    command: str,
+                    config: Optional[ClusterConfig] = None) -> paramiko.Channel:  # noqa, pylint: disable=bad-continuation,line-too-long
+    """Opens a session channel and executes the command in the remote shell,
+        without waiting for the output.
+
+        :param client: Connected client.
+
+        :param command: Command to execute.
+
+        :param config: Cluster config with the remote shell,
+                       see :func:`.get_remote_command`.
+
+    """
+    transport = client.get_transport()
+    if transport is None or not transport.is_active():
+        raise RuntimeError("Connection is closed.")
+    channel = transport.open_session()
+    channel.exec_command(get_remote_command(command=command, config=config))
+    return channel
+
+
+def check_exit_status(channel: paramiko.Channel, command: str):
+    """Waits for the command to exit, and raises an exception on failure.
+
+        :param channel: Channel the command was executed on.
+
+        :param command: Command for the error message.
+
+    """
+    exit_status = channel.recv_exit_status()
+    if exit_status != 0:
+        stderr = channel.recv_stderr(RECEIVE_BUFFER_SIZE).decode(
+            'utf-8', 'replace').strip()
+        raise RuntimeError(
+            "Command '{command}' returned non-zero exit status {status}:"
+            " {stderr}".format(command=command,
+                               status=exit_status,
+                               stderr=stderr))
@@ -0,0 +1,31 @@
+"""This module contains a function for building the connection key
+    for a cluster node."""
+
+from idact.core.config import ClusterConfig
+from idact.detail.ssh.connection_key import ConnectionKey
+
+
+def get_connection_key(host: str,
+                       port: int,
+                       config: ClusterConfig) -> ConnectionKey:
+    """Returns the connection key for the target host.
+
+        If the target host is the access node, there is no gateway.
+        Otherwise, the access node is the gateway.
+
+        :param host: Connection target.
+
+        :param port: Connection target port.
+
+        :param config: Cluster config.
+
+    """
+    access_node = ConnectionKey(host=config.host,
+                                port=config.port,
+                                user=config.user)
+    if host == config.host:
+        return access_node
+    return ConnectionKey(host=host,
+                         port=port,
+                         user=config.user,
+                         gateway=access_node)
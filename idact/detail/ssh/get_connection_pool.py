@@ -0,0 +1,14 @@
+"""This module contains a function for getting the global connection pool.
+"""
+
+from idact.detail.ssh.connection_pool import ConnectionPool
+from idact.detail.ssh.connection_pool_provider import ConnectionPoolProvider
+
+
+def get_connection_pool() -> ConnectionPool:
+    """Returns the global connection pool.
+
+        See :class:`.ConnectionPoolProvider`.
+
+    """
+    return ConnectionPoolProvider().pool
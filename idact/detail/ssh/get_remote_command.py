@@ -0,0 +1,68 @@
+"""This module contains functions for wrapping a command in the remote
+    shell invocation."""
+
+import shlex
+from typing import Dict, Optional
+
+from idact.core.config import ClusterConfig
+
+DEFAULT_REMOTE_SHELL = "/bin/bash --noprofile -l -c"
+"""Default remote shell invocation, see :attr:`.ClusterConfig.remote_shell`.
+"""
+
+
+def format_remote_command(command: str,
+                          shell: str,
+                          environment: Optional[Dict[str, str]] = None) -> str:
+    """Returns the command prefixed with environment variable exports,
+        and wrapped in the shell invocation.
+
+        :param command: Command to run.
+
+        :param shell: Shell invocation, to which the quoted command
+                      is appended. If empty, the command is run by the
+                      user's default shell.
+
+        :param environment: Variables to export before the command.
+
+    """
+    if environment:
+        exports = ' '.join(
+            "{name}={value}".format(name=name, value=shlex.quote(value))
+            for name, value in sorted(environment.items()))
+        command = "export {exports}; {command}".format(exports=exports,
+                                                       command=command)
+    if not shell:
+        return command
+    return "{shell} {command}".format(shell=shell,
+                                      command=shlex.quote(command))
+
+
+def get_bash_command(command: str) -> str:
+    """Returns the command wrapped in a `bash -c` invocation, for commands
+        that use bash features, e.g. process substitution or `pipefail`,
+        so they do not depend on :attr:`.ClusterConfig.remote_shell`.
+
+        :param command: Bash command to run.
+
+    """
+    return "bash -c {command}".format(command=shlex.quote(command))
+
+
+def get_remote_command(command: str,
+                       config: Optional[ClusterConfig] = None) -> str:
+    """Returns the command wrapped in the remote shell invocation
+        from the cluster config.
+
+        :param command: Command to run.
+
+        :param config: Cluster config. If None,
+                       :attr:`.DEFAULT_REMOTE_SHELL` is used.
+
+    """
+    if config is None:
+        return format_remote_command(command=command,
+                                     shell=DEFAULT_REMOTE_SHELL)
+    return format_remote_command(command=command,
+                                 shell=config.remote_shell,
+                                 environment=config.shell_environment)
@@ -0,0 +1,18 @@
+"""This module contains a function for converting a remote path
+    to a path accepted by SFTP."""
+
+
+def get_sftp_path(remote_path: str) -> str:
+    """Returns the path relative to the SFTP working directory,
+        which is the home directory, if the path starts with `~`.
+
+        SFTP does not perform tilde expansion.
+
+        :param remote_path: Remote path.
+
+    """
+    if remote_path == '~':
+        return '.'
+    if remote_path.startswith('~/'):
+        return remote_path[2:]
+    return remote_path
@@ -0,0 +1,135 @@
+"""This module contains functions for measuring the startup overhead
+    of remote shells."""
+
+import statistics
+import time
+from typing import List, Optional, Tuple
+
+import paramiko
+
+from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.ssh.get_remote_command import DEFAULT_REMOTE_SHELL, \
+    format_remote_command
+from idact.detail.ssh.run_command import receive_output
+from idact.detail.ssh.shell_startup_time import ShellStartupTime
+
+SHELL_STARTUP_REPEAT = 5
+"""Default number of measured runs for each shell."""
+
+SHELL_STARTUP_TIMEOUT = 60
+"""Seconds after which a single measured command fails."""
+
+BASELINE_SHELL_NAME = 'default shell'
+
+MEASURED_SHELLS = [(BASELINE_SHELL_NAME, ''),
+                   ('sh', '/bin/sh -c'),
+                   ('bash', '/bin/bash -c'),
+                   ('bash, idact default', DEFAULT_REMOTE_SHELL),
+                   ('bash, login', '/bin/bash -l -c')]
+"""Shell invocations compared with the configured one. An empty invocation
+    runs the command directly in the user's default shell, as started
+    by sshd, which is the baseline."""
+
+
+def time_remote_command(client: paramiko.SSHClient,
+                        command: str) -> float:
+    """Runs the command on a new channel and returns the time until
+        it exits.
+
+        :param client: Connected client.
+
+        :param command: Command, already wrapped in a shell invocation.
+
+    """
+    transport = client.get_transport()
+    if transport is None or not transport.is_active():
+        raise RuntimeError("Connection is closed.")
+    start = time.perf_counter()
+    channel = transport.open_session()
+    try:
+        channel.set_combine_stderr(True)
+        channel.exec_command(command)
+        receive_output(channel=channel, timeout=SHELL_STARTUP_TIMEOUT)
+        exit_status = channel.recv_exit_status()
+    finally:
+        channel.close()
+    elapsed = time.perf_counter() - start
+    if exit_status != 0:
+        raise RuntimeError("Command returned non-zero exit status {status}:"
+                           " '{command}'".format(status=exit_status,
+                                                 command=command))
+    return elapsed
+
+
+def measure_shell_startup(
+        node: NodeInternal,
+        repeat: int = SHELL_STARTUP_REPEAT,
+        shells: Optional[List[Tuple[str, str]]] = None) -> List[ShellStartupTime]:  # noqa, pylint: disable=bad-continuation,line-too-long
+    """Measures the median time of running a no-op command in each shell,
+        including the remote shell from the node config, over one pooled
+        connection.
+
+        Shells are measured in turns, after a warm-up run, so that
+        load changes affect all of them equally.
+
+        :param node: Node to measure on.
+
+        :param repeat: Number of measured runs for each shell.
+
+        :param shells: Pairs of labels and shell invocations.
+                       Default: :attr:`.MEASURED_SHELLS`.
+
+    """
+    if repeat < 1:
+        raise ValueError("At least one run is required.")
+    if shells is None:
+        shells = MEASURED_SHELLS
+    config = node.config
+    commands = [(name,
+                 shell,
+                 format_remote_command(command='true', shell=shell))
+                for name, shell in shells]
+    commands.append(('configured', config.remote_shell,
+                     format_remote_command(
+                         command='true',
+                         shell=config.remote_shell,
+                         environment=config.shell_environment)))
+
+    times = {name: [] for name, _, _ in commands}
+    with node.connection() as client:
+        for _, _, command in commands:
+            time_remote_command(client=client, command=command)
+        for _ in range(repeat):
+            for name, _, command in commands:
+                times[name].append(time_remote_command(client=client,
+                                                       command=command))
+
+    medians = {name: statistics.median(values)
+               for name, values in times.items()}
+    baseline = medians.get(BASELINE_SHELL_NAME, 0.0)
+    return [ShellStartupTime(name=name,
+                             shell=shell,
+                             seconds=medians[name],
+                             overhead=max(0.0, medians[name] - baseline))
+            for name, shell, _ in commands]
+
+
+def format_shell_startup_times(times: List[ShellStartupTime]) -> str:
+    """Formats measured startup times as a table.
+
+        :param times: Measured times.
+
+    """
+    lines = ["{name:<22}{seconds:>12}{overhead:>14}  {shell}".format(
+        name='Shell',
+        seconds='Median [ms]',
+        overhead='Overhead [ms]',
+        shell='Invocation')]
+    for startup_time in times:
+        lines.append(
+            "{name:<22}{seconds:>12.1f}{overhead:>14.1f}  {shell}".format(
+                name=startup_time.name,
+                seconds=startup_time.seconds * 1000,
+                overhead=startup_time.overhead * 1000,
+                shell=startup_time.shell or '(none)'))
+    return '\n'.join(lines)
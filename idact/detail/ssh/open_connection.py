@@ -0,0 +1,82 @@
+"""This module contains a function for opening an authenticated
+    SSH connection."""
+
+from typing import Optional
+
+import paramiko
+
+from idact.detail.log.get_logger import get_logger
+from idact.detail.ssh.connection_key import ConnectionKey
+
+CONNECTION_ATTEMPTS = 3
+CONNECTION_TIMEOUT = 15
+CONNECTION_KEEPALIVE = 30
+
+
+def open_channel_through_gateway(key: ConnectionKey,
+                                 gateway: paramiko.SSHClient) -> paramiko.Channel:  # noqa, pylint: disable=bad-continuation,line-too-long
+    """Opens a direct TCP/IP channel to the target through the gateway.
+
+        :param key: Connection target.
+
+        :param gateway: Connected gateway client.
+
+    """
+    transport = gateway.get_transport()
+    if transport is None or not transport.is_active():
+        raise paramiko.SSHException("Gateway is not connected.")
+    return transport.open_channel(kind='direct-tcpip',
+                                  dest_addr=(key.host, key.port),
+                                  src_addr=('', 0),
+                                  timeout=CONNECTION_TIMEOUT)
+
+
+def open_connection(key: ConnectionKey,
+                    password: Optional[str],
+                    key_filename: Optional[str],
+                    gateway: Optional[paramiko.SSHClient] = None) -> paramiko.SSHClient:  # noqa, pylint: disable=bad-continuation,line-too-long
+    """Opens an authenticated SSH connection.
+
+        :param key: Connection target.
+
+        :param password: Password to authenticate with, or None.
+
+        :param key_filename: Private key to authenticate with, or None.
+
+        :param gateway: Connected client for :attr:`.ConnectionKey.gateway`,
+                        or None for a direct connection.
+
+    """
+    log = get_logger(__name__)
+    for attempt in range(1, CONNECTION_ATTEMPTS + 1):
+        client = paramiko.SSHClient()
+        client.load_system_host_keys()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        try:
+            sock = None
+            if gateway is not None:
+                sock = open_channel_through_gateway(key=key,
+                                                    gateway=gateway)
+            client.connect(hostname=key.host,
+                           port=key.port,
+                           username=key.user,
+                           password=password,
+                           key_filename=key_filename,
+                           timeout=CONNECTION_TIMEOUT,
+                           allow_agent=False,
+                           look_for_keys=False,
+                           sock=sock)
+            client.get_transport().set_keepalive(CONNECTION_KEEPALIVE)
+            return client
+        except paramiko.AuthenticationException as e:
+            client.close()
+            raise RuntimeError(
+                "Authentication failed: {key}".format(key=key)) from e
+        except (paramiko.SSHException, OSError) as e:
+            client.close()
+            if attempt == CONNECTION_ATTEMPTS:
+                raise RuntimeError(
+                    "Unable to connect: {key}".format(key=key)) from e
+            log.debug("Connection attempt %d/%d failed: %s",
+                      attempt, CONNECTION_ATTEMPTS, key, exc_info=1)
+    raise RuntimeError("Unable to connect: {key}".format(key=key))
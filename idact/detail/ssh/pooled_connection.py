@@ -0,0 +1,65 @@
+"""This module contains a connection stored in the connection pool."""
+
+import time
+
+import paramiko
+
+from idact.detail.ssh.connection_key import ConnectionKey
+
+
+class PooledConnection:
+    """An authenticated SSH client stored in the :class:`.ConnectionPool`.
+
+        :param key: Connection key.
+
+        :param client: Connected SSH client.
+
+    """
+
+    def __init__(self,
+                 key: ConnectionKey,
+                 client: paramiko.SSHClient):
+        self._key = key
+        self._client = client
+        self._users = 0
+        self._last_used = time.monotonic()
+
+    @property
+    def key(self) -> ConnectionKey:
+        """Connection key."""
+        return self._key
+
+    @property
+    def client(self) -> paramiko.SSHClient:
+        """Connected SSH client."""
+        return self._client
+
+    @property
+    def in_use(self) -> bool:
+        """True, if the connection was acquired and not released yet."""
+        return self._users > 0
+
+    @property
+    def last_used(self) -> float:
+        """Monotonic timestamp of the last acquire or release."""
+        return self._last_used
+
+    @property
+    def alive(self) -> bool:
+        """True, if the underlying transport is still active."""
+        transport = self._client.get_transport()
+        return transport is not None and transport.is_active()
+
+    def acquire(self):
+        """Marks the connection as used by one more caller."""
+        self._users += 1
+        self._last_used = time.monotonic()
+
+    def release(self):
+        """Marks the connection as used by one less caller."""
+        self._users -= 1
+        self._last_used = time.monotonic()
+
+    def close(self):
+        """Closes the client."""
+        self._client.close()
@@ -0,0 +1,96 @@
+"""This module contains a function for running a command over
+    an open SSH connection."""
+
+import socket
+import time
+from typing import Optional
+
+import paramiko
+
+from idact.core.config import ClusterConfig
+from idact.detail.log.capture_fabric_output_to_log import FABRIC_LOGGER_NAME
+from idact.detail.log.get_logger import get_logger
+from idact.detail.ssh.get_remote_command import get_remote_command
+
+RECEIVE_BUFFER_SIZE = 32 * 1024
+
+
+def receive_output(channel: paramiko.Channel,
+                   timeout: Optional[float]) -> bytes:
+    """Receives the command output until the channel is closed.
+
+        :param channel: Channel the command was executed on.
+
+        :param timeout: Total time limit in seconds, or None.
+
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    chunks = []
+    while True:
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise socket.timeout()
+            channel.settimeout(remaining)
+        chunk = channel.recv(RECEIVE_BUFFER_SIZE)
+        if not chunk:
+            return b''.join(chunks)
+        chunks.append(chunk)
+
+
+def run_command(client: paramiko.SSHClient,
+                host: str,
+                command: str,
+                timeout: Optional[float] = None,
+                config: Optional[ClusterConfig] = None) -> str:
+    """Runs the command in the remote shell and returns its output,
+        with stderr combined into stdout, and whitespace stripped.
+
+        The command and its output are logged with DEBUG level.
+
+        :param client: Connected client.
+
+        :param host: Host name for the log.
+
+        :param command: Command to run.
+
+        :param timeout: Command timeout in seconds, or None.
+
+        :param config: Cluster config with the remote shell,
+                       see :func:`.get_remote_command`.
+
+        :raises TimeoutError: On command timeout.
+
+        :raises RuntimeError: On non-zero exit status.
+
+    """
+    log = get_logger(FABRIC_LOGGER_NAME)
+    transport = client.get_transport()
+    if transport is None or not transport.is_active():
+        raise RuntimeError("Connection is closed.")
+    log.debug("[%s] run: %s", host, command)
+
+    channel = transport.open_session()
+    try:
+        channel.set_combine_stderr(True)
+        channel.exec_command(get_remote_command(command=command,
+                                                config=config))
+        try:
+            output = receive_output(channel=channel, timeout=timeout)
+        except socket.timeout as e:
+            raise TimeoutError(
+                "Command timed out after {timeout} seconds.".format(
+                    timeout=timeout)) from e
+        exit_status = channel.recv_exit_status()
+    finally:
+        channel.close()
+
+    result = output.decode('utf-8', 'replace').strip()
+    for line in result.splitlines():
+        log.debug("[%s] out: %s", host, line)
+
+    if exit_status != 0:
+        raise RuntimeError(
+            "Command returned non-zero exit status {status}.".format(
+                status=exit_status))
+    return result
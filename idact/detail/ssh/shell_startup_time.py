@@ -0,0 +1,56 @@
+"""This module contains the measured startup time of a remote shell."""
+
+
+class ShellStartupTime:
+    """Median time of running a no-op command in a remote shell.
+
+        :param name: Shell label.
+
+        :param shell: Shell invocation, see :func:`.format_remote_command`.
+
+        :param seconds: Median round trip time.
+
+        :param overhead: Time over the round trip of a command run
+                         directly by the user's default shell.
+
+    """
+
+    def __init__(self,
+                 name: str,
+                 shell: str,
+                 seconds: float,
+                 overhead: float):
+        self._name = name
+        self._shell = shell
+        self._seconds = seconds
+        self._overhead = overhead
+
+    @property
+    def name(self) -> str:
+        """Shell label."""
+        return self._name
+
+    @property
+    def shell(self) -> str:
+        """Shell invocation."""
+        return self._shell
+
+    @property
+    def seconds(self) -> float:
+        """Median round trip time."""
+        return self._seconds
+
+    @property
+    def overhead(self) -> float:
+        """Time over the round trip of a command run directly by the user's
+            default shell."""
+        return self._overhead
+
+    def __str__(self):
+        return "ShellStartupTime({name}, {seconds:.3f}s, +{overhead:.3f}s)" \
+            .format(name=self._name,
+                    seconds=self._seconds,
+                    overhead=self._overhead)
+
+    def __repr__(self):
+        return str(self)
@@ -0,0 +1,2 @@
+"""This package contains internal functionality related to synchronizing
+    local directories to the cluster."""
@@ -0,0 +1,76 @@
+"""This module contains functions for computing block signatures
+    of file contents, for delta transfer."""
+
+import hashlib
+import zlib
+from typing import List, Tuple
+
+SYNC_BLOCK_SIZE = 4096
+"""Size of blocks compared between the local and remote file."""
+
+BlockSignature = Tuple[int, str]
+"""Weak checksum (Adler-32) and strong checksum (MD5 hex digest)
+   of a block."""
+
+
+def get_weak_checksum(block: bytes) -> int:
+    """Returns the weak checksum of a block, which can be rolled,
+        see :func:`.roll_weak_checksum`.
+
+        :param block: Block contents.
+
+    """
+    return zlib.adler32(block) & 0xffffffff
+
+
+def get_strong_checksum(block: bytes) -> str:
+    """Returns the strong checksum of a block.
+
+        :param block: Block contents.
+
+    """
+    return hashlib.md5(block).hexdigest()
+
+
+class ContentsHasher:
+    """Computes block signatures and the MD5 digest of file contents
+        passed in consecutive parts.
+
+        :param block_size: Block size.
+
+    """
+
+    def __init__(self, block_size: int = SYNC_BLOCK_SIZE):
+        self._block_size = block_size
+        self._digest = hashlib.md5()
+        self._signatures = []  # type: List[BlockSignature]
+        self._pending = b''
+
+    def update(self, data: bytes):
+        """Hashes the next part of the contents.
+
+            :param data: Contents following the previous part.
+
+        """
+        self._digest.update(data)
+        data = self._pending + data
+        end = len(data) - len(data) % self._block_size
+        for start in range(0, end, self._block_size):
+            block = data[start:start + self._block_size]
+            self._signatures.append((get_weak_checksum(block),
+                                     get_strong_checksum(block)))
+        self._pending = data[end:]
+
+    @property
+    def signatures(self) -> List[BlockSignature]:
+        """Signatures of consecutive blocks of the contents so far.
+            The last block may be shorter."""
+        if not self._pending:
+            return list(self._signatures)
+        return self._signatures + [(get_weak_checksum(self._pending),
+                                    get_strong_checksum(self._pending))]
+
+    @property
+    def digest(self) -> str:
+        """MD5 hex digest of the contents so far."""
+        return self._digest.hexdigest()
@@ -0,0 +1,160 @@
+"""This module contains a function for computing the difference between
+    a local file and a remote file described by block signatures."""
+
+from typing import Dict, Iterator, List, Tuple, Union
+
+from idact.detail.sync.block_signatures import BlockSignature, \
+    get_strong_checksum, get_weak_checksum
+
+ADLER_MODULUS = 65521
+"""Modulus of the Adler-32 checksum."""
+
+MAX_LITERAL_SIZE = 1024 * 1024
+"""Maximum size of a single literal data operation."""
+
+DeltaOperation = Union[Tuple[int, int], bytes]
+"""Either a range of remote blocks to copy as `(first, count)`,
+   or literal data."""
+
+
+def roll_weak_checksum(checksum: int,
+                       removed: int,
+                       added: int,
+                       block_size: int) -> int:
+    """Returns the Adler-32 checksum of the window moved by one byte.
+
+        :param checksum: Checksum of the current window.
+
+        :param removed: Byte leaving the window.
+
+        :param added: Byte entering the window.
+
+        :param block_size: Window size.
+
+    """
+    low = checksum & 0xffff
+    high = checksum >> 16
+    low = (low - removed + added) % ADLER_MODULUS
+    high = (high - block_size * removed + low - 1) % ADLER_MODULUS
+    return (high << 16) | low
+
+
+def index_signatures(signatures: List[BlockSignature]) -> \
+        Dict[int, List[Tuple[int, str]]]:  # noqa
+    """Maps weak checksums to block indices and strong checksums.
+
+        :param signatures: Remote block signatures.
+
+    """
+    index = {}  # type: Dict[int, List[Tuple[int, str]]]
+    for i, (weak, strong) in enumerate(signatures):
+        index.setdefault(weak, []).append((i, strong))
+    return index
+
+
+def find_block(index: Dict[int, List[Tuple[int, str]]],
+               weak: int,
+               window: bytes,
+               expected: int) -> int:
+    """Returns the index of a remote block matching the window, or -1.
+        The expected block is preferred, to keep copies contiguous.
+
+        :param index: See :func:`.index_signatures`.
+
+        :param weak: Weak checksum of the window.
+
+        :param window: Window contents.
+
+        :param expected: Block following the last copied block.
+
+    """
+    candidates = index.get(weak)
+    if not candidates:
+        return -1
+    strong = get_strong_checksum(window)
+    found = -1
+    for i, candidate_strong in candidates:
+        if candidate_strong == strong:
+            if i == expected:
+                return i
+            if found == -1:
+                found = i
+    return found
+
+
+def compute_delta(contents: bytes,
+                  signatures: List[BlockSignature],
+                  block_size: int) -> Iterator[DeltaOperation]:
+    """Yields operations that rebuild the local contents from the remote
+        file blocks and literal data.
+
+        The window is rolled byte by byte only where blocks do not match.
+        Near the end of the local file, the window shrinks, so it can match
+        the last, shorter remote block.
+
+        :param contents: Local file contents, e.g. a memory map.
+
+        :param signatures: Remote block signatures.
+
+        :param block_size: Remote block size.
+
+    """
+    index = index_signatures(signatures)
+    size = len(contents)
+
+    copy_first = -1
+    copy_count = 0
+    literal_start = 0
+    position = 0
+    weak = None
+
+    def flush_literal(end: int) -> Iterator[DeltaOperation]:
+        for start in range(literal_start, end, MAX_LITERAL_SIZE):
+            yield contents[start:min(end, start + MAX_LITERAL_SIZE)]
+
+    if not index:
+        yield from flush_literal(size)
+        return
+
+    while position < size:
+        window_size = min(block_size, size - position)
+        window = contents[position:position + window_size]
+        if weak is None:
+            weak = get_weak_checksum(window)
+
+        found = find_block(index=index,
+                           weak=weak,
+                           window=window,
+                           expected=copy_first + copy_count)
+
+        if found != -1:
+            yield from flush_literal(position)
+            if copy_count and found == copy_first + copy_count:
+                copy_count += 1
+            else:
+                if copy_count:
+                    yield copy_first, copy_count
+                copy_first = found
+                copy_count = 1
+            position += window_size
+            literal_start = position
+            weak = None
+            continue
+
+        if copy_count and literal_start == position:
+            yield copy_first, copy_count
+            copy_count = 0
+            copy_first = -1
+
+        if position + block_size < size:
+            weak = roll_weak_checksum(checksum=weak,
+                                      removed=contents[position],
+                                      added=contents[position + block_size],
+                                      block_size=block_size)
+        else:
+            weak = None
+        position += 1
+
+    if copy_count:
+        yield copy_first, copy_count
+    yield from flush_literal(size)
@@ -0,0 +1,111 @@
+"""This module contains Python scripts run on the cluster during directory
+    synchronization. They are compatible with Python 2.7 and 3."""
+
+SYNC_TEMPORARY_SUFFIX = '.idact-sync'
+"""Suffix of files being rebuilt on the cluster."""
+
+SCAN_SCRIPT = r"""
+import hashlib, json, os, sys, zlib
+request = json.loads(sys.stdin.read())
+root = os.path.expanduser(request['root'])
+block_size = request['block_size']
+expected = request['expected']
+wanted = set(request['paths'])
+files = {{}}
+for directory, _, names in os.walk(root):
+    for name in names:
+        if name.endswith('{suffix}'):
+            continue
+        path = os.path.join(directory, name)
+        relative = os.path.relpath(path, root).replace(os.sep, '/')
+        stat = os.stat(path)
+        entry = {{'size': stat.st_size, 'mtime': stat.st_mtime}}
+        if relative in wanted and \
+                expected.get(relative) != [stat.st_size, stat.st_mtime]:
+            blocks = []
+            with open(path, 'rb') as file:
+                while True:
+                    block = file.read(block_size)
+                    if not block:
+                        break
+                    blocks.append([zlib.adler32(block) & 0xffffffff,
+                                   hashlib.md5(block).hexdigest()])
+            entry['blocks'] = blocks
+        files[relative] = entry
+sys.stdout.write(json.dumps(files))
+""".format(suffix=SYNC_TEMPORARY_SUFFIX)
+"""Lists files under the root, and computes block signatures of requested
+   files that changed since the last synchronization.
+
+   Reads a JSON request with keys: `root`, `block_size`,
+   `expected` (path to `[size, mtime]`) and `paths`.
+   Writes a JSON object mapping paths to `size`, `mtime`
+   and optionally `blocks`."""
+
+PATCH_SCRIPT = r"""
+import hashlib, json, os, sys
+stream = getattr(sys.stdin, 'buffer', sys.stdin)
+root = os.path.expanduser(sys.argv[1])
+result = {{}}
+while True:
+    line = stream.readline()
+    if not line:
+        break
+    header = json.loads(line.decode('utf-8'))
+    relative = header['path']
+    path = os.path.join(root, *relative.split('/'))
+    if header.get('delete'):
+        if os.path.exists(path):
+            os.remove(path)
+        continue
+    directory = os.path.dirname(path)
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    block_size = header['block_size']
+    temporary = path + '{suffix}'
+    base = open(path, 'rb') if os.path.exists(path) else None
+    digest = hashlib.md5()
+    try:
+        with open(temporary, 'wb') as file:
+            while True:
+                operation = stream.readline().decode('utf-8').split()
+                if operation[0] == 'C':
+                    base.seek(int(operation[1]) * block_size)
+                    remaining = int(operation[2]) * block_size
+                    while remaining > 0:
+                        data = base.read(min(remaining, 1024 * 1024))
+                        if not data:
+                            break
+                        file.write(data)
+                        digest.update(data)
+                        remaining -= len(data)
+                elif operation[0] == 'D':
+                    data = stream.read(int(operation[1]))
+                    file.write(data)
+                    digest.update(data)
+                else:
+                    break
+    finally:
+        if base is not None:
+            base.close()
+    if operation[1:] != [digest.hexdigest()]:
+        os.remove(temporary)
+        result[relative] = None
+        continue
+    os.chmod(temporary, header['mode'])
+    os.rename(temporary, path)
+    stat = os.stat(path)
+    result[relative] = [stat.st_size, stat.st_mtime]
+sys.stdout.write(json.dumps(result))
+""".format(suffix=SYNC_TEMPORARY_SUFFIX)
+"""Rebuilds files from a stream of delta operations read from stdin.
+
+   For each file, reads a JSON header line with keys: `path`, `mode`,
+   `block_size`, or `path` and `delete`. Then reads operations until
+   `E digest`: `C first count` copies blocks of the old file, `D size`
+   is followed by literal data. A file is replaced only if the MD5 hex
+   digest of the rebuilt contents matches.
+
+   Writes a JSON object mapping rebuilt paths to `[size, mtime]`,
+   or to `null` if the digest did not match, e.g. because the old file
+   changed since its blocks were hashed."""
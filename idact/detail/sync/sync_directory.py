@@ -0,0 +1,571 @@
+"""This module contains a function for synchronizing a local directory
+    to the cluster, transferring only changed blocks."""
+
+import json
+import mmap
+import os
+import shlex
+import stat
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import paramiko
+
+from idact.core.config import ClusterConfig
+from idact.core.transfer_stats import TransferStats
+from idact.detail.helper.stage_info import stage_debug
+from idact.detail.log.get_logger import get_logger
+from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.ssh.exec_on_channel import exec_on_channel, \
+    check_exit_status
+from idact.detail.sync.block_signatures import SYNC_BLOCK_SIZE, \
+    BlockSignature, ContentsHasher
+from idact.detail.sync.compute_delta import MAX_LITERAL_SIZE, compute_delta
+from idact.detail.sync.remote_sync_scripts import SCAN_SCRIPT, PATCH_SCRIPT
+from idact.detail.sync.sync_manifest import SyncManifest, get_manifest_path
+from idact.detail.transfer.transfer_stats_impl import TransferStatsImpl
+
+ChangedFile = Tuple[str, List[BlockSignature]]
+"""Relative path of a changed file, and remote block signatures."""
+
+StreamedFile = Tuple[list, List[BlockSignature]]
+"""Local file state and block signatures of the contents
+   sent to the cluster."""
+
+
+def list_local_tree(local_path: str) -> Dict[str, os.stat_result]:
+    """Returns stats of regular files under the directory, by relative
+        path with `/` as the separator.
+
+        :param local_path: Local directory.
+
+    """
+    files = {}
+    for root, _, names in os.walk(local_path):
+        for name in names:
+            path = os.path.join(root, name)
+            file_stat = os.stat(path)
+            if not stat.S_ISREG(file_stat.st_mode):
+                continue
+            relative = os.path.relpath(path, local_path)
+            files[relative.replace(os.sep, '/')] = file_stat
+    return files
+
+
+def get_local_state(file_stat: os.stat_result) -> list:
+    """Returns the local file state stored in the manifest.
+
+        :param file_stat: Local file stat.
+
+    """
+    return [file_stat.st_size,
+            file_stat.st_mtime_ns,
+            stat.S_IMODE(file_stat.st_mode)]
+
+
+def run_remote_script(client: paramiko.SSHClient,
+                      script: str,
+                      args: List[str],
+                      write_input,
+                      config: ClusterConfig) -> dict:
+    """Runs a Python script on the node, writes its input and returns
+        its JSON output.
+
+        :param client: Connected client.
+
+        :param script: Script source.
+
+        :param args: Script arguments.
+
+        :param write_input: Called with the channel to write the script
+                            input to.
+
+        :param config: Cluster config with the remote shell.
+
+    """
+    command = "python -c {script} {args}".format(
+        script=shlex.quote(script),
+        args=' '.join(shlex.quote(arg) for arg in args))
+    channel = exec_on_channel(client=client,
+                              command=command,
+                              config=config)
+    try:
+        write_input(channel)
+        channel.shutdown_write()
+        with channel.makefile('rb') as output:
+            contents = output.read()
+        check_exit_status(channel=channel, command="python -c ...")
+    finally:
+        channel.close()
+    return json.loads(contents.decode('utf-8'))
+
+
+@contextmanager
+def map_contents(file) -> Iterator[bytes]:
+    """Yields the file contents as a memory map, or empty bytes.
+
+        :param file: Local file opened for binary reading.
+
+    """
+    if os.fstat(file.fileno()).st_size == 0:
+        yield b''
+        return
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as contents:
+        yield contents
+
+
+def hash_contents(hasher: ContentsHasher,
+                  contents: bytes,
+                  start: int,
+                  length: int) -> int:
+    """Hashes up to `length` bytes of the contents from `start`,
+        in parts of limited size. Returns the end of the hashed range.
+
+        :param hasher: Hasher of the sent contents.
+
+        :param contents: Local file contents.
+
+        :param start: Range start.
+
+        :param length: Maximum range length.
+
+    """
+    end = min(start + length, len(contents))
+    for part_start in range(start, end, MAX_LITERAL_SIZE):
+        hasher.update(contents[part_start:min(end,
+                                              part_start + MAX_LITERAL_SIZE)])
+    return end
+
+
+def write_file_delta(channel: paramiko.Channel,
+                     relative_path: str,
+                     path: str,
+                     signatures: List[BlockSignature]) -> Tuple[List[int],
+                                                                StreamedFile]:
+    """Writes delta operations for a file to the patch script input.
+        Returns literal, copied and written byte counts, and the state
+        and block signatures of the contents that were sent.
+
+        The state is taken, and the blocks are hashed, from the same open
+        file the delta is computed from, so they stay consistent
+        with the remote file even if the local file is modified meanwhile.
+
+        :param channel: Patch script channel.
+
+        :param relative_path: Remote path relative to the synchronized
+                              directory.
+
+        :param path: Local file path.
+
+        :param signatures: Remote block signatures.
+
+    """
+    hasher = ContentsHasher(block_size=SYNC_BLOCK_SIZE)
+    with open(path, 'rb') as file:
+        file_stat = os.fstat(file.fileno())
+        header = json.dumps({'path': relative_path,
+                             'mode': stat.S_IMODE(file_stat.st_mode),
+                             'block_size': SYNC_BLOCK_SIZE}) + '\n'
+        channel.sendall(header.encode('utf-8'))
+        literal = 0
+        position = 0
+        written = len(header)
+        with map_contents(file) as contents:
+            for operation in compute_delta(contents=contents,
+                                           signatures=signatures,
+                                           block_size=SYNC_BLOCK_SIZE):
+                if isinstance(operation, tuple):
+                    line = 'C {} {}\n'.format(*operation).encode()
+                    channel.sendall(line)
+                    position = hash_contents(
+                        hasher=hasher,
+                        contents=contents,
+                        start=position,
+                        length=operation[1] * SYNC_BLOCK_SIZE)
+                    written += len(line)
+                else:
+                    line = 'D {}\n'.format(len(operation)).encode()
+                    channel.sendall(line)
+                    channel.sendall(operation)
+                    hasher.update(operation)
+                    position += len(operation)
+                    literal += len(operation)
+                    written += len(line) + len(operation)
+            copied = len(contents) - literal
+    line = 'E {}\n'.format(hasher.digest).encode()
+    channel.sendall(line)
+    return ([literal, copied, written + len(line)],
+            (get_local_state(file_stat), hasher.signatures))
+
+
+def scan_remote_directory(client: paramiko.SSHClient,
+                          config: ClusterConfig,
+                          remote_path: str,
+                          local_files: Dict[str, os.stat_result],
+                          manifest: SyncManifest) -> dict:
+    """Lists remote files, hashing blocks of files changed since
+        the last synchronization. Returns the scan script output.
+
+        :param client: Connected client.
+
+        :param config: Cluster config with the remote shell.
+
+        :param remote_path: Remote directory.
+
+        :param local_files: Local file stats by relative path.
+
+        :param manifest: Synchronization manifest.
+
+    """
+    request = {'root': remote_path,
+               'block_size': SYNC_BLOCK_SIZE,
+               'expected': {path: manifest.get_remote_state(path)
+                            for path in local_files
+                            if manifest.get_remote_state(path) is not None},
+               'paths': sorted(local_files)}
+    log = get_logger(__name__)
+    with stage_debug(log, "Scanning remote directory: %s", remote_path):
+        return run_remote_script(
+            client=client,
+            script=SCAN_SCRIPT,
+            args=[],
+            write_input=lambda channel: channel.sendall(
+                json.dumps(request).encode('utf-8')),
+            config=config)
+
+
+def get_changed_files(local_files: Dict[str, os.stat_result],
+                      remote_files: dict,
+                      manifest: SyncManifest,
+                      delete: bool) -> Tuple[List[str],
+                                             List[ChangedFile],
+                                             List[str]]:
+    """Returns unchanged relative paths, changed relative paths
+        with the remote block signatures to compute the delta against,
+        and relative paths of remote files to remove.
+
+        :param local_files: Local file stats by relative path.
+
+        :param remote_files: Scan script output.
+
+        :param manifest: Synchronization manifest.
+
+        :param delete: Remove remote files missing locally.
+
+    """
+    unchanged = []
+    changed = []
+    for path, file_stat in sorted(local_files.items()):
+        remote_file = remote_files.get(path)
+        remote_state = None if remote_file is None else [
+            remote_file['size'], remote_file['mtime']]
+        if manifest.is_unchanged(path=path,
+                                 local_state=get_local_state(file_stat),
+                                 remote_state=remote_state):
+            unchanged.append(path)
+            continue
+        if remote_file is None:
+            signatures = []
+        elif 'blocks' in remote_file:
+            signatures = [tuple(block) for block in remote_file['blocks']]
+        else:
+            signatures = manifest.get_blocks(path) or []
+        changed.append((path, signatures))
+
+    deleted = []
+    if delete:
+        deleted = sorted(set(remote_files) - set(local_files))
+
+    log = get_logger(__name__)
+    log.debug("Sync: %d unchanged, %d changed, %d deleted.",
+              len(unchanged), len(changed), len(deleted))
+    return unchanged, changed, deleted
+
+
+def run_patch_script(client: paramiko.SSHClient,
+                     config: ClusterConfig,
+                     local_path: str,
+                     remote_path: str,
+                     changed: List[ChangedFile],
+                     deleted: List[str]) -> Tuple[dict,
+                                                  Dict[str, StreamedFile],
+                                                  Dict[str, List[int]]]:
+    """Writes the delta of changed files and paths to remove to the patch
+        script. Returns the patch script output, and the files sent
+        with their literal, copied and written byte counts by relative
+        path.
+
+        :param client: Connected client.
+
+        :param config: Cluster config with the remote shell.
+
+        :param local_path: Local directory.
+
+        :param remote_path: Remote directory.
+
+        :param changed: Changed relative paths with remote signatures.
+
+        :param deleted: Relative paths to remove.
+
+    """
+    streamed = {}
+    counts = {}
+
+    def write_input(channel: paramiko.Channel):
+        for path, signatures in changed:
+            counts[path], streamed[path] = write_file_delta(
+                channel=channel,
+                relative_path=path,
+                path=os.path.join(local_path, *path.split('/')),
+                signatures=signatures)
+        for path in deleted:
+            channel.sendall((json.dumps({'path': path,
+                                         'delete': True})
+                             + '\n').encode('utf-8'))
+
+    patched = run_remote_script(client=client,
+                                script=PATCH_SCRIPT,
+                                args=[remote_path],
+                                write_input=write_input,
+                                config=config)
+    return patched, streamed, counts
+
+
+def sum_counts(counts: Dict[str, List[int]]) -> List[int]:
+    """Returns literal, copied and written byte counts for all files.
+
+        :param counts: Byte counts by relative path.
+
+    """
+    return [sum(file_counts[i] for file_counts in counts.values())
+            for i in range(3)]
+
+
+def merge_resent_files(patched: dict,
+                       streamed: Dict[str, StreamedFile],
+                       counts: Dict[str, List[int]],
+                       resent: Tuple[dict,
+                                     Dict[str, StreamedFile],
+                                     Dict[str, List[int]]]):
+    """Replaces the results of files that were sent again in whole.
+        Written byte counts of both attempts are added up.
+
+        :param patched: Patch script output to update.
+
+        :param streamed: Files sent by relative path to update.
+
+        :param counts: Byte counts by relative path to update.
+
+        :param resent: Output of :func:`.run_patch_script` for the files
+                       sent again.
+
+    """
+    resent_patched, resent_streamed, resent_counts = resent
+    failed = sorted(path for path, remote_state in resent_patched.items()
+                    if remote_state is None)
+    if failed:
+        raise RuntimeError("Cannot rebuild remote files: {}.".format(
+            ', '.join(failed)))
+    patched.update(resent_patched)
+    streamed.update(resent_streamed)
+    for path, (literal, copied, written) in resent_counts.items():
+        counts[path] = [literal, copied, counts[path][2] + written]
+
+
+def patch_remote_directory(client: paramiko.SSHClient,
+                           config: ClusterConfig,
+                           local_path: str,
+                           remote_path: str,
+                           changed: List[ChangedFile],
+                           deleted: List[str]) -> Tuple[dict,
+                                                        Dict[str,
+                                                             StreamedFile],
+                                                        List[int]]:
+    """Rebuilds changed remote files from the delta, and removes deleted
+        ones. Returns remote file states and the files sent by relative
+        path, and literal, copied and written byte counts.
+
+        Files rebuilt with a wrong digest, because the remote file
+        changed since its blocks were hashed, are sent again in whole.
+        Only the last attempt is counted as literal and copied bytes,
+        but all attempts are counted as written.
+
+        :param client: Connected client.
+
+        :param config: Cluster config with the remote shell.
+
+        :param local_path: Local directory.
+
+        :param remote_path: Remote directory.
+
+        :param changed: Changed relative paths with remote signatures.
+
+        :param deleted: Relative paths to remove.
+
+    """
+    if not changed and not deleted:
+        return {}, {}, [0, 0, 0]
+
+    log = get_logger(__name__)
+    with stage_debug(log, "Patching remote directory: %s", remote_path):
+        patched, streamed, counts = run_patch_script(client=client,
+                                                     config=config,
+                                                     local_path=local_path,
+                                                     remote_path=remote_path,
+                                                     changed=changed,
+                                                     deleted=deleted)
+    mismatched = sorted(path for path, remote_state in patched.items()
+                        if remote_state is None)
+    if not mismatched:
+        return patched, streamed, sum_counts(counts)
+
+    log.warning("Remote files changed during synchronization,"
+                " sending them in whole: %s", ', '.join(mismatched))
+    resent = run_patch_script(client=client,
+                              config=config,
+                              local_path=local_path,
+                              remote_path=remote_path,
+                              changed=[(path, []) for path in mismatched],
+                              deleted=[])
+    merge_resent_files(patched=patched,
+                       streamed=streamed,
+                       counts=counts,
+                       resent=resent)
+    return patched, streamed, sum_counts(counts)
+
+
+def transfer_changes(node: NodeInternal,
+                     local_path: str,
+                     remote_path: str,
+                     local_files: Dict[str, os.stat_result],
+                     manifest: SyncManifest,
+                     delete: bool) -> Tuple[List[str],
+                                            dict,
+                                            Dict[str, StreamedFile],
+                                            List[int]]:
+    """Scans and patches the remote directory over one connection.
+        Returns unchanged relative paths, remote file states and files
+        sent by relative path, and literal, copied and written byte
+        counts.
+
+        :param node: Node to synchronize to.
+
+        :param local_path: Local directory.
+
+        :param remote_path: Remote directory.
+
+        :param local_files: Local file stats by relative path.
+
+        :param manifest: Synchronization manifest.
+
+        :param delete: Remove remote files missing locally.
+
+    """
+    try:
+        with node.connection() as client:
+            remote_files = scan_remote_directory(client=client,
+                                                 config=node.config,
+                                                 remote_path=remote_path,
+                                                 local_files=local_files,
+                                                 manifest=manifest)
+            unchanged, changed, deleted = get_changed_files(
+                local_files=local_files,
+                remote_files=remote_files,
+                manifest=manifest,
+                delete=delete)
+            patched, streamed, counts = patch_remote_directory(
+                client=client,
+                config=node.config,
+                local_path=local_path,
+                remote_path=remote_path,
+                changed=changed,
+                deleted=deleted)
+    except (paramiko.SSHException, OSError) as e:
+        raise RuntimeError("Cannot synchronize '{local_path}'.".format(
+            local_path=local_path)) from e
+    return unchanged, patched, streamed, counts
+
+
+def update_manifest(manifest: SyncManifest,
+                    local_files: Dict[str, os.stat_result],
+                    patched: dict,
+                    streamed: Dict[str, StreamedFile]):
+    """Records the state of synchronized files, forgets removed ones,
+        and saves the manifest.
+
+        :param manifest: Synchronization manifest.
+
+        :param local_files: Local file stats by relative path.
+
+        :param patched: Remote file states by relative path.
+
+        :param streamed: Files sent by relative path.
+
+    """
+    for path, (local_state, blocks) in streamed.items():
+        manifest.update(path=path,
+                        local_state=local_state,
+                        remote_state=patched[path],
+                        blocks=blocks)
+    manifest.retain(list(local_files))
+    manifest.save()
+
+
+def sync_directory(node: NodeInternal,
+                   local_path: str,
+                   remote_path: str,
+                   delete: bool = False,
+                   manifest_path: Optional[str] = None) -> TransferStats:
+    """Synchronizes the local directory to the remote directory,
+        transferring only changed blocks of changed files.
+
+        Takes two commands on the node: one lists remote files and hashes
+        blocks of files changed since the last synchronization,
+        the other rebuilds changed files from the delta.
+
+        :param node: Node to synchronize to.
+
+        :param local_path: Local directory.
+
+        :param remote_path: Remote directory. Created if missing.
+
+        :param delete: Remove remote files missing locally.
+
+        :param manifest_path: Local manifest path.
+                              Default: see :func:`.get_manifest_path`.
+
+    """
+    start = time.perf_counter()
+    if not os.path.isdir(local_path):
+        raise ValueError("Not a directory: '{}'.".format(local_path))
+    if manifest_path is None:
+        manifest_path = get_manifest_path(config=node.config,
+                                          local_path=local_path,
+                                          remote_path=remote_path)
+
+    local_files = list_local_tree(local_path)
+    manifest = SyncManifest.load(path=manifest_path,
+                                 block_size=SYNC_BLOCK_SIZE)
+
+    unchanged, patched, streamed, counts = transfer_changes(
+        node=node,
+        local_path=local_path,
+        remote_path=remote_path,
+        local_files=local_files,
+        manifest=manifest,
+        delete=delete)
+
+    update_manifest(manifest=manifest,
+                    local_files=local_files,
+                    patched=patched,
+                    streamed=streamed)
+
+    literal, copied, written = counts
+    return TransferStatsImpl(
+        files=len(streamed),
+        transferred_bytes=literal,
+        skipped_bytes=copied + sum(local_files[path].st_size
+                                   for path in unchanged),
+        wire_bytes=written,
+        seconds=time.perf_counter() - start)
@@ -0,0 +1,172 @@
+"""This module contains the implementation of a local cache of file states
+    after directory synchronization."""
+
+import hashlib
+import json
+import os
+from typing import List, Optional
+
+from idact.core.config import ClusterConfig
+from idact.detail.log.get_logger import get_logger
+from idact.detail.sync.block_signatures import BlockSignature
+
+SYNC_MANIFEST_DIR = os.path.expanduser('~/.idact/sync')
+"""Local directory for synchronization manifests."""
+
+SYNC_MANIFEST_VERSION = 1
+"""Manifest format version. Manifests in other versions are discarded."""
+
+
+def get_manifest_path(config: ClusterConfig,
+                      local_path: str,
+                      remote_path: str) -> str:
+    """Returns the manifest path for a pair of synchronized directories.
+
+        :param config: Cluster config.
+
+        :param local_path: Local directory.
+
+        :param remote_path: Remote directory.
+
+    """
+    key = "{user}@{host}:{port}|{local_path}|{remote_path}".format(
+        user=config.user,
+        host=config.host,
+        port=config.port,
+        local_path=os.path.abspath(local_path),
+        remote_path=remote_path)
+    return os.path.join(SYNC_MANIFEST_DIR, "{}.json".format(
+        hashlib.sha1(key.encode()).hexdigest()))
+
+
+class SyncManifest:
+    """Remembers the local and remote state of each file after
+        the last synchronization, along with block signatures
+        of its contents.
+
+        If neither the local nor the remote state changed,
+        the file is skipped. If only the local state changed,
+        cached signatures are used instead of hashing the remote file.
+
+        :param path: Manifest file path.
+
+        :param block_size: Block size of the signatures.
+
+        :param files: File entries of a loaded manifest.
+
+    """
+
+    def __init__(self,
+                 path: str,
+                 block_size: int,
+                 files: Optional[dict] = None):
+        self._path = path
+        self._block_size = block_size
+        self._files = files if files is not None else {}
+
+    @staticmethod
+    def load(path: str, block_size: int) -> 'SyncManifest':
+        """Loads the manifest, or returns an empty one if it does not exist
+            or is incompatible.
+
+            :param path: Manifest file path.
+
+            :param block_size: Block size of the signatures.
+
+        """
+        try:
+            with open(path, 'r') as file:
+                contents = json.load(file)
+        except FileNotFoundError:
+            return SyncManifest(path=path, block_size=block_size)
+        except ValueError:
+            log = get_logger(__name__)
+            log.warning("Discarding invalid sync manifest: %s", path)
+            return SyncManifest(path=path, block_size=block_size)
+        if contents.get('version') != SYNC_MANIFEST_VERSION \
+                or contents.get('block_size') != block_size:
+            return SyncManifest(path=path, block_size=block_size)
+        return SyncManifest(path=path,
+                            block_size=block_size,
+                            files=contents['files'])
+
+    def save(self):
+        """Saves the manifest, replacing the file atomically."""
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        temporary = self._path + '.tmp'
+        with open(temporary, 'w') as file:
+            json.dump({'version': SYNC_MANIFEST_VERSION,
+                       'block_size': self._block_size,
+                       'files': self._files}, file)
+        os.replace(temporary, self._path)
+
+    def get_remote_state(self, path: str) -> Optional[list]:
+        """Returns the remote `[size, mtime]` after the last synchronization.
+
+            :param path: Relative file path.
+
+        """
+        entry = self._files.get(path)
+        return entry['remote'] if entry else None
+
+    def is_unchanged(self,
+                     path: str,
+                     local_state: list,
+                     remote_state: Optional[list]) -> bool:
+        """Returns True, if neither the local nor the remote file changed
+            since the last synchronization.
+
+            :param path: Relative file path.
+
+            :param local_state: Local `[size, mtime_ns, mode]`.
+
+            :param remote_state: Remote `[size, mtime]`, or None if missing.
+
+        """
+        entry = self._files.get(path)
+        return (entry is not None
+                and remote_state is not None
+                and entry['local'] == local_state
+                and entry['remote'] == remote_state)
+
+    def get_blocks(self, path: str) -> Optional[List[BlockSignature]]:
+        """Returns cached block signatures of the synchronized contents.
+
+            :param path: Relative file path.
+
+        """
+        entry = self._files.get(path)
+        if entry is None:
+            return None
+        return [tuple(block) for block in entry['blocks']]
+
+    def update(self,
+               path: str,
+               local_state: list,
+               remote_state: list,
+               blocks: List[BlockSignature]):
+        """Records the state of a synchronized file.
+
+            :param path: Relative file path.
+
+            :param local_state: Local `[size, mtime_ns, mode]`.
+
+            :param remote_state: Remote `[size, mtime]`.
+
+            :param blocks: Block signatures of the contents.
+
+        """
+        self._files[path] = {'local': local_state,
+                             'remote': remote_state,
+                             'blocks': [list(block) for block in blocks]}
+
+    def retain(self, paths: List[str]):
+        """Forgets files other than the listed ones.
+
+            :param paths: Relative file paths to keep.
+
+        """
+        kept = set(paths)
+        self._files = {path: entry
+                       for path, entry in self._files.items()
+                       if path in kept}
@@ -0,0 +1,2 @@
+"""This package contains internal functionality related to transferring
+    files between the local machine and cluster nodes."""
@@ -0,0 +1,125 @@
+"""This module contains functions for transferring a file through
+    a gzip stream on an exec channel."""
+
+import shlex
+import zlib
+from typing import Tuple
+
+import paramiko
+
+from idact.core.config import ClusterConfig
+from idact.detail.ssh.get_remote_command import get_bash_command
+from idact.detail.ssh.exec_on_channel import exec_on_channel, \
+    check_exit_status
+from idact.detail.transfer.file_transfer import FileTransfer, \
+    TRANSFER_CHUNK_SIZE
+
+COMPRESSION_LEVEL = 6
+"""Compression level for local compression."""
+
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+"""Window bits for a zlib stream with a gzip header and trailer."""
+
+
+def upload_file_compressed(client: paramiko.SSHClient,
+                           transfer: FileTransfer,
+                           offset: int,
+                           config: ClusterConfig) -> Tuple[int, int]:
+    """Compresses the file locally, starting at offset, and decompresses
+        it on the node. Returns the number of bytes sent before
+        and after compression.
+
+        :param client: Connected client.
+
+        :param transfer: File to upload, with a destination path relative
+                         to the home directory or absolute.
+
+        :param offset: Bytes already present at the destination.
+
+        :param config: Cluster config with the remote shell.
+
+    """
+    command = "gzip -dc {redirect} {path} && chmod {mode:o} {path}".format(
+        redirect='>>' if offset else '>',
+        path=shlex.quote(transfer.destination),
+        mode=transfer.mode)
+    compressor = zlib.compressobj(COMPRESSION_LEVEL, zlib.DEFLATED,
+                                  GZIP_WBITS)
+    sent = 0
+    wire = 0
+    channel = exec_on_channel(client=client,
+                              command=command,
+                              config=config)
+    try:
+        with open(transfer.source, 'rb') as local_file:
+            local_file.seek(offset)
+            while True:
+                chunk = local_file.read(TRANSFER_CHUNK_SIZE)
+                if not chunk:
+                    break
+                compressed = compressor.compress(chunk)
+                channel.sendall(compressed)
+                wire += len(compressed)
+                sent += len(chunk)
+                transfer.report_progress(done=offset + sent)
+        compressed = compressor.flush()
+        channel.sendall(compressed)
+        wire += len(compressed)
+        channel.shutdown_write()
+        check_exit_status(channel=channel, command=command)
+    finally:
+        channel.close()
+    return sent, wire
+
+
+def download_file_compressed(client: paramiko.SSHClient,
+                             transfer: FileTransfer,
+                             offset: int,
+                             config: ClusterConfig) -> Tuple[int, int]:
+    """Compresses the file on the node, starting at offset, and decompresses
+        it locally. Returns the number of bytes received after
+        and before decompression.
+
+        :param client: Connected client.
+
+        :param transfer: File to download, with a source path relative
+                         to the home directory or absolute.
+
+        :param offset: Bytes already present at the destination.
+
+        :param config: Cluster config with the remote shell.
+
+    """
+    command = get_bash_command(
+        "set -o pipefail && tail -c +{start} {path} | gzip -c".format(
+            start=offset + 1,
+            path=shlex.quote(transfer.source)))
+    decompressor = zlib.decompressobj(GZIP_WBITS)
+    received = 0
+    wire = 0
+    channel = exec_on_channel(client=client,
+                              command=command,
+                              config=config)
+    try:
+        mode = 'r+b' if offset else 'wb'
+        with open(transfer.destination, mode) as local_file:
+            local_file.seek(offset)
+            local_file.truncate()
+            while True:
+                compressed = channel.recv(TRANSFER_CHUNK_SIZE)
+                if not compressed:
+                    break
+                wire += len(compressed)
+                chunk = decompressor.decompress(compressed)
+                local_file.write(chunk)
+                received += len(chunk)
+                transfer.report_progress(done=offset + received)
+            chunk = decompressor.flush()
+            local_file.write(chunk)
+            received += len(chunk)
+        check_exit_status(channel=channel, command=command)
+    finally:
+        channel.close()
+    if not decompressor.eof:
+        raise RuntimeError("Compressed stream ended unexpectedly.")
+    return received, wire
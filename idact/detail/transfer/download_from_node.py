@@ -0,0 +1,198 @@
+"""This module contains a function for downloading a file or a directory
+    tree from a node."""
+
+import os
+import posixpath
+import stat
+import time
+from typing import List, Optional, Tuple
+
+import paramiko
+
+from idact.core.transfer_stats import TransferStats
+from idact.detail.helper.run_in_parallel import run_in_parallel, \
+    DEFAULT_MAX_PARALLEL
+from idact.detail.helper.stage_info import stage_debug
+from idact.detail.log.get_logger import get_logger
+from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.ssh.get_sftp_path import get_sftp_path
+from idact.detail.transfer.compressed_file_transfer import \
+    download_file_compressed
+from idact.detail.transfer.file_transfer import FileTransfer, \
+    ProgressCallback, get_resume_offset
+from idact.detail.transfer.sftp_file_transfer import download_file_over_sftp
+from idact.detail.transfer.transfer_stats_impl import TransferStatsImpl
+
+
+def list_remote_files(sftp: paramiko.SFTPClient,
+                      remote_path: str,
+                      local_path: str,
+                      on_progress: Optional[ProgressCallback]) -> \
+        Tuple[List[str], List[FileTransfer]]:  # noqa
+    """Returns local directories to create and files to download.
+
+        :param sftp: SFTP session.
+
+        :param remote_path: Remote file or directory, as an SFTP path.
+
+        :param local_path: Local file or directory.
+
+        :param on_progress: Progress callback.
+
+    """
+    attributes = sftp.stat(remote_path)
+    if not stat.S_ISDIR(attributes.st_mode):
+        return [], [FileTransfer(source=remote_path,
+                                 destination=local_path,
+                                 size=attributes.st_size,
+                                 mode=stat.S_IMODE(attributes.st_mode),
+                                 on_progress=on_progress)]
+
+    directories = [local_path]
+    files = []
+    pending = [(remote_path, local_path)]
+    while pending:
+        remote_dir, local_dir = pending.pop(0)
+        for entry in sorted(sftp.listdir_attr(remote_dir),
+                            key=lambda entry: entry.filename):
+            remote_entry = posixpath.join(remote_dir, entry.filename)
+            local_entry = os.path.join(local_dir, entry.filename)
+            if stat.S_ISDIR(entry.st_mode):
+                directories.append(local_entry)
+                pending.append((remote_entry, local_entry))
+            elif stat.S_ISREG(entry.st_mode):
+                files.append(FileTransfer(
+                    source=remote_entry,
+                    destination=local_entry,
+                    size=entry.st_size,
+                    mode=stat.S_IMODE(entry.st_mode),
+                    on_progress=on_progress))
+    return directories, files
+
+
+def get_local_size(path: str) -> Optional[int]:
+    """Returns the local file size, or None if it does not exist.
+
+        :param path: Local path.
+
+    """
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return None
+
+
+def make_local_directories(directories: List[str]):
+    """Creates missing local directories.
+
+        :param directories: Directories to create.
+
+    """
+    for directory in directories:
+        os.makedirs(directory, exist_ok=True)
+
+
+def download_file(node: NodeInternal,
+                  transfer: FileTransfer,
+                  compress: bool,
+                  resume: bool) -> Tuple[int, int, int]:
+    """Downloads a single file, and returns the number of bytes received,
+        skipped and transferred over the wire.
+
+        :param node: Node to download from.
+
+        :param transfer: File to download.
+
+        :param compress: Compress the file on the fly.
+
+        :param resume: Skip a complete file, or append to a partially
+                       downloaded one.
+
+    """
+    offset = get_resume_offset(
+        size=transfer.size,
+        destination_size=get_local_size(path=transfer.destination),
+        resume=resume)
+    if offset is None:
+        transfer.report_progress(done=transfer.size)
+        return 0, transfer.size, 0
+    with node.connection() as client:
+        if compress:
+            received, wire = download_file_compressed(
+                client=client,
+                transfer=transfer,
+                offset=offset,
+                config=node.config)
+        else:
+            with client.open_sftp() as sftp:
+                received = download_file_over_sftp(sftp=sftp,
+                                                   transfer=transfer,
+                                                   offset=offset)
+            wire = received
+    os.chmod(transfer.destination, transfer.mode)
+    return received, offset, wire
+
+
+def download_from_node(node: NodeInternal,
+                       remote_path: str,
+                       local_path: str,
+                       compress: bool = False,
+                       resume: bool = False,
+                       max_parallel: Optional[int] = None,
+                       on_progress: Optional[ProgressCallback] = None) -> TransferStats:  # noqa, pylint: disable=bad-continuation,line-too-long
+    """Downloads a file, or the contents of a directory, from the node.
+        Files of a directory tree are downloaded in parallel.
+
+        :param node: Node to download from.
+
+        :param remote_path: Remote file or directory path.
+
+        :param local_path: Local file or directory path.
+                           Parent directories must exist.
+
+        :param compress: Compress files on the fly. Requires `gzip`
+                         on the node.
+
+        :param resume: Skip complete files, and append to partially
+                       downloaded ones.
+
+        :param max_parallel: Maximum number of concurrent file downloads.
+                             Default: :attr:`.DEFAULT_MAX_PARALLEL`.
+
+        :param on_progress: Called from worker threads with the local path,
+                            bytes downloaded and file size.
+
+    """
+    if max_parallel is None:
+        max_parallel = DEFAULT_MAX_PARALLEL
+    log = get_logger(__name__)
+    start = time.perf_counter()
+    try:
+        with stage_debug(log, "Downloading from node %s: %s to %s",
+                         node.host, remote_path, local_path):
+            with node.connection() as client:
+                with client.open_sftp() as sftp:
+                    directories, files = list_remote_files(
+                        sftp=sftp,
+                        remote_path=get_sftp_path(remote_path),
+                        local_path=local_path,
+                        on_progress=on_progress)
+            make_local_directories(directories=directories)
+
+            results = run_in_parallel(
+                lambda transfer: download_file(node=node,
+                                               transfer=transfer,
+                                               compress=compress,
+                                               resume=resume),
+                items=files,
+                max_parallel=max_parallel)
+    except (paramiko.SSHException, OSError) as e:
+        raise RuntimeError("Cannot download '{remote_path}'.".format(
+            remote_path=remote_path)) from e
+
+    return TransferStatsImpl(
+        files=len(files),
+        transferred_bytes=sum(result[0] for result in results),
+        skipped_bytes=sum(result[1] for result in results),
+        wire_bytes=sum(result[2] for result in results),
+        seconds=time.perf_counter() - start)
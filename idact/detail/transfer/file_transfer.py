@@ -0,0 +1,79 @@
+"""This module contains a data class describing a single file transfer."""
+
+from typing import Callable, Optional
+
+ProgressCallback = Callable[[str, int, int], None]
+"""Called with destination path, bytes present at the destination,
+   and the file size."""
+
+TRANSFER_CHUNK_SIZE = 1024 * 1024
+"""Bytes read from the source at a time."""
+
+
+class FileTransfer:
+    """Describes a file to transfer.
+
+        :param source: Source path.
+
+        :param destination: Destination path.
+
+        :param size: Source file size.
+
+        :param mode: Permission bits to set at the destination.
+
+        :param on_progress: Progress callback, or None.
+
+    """
+
+    def __init__(self,
+                 source: str,
+                 destination: str,
+                 size: int,
+                 mode: int,
+                 on_progress: Optional[ProgressCallback] = None):
+        self.source = source
+        self.destination = destination
+        self.size = size
+        self.mode = mode
+        self.on_progress = on_progress
+
+    def report_progress(self, done: int):
+        """Calls the progress callback, if any.
+
+            :param done: Bytes present at the destination.
+
+        """
+        if self.on_progress is not None:
+            self.on_progress(self.destination, done, self.size)
+
+    def __str__(self):
+        return "FileTransfer({source} -> {destination}, {size} B)".format(
+            source=self.source,
+            destination=self.destination,
+            size=self.size)
+
+    def __repr__(self):
+        return str(self)
+
+
+def get_resume_offset(size: int,
+                      destination_size: Optional[int],
+                      resume: bool) -> Optional[int]:
+    """Returns the offset to start the transfer at, or None if the file
+        is already complete at the destination.
+
+        A shorter destination file is assumed to be a prefix of the source.
+
+        :param size: Source file size.
+
+        :param destination_size: Destination file size, or None if it does
+                                 not exist.
+
+        :param resume: Resume transfer of a partial file.
+
+    """
+    if not resume or destination_size is None or destination_size > size:
+        return 0
+    if destination_size == size:
+        return None
+    return destination_size
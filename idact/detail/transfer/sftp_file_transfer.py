@@ -0,0 +1,70 @@
+"""This module contains functions for transferring a file over SFTP,
+    with pipelined reads and writes."""
+
+import paramiko
+
+from idact.detail.transfer.file_transfer import FileTransfer, \
+    TRANSFER_CHUNK_SIZE
+
+
+def upload_file_over_sftp(sftp: paramiko.SFTPClient,
+                          transfer: FileTransfer,
+                          offset: int) -> int:
+    """Uploads the file, starting at offset. Writes are pipelined,
+        so they are not acknowledged one by one.
+        Returns the number of bytes sent.
+
+        :param sftp: SFTP session.
+
+        :param transfer: File to upload, with an SFTP destination path.
+
+        :param offset: Bytes already present at the destination.
+
+    """
+    sent = 0
+    with open(transfer.source, 'rb') as local_file:
+        local_file.seek(offset)
+        mode = 'r+b' if offset else 'wb'
+        with sftp.open(transfer.destination, mode) as remote_file:
+            remote_file.seek(offset)
+            remote_file.set_pipelined(True)
+            while True:
+                chunk = local_file.read(TRANSFER_CHUNK_SIZE)
+                if not chunk:
+                    break
+                remote_file.write(chunk)
+                sent += len(chunk)
+                transfer.report_progress(done=offset + sent)
+    sftp.chmod(transfer.destination, transfer.mode)
+    return sent
+
+
+def download_file_over_sftp(sftp: paramiko.SFTPClient,
+                            transfer: FileTransfer,
+                            offset: int) -> int:
+    """Downloads the file, starting at offset. Reads are prefetched
+        in the background. Returns the number of bytes received.
+
+        :param sftp: SFTP session.
+
+        :param transfer: File to download, with an SFTP source path.
+
+        :param offset: Bytes already present at the destination.
+
+    """
+    received = 0
+    mode = 'r+b' if offset else 'wb'
+    with open(transfer.destination, mode) as local_file:
+        local_file.seek(offset)
+        local_file.truncate()
+        with sftp.open(transfer.source, 'rb') as remote_file:
+            remote_file.seek(offset)
+            remote_file.prefetch(transfer.size)
+            while True:
+                chunk = remote_file.read(TRANSFER_CHUNK_SIZE)
+                if not chunk:
+                    break
+                local_file.write(chunk)
+                received += len(chunk)
+                transfer.report_progress(done=offset + received)
+    return received
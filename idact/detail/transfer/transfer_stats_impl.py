@@ -0,0 +1,74 @@
+"""This module contains the implementation of a file transfer summary."""
+
+from idact.core.transfer_stats import TransferStats
+
+
+class TransferStatsImpl(TransferStats):
+    """Implementation of :class:`.TransferStats`.
+
+        :param files: Number of files.
+
+        :param transferred_bytes: File contents sent before compression.
+
+        :param skipped_bytes: File contents already present.
+
+        :param wire_bytes: File contents sent after compression.
+
+        :param seconds: Total transfer time.
+
+    """
+
+    def __init__(self,
+                 files: int,
+                 transferred_bytes: int,
+                 skipped_bytes: int,
+                 wire_bytes: int,
+                 seconds: float):
+        self._files = files
+        self._transferred_bytes = transferred_bytes
+        self._skipped_bytes = skipped_bytes
+        self._wire_bytes = wire_bytes
+        self._seconds = seconds
+
+    @property
+    def files(self) -> int:
+        return self._files
+
+    @property
+    def transferred_bytes(self) -> int:
+        return self._transferred_bytes
+
+    @property
+    def skipped_bytes(self) -> int:
+        return self._skipped_bytes
+
+    @property
+    def wire_bytes(self) -> int:
+        return self._wire_bytes
+
+    @property
+    def seconds(self) -> float:
+        return self._seconds
+
+    @property
+    def throughput(self) -> float:
+        if self._seconds <= 0:
+            return 0.0
+        return self._transferred_bytes / self._seconds
+
+    def __str__(self):
+        return ("TransferStats(files={files},"
+                " transferred={transferred_bytes} B,"
+                " skipped={skipped_bytes} B,"
+                " wire={wire_bytes} B,"
+                " {seconds:.3f} s,"
+                " {throughput:.0f} B/s)").format(
+                    files=self._files,
+                    transferred_bytes=self._transferred_bytes,
+                    skipped_bytes=self._skipped_bytes,
+                    wire_bytes=self._wire_bytes,
+                    seconds=self._seconds,
+                    throughput=self.throughput)
+
+    def __repr__(self):
+        return str(self)
@@ -0,0 +1,205 @@
+"""This module contains a function for uploading a file or a directory
+    tree to a node."""
+
+import os
+import posixpath
+import stat
+import time
+from typing import List, Optional, Tuple
+
+import paramiko
+
+from idact.core.transfer_stats import TransferStats
+from idact.detail.helper.run_in_parallel import run_in_parallel, \
+    DEFAULT_MAX_PARALLEL
+from idact.detail.helper.stage_info import stage_debug
+from idact.detail.log.get_logger import get_logger
+from idact.detail.nodes.node_internal import NodeInternal
+from idact.detail.ssh.get_sftp_path import get_sftp_path
+from idact.detail.transfer.compressed_file_transfer import \
+    upload_file_compressed
+from idact.detail.transfer.file_transfer import FileTransfer, \
+    ProgressCallback, get_resume_offset
+from idact.detail.transfer.sftp_file_transfer import upload_file_over_sftp
+from idact.detail.transfer.transfer_stats_impl import TransferStatsImpl
+
+
+def list_local_files(local_path: str,
+                     remote_path: str,
+                     on_progress: Optional[ProgressCallback]) -> \
+        Tuple[List[str], List[FileTransfer]]:  # noqa
+    """Returns remote directories to create and files to upload.
+
+        :param local_path: Local file or directory.
+
+        :param remote_path: Remote file or directory, as an SFTP path.
+
+        :param on_progress: Progress callback.
+
+    """
+    if not os.path.isdir(local_path):
+        file_stat = os.stat(local_path)
+        return [], [FileTransfer(source=local_path,
+                                 destination=remote_path,
+                                 size=file_stat.st_size,
+                                 mode=stat.S_IMODE(file_stat.st_mode),
+                                 on_progress=on_progress)]
+
+    directories = [remote_path]
+    files = []
+    for root, dir_names, file_names in os.walk(local_path):
+        relative = os.path.relpath(root, local_path)
+        remote_root = remote_path if relative == '.' else posixpath.join(
+            remote_path, *relative.split(os.sep))
+        for dir_name in sorted(dir_names):
+            directories.append(posixpath.join(remote_root, dir_name))
+        for file_name in sorted(file_names):
+            source = os.path.join(root, file_name)
+            file_stat = os.stat(source)
+            files.append(FileTransfer(
+                source=source,
+                destination=posixpath.join(remote_root, file_name),
+                size=file_stat.st_size,
+                mode=stat.S_IMODE(file_stat.st_mode),
+                on_progress=on_progress))
+    return directories, files
+
+
+def make_remote_directories(sftp: paramiko.SFTPClient,
+                            directories: List[str]):
+    """Creates missing remote directories, parents first.
+
+        :param sftp: SFTP session.
+
+        :param directories: Directories to create, parents before children.
+
+    """
+    for directory in directories:
+        try:
+            if stat.S_ISDIR(sftp.stat(directory).st_mode):
+                continue
+        except FileNotFoundError:
+            pass
+        sftp.mkdir(directory)
+
+
+def get_remote_size(sftp: paramiko.SFTPClient,
+                    path: str) -> Optional[int]:
+    """Returns the remote file size, or None if it does not exist.
+
+        :param sftp: SFTP session.
+
+        :param path: SFTP path.
+
+    """
+    try:
+        return sftp.stat(path).st_size
+    except FileNotFoundError:
+        return None
+
+
+def upload_file(node: NodeInternal,
+                transfer: FileTransfer,
+                compress: bool,
+                resume: bool) -> Tuple[int, int, int]:
+    """Uploads a single file, and returns the number of bytes sent,
+        skipped and transferred over the wire.
+
+        :param node: Node to upload to.
+
+        :param transfer: File to upload.
+
+        :param compress: Compress the file on the fly.
+
+        :param resume: Skip a complete file, or append to a partially
+                       uploaded one.
+
+    """
+    with node.connection() as client:
+        with client.open_sftp() as sftp:
+            offset = get_resume_offset(
+                size=transfer.size,
+                destination_size=get_remote_size(
+                    sftp=sftp,
+                    path=transfer.destination),
+                resume=resume)
+            if offset is None:
+                transfer.report_progress(done=transfer.size)
+                return 0, transfer.size, 0
+            if compress:
+                sent, wire = upload_file_compressed(
+                    client=client,
+                    transfer=transfer,
+                    offset=offset,
+                    config=node.config)
+            else:
+                sent = upload_file_over_sftp(sftp=sftp,
+                                             transfer=transfer,
+                                             offset=offset)
+                wire = sent
+            return sent, offset, wire
+
+
+def upload_to_node(node: NodeInternal,
+                   local_path: str,
+                   remote_path: str,
+                   compress: bool = False,
+                   resume: bool = False,
+                   max_parallel: Optional[int] = None,
+                   on_progress: Optional[ProgressCallback] = None) -> TransferStats:  # noqa, pylint: disable=bad-continuation,line-too-long
+    """Uploads a file, or the contents of a directory, to the node.
+        Files of a directory tree are uploaded in parallel.
+
+        :param node: Node to upload to.
+
+        :param local_path: Local file or directory.
+
+        :param remote_path: Remote file or directory path.
+                            Parent directories must exist.
+
+        :param compress: Compress files on the fly. Requires `gzip`
+                         on the node.
+
+        :param resume: Skip complete files, and append to partially
+                       uploaded ones.
+
+        :param max_parallel: Maximum number of concurrent file uploads.
+                             Default: :attr:`.DEFAULT_MAX_PARALLEL`.
+
+        :param on_progress: Called from worker threads with the remote path,
+                            bytes uploaded and file size.
+
+    """
+    if max_parallel is None:
+        max_parallel = DEFAULT_MAX_PARALLEL
+    log = get_logger(__name__)
+    start = time.perf_counter()
+    try:
+        with stage_debug(log, "Uploading %s to node %s: %s",
+                         local_path, node.host, remote_path):
+            directories, files = list_local_files(
+                local_path=local_path,
+                remote_path=get_sftp_path(remote_path),
+                on_progress=on_progress)
+            with node.connection() as client:
+                with client.open_sftp() as sftp:
+                    make_remote_directories(sftp=sftp,
+                                            directories=directories)
+
+            results = run_in_parallel(
+                lambda transfer: upload_file(node=node,
+                                             transfer=transfer,
+                                             compress=compress,
+                                             resume=resume),
+                items=files,
+                max_parallel=max_parallel)
+    except (paramiko.SSHException, OSError) as e:
+        raise RuntimeError("Cannot upload '{local_path}'.".format(
+            local_path=local_path)) from e
+
+    return TransferStatsImpl(
+        files=len(files),
+        transferred_bytes=sum(result[0] for result in results),
+        skipped_bytes=sum(result[1] for result in results),
+        wire_bytes=sum(result[2] for result in results),
+        seconds=time.perf_counter() - start)
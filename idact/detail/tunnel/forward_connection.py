@@ -0,0 +1,38 @@
+"""This module contains a function for forwarding data between a local
+    socket and an SSH channel."""
+
+import select
+import socket
+
+import paramiko
+
+FORWARD_BUFFER_SIZE = 32 * 1024
+
+
+def forward_connection(sock: socket.socket, channel: paramiko.Channel):
+    """Copies data in both directions until either side closes,
+        then closes both.
+
+        :param sock: Accepted local connection.
+
+        :param channel: Channel to the tunnel destination.
+
+    """
+    try:
+        while True:
+            readable, _, _ = select.select([sock, channel], [], [])
+            if sock in readable:
+                data = sock.recv(FORWARD_BUFFER_SIZE)
+                if not data:
+                    break
+                channel.sendall(data)
+            if channel in readable:
+                data = channel.recv(FORWARD_BUFFER_SIZE)
+                if not data:
+                    break
+                sock.sendall(data)
+    except (OSError, EOFError, paramiko.SSHException):
+        pass
+    finally:
+        channel.close()
+        sock.close()
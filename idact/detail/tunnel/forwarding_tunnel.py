@@ -0,0 +1,146 @@
+"""This module contains the implementation of a tunnel that forwards local
+    connections over a single SSH transport."""
+
+import socket
+import threading
+from typing import Callable, Optional
+
+import paramiko
+
+from idact.core.config import ClusterConfig
+from idact.detail.log.get_logger import get_logger
+from idact.detail.tunnel.binding import Binding
+from idact.detail.tunnel.forward_connection import forward_connection
+from idact.detail.tunnel.tunnel_internal import TunnelInternal
+
+CHANNEL_TIMEOUT = 15
+LISTEN_BACKLOG = 100
+
+
+class ForwardingTunnel(TunnelInternal):
+    """Listens on a local port, and forwards each accepted connection
+        over a new direct TCP/IP channel of the transport.
+
+        Many tunnels can share one transport, e.g. the pooled connection
+        to a node, see :class:`.TunnelMultiplexer`. A transport can be
+        nested inside a channel of another transport, so a multi-hop
+        tunnel needs only one TCP connection to the gateway.
+
+        :param get_transport: Returns the transport to open channels on.
+                              Called for each accepted connection.
+
+        :param here: Local binding. Port zero means any free port.
+
+        :param there: Destination, as seen from the transport's server.
+
+        :param config: Cluster config.
+
+        :param on_close: Called once the tunnel is closed,
+                         e.g. to close the transport.
+
+    """
+
+    def __init__(self,
+                 get_transport: Callable[[], paramiko.Transport],
+                 here: Binding,
+                 there: Binding,
+                 config: ClusterConfig,
+                 on_close: Optional[Callable[[], None]] = None):
+        self._get_transport = get_transport
+        self._there = there
+        self._config = config
+        self._on_close = on_close
+        self._lock = threading.Lock()
+        self._closed = False
+        self._connections = set()
+
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self._socket.bind(here.as_tuple())
+            self._socket.listen(LISTEN_BACKLOG)
+        except OSError as e:
+            self._socket.close()
+            raise RuntimeError(
+                "Unable to bind local tunnel port {port}.".format(
+                    port=here.port)) from e
+        self._here = self._socket.getsockname()[1]
+
+        self._thread = threading.Thread(target=self._accept_connections,
+                                        daemon=True)
+        self._thread.start()
+
+    def _accept_connections(self):
+        while True:
+            try:
+                sock, address = self._socket.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._forward,
+                             args=(sock, address),
+                             daemon=True).start()
+
+    def _forward(self, sock: socket.socket, address):
+        log = get_logger(__name__)
+        try:
+            channel = self._get_transport().open_channel(
+                kind='direct-tcpip',
+                dest_addr=self._there.as_tuple(),
+                src_addr=address,
+                timeout=CHANNEL_TIMEOUT)
+        except (paramiko.SSHException, OSError, EOFError, RuntimeError):
+            log.debug("Unable to open channel for %s.", self, exc_info=1)
+            sock.close()
+            return
+
+        connection = (sock, channel)
+        with self._lock:
+            if self._closed:
+                channel.close()
+                sock.close()
+                return
+            self._connections.add(connection)
+        try:
+            forward_connection(sock=sock, channel=channel)
+        finally:
+            with self._lock:
+                self._connections.discard(connection)
+
+    @property
+    def there(self) -> int:
+        return self._there.port
+
+    @property
+    def here(self) -> int:
+        return self._here
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            connections = list(self._connections)
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._socket.close()
+        self._thread.join()
+        for sock, channel in connections:
+            channel.close()
+            sock.close()
+        if self._on_close is not None:
+            self._on_close()
+
+    def __str__(self):
+        return "{class_name}({here}:{there})".format(
+            class_name=self.__class__.__name__,
+            here=self.here,
+            there=self.there)
+
+    def __repr__(self):
+        return str(self)
+
+    @property
+    def config(self) -> ClusterConfig:
+        return self._config
@@ -0,0 +1,15 @@
+"""This module contains a function for getting the global tunnel
+    multiplexer."""
+
+from idact.detail.tunnel.tunnel_multiplexer import TunnelMultiplexer
+from idact.detail.tunnel.tunnel_multiplexer_provider import \
+    TunnelMultiplexerProvider
+
+
+def get_tunnel_multiplexer() -> TunnelMultiplexer:
+    """Returns the global tunnel multiplexer.
+
+        See :class:`.TunnelMultiplexerProvider`.
+
+    """
+    return TunnelMultiplexerProvider().multiplexer
@@ -0,0 +1,28 @@
+"""This module contains a function for checking once whether there is
+    an HTTP server replying through a tunnel."""
+
+import requests
+
+from idact.detail.tunnel.tunnel_internal import TunnelInternal
+
+HTTP_PROBE_TIMEOUT = 5
+"""Seconds to wait for the HTTP server to connect and reply."""
+
+
+def probe_tunnel_http_connection(tunnel: TunnelInternal) -> bool:
+    """Returns True, if there is an HTTP server replying with HTML
+        through the tunnel. Unlike :func:`.validate_tunnel_http_connection`,
+        does not retry.
+
+        :param tunnel: Tunnel to probe.
+
+    """
+    try:
+        with requests.Session() as session:
+            response = session.get(
+                "http://127.0.0.1:{local_port}".format(
+                    local_port=tunnel.here),
+                timeout=HTTP_PROBE_TIMEOUT)
+    except requests.RequestException:
+        return False
+    return "text/html" in response.headers.get('Content-type', '')
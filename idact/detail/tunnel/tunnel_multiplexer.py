@@ -0,0 +1,153 @@
+"""This module contains the implementation of a multiplexer that shares
+    one SSH transport between all tunnels to a node."""
+
+import threading
+from contextlib import ExitStack
+from typing import Callable, Optional, Tuple
+
+import paramiko
+
+from idact.core.config import ClusterConfig
+from idact.detail.log.get_logger import get_logger
+from idact.detail.ssh.connection_key import ConnectionKey
+from idact.detail.ssh.connection_to_node import connection_to_key
+from idact.detail.ssh.get_connection_key import get_connection_key
+from idact.detail.tunnel.binding import Binding
+from idact.detail.tunnel.forwarding_tunnel import ForwardingTunnel
+from idact.detail.tunnel.tunnel_internal import TunnelInternal
+
+
+class TunnelMultiplexer:
+    """Opens tunnels as port forwards over the pooled connection
+        to the node, so all tunnels to a node, and commands run on it,
+        share one transport per (gateway, node) pair.
+
+        The pooled connection is held while any tunnel to the node
+        is open, so it is not closed as idle. Closing a tunnel only
+        stops its port forward. If the connection is lost, it is
+        reopened for the next forwarded connection.
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._forward_counts = {}
+        self._holds = {}
+
+    def tunnel(self,
+               host: str,
+               port: int,
+               config: ClusterConfig,
+               get_credentials: Callable[[], Tuple[Optional[str], Optional[str]]],  # noqa, pylint: disable=bad-continuation,line-too-long
+               here: Binding,
+               there: Binding) -> TunnelInternal:
+        """Opens a tunnel to the node.
+
+            :param host: Node host.
+
+            :param port: Node SSH port.
+
+            :param config: Cluster config.
+
+            :param get_credentials: Returns the password and private key
+                                    path to authenticate with.
+
+            :param here: Local binding.
+
+            :param there: Destination, as seen from the node.
+
+        """
+        return self.tunnel_to_key(
+            key=get_connection_key(host=host, port=port, config=config),
+            config=config,
+            get_credentials=get_credentials,
+            here=here,
+            there=there)
+
+    def tunnel_to_key(self,
+                      key: ConnectionKey,
+                      config: ClusterConfig,
+                      get_credentials: Callable[[], Tuple[Optional[str], Optional[str]]],  # noqa, pylint: disable=bad-continuation,line-too-long
+                      here: Binding,
+                      there: Binding) -> TunnelInternal:
+        """Opens a tunnel over the pooled connection for the key,
+            e.g. the last hop of a multi-hop tunnel.
+
+            :param key: Connection key.
+
+            :param config: Cluster config.
+
+            :param get_credentials: Returns the password and private key
+                                    path to authenticate with.
+
+            :param here: Local binding.
+
+            :param there: Destination, as seen from the connection target.
+
+        """
+
+        def get_transport() -> paramiko.Transport:
+            with connection_to_key(key=key,
+                                   get_credentials=get_credentials) as client:
+                return client.get_transport()
+
+        hold = ExitStack()
+        hold.enter_context(connection_to_key(key=key,
+                                             get_credentials=get_credentials))
+        self._add_forward(key=key, hold=hold)
+        try:
+            return ForwardingTunnel(
+                get_transport=get_transport,
+                here=here,
+                there=there,
+                config=config,
+                on_close=lambda: self._remove_forward(key=key))
+        except Exception:  # noqa, pylint: disable=broad-except
+            self._remove_forward(key=key)
+            raise
+
+    def _add_forward(self, key: ConnectionKey, hold: ExitStack):
+        """Counts a new forward, keeping the first hold on the connection.
+
+            :param key: Connection key.
+
+            :param hold: Holds an acquired pooled connection.
+
+        """
+        with self._lock:
+            count = self._forward_counts.get(key, 0)
+            self._forward_counts[key] = count + 1
+            if count == 0:
+                self._holds[key] = hold
+                hold = None
+        if hold is not None:
+            hold.close()
+
+    def _remove_forward(self, key: ConnectionKey):
+        """Counts a closed forward, releasing the connection
+            after the last one.
+
+            :param key: Connection key.
+
+        """
+        hold = None
+        with self._lock:
+            count = self._forward_counts[key] - 1
+            if count == 0:
+                del self._forward_counts[key]
+                hold = self._holds.pop(key)
+            else:
+                self._forward_counts[key] = count
+        if hold is not None:
+            log = get_logger(__name__)
+            log.debug("Last tunnel closed, releasing connection: %s", key)
+            hold.close()
+
+    def forward_count(self, key: ConnectionKey) -> int:
+        """Returns the number of open tunnels over the connection.
+
+            :param key: Connection key.
+
+        """
+        with self._lock:
+            return self._forward_counts.get(key, 0)
@@ -0,0 +1,23 @@
+"""This module contains the implementation of a global tunnel multiplexer
+    provider."""
+
+from idact.detail.tunnel.tunnel_multiplexer import TunnelMultiplexer
+
+
+class TunnelMultiplexerProvider:
+    """Stores the global tunnel multiplexer."""
+    _state = {}
+
+    def __init__(self):
+        if TunnelMultiplexerProvider._state:
+            self.__dict__ = TunnelMultiplexerProvider._state
+            return
+
+        self._multiplexer = TunnelMultiplexer()
+
+        TunnelMultiplexerProvider._state = self.__dict__
+
+    @property
+    def multiplexer(self) -> TunnelMultiplexer:
+        """Global tunnel multiplexer."""
+        return self._multiplexer
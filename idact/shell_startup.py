@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""Console script for idact-shell-startup.
+
+How to run::
+
+  python -m idact.shell_startup --help
+
+Or::
+
+  idact-shell-startup --help
+
+.. click:: idact.shell_startup:main
+   :prog: idact-shell-startup
+   :show-nested:
+
+"""
+
+import sys
+from idact.detail.shell_startup_app.main import main
+
+if __name__ == "__main__":
+    sys.exit(
+        main())  # pragma: no cover, pylint: disable=no-value-for-parameter
@@ -37,6 +37,7 @@ DIAGRAMS_TO_GENERATE = {
                            " idact/core/tunnel.py",
     "detail-core-nodes":
         " idact/detail/nodes"
+        " idact/detail/transfer/transfer_stats_impl.py"
         " idact/detail/cluster_impl.py",
     "detail-core-deployments":
         " idact/detail/dask/dask_deployment_impl.py"
@@ -44,8 +45,7 @@ DIAGRAMS_TO_GENERATE = {
         " idact/detail/jupyter/jupyter_deployment_impl.py"
         " idact/detail/deployment_sync/synchronized_deployments_impl.py",
     "detail-core-tunnels":
-        " idact/detail/tunnel/first_hop_tunnel.py"
-        " idact/detail/tunnel/multi_hop_tunnel.py"
+        " idact/detail/tunnel/forwarding_tunnel.py"
         " idact/detail/tunnel/ssh_tunnel.py"
         " idact/detail/tunnel/tunnel_internal.py",
     "detail-core-config":
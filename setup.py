@@ -33,6 +33,7 @@ setup(
     entry_points={
         'console_scripts': [
             'idact-notebook=idact.notebook:main',
+            'idact-shell-startup=idact.shell_startup:main',
         ],
     },
     install_requires=REQUIREMENTS,
@@ -21,6 +21,9 @@ from idact.core.synchronized_deployments import SynchronizedDeployments
 from idact.core.get_default_retries import get_default_retries
 from idact.core.retry import Retry
 from idact.core.set_retry import set_retry
+from idact.core.run_results import RunResult, RunResults
+from idact.core.transfer_stats import TransferStats
+from idact.core.nodes_monitor import NodeResourceHistory, NodesMonitor
 
 from idact import _IMPORTED
 from idact import add_cluster as add_cluster2
@@ -51,6 +54,11 @@ from idact import RetryConfig as RetryConfig2
 from idact import get_default_retries as get_default_retries2
 from idact import Retry as Retry2
 from idact import set_retry as set_retry2
+from idact import RunResult as RunResult2
+from idact import RunResults as RunResults2
+from idact import TransferStats as TransferStats2
+from idact import NodeResourceHistory as NodeResourceHistory2
+from idact import NodesMonitor as NodesMonitor2
 
 IMPORT_PAIRS_CORE_MAIN = [(add_cluster, add_cluster2),
                           (show_cluster, show_cluster2),
@@ -79,7 +87,12 @@ IMPORT_PAIRS_CORE_MAIN = [(add_cluster, add_cluster2),
                           (RetryConfig, RetryConfig2),
                           (get_default_retries, get_default_retries2),
                           (Retry, Retry2),
-                          (set_retry, set_retry2)]
+                          (set_retry, set_retry2),
+                          (RunResult, RunResult2),
+                          (RunResults, RunResults2),
+                          (TransferStats, TransferStats2),
+                          (NodeResourceHistory, NodeResourceHistory2),
+                          (NodesMonitor, NodesMonitor2)]
 
 CORE_IMPORTS = [add_cluster,
                 load_environment,
@@ -108,14 +121,19 @@ CORE_IMPORTS = [add_cluster,
                 RetryConfig,
                 get_default_retries,
                 Retry,
-                set_retry]
+                set_retry,
+                RunResult,
+                RunResults,
+                TransferStats,
+                NodeResourceHistory,
+                NodesMonitor]
 
 
 def test_aliases():
     """Tests classes and functions imported from the core package
        to the top level package.
     """
-    assert len(_IMPORTED) == 28
+    assert len(_IMPORTED) == 33
 
     for core, main in IMPORT_PAIRS_CORE_MAIN:
         assert core is main
@@ -0,0 +1,124 @@
+import os
+import subprocess
+import time
+from contextlib import ExitStack, contextmanager
+from unittest.mock import patch
+
+import pytest
+
+import idact.detail.agent.remote_agent
+from idact.detail.agent.agent_provider import AgentProvider
+from idact.detail.agent.get_remote_agent import get_remote_agent
+from idact.detail.helper.file_exists_on_node import file_exists_on_node
+from idact.detail.helper.get_free_remote_port import get_free_remote_ports
+from idact.detail.helper.ptree import ptree, ptree_with_pgrep
+from idact.detail.slurm.run_squeue import run_squeue
+from idact.detail.ssh.get_connection_pool import get_connection_pool
+from tests.helpers.local_node import CountingNode, local_counting_node
+
+FAKE_SQUEUE = """#!/bin/bash
+if [[ "$*" == *--jobs* ]]; then
+    exit 1
+fi
+echo 'JOBID|NODES|TIME_LEFT|REASON|NODELIST(REASON)|STATE'
+echo '1|2|10:00|None|node[1-2]|RUNNING'
+"""
+
+
+@contextmanager
+def local_agent_node(tmpdir) -> CountingNode:
+    """Runs a local SSH server, and yields a node using the remote agent,
+        with a fake `squeue` on the path and home directory in `tmpdir`.
+
+        :param tmpdir: Temporary directory.
+
+    """
+    home = str(tmpdir.mkdir('home'))
+    bin_dir = str(tmpdir.mkdir('bin'))
+    squeue_path = os.path.join(bin_dir, 'squeue')
+    with open(squeue_path, 'w') as file:
+        file.write(FAKE_SQUEUE)
+    os.chmod(squeue_path, 0o700)
+    environment = {'HOME': home,
+                   'PATH': bin_dir + os.pathsep + os.environ['PATH']}
+
+    with ExitStack() as stack:
+        stack.enter_context(patch.dict(os.environ, environment))
+        node = stack.enter_context(local_counting_node(use_agent=True))
+        stack.callback(AgentProvider().close_all)
+        yield node
+
+
+def test_agent_answers_queries_without_shell(tmpdir):
+    with local_agent_node(tmpdir) as node:
+        home = os.environ['HOME']
+        process = subprocess.Popen(['bash', '-c',
+                                    'sleep 30 & sleep 30 & wait'])
+        try:
+            time.sleep(0.5)
+            pids = ptree(pid=process.pid, node=node)
+            assert pids[0] == process.pid
+            assert len(pids) == 3
+            pgrep_pids = ptree_with_pgrep(pid=process.pid, node=node)
+            assert sorted(pids) == sorted(pgrep_pids)
+        finally:
+            subprocess.call(['pkill', '-P', str(process.pid)])
+            process.wait()
+        node.commands.clear()
+
+        ports = get_free_remote_ports(count=5, node=node)
+        assert len(set(ports)) == 5
+
+        assert file_exists_on_node(node=node, path='~/.idact')
+        assert file_exists_on_node(node=node, path='$HOME/.idact')
+        assert not file_exists_on_node(node=node, path='~/missing')
+
+        results = run_squeue(node=node)
+        assert list(results) == [1]
+        assert results[1].node_list == ['node1', 'node2']
+        assert run_squeue(node=node, job_ids=[2]) == {}
+
+        assert not node.commands
+        agent_files = os.listdir(os.path.join(home, '.idact'))
+        assert len(agent_files) == 1
+        assert agent_files[0].startswith('agent-')
+
+
+def test_agent_is_restarted_after_connection_closed(tmpdir):
+    with local_agent_node(tmpdir) as node:
+        agent = get_remote_agent(node=node)
+        assert agent is get_remote_agent(node=node)
+        assert agent.file_exists(path='~')
+
+        get_connection_pool().close_all()
+        assert agent.file_exists(path='~')
+
+        agent.close()
+        assert agent.file_exists(path='~')
+
+
+def test_agent_operation_error(tmpdir):
+    with local_agent_node(tmpdir) as node:
+        agent = get_remote_agent(node=node)
+        with pytest.raises(RuntimeError):
+            agent.request('ptree')
+        with pytest.raises(RuntimeError):
+            agent.request('unknown')
+        assert agent.ptree(pid=os.getpid())[0] == os.getpid()
+
+
+def test_fall_back_to_shell_when_agent_fails(tmpdir, monkeypatch):
+    with local_agent_node(tmpdir) as node:
+        monkeypatch.setattr(idact.detail.agent.remote_agent,
+                            'get_agent_command',
+                            lambda: 'exit 1')
+        assert file_exists_on_node(node=node, path='~')
+        assert len(node.commands) == 1
+
+
+def test_agent_disabled(tmpdir):
+    with local_agent_node(tmpdir) as node:
+        node.config.use_agent = False
+        assert get_remote_agent(node=node) is None
+        assert file_exists_on_node(node=node, path='~')
+        assert len(node.commands) == 1
@@ -0,0 +1,126 @@
+import asyncio
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from idact.aio import AsyncNode, AsyncNodes
+from idact.detail.aio.run_blocking import run_blocking
+from idact.detail.nodes.nodes_impl import NodesImpl
+from tests.helpers.local_node import get_local_config, get_local_node, \
+    local_ssh_servers
+
+NODE_COUNT = 2
+COMMAND_COUNT = 200
+
+
+@contextmanager
+def event_loop() -> asyncio.AbstractEventLoop:
+    """Yields a new event loop, and closes it on exit."""
+    loop = asyncio.new_event_loop()
+    try:
+        yield loop
+    finally:
+        loop.close()
+
+
+def get_nodes(servers) -> AsyncNodes:
+    config = get_local_config(port=servers[0].port)
+    nodes = [get_local_node(config=config, port=server.port)
+             for server in servers[1:]]
+    return AsyncNodes(nodes=NodesImpl(nodes=nodes, allocation=None))
+
+
+def test_run():
+    with local_ssh_servers(count=NODE_COUNT + 1) as servers, \
+            event_loop() as loop:
+        node = get_nodes(servers)[0]
+        assert isinstance(node, AsyncNode)
+
+        async def run():
+            await node.connect()
+            assert await node.run("echo out; echo err 1>&2") == "out\nerr"
+            with pytest.raises(RuntimeError):
+                await node.run("exit 3")
+            with pytest.raises(TimeoutError):
+                await node.run("sleep 5", timeout=0.5)
+
+        loop.run_until_complete(run())
+        assert servers[1].connection_count == 1
+
+
+def test_many_concurrent_commands():
+    with local_ssh_servers(count=NODE_COUNT + 1) as servers, \
+            event_loop() as loop:
+        nodes = get_nodes(servers)
+
+        async def run():
+            return await asyncio.gather(
+                *[nodes[i % NODE_COUNT].run("sleep 0.2; echo {i}".format(i=i))
+                  for i in range(COMMAND_COUNT)])
+
+        start = time.monotonic()
+        outputs = loop.run_until_complete(run())
+        elapsed = time.monotonic() - start
+
+        assert outputs == [str(i) for i in range(COMMAND_COUNT)]
+        assert elapsed < COMMAND_COUNT * 0.2 / 10
+        assert [server.connection_count for server in servers[1:]] == [1, 1]
+
+
+def test_cancel_closes_channel():
+    with local_ssh_servers(count=NODE_COUNT + 1) as servers, \
+            event_loop() as loop:
+        node = get_nodes(servers)[0]
+
+        async def run():
+            task = loop.create_task(node.run("sleep 10"))
+            await asyncio.sleep(0.5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return await node.run("echo 'still connected'")
+
+        start = time.monotonic()
+        assert loop.run_until_complete(run()) == 'still connected'
+        assert time.monotonic() - start < 5
+
+        with node.node.connection() as client:
+            channels = client.get_transport()._channels  # noqa, pylint: disable=protected-access
+            for _ in range(50):
+                if not channels:
+                    break
+                time.sleep(0.1)
+            assert not channels
+
+
+def test_run_all():
+    with local_ssh_servers(count=NODE_COUNT + 1) as servers, \
+            event_loop() as loop:
+        nodes = get_nodes(servers)
+        results = loop.run_until_complete(
+            nodes.run_all("echo 'Hello'", max_parallel=1))
+        assert results.succeeded
+        assert results.outputs == ['Hello'] * NODE_COUNT
+
+        results = loop.run_until_complete(nodes.run_many(["echo 0", "exit 1"]))
+        assert results.outputs == ['0', None]
+        assert [result.node for result in results.failed] == [nodes.nodes[1]]
+
+
+def test_run_blocking_cleans_up_after_cancellation():
+    with event_loop() as loop:
+        abandoned = []
+
+        async def run():
+            task = loop.create_task(run_blocking(
+                lambda: time.sleep(0.2) or 'result',
+                on_abandoned=abandoned.append))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            await asyncio.sleep(0.5)
+
+        loop.run_until_complete(run())
+        assert abandoned == ['result']
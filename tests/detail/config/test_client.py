@@ -73,6 +73,13 @@ def test_client_cluster_config_create():
     assert config.scratch == "$HOME"
     assert config.retries == get_default_retries()
     assert config.use_jupyter_lab
+    assert not config.watch_squeue
+    assert config.squeue_cache_ttl == 1
+    assert not config.use_agent
+    assert config.remote_shell == "/bin/bash --noprofile -l -c"
+    assert config.shell_environment == {}
+    assert not config.reserve_ports
+    assert config.health_check_interval == 0
 
 
 def test_client_config_validation_is_used():
@@ -131,7 +138,14 @@ def test_client_config_serialize():
                          'scratch': '$HOME',
                          'notebookDefaults': {},
                          'retries': DEFAULT_RETRIES_JSON,
-                         'useJupyterLab': True}
+                         'useJupyterLab': True,
+                         'watchSqueue': False,
+                         'squeueCacheTtl': 1,
+                         'useAgent': False,
+                         'remoteShell': '/bin/bash --noprofile -l -c',
+                         'shellEnvironment': {},
+                         'reservePorts': False,
+                         'healthCheckInterval': 0}
         },
         'logLevel': INFO
     }
@@ -188,7 +202,14 @@ def test_client_config_serialize_public_key():
                          'scratch': '$HOME',
                          'notebookDefaults': {},
                          'retries': DEFAULT_RETRIES_JSON,
-                         'useJupyterLab': True}
+                         'useJupyterLab': True,
+                         'watchSqueue': False,
+                         'squeueCacheTtl': 1,
+                         'useAgent': False,
+                         'remoteShell': '/bin/bash --noprofile -l -c',
+                         'shellEnvironment': {},
+                         'reservePorts': False,
+                         'healthCheckInterval': 0}
         }, 'logLevel': INFO}
     assert serialize_client_config_to_json(client_config) == expected_json
 
@@ -230,7 +251,14 @@ EXPECTED_DEFAULT_JSON = {
                      'scratch': '$HOME',
                      'notebookDefaults': {},
                      'retries': DEFAULT_RETRIES_JSON,
-                     'useJupyterLab': True}
+                     'useJupyterLab': True,
+                     'watchSqueue': False,
+                     'squeueCacheTtl': 1,
+                     'useAgent': False,
+                     'remoteShell': '/bin/bash --noprofile -l -c',
+                     'shellEnvironment': {},
+                     'reservePorts': False,
+                     'healthCheckInterval': 0}
     },
     'logLevel': INFO
 }
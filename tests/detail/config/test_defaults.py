@@ -1,6 +1,10 @@
+import pytest
+
 from idact.core.get_default_retries import get_default_retries
 from idact.core.retry import Retry
 from idact.detail.config.client.retry_config_impl import RetryConfigImpl
+from idact.detail.config.defaults.provide_defaults_for_options import \
+    CLUSTER_OPTION_DEFAULTS, provide_defaults_for_options
 from idact.detail.config.defaults.provide_defaults_for_retries import \
     provide_defaults_for_retries
 
@@ -17,3 +21,20 @@ def test_defaults_do_not_override_existing_values():
     assert with_defaults[Retry.JUPYTER_JSON] == RetryConfigImpl(
         count=0,
         seconds_between=0)
+
+
+def test_defaults_for_options():
+    assert provide_defaults_for_options({}) == CLUSTER_OPTION_DEFAULTS
+
+    with_defaults = provide_defaults_for_options({'use_agent': True,
+                                                  'squeue_cache_ttl': None})
+    assert with_defaults['use_agent'] is True
+    assert with_defaults['squeue_cache_ttl'] == 1
+
+    with_defaults['shell_environment']['A'] = 'a'
+    assert CLUSTER_OPTION_DEFAULTS['shell_environment'] == {}
+
+
+def test_unknown_option_is_an_error():
+    with pytest.raises(TypeError):
+        provide_defaults_for_options({'unknown': True})
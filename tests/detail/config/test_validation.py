@@ -14,6 +14,8 @@ from idact.detail.config.validation.validate_log_level \
 from idact.detail.config.validation.validate_notebook_defaults import \
     validate_notebook_defaults
 from idact.detail.config.validation.validate_port import validate_port
+from idact.detail.config.validation.validate_remote_shell import \
+    validate_remote_shell
 from idact.detail.config.validation.validate_non_negative_int \
     import validate_non_negative_int
 from idact.detail.config.validation.validate_retry_config_dict import \
@@ -23,6 +25,8 @@ from idact.detail.config.validation.validate_setup_actions import \
     validate_setup_actions
 from idact.detail.config.validation.validate_setup_actions_config import \
     validate_setup_actions_config
+from idact.detail.config.validation.validate_shell_environment import \
+    validate_shell_environment
 from idact.detail.config.validation.validate_username import validate_username
 from idact.detail.config.validation.validation_error_message import \
     validation_error_message
@@ -290,3 +294,35 @@ def test_validate_retry_config_dict():
         validate_retry_config_dict(
             {Retry.PORT_INFO: RetryConfigImpl(0, 0),
              22: RetryConfigImpl(0, 0)}, label='')
+
+
+def test_validate_remote_shell():
+    assert validate_remote_shell('/bin/sh -c') == '/bin/sh -c'
+    assert validate_remote_shell('') == ''
+    assert validate_remote_shell('/bin/bash -lc') == '/bin/bash -lc'
+    with pytest.raises(TypeError):
+        validate_remote_shell(None)
+    with pytest.raises(TypeError):
+        validate_remote_shell(['/bin/sh', '-c'])
+    with pytest.raises(ValueError):
+        validate_remote_shell('/bin/sh\n-c')
+    with pytest.raises(ValueError):
+        validate_remote_shell('/bin/sh')
+    with pytest.raises(ValueError):
+        validate_remote_shell('/bin/sh -c echo')
+
+
+def test_validate_shell_environment():
+    assert validate_shell_environment({}) == {}
+    assert validate_shell_environment(
+        {'A': 'a b', '_b1': ''}) == {'A': 'a b', '_b1': ''}
+    with pytest.raises(TypeError):
+        validate_shell_environment(None)
+    with pytest.raises(TypeError):
+        validate_shell_environment([('A', 'a')])
+    with pytest.raises(TypeError):
+        validate_shell_environment({'A': 1})
+    with pytest.raises(ValueError):
+        validate_shell_environment({'1A': 'a'})
+    with pytest.raises(ValueError):
+        validate_shell_environment({'A B': 'a'})
@@ -0,0 +1,241 @@
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from typing import List, Optional
+from unittest.mock import patch
+
+import pytest
+
+import idact.detail.dask.deploy_dask_impl
+from idact import AuthMethod
+from idact.core.deploy_dask import deploy_dask
+from idact.core.retry import Retry
+from idact.core.set_retry import set_retry
+from idact.detail.config.client.client_cluster_config import ClusterConfigImpl
+from idact.detail.log.get_logger import get_debug_logger
+from idact.detail.nodes.node_impl import NodeImpl
+from tests.helpers.fake_tunnel import FakeTunnel
+
+LATENCY = 0.01
+BENCHMARK_NODE_COUNTS = [1, 8, 32, 64]
+BENCHMARK_MAX_PARALLEL = 16
+
+
+class SimulatedNode(NodeImpl):
+    """Node that only simulates the latency of connecting."""
+
+    def connect(self, timeout: Optional[int] = None):
+        time.sleep(LATENCY)
+
+
+class FakeDeployment:
+    def __init__(self, node: NodeImpl):
+        self.node = node
+
+
+class FakeScheduler:
+    def __init__(self):
+        self.address = 'tcp://127.0.0.1:1234'
+        self.bokeh_tunnel = FakeTunnel(here=8787, there=8787)
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class FakeWorker:
+    def __init__(self, node: NodeImpl):
+        self.deployment = FakeDeployment(node=node)
+        self.bokeh_tunnel = FakeTunnel(here=8787, there=8787)
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class SimulatedBackend:
+    """Replaces remote operations in Dask deployment with delays.
+
+        :param failing_hosts: Hosts, on which worker deployment fails.
+
+        :param invalid_once_hosts: Hosts, on which the first deployed
+                                   worker is invalid.
+
+    """
+
+    def __init__(self,
+                 failing_hosts: List[str] = None,
+                 invalid_once_hosts: List[str] = None):
+        self.failing_hosts = failing_hosts or []
+        self.invalid_once_hosts = list(invalid_once_hosts or [])
+        self.scheduler = None  # type: Optional[FakeScheduler]
+        self.workers = []  # type: List[FakeWorker]
+        self.lock = threading.Lock()
+        self.in_progress = 0
+        self.peak_in_progress = 0
+
+    @contextmanager
+    def remote_operation(self):
+        """Simulates the latency of a remote operation, and counts
+            operations in progress."""
+        with self.lock:
+            self.in_progress += 1
+            self.peak_in_progress = max(self.peak_in_progress,
+                                        self.in_progress)
+        try:
+            time.sleep(LATENCY)
+            yield
+        finally:
+            with self.lock:
+                self.in_progress -= 1
+
+    def deploy_dask_scheduler(self, node: NodeImpl) -> FakeScheduler:
+        time.sleep(LATENCY)
+        assert node.host == 'node0'
+        self.scheduler = FakeScheduler()
+        return self.scheduler
+
+    def check_scheduler_reachable(self,
+                                  node: NodeImpl,
+                                  scheduler: FakeScheduler):
+        assert node.host is not None
+        assert scheduler.address
+        with self.remote_operation():
+            pass
+
+    def deploy_dask_worker(self,
+                           node: NodeImpl,
+                           scheduler: FakeScheduler) -> FakeWorker:
+        assert scheduler is self.scheduler
+        with self.remote_operation():
+            pass
+        if node.host in self.failing_hosts:
+            raise RuntimeError("Simulated failure.")
+        worker = FakeWorker(node=node)
+        self.workers.append(worker)
+        return worker
+
+    def validate_worker(self, worker: FakeWorker):
+        with self.remote_operation():
+            pass
+        host = worker.deployment.node.host
+        if host in self.invalid_once_hosts:
+            self.invalid_once_hosts.remove(host)
+            raise RuntimeError("Simulated invalid worker.")
+
+
+@contextmanager
+def simulated_backend(**kwargs) -> SimulatedBackend:
+    """Replaces remote operations in Dask deployment with
+        a :class:`SimulatedBackend`.
+
+        :param kwargs: Simulated backend parameters.
+
+    """
+    backend = SimulatedBackend(**kwargs)
+    with ExitStack() as stack:
+        for name in ['deploy_dask_scheduler',
+                     'check_scheduler_reachable',
+                     'deploy_dask_worker',
+                     'validate_worker']:
+            stack.enter_context(
+                patch.object(idact.detail.dask.deploy_dask_impl,
+                             name,
+                             getattr(backend, name)))
+        yield backend
+
+
+def get_nodes(count: int) -> List[SimulatedNode]:
+    config = ClusterConfigImpl(host='localhost',
+                               port=22,
+                               user='user',
+                               auth=AuthMethod.ASK)
+    for retry in Retry:
+        config.retries[retry] = set_retry(count=0, seconds_between=0)
+    nodes = []
+    for i in range(count):
+        node = SimulatedNode(config=config)
+        node.make_allocated(host='node{}'.format(i),
+                            port=22,
+                            cores=None,
+                            memory=None,
+                            allocated_until=None)
+        nodes.append(node)
+    return nodes
+
+
+def test_deploy_dask_in_parallel():
+    with simulated_backend() as backend:
+        nodes = get_nodes(count=8)
+        deployment = deploy_dask(nodes=nodes, max_parallel=4)
+        assert deployment.scheduler is backend.scheduler
+        assert sorted(worker.deployment.node.host
+                      for worker in backend.workers) == [node.host
+                                                         for node in nodes]
+        assert not any(worker.cancelled for worker in backend.workers)
+
+
+def test_failed_worker_cancels_all_deployed():
+    with simulated_backend(failing_hosts=['node3']) as backend:
+        nodes = get_nodes(count=8)
+        with pytest.raises(RuntimeError):
+            deploy_dask(nodes=nodes, max_parallel=8)
+        assert backend.scheduler.cancelled
+        assert len(backend.workers) == 7
+        assert all(worker.cancelled for worker in backend.workers)
+
+
+def test_invalid_workers_are_redeployed():
+    with simulated_backend(invalid_once_hosts=['node1', 'node5']) as backend:
+        nodes = get_nodes(count=8)
+        deploy_dask(nodes=nodes, max_parallel=4)
+        cancelled = [worker.deployment.node.host
+                     for worker in backend.workers
+                     if worker.cancelled]
+        assert sorted(cancelled) == ['node1', 'node5']
+        assert len(backend.workers) == 10
+
+
+@pytest.mark.parametrize('max_parallel', [1, 4, 16])
+def test_deploy_dask_concurrency_is_limited(max_parallel: int):
+    with simulated_backend() as backend:
+        nodes = get_nodes(count=32)
+        deploy_dask(nodes=nodes, max_parallel=max_parallel)
+        assert len(backend.workers) == 32
+        assert backend.in_progress == 0
+        if max_parallel == 1:
+            assert backend.peak_in_progress == 1
+        else:
+            assert 1 < backend.peak_in_progress <= max_parallel
+
+
+def measure_deploy_time(node_count: int, max_parallel: int) -> float:
+    """Returns the time it took to deploy Dask on simulated nodes.
+
+        :param node_count: Number of nodes.
+
+        :param max_parallel: Maximum number of parallel operations.
+
+    """
+    with simulated_backend() as backend:
+        nodes = get_nodes(count=node_count)
+        start = time.perf_counter()
+        deploy_dask(nodes=nodes, max_parallel=max_parallel)
+        elapsed = time.perf_counter() - start
+        assert len(backend.workers) == node_count
+    return elapsed
+
+
+def test_benchmark_deploy_time_against_node_count():
+    """Logs serial and parallel deploy time for increasing node counts.
+        Timings are not asserted, as they depend on the machine."""
+    log = get_debug_logger(__name__)
+    log.debug("%6s %12s %16s",
+              "Nodes", "Serial [s]",
+              "Parallel={} [s]".format(BENCHMARK_MAX_PARALLEL))
+    for node_count in BENCHMARK_NODE_COUNTS:
+        serial = measure_deploy_time(node_count=node_count,
+                                     max_parallel=1)
+        parallel = measure_deploy_time(node_count=node_count,
+                                       max_parallel=BENCHMARK_MAX_PARALLEL)
+        log.debug("%6d %12.3f %16.3f", node_count, serial, parallel)
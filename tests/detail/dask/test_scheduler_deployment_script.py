@@ -4,6 +4,8 @@ from idact.detail.config.client.setup_actions_config import \
     SetupActionsConfigImpl
 from idact.detail.dask.get_scheduler_deployment_script import \
     get_scheduler_deployment_script
+from idact.detail.helper.get_free_remote_port import \
+    get_release_remote_ports_command
 
 
 def test_worker_deployment_script():
@@ -33,3 +35,22 @@ def test_worker_deployment_script():
     print(repr(script))
     print(repr(expected))
     assert script == expected
+
+
+def test_scheduler_deployment_script_releases_reserved_ports():
+    config = ClusterConfigImpl(
+        host='host',
+        port=1234,
+        user='user',
+        auth=AuthMethod.ASK)
+    script = get_scheduler_deployment_script(
+        remote_port=1111,
+        bokeh_port=2222,
+        scratch_subdir='/scratch',
+        log_file='/home/user/log',
+        config=config,
+        reservation_file='/home/user/reserved-ports')
+    lines = script.splitlines()
+    assert lines[2] == get_release_remote_ports_command(
+        reservation_file='/home/user/reserved-ports')
+    assert lines[3].startswith('dask-scheduler')
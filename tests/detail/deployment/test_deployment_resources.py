@@ -0,0 +1,43 @@
+import os
+
+from idact.detail.deployment.create_deployment_dir import \
+    get_random_runtime_dir
+from idact.detail.deployment.deployment_resources import DeploymentResources
+from idact.detail.helper.get_free_remote_port import \
+    get_release_remote_ports_command
+from idact.detail.ssh.command_batch import CommandBatch
+from tests.helpers.local_node import local_counting_node
+
+
+def test_deployment_resources_in_one_command():
+    with local_counting_node() as node:
+        batch = CommandBatch()
+        resources = DeploymentResources(batch=batch,
+                                        runtime_dir=get_random_runtime_dir(),
+                                        port_count=2,
+                                        reserve_ports=False)
+        batch.run(node=node)
+        assert len(node.commands) == 1
+
+        assert os.path.isdir(resources.runtime_dir)
+        assert resources.log_file == os.path.join(resources.runtime_dir,
+                                                  'log')
+        assert os.path.isfile(resources.log_file)
+        assert len(set(resources.ports)) == 2
+        assert resources.reservation_file is None
+
+
+def test_deployment_resources_with_reserved_ports():
+    with local_counting_node() as node:
+        batch = CommandBatch()
+        resources = DeploymentResources(batch=batch,
+                                        runtime_dir=get_random_runtime_dir(),
+                                        port_count=1,
+                                        reserve_ports=True)
+        batch.run(node=node)
+
+        assert resources.reservation_file.startswith(resources.runtime_dir)
+        assert os.path.isfile(resources.reservation_file)
+        node.run(get_release_remote_ports_command(
+            reservation_file=resources.reservation_file))
+        assert not os.path.exists(resources.reservation_file)
@@ -0,0 +1,219 @@
+import datetime
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from idact.detail.deployment_sync.deployment_definitions import \
+    DeploymentDefinitions
+from idact.detail.deployment_sync.deployment_definitions_serialization import \
+    append_deployment_definition_to_cluster, \
+    compact_deployment_definitions_on_cluster, \
+    discard_deployment_definitions_on_cluster, \
+    remove_serialized_deployment_definitions
+from idact.detail.deployment_sync.deployment_journal_script import \
+    DEPLOYMENT_DEFINITIONS_FILENAME, DEPLOYMENT_JOURNAL_FILENAME
+from idact.detail.deployment_sync.discard_expired_deployments import \
+    discard_expired_deployments
+from idact.detail.helper.utc_now import utc_now
+from idact.detail.nodes.node_impl import NodeImpl
+from idact.detail.nodes.nodes_impl import NodesImpl
+from tests.detail.deployment_sync.test_add_deployment_definition import \
+    get_deployment_for_test
+from tests.helpers.local_node import local_node
+
+
+def get_expired_deployment_for_test(uuid: str, job_id: int) -> NodesImpl:
+    deployment = get_deployment_for_test(uuid=uuid, job_id=job_id)
+    for node in deployment:
+        node.make_allocated(host='localhost2',
+                            port=2,
+                            cores=None,
+                            memory=None,
+                            allocated_until=(
+                                utc_now() - datetime.timedelta(minutes=1)))
+    return deployment
+
+
+def pull(node: NodeImpl, path: str) -> DeploymentDefinitions:
+    deployments = compact_deployment_definitions_on_cluster(node=node,
+                                                            path=path)
+    kept = discard_expired_deployments(deployments)
+    discard_deployment_definitions_on_cluster(node=node,
+                                              deployments=deployments,
+                                              kept=kept,
+                                              path=path)
+    return kept
+
+
+def read_journal(path: str) -> str:
+    with open(os.path.join(path, DEPLOYMENT_JOURNAL_FILENAME)) as file:
+        return file.read()
+
+
+def test_append_and_compact(tmpdir):
+    with local_node() as node:
+        path = str(tmpdir.join('idact'))
+        deployment_1 = get_deployment_for_test(uuid='111', job_id=1)
+        deployment_2 = get_deployment_for_test(uuid='222', job_id=2)
+        deployment_1_new = get_deployment_for_test(uuid='111', job_id=3)
+
+        for deployment in [deployment_1, deployment_2, deployment_1_new]:
+            append_deployment_definition_to_cluster(node=node,
+                                                    deployment=deployment,
+                                                    path=path)
+        assert len(read_journal(path).splitlines()) == 3
+        assert oct(os.stat(path).st_mode & 0o777) == oct(0o700)
+
+        deployments = compact_deployment_definitions_on_cluster(node=node,
+                                                                path=path)
+        assert sorted(deployments.nodes) == ['111', '222']
+        assert deployments.nodes['111'].value == deployment_1_new.serialize()
+        assert deployments.nodes['222'].value == deployment_2.serialize()
+        assert not read_journal(path)
+        definitions_path = os.path.join(path, DEPLOYMENT_DEFINITIONS_FILENAME)
+        assert oct(os.stat(definitions_path).st_mode & 0o777) == oct(0o600)
+
+        assert compact_deployment_definitions_on_cluster(
+            node=node,
+            path=path) == deployments
+
+
+def test_compact_empty_and_invalid_records(tmpdir):
+    with local_node() as node:
+        path = str(tmpdir.join('idact'))
+        assert compact_deployment_definitions_on_cluster(
+            node=node,
+            path=path) == DeploymentDefinitions()
+
+        append_deployment_definition_to_cluster(
+            node=node,
+            deployment=get_deployment_for_test(uuid='111', job_id=1),
+            path=path)
+        journal_path = os.path.join(path, DEPLOYMENT_JOURNAL_FILENAME)
+        with open(journal_path, 'a') as file:
+            file.write('{"kind": "nodes", "uu')
+
+        deployments = compact_deployment_definitions_on_cluster(node=node,
+                                                                path=path)
+        assert list(deployments.nodes) == ['111']
+
+
+def test_concurrent_appends_are_not_lost(tmpdir):
+    with local_node() as node:
+        path = str(tmpdir.join('idact'))
+        count = 16
+
+        def append(i: int):
+            append_deployment_definition_to_cluster(
+                node=node,
+                deployment=get_deployment_for_test(uuid=str(i), job_id=i),
+                path=path)
+            if i % 4 == 0:
+                compact_deployment_definitions_on_cluster(node=node,
+                                                          path=path)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(append, range(count)))
+
+        deployments = compact_deployment_definitions_on_cluster(node=node,
+                                                                path=path)
+        assert sorted(deployments.nodes) == sorted(str(i)
+                                                   for i in range(count))
+
+
+def test_discard_and_clear(tmpdir):
+    with local_node() as node:
+        path = str(tmpdir.join('idact'))
+        for i in range(3):
+            append_deployment_definition_to_cluster(
+                node=node,
+                deployment=get_deployment_for_test(uuid=str(i), job_id=i),
+                path=path)
+        deployments = compact_deployment_definitions_on_cluster(node=node,
+                                                                path=path)
+        kept = DeploymentDefinitions(nodes={'1': deployments.nodes['1']})
+        discard_deployment_definitions_on_cluster(node=node,
+                                                  deployments=deployments,
+                                                  kept=kept,
+                                                  path=path)
+        assert compact_deployment_definitions_on_cluster(node=node,
+                                                         path=path) == kept
+
+        remove_serialized_deployment_definitions(node=node, path=path)
+        assert compact_deployment_definitions_on_cluster(
+            node=node,
+            path=path) == DeploymentDefinitions()
+
+
+def test_discard_does_not_remove_definition_pushed_again(tmpdir):
+    with local_node() as node:
+        path = str(tmpdir.join('idact'))
+        append_deployment_definition_to_cluster(
+            node=node,
+            deployment=get_expired_deployment_for_test(uuid='111', job_id=1),
+            path=path)
+        deployments = compact_deployment_definitions_on_cluster(node=node,
+                                                                path=path)
+
+        renewed = get_deployment_for_test(uuid='111', job_id=2)
+        append_deployment_definition_to_cluster(node=node,
+                                                deployment=renewed,
+                                                path=path)
+        compact_deployment_definitions_on_cluster(node=node, path=path)
+
+        discard_deployment_definitions_on_cluster(
+            node=node,
+            deployments=deployments,
+            kept=DeploymentDefinitions(),
+            path=path)
+        deployments = compact_deployment_definitions_on_cluster(node=node,
+                                                                path=path)
+        assert deployments.nodes['111'].value == renewed.serialize()
+
+
+def test_many_clients_pushing_and_pulling_in_parallel(tmpdir):
+    with local_node() as node:
+        path = str(tmpdir.join('idact'))
+        client_count = 8
+        round_count = 3
+
+        def run_client(client: int):
+            append_deployment_definition_to_cluster(
+                node=node,
+                deployment=get_expired_deployment_for_test(
+                    uuid='renewed-{}'.format(client),
+                    job_id=client),
+                path=path)
+            for i in range(round_count):
+                append_deployment_definition_to_cluster(
+                    node=node,
+                    deployment=get_deployment_for_test(
+                        uuid='live-{}-{}'.format(client, i),
+                        job_id=i),
+                    path=path)
+                append_deployment_definition_to_cluster(
+                    node=node,
+                    deployment=get_expired_deployment_for_test(
+                        uuid='expired-{}-{}'.format(client, i),
+                        job_id=i),
+                    path=path)
+                pull(node=node, path=path)
+            append_deployment_definition_to_cluster(
+                node=node,
+                deployment=get_deployment_for_test(
+                    uuid='renewed-{}'.format(client),
+                    job_id=client),
+                path=path)
+            pull(node=node, path=path)
+
+        with ThreadPoolExecutor(max_workers=client_count) as executor:
+            list(executor.map(run_client, range(client_count)))
+
+        expected = ['live-{}-{}'.format(client, i)
+                    for client in range(client_count)
+                    for i in range(round_count)]
+        expected += ['renewed-{}'.format(client)
+                     for client in range(client_count)]
+        deployments = compact_deployment_definitions_on_cluster(node=node,
+                                                                path=path)
+        assert sorted(deployments.nodes) == sorted(expected)
+        assert pull(node=node, path=path) == deployments
@@ -0,0 +1,93 @@
+import threading
+import time
+from typing import Optional
+
+from idact import AuthMethod
+from idact.detail.allocation.allocation_parameters import AllocationParameters
+from idact.detail.config.client.client_cluster_config import ClusterConfigImpl
+from idact.detail.deployment_sync.discard_non_functional_deployments import \
+    discard_non_functional_deployments
+from idact.detail.deployment_sync.synchronized_deployments_impl import \
+    SynchronizedDeploymentsImpl
+from idact.detail.nodes.node_impl import NodeImpl
+from idact.detail.nodes.nodes_impl import NodesImpl
+from idact.detail.slurm.slurm_allocation import SlurmAllocation
+
+HEADER = 'JOBID|NODES|TIME_LEFT|REASON|NODELIST(REASON)|STATE'
+RUNNING_JOB_COUNT = 10
+DEPLOYMENT_COUNT = 20
+
+
+class FakeAccessNode(NodeImpl):
+    """Access node that counts squeue calls, with a few running jobs.
+        The squeue cache is disabled."""
+
+    def __init__(self):
+        super().__init__(config=ClusterConfigImpl(
+            host='localhost',
+            port=2223,
+            user='user',
+            auth=AuthMethod.ASK,
+            squeue_cache_ttl=0))
+        self.make_allocated(host='localhost',
+                            port=2223,
+                            cores=None,
+                            memory=None,
+                            allocated_until=None)
+        self.squeue_count = 0
+        self._lock = threading.Lock()
+
+    def run(self, command: str, timeout: Optional[int] = None) -> str:
+        assert command.startswith('squeue')
+        with self._lock:
+            self.squeue_count += 1
+        time.sleep(0.1)
+        return '\n'.join([HEADER] + ['{}|1|10:00|None|(None)|RUNNING'.format(i)
+                                     for i in range(RUNNING_JOB_COUNT)])
+
+
+def get_nodes_for_test(access_node: NodeImpl,
+                       job_id: int,
+                       done_waiting: bool) -> NodesImpl:
+    return NodesImpl(nodes=[],
+                     allocation=SlurmAllocation(
+                         job_id=job_id,
+                         access_node=access_node,
+                         nodes=[],
+                         entry_point_script_path='a',
+                         parameters=AllocationParameters(),
+                         done_waiting=done_waiting))
+
+
+def test_allocations_are_checked_with_one_squeue_call():
+    access_node = FakeAccessNode()
+    nodes = [get_nodes_for_test(access_node=access_node,
+                                job_id=i,
+                                done_waiting=True)
+             for i in range(DEPLOYMENT_COUNT)]
+    not_waited = get_nodes_for_test(access_node=access_node,
+                                    job_id=DEPLOYMENT_COUNT,
+                                    done_waiting=False)
+
+    deployments = discard_non_functional_deployments(
+        deployments=SynchronizedDeploymentsImpl(nodes=nodes + [not_waited]),
+        access_node=access_node)
+
+    assert access_node.squeue_count == 1
+    assert deployments.nodes == nodes[:RUNNING_JOB_COUNT] + [not_waited]
+    assert not deployments.jupyter_deployments
+    assert not deployments.dask_deployments
+
+
+def test_no_squeue_call_without_waited_allocations():
+    access_node = FakeAccessNode()
+    not_waited = get_nodes_for_test(access_node=access_node,
+                                    job_id=1,
+                                    done_waiting=False)
+
+    deployments = discard_non_functional_deployments(
+        deployments=SynchronizedDeploymentsImpl(nodes=[not_waited]),
+        access_node=access_node)
+
+    assert access_node.squeue_count == 0
+    assert deployments.nodes == [not_waited]
@@ -0,0 +1,158 @@
+import datetime
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from idact import AuthMethod
+from idact.core.retry import Retry
+from idact.core.set_retry import set_retry
+from idact.detail.config.client.client_cluster_config import ClusterConfigImpl
+from idact.detail.deployment_sync.add_deployment_definition import \
+    get_deployment_kind_and_uuid
+from idact.detail.deployment_sync.deployment_definition import \
+    DeploymentDefinition
+from idact.detail.deployment_sync.deployment_definitions import \
+    DeploymentDefinitions
+from idact.detail.deployment_sync.get_deployment_definition import \
+    get_deployment_definition
+from idact.detail.deployment_sync.jupyter_deployments. \
+    lazy_jupyter_deployment import LazyJupyterDeployment
+from idact.detail.deployment_sync.dask_deployments.lazy_dask_deployment \
+    import LazyDaskDeployment
+from idact.detail.deployment_sync.materialize_deployments import \
+    materialize_deployments
+from idact.detail.helper.utc_now import utc_now
+from idact.detail.nodes.node_impl import NodeImpl
+from tests.helpers.local_node import get_local_config, get_local_node, \
+    local_ssh_servers
+
+
+class HtmlHandler(BaseHTTPRequestHandler):
+    """Replies with an empty HTML page."""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.send_response(200)
+        self.send_header('Content-type', 'text/html')
+        self.end_headers()
+        self.wfile.write(b'<html></html>')
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@contextmanager
+def html_server():
+    """Runs an HTTP server in the background, and yields its port."""
+    server = HTTPServer(('127.0.0.1', 0), HtmlHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.server_address[1]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def get_jupyter_definition(node: NodeImpl,
+                           port: int) -> DeploymentDefinition:
+    return DeploymentDefinition(
+        value={'type': 'SerializableTypes.JUPYTER_DEPLOYMENT_IMPL',
+               'deployment': {'type': 'SerializableTypes.GENERIC_DEPLOYMENT',
+                              'node': node.serialize(),
+                              'pid': 1,
+                              'runtime_dir': '/tmp/runtime'},
+               'tunnel_there': port,
+               'tunnel_here': 0,
+               'token': 'abc'},
+        expiration_date=utc_now() + datetime.timedelta(hours=1))
+
+
+@contextmanager
+def local_compute_node() -> NodeImpl:
+    """Runs local SSH servers for an access node and a compute node,
+        and yields the compute node. HTTP tunnels are validated once."""
+    with local_ssh_servers(count=2) as (access_server, compute_server):
+        config = get_local_config(port=access_server.port)
+        config.retries[Retry.VALIDATE_HTTP_TUNNEL] = set_retry(
+            count=1,
+            seconds_between=0)
+        yield get_local_node(config=config, port=compute_server.port)
+
+
+def test_lazy_deployments_are_not_materialized_on_pull():
+    config = ClusterConfigImpl(host='localhost1',
+                               port=1,
+                               user='user-1',
+                               auth=AuthMethod.ASK)
+    expiration_date = utc_now() + datetime.timedelta(hours=10)
+    jupyter_definition = DeploymentDefinition(
+        value={'type': 'SerializableTypes.JUPYTER_DEPLOYMENT_IMPL'},
+        expiration_date=expiration_date)
+    dask_definition = DeploymentDefinition(
+        value={'type': 'SerializableTypes.DASK_DEPLOYMENT_IMPL'},
+        expiration_date=expiration_date)
+    deployments = materialize_deployments(
+        config=config,
+        access_node=NodeImpl(config=config),
+        deployments=DeploymentDefinitions(
+            jupyter_deployments={'222': jupyter_definition},
+            dask_deployments={'333': dask_definition}),
+        lazy=True)
+
+    jupyter = deployments.jupyter_deployments[0]
+    dask = deployments.dask_deployments[0]
+    assert isinstance(jupyter, LazyJupyterDeployment)
+    assert isinstance(dask, LazyDaskDeployment)
+    assert not jupyter.materialized
+    assert str(jupyter) == "JupyterDeployment(222, not opened)"
+    assert repr(dask) == "DaskDeployment(333, not opened)"
+
+    assert get_deployment_definition(jupyter) is jupyter_definition
+    assert get_deployment_kind_and_uuid(dask) == ('dask_deployments', '333')
+
+    jupyter.cancel_local()
+    with pytest.raises(RuntimeError):
+        _ = jupyter.local_port
+    with pytest.raises(RuntimeError):
+        dask.get_client()
+    assert not dask.materialized
+
+
+def test_lazy_jupyter_deployment_opens_tunnel_on_first_access():
+    with local_compute_node() as node, html_server() as port:
+        jupyter = LazyJupyterDeployment(
+            config=node.config,
+            uuid='111',
+            definition=get_jupyter_definition(node=node, port=port))
+        assert not jupyter.materialized
+
+        try:
+            local_port = jupyter.local_port
+            assert jupyter.materialized
+            assert jupyter.address == (
+                "http://localhost:{}/?token=abc".format(local_port))
+            assert jupyter.tunnel.there == port
+            assert str(jupyter).startswith(
+                "JupyterDeployment({}".format(local_port))
+        finally:
+            jupyter.cancel_local()
+
+
+def test_lazy_jupyter_deployment_is_validated():
+    with local_compute_node() as node:
+        with html_server() as port:
+            pass
+
+        jupyter = LazyJupyterDeployment(
+            config=node.config,
+            uuid='111',
+            definition=get_jupyter_definition(node=node, port=port))
+        with pytest.raises(RuntimeError) as error:
+            _ = jupyter.local_port
+        assert "no longer functional" in str(error.value)
+
+        with pytest.raises(RuntimeError) as error_again:
+            jupyter.open_in_browser()
+        assert error_again.value is error.value
@@ -0,0 +1,154 @@
+import os
+import subprocess
+import threading
+import time
+from typing import Optional
+
+import idact.detail.entry_point.collect_port_info
+from idact import AuthMethod
+from idact.core.retry import Retry
+from idact.core.set_retry import set_retry
+from idact.detail.allocation.allocation_parameters import AllocationParameters
+from idact.detail.config.client.client_cluster_config import ClusterConfigImpl
+from idact.detail.entry_point.collect_port_info import \
+    get_collect_port_info_command
+from idact.detail.nodes.node_impl import NodeImpl
+from idact.detail.slurm.slurm_allocation import SlurmAllocation
+
+HEADER = 'JOBID|NODES|TIME_LEFT|REASON|NODELIST(REASON)|STATE'
+
+
+def run_locally(command: str, home: str) -> str:
+    return subprocess.check_output(['sh', '-c', command],
+                                   env={'HOME': home,
+                                        'PATH': os.environ['PATH']},
+                                   universal_newlines=True).strip()
+
+
+def get_port_info_file(home: str) -> str:
+    port_info_dir = os.path.join(home, '.idact', 'sshd_ports')
+    os.makedirs(port_info_dir)
+    return os.path.join(port_info_dir, 'alloc-1')
+
+
+def append_line(path: str, line: str):
+    with open(path, 'a') as file:
+        file.write(line + '\n')
+
+
+def test_collect_follows_file_and_cleans_up(tmpdir):
+    home = str(tmpdir)
+    port_info_file = get_port_info_file(home)
+    entry_point = os.path.join(home, 'entry_point.sh')
+    open(entry_point, 'w').close()
+    append_line(port_info_file, 'node1:1234')
+
+    def report_second_node():
+        time.sleep(0.5)
+        append_line(port_info_file, 'node2:2345')
+
+    thread = threading.Thread(target=report_second_node)
+    thread.start()
+    command = get_collect_port_info_command(
+        allocation_id=1,
+        expected_count=2,
+        timeout=20,
+        entry_point_script_path=entry_point)
+    try:
+        start = time.perf_counter()
+        output = run_locally(command=command, home=home)
+        elapsed = time.perf_counter() - start
+    finally:
+        thread.join()
+
+    assert output.split(' ') == ['node1:1234', 'node2:2345']
+    assert elapsed < 5
+    assert not os.path.exists(port_info_file)
+    assert not os.path.exists(entry_point)
+
+
+def test_collect_waits_for_file_to_appear(tmpdir):
+    home = str(tmpdir)
+    port_info_file = get_port_info_file(home)
+    entry_point = os.path.join(home, 'entry_point.sh')
+
+    def report_node():
+        time.sleep(0.5)
+        append_line(port_info_file, 'node1:1234')
+
+    thread = threading.Thread(target=report_node)
+    thread.start()
+    command = get_collect_port_info_command(
+        allocation_id=1,
+        expected_count=1,
+        timeout=20,
+        entry_point_script_path=entry_point)
+    try:
+        output = run_locally(command=command, home=home)
+    finally:
+        thread.join()
+
+    assert output == 'node1:1234'
+    assert not os.path.exists(port_info_file)
+
+
+def test_collect_gives_up_after_timeout(tmpdir):
+    home = str(tmpdir)
+    entry_point = os.path.join(home, 'entry_point.sh')
+    open(entry_point, 'w').close()
+    command = get_collect_port_info_command(
+        allocation_id=1,
+        expected_count=1,
+        timeout=1,
+        entry_point_script_path=entry_point)
+
+    assert run_locally(command=command, home=home) == ''
+    assert not os.path.exists(entry_point)
+
+
+class FakeAccessNode(NodeImpl):
+    """Access node that reports a running job and its port info."""
+
+    def __init__(self, config: ClusterConfigImpl):
+        super().__init__(config=config)
+        self.make_allocated(host='localhost',
+                            port=22,
+                            cores=None,
+                            memory=None,
+                            allocated_until=None)
+        self.commands = []
+
+    def run(self, command: str, timeout: Optional[int] = None) -> str:
+        self.commands.append(command)
+        if command.startswith('squeue'):
+            return '\n'.join([HEADER,
+                              '1|2|10:00|None|node[1-2]|RUNNING'])
+        return 'node1:1234 node2:2345 '
+
+
+def test_finalize_allocation_in_one_command(monkeypatch):
+    config = ClusterConfigImpl(host='localhost',
+                               port=22,
+                               user='user',
+                               auth=AuthMethod.ASK,
+                               squeue_cache_ttl=0)
+    config.retries[Retry.PORT_INFO] = set_retry(count=3, seconds_between=1)
+    access_node = FakeAccessNode(config=config)
+    monkeypatch.setattr(idact.detail.entry_point.collect_port_info,
+                        'get_access_node',
+                        lambda config: access_node)
+    nodes = [NodeImpl(config=config) for _ in range(2)]
+    allocation = SlurmAllocation(job_id=1,
+                                 access_node=access_node,
+                                 nodes=nodes,
+                                 entry_point_script_path='/tmp/entry_point',
+                                 parameters=AllocationParameters())
+
+    allocation.wait(timeout=None)
+
+    assert [(node.host, node.port) for node in nodes] == [('node1', 1234),
+                                                          ('node2', 2345)]
+    other_commands = [command for command in access_node.commands
+                      if not command.startswith('squeue')]
+    assert len(other_commands) == 1
+    assert 'rm -f /tmp/entry_point' in other_commands[0]
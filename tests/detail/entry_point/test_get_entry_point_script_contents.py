@@ -1,8 +1,14 @@
+import os
+import socket
+import subprocess
+
 from idact import AuthMethod
 from idact.detail.config.client.client_cluster_config \
     import ClusterConfigImpl
 from idact.detail.entry_point.get_entry_point_script_contents import \
-    get_entry_point_script_contents
+    get_entry_point_script_contents, get_port_info_append_command
+
+REPORT_COUNT = 20
 
 
 def test_entry_point_disabled_sshd():
@@ -28,9 +34,8 @@ def test_entry_point_sshd():
                 " s=socket.socket();"
                 " s.bind((str(), 0)); print(s.getsockname()[1]);"
                 " s.close()')\n"
-                "mkdir -p ~/.idact/sshd_ports/alloc-$IDACT_ALLOCATION_ID\n"
-                "chmod 700 ~/.idact/sshd_ports/alloc-$IDACT_ALLOCATION_ID\n"
-                "touch ~/.idact/sshd_ports/alloc-$IDACT_ALLOCATION_ID/$(hostname):$SSHD_PORT\n"  # noqa, pylint: disable=line-too-long
+                "mkdir -p ~/.idact/sshd_ports\n"
+                "chmod 700 ~/.idact/sshd_ports\n"
                 "export PATH=\"$PATH:/usr/sbin\"\n"
                 " $(which sshd)"
                 " -D "
@@ -50,6 +55,39 @@ def test_entry_point_sshd():
                 " -oGSSAPIAuthentication=no"
                 " -oUsePAM=no"
                 " -oSubsystem='sftp internal-sftp'"
-                " -oX11Forwarding=yes\n"
+                " -oX11Forwarding=yes &\n"
+                "SSHD_PID=$!\n"
+                "for i in $(seq 100); do\n"
+                "  python -c 'import socket, sys;"
+                " socket.create_connection((\"127.0.0.1\", int(sys.argv[1])),"
+                " 1).close()' $SSHD_PORT 2> /dev/null && break\n"
+                "  kill -0 $SSHD_PID 2> /dev/null || break\n"
+                "  sleep 0.1\n"
+                "done\n"
+                "python -c 'import fcntl, sys;"
+                " f = open(sys.argv[1], \"a\");"
+                " fcntl.flock(f, fcntl.LOCK_EX);"
+                " f.write(sys.argv[2] + \"\\n\");"
+                " f.close()'"
+                " ~/.idact/sshd_ports/alloc-$IDACT_ALLOCATION_ID"
+                " \"$(hostname):$SSHD_PORT\"\n"
+                "wait $SSHD_PID\n"
                 "exit $?")
     assert formatted == expected
+
+
+def test_concurrent_port_reports_are_all_appended(tmpdir):
+    port_info_file = str(tmpdir.join('alloc-1'))
+    command = get_port_info_append_command(port_info_file=port_info_file)
+    processes = [subprocess.Popen(['bash', '-c', command],
+                                  env={'PATH': os.environ['PATH'],
+                                       'SSHD_PORT': str(port)})
+                 for port in range(REPORT_COUNT)]
+    for process in processes:
+        assert process.wait() == 0
+
+    with open(port_info_file) as file:
+        lines = file.read().splitlines()
+    hostname = socket.gethostname()
+    assert sorted(lines) == sorted('{}:{}'.format(hostname, port)
+                                   for port in range(REPORT_COUNT))
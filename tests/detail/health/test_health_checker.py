@@ -0,0 +1,196 @@
+import datetime
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Optional
+
+from idact import AuthMethod
+from idact.core.retry import Retry
+from idact.core.set_retry import set_retry
+from idact.detail.allocation.allocation_parameters import AllocationParameters
+from idact.detail.config.client.client_cluster_config import ClusterConfigImpl
+from idact.detail.deployment_sync.deployment_definition import \
+    DeploymentDefinition
+from idact.detail.deployment_sync.jupyter_deployments. \
+    lazy_jupyter_deployment import LazyJupyterDeployment
+from idact.detail.health.health_checker import HealthChecker
+from idact.detail.helper.utc_now import utc_now
+from idact.detail.nodes.node_impl import NodeImpl
+from idact.detail.nodes.nodes_impl import NodesImpl
+from idact.detail.slurm.slurm_allocation import SlurmAllocation
+from tests.helpers.local_node import get_local_config, get_local_node, \
+    local_ssh_servers
+
+HEADER = 'JOBID|NODES|TIME_LEFT|REASON|NODELIST(REASON)|STATE'
+RUNNING_JOB_COUNT = 10
+DEPLOYMENT_COUNT = 20
+
+
+class FakeAccessNode(NodeImpl):
+    """Access node that counts squeue calls, with a few running jobs."""
+
+    def __init__(self, port: int, health_check_interval: int):
+        super().__init__(config=ClusterConfigImpl(
+            host='localhost',
+            port=port,
+            user='user',
+            auth=AuthMethod.ASK,
+            squeue_cache_ttl=60,
+            health_check_interval=health_check_interval))
+        self.make_allocated(host='localhost',
+                            port=port,
+                            cores=None,
+                            memory=None,
+                            allocated_until=None)
+        self.squeue_count = 0
+        self._lock = threading.Lock()
+
+    def run(self, command: str, timeout: Optional[int] = None) -> str:
+        assert command.startswith('squeue')
+        with self._lock:
+            self.squeue_count += 1
+        time.sleep(0.1)
+        return '\n'.join([HEADER] + ['{}|1|10:00|None|(None)|RUNNING'.format(i)
+                                     for i in range(RUNNING_JOB_COUNT)])
+
+
+def get_nodes_for_test(access_node: NodeImpl,
+                       job_id: int,
+                       done_waiting: bool) -> NodesImpl:
+    return NodesImpl(nodes=[],
+                     allocation=SlurmAllocation(
+                         job_id=job_id,
+                         access_node=access_node,
+                         nodes=[],
+                         entry_point_script_path='a',
+                         parameters=AllocationParameters(),
+                         done_waiting=done_waiting))
+
+
+def wait_until_checked(deployments, timeout: float = 10.0):
+    end = time.monotonic() + timeout
+    while any(deployment.is_alive is None for deployment in deployments):
+        assert time.monotonic() < end
+        time.sleep(0.05)
+
+
+class HtmlHandler(BaseHTTPRequestHandler):
+    """Replies with an empty HTML page."""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.send_response(200)
+        self.send_header('Content-type', 'text/html')
+        self.end_headers()
+        self.wfile.write(b'<html></html>')
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@contextmanager
+def html_server():
+    """Runs an HTTP server in the background, and yields its port."""
+    server = HTTPServer(('127.0.0.1', 0), HtmlHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.server_address[1]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@contextmanager
+def local_compute_node():
+    """Runs local SSH servers for an access node and a compute node,
+        and yields the compute node. HTTP tunnels are validated once."""
+    with local_ssh_servers(count=2) as (access_server, compute_server):
+        config = get_local_config(port=access_server.port)
+        config.retries[Retry.VALIDATE_HTTP_TUNNEL] = set_retry(
+            count=1,
+            seconds_between=0)
+        yield get_local_node(config=config, port=compute_server.port)
+
+
+def test_health_status_is_empty_when_disabled():
+    access_node = FakeAccessNode(port=2224, health_check_interval=0)
+    nodes = get_nodes_for_test(access_node=access_node,
+                               job_id=1,
+                               done_waiting=True)
+
+    assert nodes.is_alive is None
+    assert nodes.last_seen is None
+    time.sleep(0.2)
+    assert access_node.squeue_count == 0
+
+
+def test_allocations_are_checked_in_background():
+    access_node = FakeAccessNode(port=2225, health_check_interval=60)
+    nodes = [get_nodes_for_test(access_node=access_node,
+                                job_id=i,
+                                done_waiting=True)
+             for i in range(DEPLOYMENT_COUNT)]
+    not_waited = get_nodes_for_test(access_node=access_node,
+                                    job_id=1,
+                                    done_waiting=False)
+    not_in_queue = get_nodes_for_test(access_node=access_node,
+                                      job_id=DEPLOYMENT_COUNT,
+                                      done_waiting=False)
+    before = utc_now()
+
+    wait_until_checked(nodes + [not_waited, not_in_queue])
+
+    assert access_node.squeue_count == 1
+    for running in nodes[:RUNNING_JOB_COUNT] + [not_waited]:
+        assert running.is_alive
+        assert running.last_seen >= before
+    for finished in nodes[RUNNING_JOB_COUNT:] + [not_in_queue]:
+        assert finished.is_alive is False
+        assert finished.last_seen is None
+
+
+def test_jupyter_deployment_last_seen_is_kept():
+    with local_compute_node() as node:
+        with html_server() as port:
+            jupyter = LazyJupyterDeployment(
+                config=node.config,
+                uuid='111',
+                definition=DeploymentDefinition(
+                    value={'type': 'SerializableTypes.JUPYTER_DEPLOYMENT_IMPL',
+                           'deployment': {
+                               'type': 'SerializableTypes.GENERIC_DEPLOYMENT',
+                               'node': node.serialize(),
+                               'pid': 1,
+                               'runtime_dir': '/tmp/runtime'},
+                           'tunnel_there': port,
+                           'tunnel_here': 0,
+                           'token': 'abc'},
+                    expiration_date=utc_now() + datetime.timedelta(hours=1)))
+            checker = HealthChecker(config=node.config)
+            assert checker.get_status(uuid=jupyter.uuid,
+                                      deployment=jupyter).is_alive is None
+
+            try:
+                checker.check_now()
+                assert checker.get_status(uuid=jupyter.uuid,
+                                          deployment=jupyter).is_alive is None
+
+                jupyter.materialize()
+                checker.check_now()
+                status = checker.get_status(uuid=jupyter.uuid,
+                                            deployment=jupyter)
+                assert status.is_alive
+                last_seen = status.last_seen
+                assert last_seen is not None
+            except Exception:
+                jupyter.cancel_local()
+                raise
+
+        try:
+            checker.check_now()
+            status = checker.get_status(uuid=jupyter.uuid, deployment=jupyter)
+            assert status.is_alive is False
+            assert status.last_seen == last_seen
+        finally:
+            jupyter.cancel_local()
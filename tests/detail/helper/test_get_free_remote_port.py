@@ -0,0 +1,87 @@
+import os
+import socket
+import time
+
+import pytest
+
+from idact.detail.helper.get_free_remote_port import \
+    get_free_remote_port, get_free_remote_ports, \
+    get_free_remote_ports_command, get_release_remote_ports_command, \
+    parse_free_remote_ports
+from tests.helpers.local_node import local_counting_node
+
+
+def is_port_free(port: int) -> bool:
+    sock = socket.socket()
+    try:
+        sock.bind(('', port))
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+def test_parse_free_remote_ports():
+    assert parse_free_remote_ports(output='1 2 3\n', count=3) == [1, 2, 3]
+    with pytest.raises(RuntimeError):
+        parse_free_remote_ports(output='1 1', count=2)
+    with pytest.raises(RuntimeError):
+        parse_free_remote_ports(output='1 2', count=3)
+    with pytest.raises(RuntimeError):
+        parse_free_remote_ports(output='Traceback', count=1)
+
+
+def test_get_free_remote_ports_in_one_command():
+    with local_counting_node() as node:
+        ports = get_free_remote_ports(count=10, node=node)
+        assert len(set(ports)) == 10
+        assert len(node.commands) == 1
+
+        assert get_free_remote_port(node=node) > 0
+        assert len(node.commands) == 2
+
+
+def test_reserved_ports_are_released_by_command(tmpdir):
+    with local_counting_node() as node:
+        reservation_file = os.path.join(str(tmpdir), 'reserved-ports')
+        ports = parse_free_remote_ports(
+            output=node.run(get_free_remote_ports_command(
+                count=3,
+                reservation_file=reservation_file)),
+            count=3)
+        with open(reservation_file) as file:
+            assert int(file.read()) > 0
+        assert not any(is_port_free(port) for port in ports)
+
+        node.run(get_release_remote_ports_command(
+            reservation_file=reservation_file))
+        assert not os.path.exists(reservation_file)
+        assert all(is_port_free(port) for port in ports)
+
+        node.run(get_release_remote_ports_command(
+            reservation_file=reservation_file), timeout=1)
+
+
+def test_reserved_ports_are_released_on_file_removal_and_timeout(tmpdir):
+    with local_counting_node() as node:
+        reservation_file = os.path.join(str(tmpdir), 'reserved-ports')
+        port = parse_free_remote_ports(
+            output=node.run(get_free_remote_ports_command(
+                count=1,
+                reservation_file=reservation_file)),
+            count=1)[0]
+        assert not is_port_free(port)
+        os.remove(reservation_file)
+        time.sleep(0.5)
+        assert is_port_free(port)
+
+        port = parse_free_remote_ports(
+            output=node.run(get_free_remote_ports_command(
+                count=1,
+                reservation_file=reservation_file,
+                timeout=0)),
+            count=1)[0]
+        time.sleep(0.5)
+        assert not os.path.exists(reservation_file)
+        assert is_port_free(port)
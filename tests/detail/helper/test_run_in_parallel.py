@@ -0,0 +1,67 @@
+import threading
+import time
+
+import pytest
+
+from idact.detail.helper.run_in_parallel import run_in_parallel
+
+
+def test_results_are_in_item_order():
+    def fun(item: int) -> int:
+        time.sleep(0.01 * (5 - item))
+        return item * 2
+
+    assert run_in_parallel(fun, range(5), max_parallel=5) == [0, 2, 4, 6, 8]
+    assert run_in_parallel(fun, range(5), max_parallel=1) == [0, 2, 4, 6, 8]
+
+
+def test_parallelism_is_limited():
+    lock = threading.Lock()
+    running = [0]
+    max_running = [0]
+
+    def fun(_):
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+
+    run_in_parallel(fun, range(20), max_parallel=4)
+    assert max_running[0] == 4
+
+
+def test_invalid_parallelism_limit():
+    with pytest.raises(ValueError):
+        run_in_parallel(lambda item: item, [1], max_parallel=0)
+
+
+def test_on_result_is_called_for_successes_before_raising():
+    registered = []
+
+    def fun(item: int) -> int:
+        if item == 1:
+            time.sleep(0.02)
+            raise RuntimeError("Failed for 1.")
+        time.sleep(0.05)
+        return item
+
+    with pytest.raises(RuntimeError):
+        run_in_parallel(fun, range(3), max_parallel=3,
+                        on_result=registered.append)
+    assert sorted(registered) == [0, 2]
+
+
+def test_calls_not_started_are_skipped_on_failure():
+    called = []
+
+    def fun(item: int):
+        called.append(item)
+        if item == 0:
+            raise RuntimeError("Failed for 0.")
+        time.sleep(0.05)
+
+    with pytest.raises(RuntimeError):
+        run_in_parallel(fun, range(10), max_parallel=2)
+    assert len(called) < 10
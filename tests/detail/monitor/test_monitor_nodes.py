@@ -0,0 +1,88 @@
+import time
+from contextlib import contextmanager
+
+import bitmath
+import pytest
+
+from idact.detail.monitor.monitor_nodes import monitor_nodes
+from idact.detail.nodes.nodes_impl import NodesImpl
+from tests.helpers.local_node import get_local_config, get_local_node, \
+    local_ssh_servers
+
+INTERVAL = 0.1
+
+
+@contextmanager
+def local_nodes():
+    """Runs a local SSH server, and yields two nodes allocated on it."""
+    with local_ssh_servers(count=1) as servers:
+        port = servers[0].port
+        config = get_local_config(port=port)
+        yield [get_local_node(config=config, port=port)
+               for _ in range(2)]
+
+
+def wait_for_samples(histories, count: int):
+    end = time.monotonic() + 10
+    while any(len(history) < count for history in histories):
+        assert time.monotonic() < end
+        time.sleep(INTERVAL)
+
+
+def test_monitor_nodes():
+    with local_nodes() as nodes:
+        with NodesImpl(nodes=nodes, allocation=None).monitor(
+                interval=INTERVAL,
+                capacity=3) as monitor:
+            assert monitor.running
+            assert monitor.interval == INTERVAL
+            assert len(monitor) == 2
+            assert monitor[0].node is nodes[0]
+            wait_for_samples(histories=monitor, count=3)
+            time.sleep(2 * INTERVAL)
+
+        assert not monitor.running
+        for history in monitor:
+            assert history.error is None
+            assert len(history) == 3
+            assert len(history.cpu_usage) == 3
+            assert list(history.timestamps) == sorted(history.timestamps)
+            assert history.memory_usage.min() > 0.0
+            assert history.peak_cpu_usage >= history.mean_cpu_usage >= 0.0
+            assert history.peak_memory_usage >= history.mean_memory_usage
+            assert history.mean_memory_usage > bitmath.GiB(0)
+
+        assert monitor.peak_cpu_usage == max(history.peak_cpu_usage
+                                             for history in monitor)
+        assert monitor.peak_memory_usage == max(history.peak_memory_usage
+                                                for history in monitor)
+        assert monitor.mean_memory_usage > bitmath.GiB(0)
+
+        count = len(monitor[0])
+        time.sleep(3 * INTERVAL)
+        assert len(monitor[0]) == count
+
+
+def test_monitor_without_samples():
+    with local_nodes() as nodes:
+        monitor = monitor_nodes(nodes=[], interval=INTERVAL)
+        assert monitor.mean_cpu_usage is None
+        assert monitor.peak_memory_usage is None
+        monitor.stop()
+
+        with pytest.raises(ValueError):
+            monitor_nodes(nodes=nodes, interval=0)
+        with pytest.raises(ValueError):
+            monitor_nodes(nodes=nodes, capacity=0)
+
+
+def test_monitor_failure():
+    with local_nodes() as nodes:
+        nodes[0].config.shell_environment = {'PATH': '/nonexistent'}
+        with monitor_nodes(nodes=nodes[:1], interval=INTERVAL) as monitor:
+            end = time.monotonic() + 10
+            while monitor[0].error is None:
+                assert time.monotonic() < end
+                time.sleep(INTERVAL)
+            assert isinstance(monitor[0].error, RuntimeError)
+            assert monitor[0].mean_cpu_usage is None
@@ -0,0 +1,29 @@
+import numpy
+import pytest
+
+from idact.detail.monitor.resource_ring_buffer import ResourceRingBuffer
+
+
+def test_ring_buffer_keeps_most_recent_samples():
+    buffer = ResourceRingBuffer(capacity=3)
+    assert buffer.to_array().shape == (0, 3)
+
+    buffer.append(timestamp=1.0, cpu_usage=10.0, memory_usage=0.5)
+    buffer.append(timestamp=2.0, cpu_usage=20.0, memory_usage=1.0)
+    assert len(buffer) == 2
+    assert numpy.array_equal(buffer.to_array(), [[1.0, 10.0, 0.5],
+                                                 [2.0, 20.0, 1.0]])
+
+    buffer.append(timestamp=3.0, cpu_usage=30.0, memory_usage=1.5)
+    buffer.append(timestamp=4.0, cpu_usage=40.0, memory_usage=2.0)
+    assert len(buffer) == 3
+    assert numpy.array_equal(buffer.to_array()[:, 0], [2.0, 3.0, 4.0])
+
+    samples = buffer.to_array()
+    samples[0, 0] = 100.0
+    assert buffer.to_array()[0, 0] == 2.0
+
+
+def test_ring_buffer_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        ResourceRingBuffer(capacity=0)
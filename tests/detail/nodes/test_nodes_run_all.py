@@ -0,0 +1,49 @@
+import pytest
+
+from idact.detail.nodes.nodes_impl import NodesImpl
+from tests.helpers.local_node import get_local_config, get_local_node, \
+    local_ssh_servers
+
+NODE_COUNT = 4
+
+
+def get_nodes(servers) -> NodesImpl:
+    config = get_local_config(port=servers[0].port)
+    nodes = [get_local_node(config=config, port=server.port)
+             for server in servers[1:]]
+    return NodesImpl(nodes=nodes, allocation=None)
+
+
+def test_run_all():
+    with local_ssh_servers(count=NODE_COUNT + 1) as servers:
+        nodes = get_nodes(servers)
+        results = nodes.run_all("echo 'Hello'", max_parallel=2)
+        assert results.succeeded
+        assert results.outputs == ['Hello'] * NODE_COUNT
+        assert [result.node for result in results] == list(nodes)
+        results.raise_on_error()
+
+        nodes.run_all("echo 'Hello again'")
+        assert [server.connection_count for server in servers] == [1] * len(
+            servers)
+
+
+def test_run_many_isolates_failures():
+    with local_ssh_servers(count=NODE_COUNT + 1) as servers:
+        nodes = get_nodes(servers)
+        results = nodes.run_many(["echo 0", "exit 1", "echo 2", "exit 3"])
+        assert not results.succeeded
+        assert results.outputs == ['0', None, '2', None]
+        assert [result.node for result in results.failed] == [nodes[1],
+                                                              nodes[3]]
+        assert all(isinstance(result.error, RuntimeError)
+                   for result in results.failed)
+        with pytest.raises(RuntimeError):
+            results.raise_on_error()
+
+
+def test_run_many_requires_command_for_each_node():
+    with local_ssh_servers(count=NODE_COUNT + 1) as servers:
+        nodes = get_nodes(servers)
+        with pytest.raises(ValueError):
+            nodes.run_many(["echo 0"])
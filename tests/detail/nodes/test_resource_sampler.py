@@ -0,0 +1,91 @@
+import os
+import subprocess
+import sys
+import time
+from contextlib import ExitStack, contextmanager
+from unittest.mock import patch
+
+import bitmath
+
+from idact.detail.agent.agent_provider import AgentProvider
+from idact.detail.nodes.resource_sample import ResourceSample, get_cpu_usage
+from idact.detail.nodes.resource_sampler import RESOURCE_SAMPLE_INTERVAL
+from tests.helpers.local_node import CountingNode, local_counting_node
+
+
+@contextmanager
+def local_sampled_node(tmpdir) -> CountingNode:
+    """Runs a local SSH server, and yields a node allocated on it,
+        with the home directory in `tmpdir`.
+
+        :param tmpdir: Temporary directory.
+
+    """
+    with ExitStack() as stack:
+        stack.enter_context(patch.dict(os.environ, {'HOME': str(tmpdir)}))
+        node = stack.enter_context(local_counting_node())
+        stack.callback(AgentProvider().close_all)
+        yield node
+
+
+def get_sample(cpu_ticks: int, processes: dict,
+               boot_time: int = 1) -> ResourceSample:
+    return ResourceSample(boot_time=boot_time,
+                          cpu_ticks=cpu_ticks,
+                          cpu_count=2,
+                          processes=processes,
+                          memory_usage=bitmath.KiB(1))
+
+
+def test_get_cpu_usage():
+    previous = get_sample(cpu_ticks=1000,
+                          processes={'1': (5, 100),
+                                     '2': (6, 100),
+                                     '3': (7, 100)})
+    current = get_sample(cpu_ticks=1200,
+                         processes={'1': (5, 150),
+                                    '2': (8, 20),
+                                    '4': (9, 10)})
+    assert get_cpu_usage(previous=previous, current=current) == 80.0
+
+    assert get_cpu_usage(previous=previous, current=previous) is None
+    rebooted = get_sample(cpu_ticks=1200, processes={}, boot_time=2)
+    assert get_cpu_usage(previous=previous, current=rebooted) is None
+
+
+def test_resources_are_sampled_together(tmpdir):
+    with local_sampled_node(tmpdir) as node:
+        resources = node.resources
+        assert resources.cpu_usage >= 0.0
+        assert resources.memory_usage > bitmath.GiB(0)
+        assert resources.cpu_usage >= 0.0
+        assert len(node.commands) == 1
+        assert node.commands[0].endswith(
+            ' {}'.format(RESOURCE_SAMPLE_INTERVAL))
+
+        time.sleep(RESOURCE_SAMPLE_INTERVAL)
+        assert node.resources.cpu_usage >= 0.0
+        assert len(node.commands) == 2
+        assert node.commands[1].endswith(' 0')
+
+
+def test_cpu_usage_of_busy_process(tmpdir):
+    with local_sampled_node(tmpdir) as node:
+        process = subprocess.Popen([sys.executable, '-c', 'while True: pass'])
+        try:
+            node.resources.cpu_usage  # pylint: disable=pointless-statement
+            time.sleep(0.5)
+            assert node.resources.cpu_usage > 30.0
+        finally:
+            process.kill()
+            process.wait()
+
+
+def test_resources_with_agent(tmpdir):
+    with local_sampled_node(tmpdir) as node:
+        node.config.use_agent = True
+        resources = node.resources
+        assert resources.memory_usage > bitmath.GiB(0)
+        time.sleep(RESOURCE_SAMPLE_INTERVAL)
+        assert node.resources.cpu_usage >= 0.0
+        assert not node.commands
@@ -0,0 +1,22 @@
+from click.testing import CliRunner
+
+from idact.shell_startup import main
+
+
+def test_no_cluster_name():
+    runner = CliRunner()
+    result = runner.invoke(main)
+    assert result.exit_code == 2
+    print(result.output)
+    assert 'Usage: main [OPTIONS] CLUSTER_NAME\n' in result.output
+    assert 'Error: Missing argument' in result.output
+
+
+def test_help():
+    runner = CliRunner()
+    result = runner.invoke(main, ['--help'])
+    assert result.exit_code == 0
+    print(result.output)
+    assert 'A console script that measures the time of running a no-op' \
+           in result.output
+    assert '--repeat' in result.output
@@ -0,0 +1,121 @@
+import time
+
+import pytest
+
+import idact.detail.slurm.run_squeue
+from idact.detail.helper.utc_now import utc_now
+from idact.detail.log.get_logger import get_debug_logger
+from idact.detail.slurm.expand_hostlist import expand_hostlist
+from idact.detail.slurm.run_squeue import extract_squeue_lines
+
+SCONTROL_LATENCY = 0.0005
+BENCHMARK_LINE_COUNTS = [100, 1000, 3000]
+
+
+class FakeNode:
+    """Node that expands hostlists like `scontrol show hostname`,
+        with simulated latency."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.commands = []
+
+    def run(self, command: str) -> str:
+        self.commands.append(command)
+        time.sleep(self.latency)
+        value = command.split(' ')[-1].strip("'")
+        if value == 'weird{1..2}':
+            return 'weird1\nweird2'
+        return '\n'.join(expand_hostlist(value))
+
+
+def test_expand_single_host():
+    assert expand_hostlist('node1') == ['node1']
+    assert expand_hostlist('node-a.cluster') == ['node-a.cluster']
+
+
+def test_expand_ranges():
+    assert expand_hostlist('node[1-3,7,9-10]') == [
+        'node1', 'node2', 'node3', 'node7', 'node9', 'node10']
+
+
+def test_expand_zero_padding():
+    assert expand_hostlist('p[008-011]') == ['p008', 'p009', 'p010', 'p011']
+    assert expand_hostlist('p[07,10]') == ['p07', 'p10']
+
+
+def test_expand_multiple_expressions_and_brackets():
+    assert expand_hostlist('a[1-2]b[01-02],c') == [
+        'a1b01', 'a1b02', 'a2b01', 'a2b02', 'c']
+
+
+def test_expand_returns_copy():
+    hosts = expand_hostlist('node[1-2]')
+    hosts.append('node3')
+    assert expand_hostlist('node[1-2]') == ['node1', 'node2']
+
+
+@pytest.mark.parametrize('value', ['node[1-', 'node]1[', 'node[a-b]',
+                                   'node[3-1]', 'node[[1]]', 'a,,b',
+                                   'weird{1..2}', 'weird{1..2}x[1]y]'])
+def test_expand_unsupported(value: str):
+    with pytest.raises(ValueError):
+        expand_hostlist(value)
+
+
+def test_scontrol_is_only_a_fallback():
+    node = FakeNode()
+    lines = ['1|2|10:00|None|node[1-2]|RUNNING',
+             '2|1|10:00|None|weird{1..2}|RUNNING',
+             '3|1|10:00|Priority|(Priority)|PENDING']
+    results = extract_squeue_lines(now=utc_now(), lines=lines, node=node)
+
+    assert results[1].node_list == ['node1', 'node2']
+    assert results[2].node_list == ['weird1', 'weird2']
+    assert results[3].node_list is None
+    assert node.commands == ["scontrol show hostname 'weird{1..2}'"]
+
+
+def get_synthetic_squeue_lines(count: int):
+    return ['{job_id}|4|1-00:00:00|None|r{rack}n[{low:03}-{high:03},200]'
+            '|RUNNING'.format(job_id=job_id,
+                              rack=job_id % 50,
+                              low=job_id % 100,
+                              high=job_id % 100 + 2)
+            for job_id in range(count)]
+
+
+def measure_extract_time(lines, node) -> float:
+    start = time.perf_counter()
+    extract_squeue_lines(now=utc_now(), lines=lines, node=node)
+    return time.perf_counter() - start
+
+
+def unsupported(value: str):
+    raise ValueError("Simulated unsupported hostlist: {}".format(value))
+
+
+def test_benchmark_local_expansion_against_scontrol(monkeypatch):
+    """Logs the time of expanding squeue output with scontrol calls
+        and locally. Only call counts are asserted, as timings depend
+        on the machine."""
+    log = get_debug_logger(__name__)
+    log.debug("Expanding synthetic squeue output,"
+              " %ss per simulated scontrol call.", SCONTROL_LATENCY)
+    log.debug("%6s %14s %12s", "Lines", "Scontrol [s]", "Local [s]")
+    for count in BENCHMARK_LINE_COUNTS:
+        lines = get_synthetic_squeue_lines(count=count)
+
+        with monkeypatch.context() as context:
+            context.setattr(idact.detail.slurm.run_squeue,
+                            'expand_hostlist',
+                            unsupported)
+            remote_node = FakeNode(latency=SCONTROL_LATENCY)
+            remote = measure_extract_time(lines=lines, node=remote_node)
+            assert len(remote_node.commands) == count
+
+        local_node = FakeNode(latency=SCONTROL_LATENCY)
+        local = measure_extract_time(lines=lines, node=local_node)
+        assert not local_node.commands
+
+        log.debug("%6d %14.3f %12.3f", count, remote, local)
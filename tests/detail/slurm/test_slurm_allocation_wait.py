@@ -0,0 +1,84 @@
+import time
+from typing import List, Optional
+
+import pytest
+
+import idact.detail.slurm.slurm_allocation
+from idact import AuthMethod
+from idact.detail.allocation.allocation_parameters import AllocationParameters
+from idact.detail.config.client.client_cluster_config import ClusterConfigImpl
+from idact.detail.nodes.node_impl import NodeImpl
+from idact.detail.slurm.slurm_allocation import SlurmAllocation, \
+    WAIT_SQUEUE_MAX_INTERVAL
+
+HEADER = 'JOBID|NODES|TIME_LEFT|REASON|NODELIST(REASON)|STATE'
+
+
+class FakeAccessNode(NodeImpl):
+    """Access node that reports job states from a list."""
+
+    def __init__(self, states: List[str]):
+        super().__init__(config=ClusterConfigImpl(host='localhost',
+                                                  port=22,
+                                                  user='user',
+                                                  auth=AuthMethod.ASK,
+                                                  squeue_cache_ttl=0))
+        self.make_allocated(host='localhost',
+                            port=22,
+                            cores=None,
+                            memory=None,
+                            allocated_until=None)
+        self.states = states
+        self.commands = []
+
+    def run(self, command: str, timeout: Optional[int] = None) -> str:
+        self.commands.append(command)
+        if not command.startswith('squeue'):
+            return ''
+        state = self.states.pop(0)
+        return '\n'.join([HEADER,
+                          '1|1|10:00|None|(None)|{}'.format(state)])
+
+
+def test_wait_backs_off_exponentially(monkeypatch):
+    intervals = []
+    monkeypatch.setattr(idact.detail.slurm.slurm_allocation,
+                        'sleep',
+                        intervals.append)
+    node = FakeAccessNode(states=['PENDING'] * 12 + ['FAILED'])
+    allocation = SlurmAllocation(job_id=1,
+                                 access_node=node,
+                                 nodes=[],
+                                 entry_point_script_path='/tmp/entry_point',
+                                 parameters=AllocationParameters())
+
+    with pytest.raises(RuntimeError):
+        allocation.wait(timeout=None)
+
+    assert len(intervals) == 12
+    assert intervals == sorted(intervals)
+    assert intervals[0] < intervals[1]
+    assert intervals[-1] == WAIT_SQUEUE_MAX_INTERVAL
+    squeue_commands = [command for command in node.commands
+                       if command.startswith('squeue')]
+    assert len(squeue_commands) == 13
+    assert node.commands[-1] == 'rm -f /tmp/entry_point'
+
+
+def test_wait_timeout_caps_interval(monkeypatch):
+    intervals = []
+
+    def sleep(interval: float):
+        intervals.append(interval)
+        time.sleep(interval)
+
+    monkeypatch.setattr(idact.detail.slurm.slurm_allocation, 'sleep', sleep)
+    node = FakeAccessNode(states=['PENDING'] * 100)
+    allocation = SlurmAllocation(job_id=1,
+                                 access_node=node,
+                                 nodes=[],
+                                 entry_point_script_path='/tmp/entry_point',
+                                 parameters=AllocationParameters())
+    with pytest.raises(TimeoutError):
+        allocation.wait(timeout=0.1)
+    assert all(interval <= 0.1 for interval in intervals)
@@ -0,0 +1,182 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import pytest
+
+from idact import AuthMethod
+from idact.detail.allocation.allocation_parameters import AllocationParameters
+from idact.detail.config.client.client_cluster_config import ClusterConfigImpl
+from idact.detail.nodes.node_impl import NodeImpl
+from idact.detail.slurm.squeue_cache import SqueueCache
+from idact.detail.slurm.slurm_allocation import SlurmAllocation
+
+HEADER = 'JOBID|NODES|TIME_LEFT|REASON|NODELIST(REASON)|STATE'
+SQUEUE_LATENCY = 0.2
+THREAD_COUNT = 30
+
+
+class FakeAccessNode(NodeImpl):
+    """Access node that counts squeue calls for 30 running jobs."""
+
+    def __init__(self, squeue_cache_ttl: int = 60):
+        super().__init__(config=ClusterConfigImpl(
+            host='localhost',
+            port=22,
+            user='user',
+            auth=AuthMethod.ASK,
+            squeue_cache_ttl=squeue_cache_ttl))
+        self.make_allocated(host='localhost',
+                            port=22,
+                            cores=None,
+                            memory=None,
+                            allocated_until=None)
+        self.squeue_count = 0
+        self.fail = False
+        self.cancelled = set()
+        self.job_queries = []
+        self._lock = threading.Lock()
+
+    def run(self, command: str, timeout: Optional[int] = None) -> str:
+        if command.startswith('scancel'):
+            self.cancelled.add(int(command.split()[1]))
+            return ''
+        assert command.startswith('squeue')
+        with self._lock:
+            self.squeue_count += 1
+        time.sleep(SQUEUE_LATENCY)
+        if self.fail:
+            raise RuntimeError("Simulated failure.")
+        job_ids = range(THREAD_COUNT)
+        if '--jobs' in command:
+            job_ids = [int(job_id) for job_id
+                       in command.split('--jobs ')[1].split()[0].split(',')]
+            self.job_queries.append(job_ids)
+        return '\n'.join([HEADER] + ['{}|1|10:00|None|(None)|RUNNING'.format(i)
+                                     for i in job_ids
+                                     if i not in self.cancelled])
+
+
+def test_concurrent_refreshes_are_deduplicated():
+    node = FakeAccessNode()
+    cache = SqueueCache()
+
+    with ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor:
+        results = list(executor.map(lambda _: cache.get(node=node),
+                                    range(THREAD_COUNT)))
+
+    assert node.squeue_count == 1
+    assert all(result is results[0] for result in results)
+    assert len(results[0]) == THREAD_COUNT
+
+    assert cache.get(node=node) is results[0]
+    assert node.squeue_count == 1
+
+    cache.get(node=node, max_age=0)
+    assert node.squeue_count == 2
+
+
+def test_invalidate_skips_refresh_in_progress():
+    node = FakeAccessNode()
+    cache = SqueueCache()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        in_progress = executor.submit(cache.get, node=node)
+        time.sleep(SQUEUE_LATENCY / 2)
+        cache.invalidate()
+        assert cache.get(node=node) is not in_progress.result()
+    assert node.squeue_count == 2
+
+    cache.get(node=node)
+    assert node.squeue_count == 2
+
+
+def test_zero_ttl_always_refreshes():
+    node = FakeAccessNode(squeue_cache_ttl=0)
+    cache = SqueueCache()
+    cache.get(node=node)
+    cache.get(node=node)
+    assert node.squeue_count == 2
+
+
+def test_failed_refresh_is_shared_and_retried():
+    node = FakeAccessNode()
+    node.fail = True
+    cache = SqueueCache()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(cache.get, node=node) for _ in range(4)]
+        for future in futures:
+            with pytest.raises(RuntimeError):
+                future.result()
+    assert node.squeue_count == 1
+
+    node.fail = False
+    assert len(cache.get(node=node)) == THREAD_COUNT
+    assert node.squeue_count == 2
+
+
+def test_allocations_share_squeue_calls():
+    node = FakeAccessNode()
+    node.config.port = 2222  # Separate from caches in other tests.
+    node.make_allocated(host='localhost',
+                        port=2222,
+                        cores=None,
+                        memory=None,
+                        allocated_until=None)
+    allocations = [SlurmAllocation(job_id=i,
+                                   access_node=node,
+                                   nodes=[],
+                                   entry_point_script_path='/tmp/entry_point',
+                                   parameters=AllocationParameters())
+                   for i in range(THREAD_COUNT)]
+
+    with ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor:
+        running = list(executor.map(lambda allocation: allocation.running(),
+                                    allocations))
+
+    assert all(running)
+    assert node.squeue_count == 1
+
+
+def test_cancelled_allocation_is_not_running():
+    node = FakeAccessNode()
+    node.config.port = 2226  # Separate from caches in other tests.
+    node.make_allocated(host='localhost',
+                        port=2226,
+                        cores=None,
+                        memory=None,
+                        allocated_until=None)
+    allocation = SlurmAllocation(job_id=1,
+                                 access_node=node,
+                                 nodes=[],
+                                 entry_point_script_path='/tmp/entry_point',
+                                 parameters=AllocationParameters())
+
+    assert allocation.running()
+    allocation.cancel()
+    assert not allocation.running()
+    assert node.squeue_count == 2
+
+
+def test_job_missing_from_cache_is_queried_directly():
+    node = FakeAccessNode()
+    node.config.port = 2228  # Separate from caches in other tests.
+    node.make_allocated(host='localhost',
+                        port=2228,
+                        cores=None,
+                        memory=None,
+                        allocated_until=None)
+    submitted_later = THREAD_COUNT
+    allocation = SlurmAllocation(job_id=submitted_later,
+                                 access_node=node,
+                                 nodes=[],
+                                 entry_point_script_path='/tmp/entry_point',
+                                 parameters=AllocationParameters())
+
+    job = allocation._wait_with_squeue_polling(end=None)  # noqa, pylint: disable=protected-access
+    assert job.job_id == submitted_later
+    assert job.state == 'RUNNING'
+    assert node.job_queries == [[submitted_later]]
+    assert node.squeue_count == 2
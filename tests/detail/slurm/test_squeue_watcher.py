@@ -0,0 +1,71 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import pytest
+
+from idact.detail.nodes.get_access_node import get_access_node
+from idact.detail.slurm.squeue_watcher import SqueueWatcher
+from tests.helpers.local_node import get_local_config, local_ssh_servers
+
+HEADER = 'JOBID|NODES|TIME_LEFT|REASON|NODELIST(REASON)|STATE'
+PENDING_STATES = ['PENDING', 'CONFIGURING']
+
+
+def get_stream_command(job_1_states, tail="sleep 2") -> str:
+    """Returns a command that prints a fake `squeue --iterate` snapshot
+        for each state of job 1. Job 2 stays pending."""
+    return ("for state in {states}; do"
+            " date;"
+            " echo '{header}';"
+            " echo \"1|1|10:00|None|(None)|$state\";"
+            " echo '2|1|10:00|Priority|(Priority)|PENDING';"
+            " sleep 0.1;"
+            " done; {tail}").format(states=' '.join(job_1_states),
+                                    header=HEADER,
+                                    tail=tail)
+
+
+@contextmanager
+def local_access_node():
+    """Runs a local SSH server, and yields it with an access node
+        connected to it."""
+    with local_ssh_servers(count=1) as servers:
+        server = servers[0]
+        config = get_local_config(port=server.port)
+        yield server, get_access_node(config=config)
+
+
+def test_waiters_share_one_stream():
+    with local_access_node() as (server, node):
+        watcher = SqueueWatcher(node=node,
+                                command=get_stream_command(
+                                    ['PENDING', 'PENDING',
+                                     'RUNNING', 'RUNNING']))
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            running = executor.submit(watcher.wait,
+                                      job_id=1,
+                                      states=PENDING_STATES,
+                                      timeout=5)
+            pending = executor.submit(watcher.wait,
+                                      job_id=2,
+                                      states=PENDING_STATES,
+                                      timeout=1)
+            job = running.result()
+            assert job.job_id == 1
+            assert job.state == 'RUNNING'
+            with pytest.raises(TimeoutError):
+                pending.result()
+
+        missing = watcher.wait(job_id=3, states=PENDING_STATES, timeout=5)
+        assert missing is None
+        assert server.connection_count == 1
+
+
+def test_stream_end_is_an_error():
+    with local_access_node() as (_, node):
+        watcher = SqueueWatcher(node=node,
+                                command=get_stream_command(['PENDING'],
+                                                           tail="exit 0"))
+        with pytest.raises(RuntimeError):
+            watcher.wait(job_id=1, states=PENDING_STATES, timeout=5)
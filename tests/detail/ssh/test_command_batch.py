@@ -0,0 +1,139 @@
+import os
+
+import pytest
+
+from idact.detail.dask.create_scratch_dir import SCRATCH_SUBDIR, \
+    create_scratch_subdir
+from idact.detail.deployment.deploy_generic import deploy_generic
+from idact.detail.entry_point.upload_entry_point import upload_entry_point
+from idact.detail.helper.get_free_remote_port import get_free_remote_ports
+from idact.detail.ssh.command_batch import CommandBatch, \
+    format_batch_script, parse_batch_output
+from tests.helpers.local_node import local_counting_node
+
+
+def test_parse_batch_output():
+    output = ("a\nb\n"
+              "MARK 0 0\n"
+              "\n"
+              "MARK 1 3\n"
+              "no newline\n"
+              "MARK 2 0")
+    assert parse_batch_output(output=output,
+                              marker='MARK',
+                              count=4) == [(0, 'a\nb'),
+                                           (3, ''),
+                                           (0, 'no newline'),
+                                           None]
+
+
+def test_format_batch_script_stops_on_failure():
+    script = format_batch_script(commands=['true', 'false'],
+                                 marker='MARK',
+                                 stop_on_failure=True)
+    assert script.count('exit 0') == 2
+    script = format_batch_script(commands=['true', 'false'],
+                                 marker='MARK',
+                                 stop_on_failure=False)
+    assert 'exit 0' not in script
+
+
+def test_batch_demultiplexes_outputs():
+    with local_counting_node() as node:
+        batch = CommandBatch()
+        first = batch.add("echo 'First'; echo 'Second' >&2")
+        second = batch.add("printf 'No newline'")
+        third = batch.add("cd /; pwd")
+        fourth = batch.add("pwd")
+        batch.run(node=node)
+
+        assert first.output == 'First\nSecond'
+        assert second.output == 'No newline'
+        assert third.output == '/'
+        assert fourth.output != '/'
+        assert [batched.exit_status for batched in batch.commands] == [0] * 4
+        assert len(node.commands) == 1
+
+
+def test_batch_stops_on_failure():
+    with local_counting_node() as node:
+        batch = CommandBatch()
+        first = batch.add("echo 'First'")
+        second = batch.add("echo 'Failing'; exit 3")
+        third = batch.add("echo 'Third'")
+        with pytest.raises(RuntimeError):
+            batch.run(node=node)
+
+        assert first.output == 'First'
+        assert second.exit_status == 3
+        assert not second.succeeded
+        with pytest.raises(RuntimeError):
+            second.output  # pylint: disable=pointless-statement
+        assert third.exit_status is None
+        with pytest.raises(RuntimeError):
+            third.output  # pylint: disable=pointless-statement
+
+
+def test_batch_without_check_continues():
+    with local_counting_node() as node:
+        batch = CommandBatch()
+        batch.add("exit 1")
+        batch.add("cat")  # Reads from /dev/null, does not block.
+        last = batch.add("echo 'Last'")
+        results = batch.run(node=node, stop_on_failure=False, check=False)
+
+        assert [result.exit_status for result in results] == [1, 0, 0]
+        assert last.output == 'Last'
+
+
+def test_empty_batch():
+    with local_counting_node() as node:
+        assert CommandBatch().run(node=node) == []
+        assert not node.commands
+
+
+def test_get_free_remote_ports_in_one_batch():
+    with local_counting_node() as node:
+        ports = get_free_remote_ports(count=3, node=node)
+        assert len(set(ports)) == 3
+        assert len(node.commands) == 1
+
+
+def test_upload_entry_point_in_one_batch(tmpdir):
+    with local_counting_node() as node:
+        contents = "#!/bin/bash\necho '$HOME \"quoted\"'\n"
+        path = upload_entry_point(contents=contents,
+                                  node=node,
+                                  runtime_dir=str(tmpdir))
+        assert len(node.commands) == 1
+        assert os.path.dirname(path) == str(tmpdir)
+        with open(path) as file:
+            assert file.read() == contents
+        assert os.stat(path).st_mode & 0o777 == 0o700
+
+
+def test_deploy_generic_in_one_batch(tmpdir):
+    with local_counting_node() as node:
+        output_path = os.path.join(str(tmpdir), 'output')
+        contents = "echo 'Deployed' > {}\n".format(output_path)
+        deployment = deploy_generic(node=node,
+                                    script_contents=contents,
+                                    runtime_dir=str(tmpdir))
+        assert len(node.commands) == 1
+        assert deployment.pid > 0
+        node.run("while [ ! -s {path} ]; do sleep 0.1; done".format(
+            path=output_path), timeout=10)
+        with open(output_path) as file:
+            assert file.read() == 'Deployed\n'
+
+
+def test_create_scratch_subdir_from_variable(tmpdir, monkeypatch):
+    with local_counting_node() as node:
+        monkeypatch.setenv('IDACTSCRATCH', str(tmpdir))
+        node.config.scratch = '$IDACTSCRATCH'
+        assert create_scratch_subdir(node=node) == os.path.join(str(tmpdir),
+                                                                SCRATCH_SUBDIR)
+
+        node.config.scratch = '$IDACTMISSINGSCRATCH'
+        with pytest.raises(RuntimeError):
+            create_scratch_subdir(node=node)
@@ -0,0 +1,72 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from idact.detail.helper.get_remote_file import get_file_from_node
+from idact.detail.nodes.get_access_node import get_access_node
+from idact.detail.ssh.get_connection_pool import get_connection_pool
+from tests.helpers.local_node import get_local_config, get_local_node, \
+    local_ssh_servers
+
+COMMAND_COUNT = 300
+THREAD_COUNT = 32
+
+
+def get_nodes(access_port: int, compute_port: int):
+    config = get_local_config(port=access_port)
+    return (get_access_node(config=config),
+            get_local_node(config=config, port=compute_port))
+
+
+def test_concurrent_commands_reuse_connections():
+    with local_ssh_servers(count=2) as (access_server, compute_server):
+        nodes = get_nodes(access_port=access_server.port,
+                          compute_port=compute_server.port)
+
+        def run(i: int) -> str:
+            return nodes[i % 2].run("echo $((1 + {i}))".format(i=i))
+
+        with ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor:
+            results = list(executor.map(run, range(COMMAND_COUNT)))
+
+        assert results == [str(1 + i) for i in range(COMMAND_COUNT)]
+        assert access_server.connection_count == 1
+        assert compute_server.connection_count == 1
+
+
+def test_command_failure_and_timeout():
+    with local_ssh_servers(count=1) as (access_server,):
+        node, _ = get_nodes(access_port=access_server.port,
+                            compute_port=0)
+
+        assert node.run("echo out; echo err 1>&2") == "out\nerr"
+        with pytest.raises(RuntimeError):
+            node.run("exit 3")
+        with pytest.raises(TimeoutError):
+            node.run("sleep 5", timeout=0.5)
+        assert node.run("echo 'still connected'") == "still connected"
+        assert access_server.connection_count == 1
+
+
+def test_dead_connection_is_reopened():
+    with local_ssh_servers(count=1) as (access_server,):
+        node, _ = get_nodes(access_port=access_server.port,
+                            compute_port=0)
+
+        assert node.run("echo 1") == "1"
+        get_connection_pool().close_all()
+        assert node.run("echo 2") == "2"
+        assert access_server.connection_count == 2
+
+
+def test_get_file_over_sftp(tmpdir):
+    with local_ssh_servers(count=1) as (access_server,):
+        node, _ = get_nodes(access_port=access_server.port,
+                            compute_port=0)
+        path = tmpdir.join('file')
+        path.write('contents')
+        assert get_file_from_node(node=node,
+                                  remote_path=str(path)) == 'contents'
+        with pytest.raises(RuntimeError):
+            get_file_from_node(node=node,
+                               remote_path=str(tmpdir.join('missing')))
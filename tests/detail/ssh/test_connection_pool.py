@@ -0,0 +1,161 @@
+import time
+
+import pytest
+
+from idact.detail.ssh.connection_key import ConnectionKey
+from idact.detail.ssh.connection_pool import ConnectionPool
+
+ACCESS_NODE = ConnectionKey(host='host', port=22, user='user')
+NODE_1 = ConnectionKey(host='node1', port=2222, user='user',
+                       gateway=ACCESS_NODE)
+NODE_2 = ConnectionKey(host='node2', port=2222, user='user',
+                       gateway=ACCESS_NODE)
+
+
+class FakeTransport:
+    def __init__(self):
+        self.active = True
+
+    def is_active(self):
+        return self.active
+
+
+class FakeClient:
+    def __init__(self):
+        self.transport = FakeTransport()
+        self.closed = False
+
+    def get_transport(self):
+        return self.transport
+
+    def close(self):
+        self.closed = True
+        self.transport.active = False
+
+
+class FakeConnector:
+    def __init__(self):
+        self.clients = []
+
+    def __call__(self):
+        client = FakeClient()
+        self.clients.append(client)
+        return client
+
+
+def test_connection_is_reused():
+    pool = ConnectionPool()
+    connect = FakeConnector()
+    with pool.connection(key=ACCESS_NODE, connect=connect) as first:
+        pass
+    with pool.connection(key=ACCESS_NODE, connect=connect) as second:
+        pass
+    assert first is second
+    assert len(connect.clients) == 1
+    assert len(pool) == 1
+
+
+def test_different_keys_are_separate_connections():
+    pool = ConnectionPool()
+    connect = FakeConnector()
+    with pool.connection(key=NODE_1, connect=connect) as first:
+        with pool.connection(key=NODE_2, connect=connect) as second:
+            assert first is not second
+    assert len(pool) == 2
+
+
+def test_dead_connection_is_replaced():
+    pool = ConnectionPool()
+    connect = FakeConnector()
+    with pool.connection(key=ACCESS_NODE, connect=connect) as first:
+        pass
+    first.transport.active = False
+    with pool.connection(key=ACCESS_NODE, connect=connect) as second:
+        pass
+    assert first is not second
+    assert first.closed
+    assert len(pool) == 1
+
+
+def test_failed_connect_is_not_pooled():
+    pool = ConnectionPool()
+
+    def connect():
+        raise RuntimeError("Unable to connect.")
+
+    with pytest.raises(RuntimeError):
+        with pool.connection(key=ACCESS_NODE, connect=connect):
+            pass
+    assert len(pool) == 0
+
+
+def test_idle_connection_is_closed():
+    pool = ConnectionPool(idle_timeout=0.1)
+    connect = FakeConnector()
+    with pool.connection(key=NODE_1, connect=connect) as first:
+        pass
+    time.sleep(0.2)
+    with pool.connection(key=NODE_2, connect=connect):
+        pass
+    assert first.closed
+    assert len(pool) == 1
+
+
+def test_connection_in_use_is_not_closed_when_idle():
+    pool = ConnectionPool(idle_timeout=0.1)
+    connect = FakeConnector()
+    with pool.connection(key=NODE_1, connect=connect) as first:
+        time.sleep(0.2)
+        with pool.connection(key=NODE_2, connect=connect):
+            pass
+        assert not first.closed
+
+
+def test_least_recently_used_connection_is_closed_on_max_size():
+    pool = ConnectionPool(max_size=2)
+    connect = FakeConnector()
+    keys = [ConnectionKey(host='node{}'.format(i), port=22, user='user')
+            for i in range(3)]
+    clients = []
+    for key in keys:
+        with pool.connection(key=key, connect=connect) as client:
+            clients.append(client)
+    assert [client.closed for client in clients] == [True, False, False]
+    assert len(pool) == 2
+
+
+def test_gateway_is_not_closed_while_tunneled_through():
+    pool = ConnectionPool(max_size=1)
+    connect = FakeConnector()
+    with pool.connection(key=ACCESS_NODE, connect=connect) as gateway:
+        pass
+    with pool.connection(key=NODE_1, connect=connect) as node:
+        pass
+    assert not gateway.closed
+    assert not node.closed
+    assert len(pool) == 2
+
+
+def test_close_all():
+    pool = ConnectionPool()
+    connect = FakeConnector()
+    for key in [ACCESS_NODE, NODE_1, NODE_2]:
+        with pool.connection(key=key, connect=connect):
+            pass
+    pool.close_all()
+    assert all(client.closed for client in connect.clients)
+    assert len(pool) == 0
+
+
+def test_close_all_for_gateway():
+    pool = ConnectionPool()
+    connect = FakeConnector()
+    other = ConnectionKey(host='other', port=22, user='user')
+    for key in [ACCESS_NODE, NODE_1, other]:
+        with pool.connection(key=key, connect=connect):
+            pass
+    pool.close_all(gateway=ACCESS_NODE)
+    assert [client.closed for client in connect.clients] == [True,
+                                                             True,
+                                                             False]
+    assert len(pool) == 1
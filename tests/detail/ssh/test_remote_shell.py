@@ -0,0 +1,64 @@
+import pytest
+
+from idact import AuthMethod
+from idact.detail.config.client.client_cluster_config import ClusterConfigImpl
+from idact.detail.ssh.get_remote_command import DEFAULT_REMOTE_SHELL, \
+    format_remote_command, get_remote_command
+from idact.detail.ssh.measure_shell_startup import BASELINE_SHELL_NAME, \
+    format_shell_startup_times, measure_shell_startup
+from tests.helpers.local_node import USER, local_node
+
+
+def test_format_remote_command():
+    assert format_remote_command(command="echo 'a'",
+                                 shell='/bin/sh -c') == (
+        "/bin/sh -c 'echo '\"'\"'a'\"'\"''")
+    assert format_remote_command(command='echo a', shell='') == 'echo a'
+    assert format_remote_command(command='echo a',
+                                 shell='',
+                                 environment={'B': 'b c',
+                                              'A': 'a'}) == (
+        "export A=a B='b c'; echo a")
+
+
+def test_get_remote_command_default():
+    assert get_remote_command(command='true') == (
+        "{} true".format(DEFAULT_REMOTE_SHELL))
+    config = ClusterConfigImpl(host='localhost',
+                               port=22,
+                               user=USER,
+                               auth=AuthMethod.ASK)
+    assert get_remote_command(command='true', config=config) == (
+        "{} true".format(DEFAULT_REMOTE_SHELL))
+
+
+def test_configured_remote_shell():
+    with local_node() as node:
+        node.config.remote_shell = '/bin/sh -c'
+        node.config.shell_environment = {'IDACT_TEST': 'a b'}
+        assert node.run('echo "$IDACT_TEST"') == 'a b'
+
+        node.config.remote_shell = ''
+        assert node.run('echo "$IDACT_TEST"') == 'a b'
+
+        node.config.shell_environment = {}
+        assert node.run('echo "$IDACT_TEST"') == ''
+
+
+def test_measure_shell_startup():
+    with local_node() as node:
+        times = measure_shell_startup(node=node, repeat=2)
+        names = [startup_time.name for startup_time in times]
+        assert names[0] == BASELINE_SHELL_NAME
+        assert names[-1] == 'configured'
+        assert times[0].overhead == 0.0
+        assert times[-1].shell == DEFAULT_REMOTE_SHELL
+        assert all(startup_time.seconds > 0 for startup_time in times)
+
+        formatted = format_shell_startup_times(times=times).splitlines()
+        assert len(formatted) == len(times) + 1
+        assert formatted[0].startswith('Shell')
+        assert '(none)' in formatted[1]
+
+        with pytest.raises(ValueError):
+            measure_shell_startup(node=node, repeat=0)
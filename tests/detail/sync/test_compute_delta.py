@@ -0,0 +1,95 @@
+import hashlib
+import os
+import random
+import zlib
+
+from idact.detail.sync.block_signatures import ContentsHasher, \
+    get_strong_checksum, get_weak_checksum
+from idact.detail.sync.compute_delta import compute_delta, \
+    roll_weak_checksum
+
+
+def get_signatures(contents: bytes, block_size: int):
+    return [(get_weak_checksum(contents[i:i + block_size]),
+             get_strong_checksum(contents[i:i + block_size]))
+            for i in range(0, len(contents), block_size)]
+
+
+def apply_delta(remote: bytes, operations, block_size: int) -> bytes:
+    result = b''
+    for operation in operations:
+        if isinstance(operation, tuple):
+            first, count = operation
+            result += remote[first * block_size:
+                             (first + count) * block_size]
+        else:
+            result += operation
+    return result
+
+
+def test_roll_weak_checksum():
+    contents = os.urandom(100)
+    checksum = get_weak_checksum(contents[0:16])
+    for i in range(1, 100 - 16):
+        checksum = roll_weak_checksum(checksum=checksum,
+                                      removed=contents[i - 1],
+                                      added=contents[i + 15],
+                                      block_size=16)
+        assert checksum == zlib.adler32(contents[i:i + 16])
+
+
+def test_unchanged_file_is_a_single_copy():
+    contents = os.urandom(10000)
+    operations = list(compute_delta(contents=contents,
+                                    signatures=get_signatures(contents, 64),
+                                    block_size=64))
+    assert operations == [(0, 157)]
+
+
+def test_insertion_sends_only_surrounding_block():
+    remote = os.urandom(10000)
+    local = remote[:5000] + b'inserted' + remote[5000:]
+    operations = list(compute_delta(contents=local,
+                                    signatures=get_signatures(remote, 64),
+                                    block_size=64))
+    assert apply_delta(remote, operations, 64) == local
+    literal = sum(len(operation) for operation in operations
+                  if isinstance(operation, bytes))
+    assert literal == 64 + len(b'inserted')
+
+
+def test_random_edits():
+    generator = random.Random(1)
+    for _ in range(200):
+        block_size = generator.choice([1, 3, 16, 64])
+        remote = os.urandom(generator.randint(0, 500))
+        local = bytearray(remote)
+        for _ in range(generator.randint(0, 4)):
+            position = generator.randint(0, len(local))
+            edit = generator.choice(['insert', 'delete', 'modify'])
+            if edit == 'insert':
+                local[position:position] = os.urandom(
+                    generator.randint(1, 20))
+            elif edit == 'delete':
+                del local[position:position + generator.randint(1, 20)]
+            elif position < len(local):
+                local[position] ^= 0xff
+        local = bytes(local)
+        operations = compute_delta(
+            contents=local,
+            signatures=get_signatures(remote, block_size),
+            block_size=block_size)
+        assert apply_delta(remote, operations, block_size) == local
+
+
+def test_contents_hasher_accepts_parts_of_any_size():
+    contents = os.urandom(1000)
+    generator = random.Random(1)
+    hasher = ContentsHasher(block_size=64)
+    position = 0
+    while position < len(contents):
+        end = position + generator.randint(1, 150)
+        hasher.update(contents[position:end])
+        position = end
+    assert hasher.signatures == get_signatures(contents, 64)
+    assert hasher.digest == hashlib.md5(contents).hexdigest()
@@ -0,0 +1,205 @@
+import os
+from contextlib import ExitStack, contextmanager
+from typing import List
+from unittest.mock import patch
+
+import idact.detail.sync.sync_directory
+import idact.detail.sync.sync_manifest
+from idact.detail.cluster_impl import ClusterImpl
+from tests.helpers.local_node import get_local_config, local_ssh_servers
+
+LARGE_FILE_SIZE = 1024 * 1024
+
+
+@contextmanager
+def local_cluster(tmpdir) -> ClusterImpl:
+    """Runs a local SSH server, and yields a cluster with it as the access
+        node. Sync manifests are stored in `tmpdir`."""
+    with ExitStack() as stack:
+        stack.enter_context(
+            patch.object(idact.detail.sync.sync_manifest,
+                         'SYNC_MANIFEST_DIR',
+                         str(tmpdir.join('manifests'))))
+        servers = stack.enter_context(local_ssh_servers(count=1))
+        config = get_local_config(port=servers[0].port)
+        yield ClusterImpl(name='cluster', config=config)
+
+
+@contextmanager
+def recording_scans() -> List[List[str]]:
+    """Records files hashed by the remote scan script."""
+    hashed = []
+    run_remote_script = idact.detail.sync.sync_directory.run_remote_script
+
+    def run_and_record(**kwargs):
+        result = run_remote_script(**kwargs)
+        if kwargs['script'] is idact.detail.sync.sync_directory.SCAN_SCRIPT:
+            hashed.append(sorted(path for path, entry in result.items()
+                                 if 'blocks' in entry))
+        return result
+
+    with patch.object(idact.detail.sync.sync_directory,
+                      'run_remote_script',
+                      run_and_record):
+        yield hashed
+
+
+def write_file(path: str, contents: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as file:
+        file.write(contents)
+
+
+def read_tree(root: str) -> dict:
+    tree = {}
+    for directory, _, names in os.walk(root):
+        for name in names:
+            path = os.path.join(directory, name)
+            with open(path, 'rb') as file:
+                tree[os.path.relpath(path, root)] = file.read()
+    return tree
+
+
+def test_sync_transfers_only_changes(tmpdir):
+    with local_cluster(tmpdir) as cluster, \
+            recording_scans() as scanned:
+        local = str(tmpdir.join('local'))
+        remote = str(tmpdir.join('remote'))
+        large = os.urandom(LARGE_FILE_SIZE)
+        write_file(os.path.join(local, 'large'), large)
+        write_file(os.path.join(local, 'src', 'main.py'), b'print(1)\n')
+        write_file(os.path.join(local, 'src', 'empty'), b'')
+
+        stats = cluster.sync_directory(local_path=local, remote_path=remote)
+        assert read_tree(remote) == read_tree(local)
+        assert stats.files == 3
+        assert stats.transferred_bytes == LARGE_FILE_SIZE + 9
+
+        stats = cluster.sync_directory(local_path=local, remote_path=remote)
+        assert stats.files == 0
+        assert stats.transferred_bytes == 0
+        assert stats.skipped_bytes == LARGE_FILE_SIZE + 9
+
+        write_file(os.path.join(local, 'large'),
+                   large[:1000] + b'inserted' + large[1000:])
+        stats = cluster.sync_directory(local_path=local, remote_path=remote)
+        assert read_tree(remote) == read_tree(local)
+        assert stats.files == 1
+        assert stats.transferred_bytes < 5000
+        assert stats.wire_bytes < 10000
+
+        assert scanned == [[], [], []]
+
+
+def test_sync_detects_remote_changes(tmpdir):
+    with local_cluster(tmpdir) as cluster, \
+            recording_scans() as scanned:
+        local = str(tmpdir.join('local'))
+        remote = str(tmpdir.join('remote'))
+        write_file(os.path.join(local, 'file'), os.urandom(LARGE_FILE_SIZE))
+        cluster.sync_directory(local_path=local, remote_path=remote)
+
+        write_file(os.path.join(remote, 'file'), b'changed remotely')
+        stats = cluster.sync_directory(local_path=local, remote_path=remote)
+        assert read_tree(remote) == read_tree(local)
+        assert stats.files == 1
+        assert scanned == [[], ['file']]
+
+
+def test_sync_without_manifest_hashes_remote(tmpdir):
+    with local_cluster(tmpdir) as cluster, \
+            recording_scans() as scanned:
+        local = str(tmpdir.join('local'))
+        remote = str(tmpdir.join('remote'))
+        contents = os.urandom(LARGE_FILE_SIZE)
+        write_file(os.path.join(local, 'file'), contents + b'appended')
+        write_file(os.path.join(remote, 'file'), contents)
+
+        stats = cluster.sync_directory(local_path=local, remote_path=remote)
+        assert read_tree(remote) == read_tree(local)
+        assert stats.transferred_bytes == len(b'appended')
+        assert stats.skipped_bytes == LARGE_FILE_SIZE
+        assert scanned == [['file']]
+
+
+def test_sync_deletes_only_when_requested(tmpdir):
+    with local_cluster(tmpdir) as cluster:
+        local = str(tmpdir.join('local'))
+        remote = str(tmpdir.join('remote'))
+        write_file(os.path.join(local, 'kept'), b'kept')
+        write_file(os.path.join(remote, 'extra'), b'extra')
+
+        cluster.sync_directory(local_path=local, remote_path=remote)
+        assert sorted(read_tree(remote)) == ['extra', 'kept']
+
+        cluster.sync_directory(local_path=local,
+                               remote_path=remote,
+                               delete=True)
+        assert sorted(read_tree(remote)) == ['kept']
+
+
+def test_sync_updates_mode(tmpdir):
+    with local_cluster(tmpdir) as cluster:
+        local = str(tmpdir.join('local'))
+        remote = str(tmpdir.join('remote'))
+        path = os.path.join(local, 'script.sh')
+        write_file(path, b'#!/bin/bash\n')
+        os.chmod(path, 0o600)
+        cluster.sync_directory(local_path=local, remote_path=remote)
+
+        os.chmod(path, 0o700)
+        cluster.sync_directory(local_path=local, remote_path=remote)
+        mode = os.stat(os.path.join(remote, 'script.sh')).st_mode
+        assert mode & 0o777 == 0o700
+
+
+def test_sync_after_local_change_during_transfer(tmpdir):
+    with local_cluster(tmpdir) as cluster:
+        local = str(tmpdir.join('local'))
+        remote = str(tmpdir.join('remote'))
+        path = os.path.join(local, 'file')
+        write_file(path, b'A' * 8192)
+        transfer_changes = idact.detail.sync.sync_directory.transfer_changes
+
+        def transfer_and_change(**kwargs):
+            result = transfer_changes(**kwargs)
+            write_file(path, b'B' * 8192)
+            file_stat = os.stat(path)
+            os.utime(path, ns=(file_stat.st_atime_ns,
+                               file_stat.st_mtime_ns + 10 ** 9))
+            return result
+
+        with patch.object(idact.detail.sync.sync_directory,
+                          'transfer_changes',
+                          transfer_and_change):
+            cluster.sync_directory(local_path=local, remote_path=remote)
+        assert read_tree(remote) == {'file': b'A' * 8192}
+
+        stats = cluster.sync_directory(local_path=local, remote_path=remote)
+        assert read_tree(remote) == read_tree(local)
+        assert stats.transferred_bytes == 8192
+
+
+def test_sync_resends_file_after_unnoticed_remote_change(tmpdir):
+    with local_cluster(tmpdir) as cluster, \
+            recording_scans() as scanned:
+        local = str(tmpdir.join('local'))
+        remote = str(tmpdir.join('remote'))
+        contents = os.urandom(LARGE_FILE_SIZE)
+        write_file(os.path.join(local, 'file'), contents)
+        cluster.sync_directory(local_path=local, remote_path=remote)
+
+        remote_file = os.path.join(remote, 'file')
+        remote_stat = os.stat(remote_file)
+        write_file(remote_file, os.urandom(LARGE_FILE_SIZE))
+        os.utime(remote_file, ns=(remote_stat.st_atime_ns,
+                                  remote_stat.st_mtime_ns))
+
+        write_file(os.path.join(local, 'file'), contents + b'appended')
+        stats = cluster.sync_directory(local_path=local, remote_path=remote)
+        assert scanned == [[], []]
+        assert read_tree(remote) == read_tree(local)
+        assert stats.files == 1
+        assert stats.transferred_bytes == LARGE_FILE_SIZE + len(b'appended')
+        assert not [name for name in os.listdir(remote)
+                    if name != 'file']
@@ -0,0 +1,157 @@
+import os
+import stat
+from contextlib import contextmanager
+
+import pytest
+
+from idact.detail.nodes.node_impl import NodeImpl
+from tests.helpers.local_node import get_local_config, get_local_node, \
+    local_ssh_servers
+
+FILE_SIZE = 3 * 1024 * 1024 + 123
+
+
+@contextmanager
+def local_compute_node() -> NodeImpl:
+    """Runs local SSH servers for an access node and a compute node,
+        and yields the compute node."""
+    with local_ssh_servers(count=2) as (access_server, node_server):
+        config = get_local_config(port=access_server.port)
+        yield get_local_node(config=config, port=node_server.port)
+
+
+def write_file(path: str, contents: bytes, mode: int = 0o640):
+    with open(path, 'wb') as file:
+        file.write(contents)
+    os.chmod(path, mode)
+
+
+def read_file(path: str) -> bytes:
+    with open(path, 'rb') as file:
+        return file.read()
+
+
+def test_upload_and_download_file(tmpdir):
+    with local_compute_node() as node:
+        contents = os.urandom(FILE_SIZE)
+        local = str(tmpdir.join('local'))
+        remote = str(tmpdir.join('remote'))
+        downloaded = str(tmpdir.join('downloaded'))
+        write_file(local, contents)
+
+        progress = []
+        stats = node.upload(local_path=local,
+                            remote_path=remote,
+                            on_progress=lambda *args: progress.append(args))
+        assert read_file(remote) == contents
+        assert stat.S_IMODE(os.stat(remote).st_mode) == 0o640
+        assert stats.files == 1
+        assert stats.transferred_bytes == FILE_SIZE
+        assert stats.wire_bytes == FILE_SIZE
+        assert stats.skipped_bytes == 0
+        assert stats.throughput > 0
+        assert progress[-1] == (remote, FILE_SIZE, FILE_SIZE)
+        assert len(progress) > 1
+
+        stats = node.download(remote_path=remote, local_path=downloaded)
+        assert read_file(downloaded) == contents
+        assert stats.transferred_bytes == FILE_SIZE
+
+
+@pytest.mark.parametrize('remote_shell', ['/bin/bash -c', '/bin/sh -c', ''])
+def test_compressed_transfer(tmpdir, remote_shell: str):
+    with local_compute_node() as node:
+        node.config.remote_shell = remote_shell
+        contents = b'compressible line\n' * 200000
+        local = str(tmpdir.join('local'))
+        remote = str(tmpdir.join('remote'))
+        downloaded = str(tmpdir.join('downloaded'))
+        write_file(local, contents)
+
+        stats = node.upload(local_path=local,
+                            remote_path=remote,
+                            compress=True)
+        assert read_file(remote) == contents
+        assert stats.transferred_bytes == len(contents)
+        assert stats.wire_bytes < len(contents) / 10
+
+        stats = node.download(remote_path=remote,
+                              local_path=downloaded,
+                              compress=True)
+        assert read_file(downloaded) == contents
+        assert stats.wire_bytes < len(contents) / 10
+
+
+def test_compressed_download_of_missing_file_fails(tmpdir):
+    with local_compute_node() as node:
+        with pytest.raises(RuntimeError):
+            node.download(remote_path=str(tmpdir.join('missing')),
+                          local_path=str(tmpdir.join('downloaded')),
+                          compress=True)
+
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_resume(tmpdir, compress: bool):
+    with local_compute_node() as node:
+        contents = os.urandom(FILE_SIZE)
+        local = str(tmpdir.join('local'))
+        remote = str(tmpdir.join('remote'))
+        downloaded = str(tmpdir.join('downloaded'))
+        write_file(local, contents)
+        write_file(remote, contents[:1000])
+
+        stats = node.upload(local_path=local,
+                            remote_path=remote,
+                            compress=compress,
+                            resume=True)
+        assert read_file(remote) == contents
+        assert stats.skipped_bytes == 1000
+        assert stats.transferred_bytes == FILE_SIZE - 1000
+
+        stats = node.upload(local_path=local, remote_path=remote, resume=True)
+        assert stats.skipped_bytes == FILE_SIZE
+        assert stats.transferred_bytes == 0
+
+        write_file(downloaded, contents[:FILE_SIZE // 2])
+        stats = node.download(remote_path=remote,
+                              local_path=downloaded,
+                              compress=compress,
+                              resume=True)
+        assert read_file(downloaded) == contents
+        assert stats.skipped_bytes == FILE_SIZE // 2
+
+
+def test_directory_tree(tmpdir):
+    with local_compute_node() as node:
+        local = tmpdir.mkdir('local')
+        local.mkdir('a').mkdir('b')
+        local.mkdir('empty')
+        files = {'top': b'top',
+                 os.path.join('a', 'one'): os.urandom(100000),
+                 os.path.join('a', 'b', 'two'): b'two' * 1000}
+        for path, contents in files.items():
+            write_file(os.path.join(str(local), path), contents)
+        remote = str(tmpdir.join('remote'))
+        downloaded = str(tmpdir.join('downloaded'))
+
+        finished = set()
+
+        def on_progress(path: str, done: int, size: int):
+            if done == size:
+                finished.add(path)
+
+        stats = node.upload(local_path=str(local),
+                            remote_path=remote,
+                            max_parallel=2,
+                            on_progress=on_progress)
+        assert stats.files == 3
+        assert finished == {os.path.join(remote, path) for path in files}
+        assert os.path.isdir(os.path.join(remote, 'empty'))
+
+        stats = node.download(remote_path=remote,
+                              local_path=downloaded,
+                              compress=True)
+        assert stats.files == 3
+        for path, contents in files.items():
+            assert read_file(os.path.join(downloaded, path)) == contents
+        assert os.path.isdir(os.path.join(downloaded, 'empty'))
@@ -0,0 +1,90 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+
+import pytest
+
+from idact import AuthMethod
+from idact.detail.config.client.client_cluster_config import ClusterConfigImpl
+from idact.detail.tunnel.binding import Binding
+from idact.detail.ssh.get_connection_pool import get_connection_pool
+from idact.detail.tunnel.build_tunnel import build_tunnel, \
+    get_hops_connection_key
+from idact.detail.tunnel.close_tunnel_on_exit import close_tunnel_on_exit
+from idact.detail.tunnel.get_tunnel_multiplexer import get_tunnel_multiplexer
+from tests.helpers.echo_server import echo_server, exchange
+from tests.helpers.local_ssh_server import local_ssh_server
+
+USER = 'user'
+PASSWORD = 'password'
+CONNECTION_COUNT = 20
+
+
+@contextmanager
+def tunnel_servers():
+    """Runs an access node server, a compute node server,
+        and an echo server to tunnel to."""
+    with ExitStack() as stack:
+        stack.callback(get_connection_pool().close_all)
+        access_server = stack.enter_context(
+            local_ssh_server(user=USER, password=PASSWORD))
+        compute_server = stack.enter_context(
+            local_ssh_server(user=USER, password=PASSWORD))
+        echo_port = stack.enter_context(echo_server())
+        yield access_server, compute_server, echo_port
+
+
+def test_two_hop_tunnel_uses_one_connection_per_hop():
+    with tunnel_servers() as (access_server, compute_server, echo_port):
+        config = ClusterConfigImpl(host='127.0.0.1',
+                                   port=access_server.port,
+                                   user=USER,
+                                   auth=AuthMethod.ASK)
+        bindings = [Binding("", 0),
+                    Binding("127.0.0.1", compute_server.port),
+                    Binding("127.0.0.1", echo_port)]
+
+        key = get_hops_connection_key(config=config, bindings=bindings)
+        multiplexer = get_tunnel_multiplexer()
+
+        with ExitStack() as stack:
+            tunnel = build_tunnel(config=config,
+                                  bindings=bindings,
+                                  ssh_password=PASSWORD)
+            stack.enter_context(close_tunnel_on_exit(tunnel))
+            assert tunnel.here != 0
+            assert tunnel.there == echo_port
+            assert multiplexer.forward_count(key) == 1
+
+            other_tunnel = build_tunnel(config=config,
+                                        bindings=bindings,
+                                        ssh_password=PASSWORD)
+            stack.enter_context(close_tunnel_on_exit(other_tunnel))
+            assert multiplexer.forward_count(key) == 2
+            assert exchange(port=other_tunnel.here, message="other") == \
+                "other"
+
+            with ThreadPoolExecutor(max_workers=CONNECTION_COUNT) as executor:
+                replies = list(executor.map(
+                    lambda i: exchange(port=tunnel.here, message=str(i)),
+                    range(CONNECTION_COUNT)))
+
+            assert replies == [str(i) for i in range(CONNECTION_COUNT)]
+            assert access_server.connection_count == 1
+            assert compute_server.connection_count == 1
+
+        assert multiplexer.forward_count(key) == 0
+        with pytest.raises(OSError):
+            exchange(port=tunnel.here, message="closed")
+
+
+def test_tunnel_to_taken_port_fails():
+    with tunnel_servers() as (access_server, _, echo_port):
+        config = ClusterConfigImpl(host='127.0.0.1',
+                                   port=access_server.port,
+                                   user=USER,
+                                   auth=AuthMethod.ASK)
+        with pytest.raises(RuntimeError):
+            build_tunnel(config=config,
+                         bindings=[Binding("127.0.0.1", echo_port),
+                                   Binding("127.0.0.1", echo_port)],
+                         ssh_password=PASSWORD)
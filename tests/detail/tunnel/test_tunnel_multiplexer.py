@@ -0,0 +1,129 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+
+import pytest
+
+from idact.detail.auth.get_credentials import get_credentials
+from idact.detail.nodes.node_impl import NodeImpl
+from idact.detail.ssh.get_connection_key import get_connection_key
+from idact.detail.ssh.get_connection_pool import get_connection_pool
+from idact.detail.tunnel.binding import Binding
+from idact.detail.tunnel.close_tunnel_on_exit import close_tunnel_on_exit
+from idact.detail.tunnel.get_tunnel_multiplexer import get_tunnel_multiplexer
+from tests.helpers.echo_server import echo_server, exchange
+from tests.helpers.local_node import get_local_config, get_local_node, \
+    local_ssh_servers
+
+TUNNEL_COUNT = 3
+CONNECTION_COUNT = 20
+
+
+@contextmanager
+def tunnel_servers():
+    """Runs an access node server, a compute node server,
+        and echo servers to tunnel to."""
+    with ExitStack() as stack:
+        access_server, compute_server = stack.enter_context(
+            local_ssh_servers(count=2))
+        echo_ports = [stack.enter_context(echo_server())
+                      for _ in range(TUNNEL_COUNT)]
+        yield access_server, compute_server, echo_ports
+
+
+def get_node(access_port: int, compute_port: int) -> NodeImpl:
+    config = get_local_config(port=access_port)
+    return get_local_node(config=config, port=compute_port)
+
+
+def test_tunnels_share_node_connection():
+    with tunnel_servers() as (access_server,
+                              compute_server,
+                              echo_ports):
+        node = get_node(access_port=access_server.port,
+                        compute_port=compute_server.port)
+        key = get_connection_key(host=node.host,
+                                 port=node.port,
+                                 config=node.config)
+        multiplexer = get_tunnel_multiplexer()
+
+        with ExitStack() as stack:
+            tunnels = [node.tunnel(there=port) for port in echo_ports]
+            for tunnel in tunnels:
+                stack.enter_context(close_tunnel_on_exit(tunnel))
+            assert multiplexer.forward_count(key) == TUNNEL_COUNT
+
+            for i, tunnel in enumerate(tunnels):
+                assert exchange(port=tunnel.here, message=str(i)) == str(i)
+            assert node.run("echo 'Hello'") == 'Hello'
+
+            tunnels[0].close()
+            assert multiplexer.forward_count(key) == TUNNEL_COUNT - 1
+            assert exchange(port=tunnels[1].here, message="open") == "open"
+
+            assert access_server.connection_count == 1
+            assert compute_server.connection_count == 1
+
+        assert multiplexer.forward_count(key) == 0
+
+
+def test_tunnel_reconnects_after_connection_loss():
+    with tunnel_servers() as (access_server,
+                              compute_server,
+                              echo_ports):
+        node = get_node(access_port=access_server.port,
+                        compute_port=compute_server.port)
+
+        with ExitStack() as stack:
+            tunnel = node.tunnel(there=echo_ports[0])
+            stack.enter_context(close_tunnel_on_exit(tunnel))
+            assert exchange(port=tunnel.here, message="1") == "1"
+
+            get_connection_pool().close_all()
+            assert exchange(port=tunnel.here, message="2") == "2"
+            assert compute_server.connection_count == 2
+
+
+def test_connections_share_tunnel_transport():
+    with tunnel_servers() as (access_server,
+                              compute_server,
+                              echo_ports):
+        node = get_node(access_port=access_server.port,
+                        compute_port=compute_server.port)
+
+        with ExitStack() as stack:
+            tunnel = node.tunnel(there=echo_ports[0])
+            stack.enter_context(close_tunnel_on_exit(tunnel))
+
+            with ThreadPoolExecutor(max_workers=CONNECTION_COUNT) as executor:
+                replies = list(executor.map(
+                    lambda i: exchange(port=tunnel.here, message=str(i)),
+                    range(CONNECTION_COUNT)))
+
+            assert replies == [str(i) for i in range(CONNECTION_COUNT)]
+            assert access_server.connection_count == 1
+            assert compute_server.connection_count == 1
+
+        with pytest.raises(OSError):
+            exchange(port=tunnel.here, message="closed")
+
+
+def test_tunnel_to_taken_port_fails():
+    with tunnel_servers() as (access_server,
+                              compute_server,
+                              echo_ports):
+        node = get_node(access_port=access_server.port,
+                        compute_port=compute_server.port)
+        key = get_connection_key(host=node.host,
+                                 port=node.port,
+                                 config=node.config)
+        multiplexer = get_tunnel_multiplexer()
+
+        with pytest.raises(RuntimeError):
+            multiplexer.tunnel(
+                host=node.host,
+                port=node.port,
+                config=node.config,
+                get_credentials=lambda: get_credentials(config=node.config),
+                here=Binding("127.0.0.1", echo_ports[0]),
+                there=Binding("127.0.0.1", echo_ports[0]))
+        assert multiplexer.forward_count(key) == 0
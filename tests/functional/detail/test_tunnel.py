@@ -1,16 +1,20 @@
 from contextlib import ExitStack
-from typing import List
+from typing import Callable, List
 
 import requests
 
 from idact import AuthMethod
+from idact.detail.auth.set_password import set_password
 from idact.detail.config.client.client_cluster_config import ClusterConfigImpl
 from idact.detail.helper.get_free_local_port import get_free_local_port
 from idact.detail.helper.ports import PORT_3, PORT_1, PORT_2
+from idact.detail.nodes.node_impl import NodeImpl
 from idact.detail.tunnel.build_tunnel import build_tunnel
 from idact.detail.tunnel.binding import Binding
 from idact.detail.helper.retry import retry
+from idact.detail.ssh.get_connection_pool import get_connection_pool
 from idact.detail.tunnel.close_tunnel_on_exit import close_tunnel_on_exit
+from idact.detail.tunnel.tunnel_internal import TunnelInternal
 from tests.helpers.join_on_exit import join_on_exit
 
 from tests.helpers.reset_environment import get_testing_host, get_testing_port
@@ -20,17 +24,23 @@ from tests.helpers.test_users import USER_3, get_test_user_password, USER_60, \
 from tests.helpers.testing_environment import get_testing_process_count
 
 
-def run_tunnel_test_for_bindings(user: str,
-                                 bindings: List[Binding]):
-    """Runs a tunneling test for a binding sequence.
+def run_tunnel_test(user: str,
+                    server_port: int,
+                    open_tunnel: Callable[[ClusterConfigImpl, int],
+                                          TunnelInternal]):
+    """Runs a tunneling test.
 
-        Runs a Python server in a separate thread through ssh, then creates
-        a multi-hop tunnel, and finally performs a HTTP request to the local
+        Runs a Python server in a separate thread through ssh, then opens
+        a tunnel to it, and finally performs a HTTP request to the local
         address.
 
         :param user: Test user.
 
-        :param bindings: Sequence of tunnel bindings.
+        :param server_port: Server port, as seen from the last hop.
+
+        :param open_tunnel: Opens a tunnel from a free local port
+                            to the server, given the config and the local
+                            port.
 
     """
     config = ClusterConfigImpl(host=get_testing_host(),
@@ -38,13 +48,12 @@ def run_tunnel_test_for_bindings(user: str,
                                user=user,
                                auth=AuthMethod.ASK)
 
-    local_port = bindings[0].port
-    server_port = bindings[-1].port
+    local_port = get_free_local_port()
 
     with ExitStack() as stack:
-        tunnel = build_tunnel(config=config,
-                              bindings=bindings,
-                              ssh_password=get_test_user_password(user))
+        stack.enter_context(set_password(get_test_user_password(user)))
+        stack.callback(get_connection_pool().close_all)
+        tunnel = open_tunnel(config, local_port)
         stack.enter_context(close_tunnel_on_exit(tunnel))
 
         server = start_dummy_server_thread(user=user,
@@ -64,25 +73,83 @@ def run_tunnel_test_for_bindings(user: str,
         assert "text/html" in request.headers['Content-type']
 
 
+def run_tunnel_test_for_bindings(user: str,
+                                 bindings: List[Binding]):
+    """Runs a tunneling test for a multi-hop tunnel.
+
+        :param user: Test user.
+
+        :param bindings: Sequence of tunnel bindings, without
+                         the local binding.
+
+    """
+
+    def open_tunnel(config: ClusterConfigImpl,
+                    local_port: int) -> TunnelInternal:
+        return build_tunnel(config=config,
+                            bindings=[Binding("", local_port)] + bindings,
+                            ssh_password=get_test_user_password(user))
+
+    run_tunnel_test(user=user,
+                    server_port=bindings[-1].port,
+                    open_tunnel=open_tunnel)
+
+
+def run_tunnel_test_for_node(user: str,
+                             host: str,
+                             port: int,
+                             server_port: int):
+    """Runs a tunneling test for a tunnel opened by a node.
+
+        :param user: Test user.
+
+        :param host: Node host, as seen from the access node.
+
+        :param port: Node SSH port.
+
+        :param server_port: Server port, as seen from the node.
+
+    """
+
+    def open_tunnel(config: ClusterConfigImpl,
+                    local_port: int) -> TunnelInternal:
+        node = NodeImpl(config=config)
+        node.make_allocated(host=host,
+                            port=port,
+                            cores=None,
+                            memory=None,
+                            allocated_until=None)
+        return node.tunnel(there=server_port, here=local_port)
+
+    run_tunnel_test(user=user,
+                    server_port=server_port,
+                    open_tunnel=open_tunnel)
+
+
 def test_tunnel_single_hop():
     user = USER_3
-    bindings = [Binding("", get_free_local_port()),
-                Binding("127.0.0.1", PORT_1)]
-    run_tunnel_test_for_bindings(user=user, bindings=bindings)
+    run_tunnel_test_for_bindings(user=user,
+                                 bindings=[Binding("127.0.0.1", PORT_1)])
+    run_tunnel_test_for_node(user=user,
+                             host=get_testing_host(),
+                             port=get_testing_port(),
+                             server_port=PORT_1)
 
 
 def test_tunnel_two_hops():
     user = USER_59
-    bindings = [Binding("", get_free_local_port()),
-                Binding("127.0.0.1", 22),
-                Binding("127.0.0.1", PORT_2)]
-    run_tunnel_test_for_bindings(user=user, bindings=bindings)
+    run_tunnel_test_for_bindings(user=user,
+                                 bindings=[Binding("127.0.0.1", 22),
+                                           Binding("127.0.0.1", PORT_2)])
+    run_tunnel_test_for_node(user=user,
+                             host="127.0.0.1",
+                             port=22,
+                             server_port=PORT_2)
 
 
 def test_tunnel_multiple_hops():
     user = USER_60
-    bindings = [Binding("", get_free_local_port()),
-                Binding("c1", 22),
+    bindings = [Binding("c1", 22),
                 Binding("c2", 8022),
                 Binding("c3", 8023),
                 Binding("127.0.0.1", PORT_3)]
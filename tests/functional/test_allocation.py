@@ -27,7 +27,7 @@ def test_allocation_should_default_to_port_22_if_port_info_file_is_missing():
         nodes = cluster.allocate_nodes(memory_per_node=MiB(100))
         stack.enter_context(cancel_on_exit(nodes))
 
-        retry(lambda: node.run("rm ~/.idact/sshd_ports/alloc-*/*"),
+        retry(lambda: node.run("rm ~/.idact/sshd_ports/alloc-*"),
               retries=SLURM_WAIT_TIMEOUT,
               seconds_between_retries=1)
 
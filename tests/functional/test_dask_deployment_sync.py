@@ -1,5 +1,7 @@
 from contextlib import ExitStack
 
+import pytest
+
 from idact import show_cluster, deploy_dask
 from idact.detail.auth.set_password import set_password
 from idact.detail.deployment.cancel_on_exit import cancel_on_exit
@@ -49,7 +51,7 @@ def test_able_to_sync_dask():
             dask_2.cancel_local()
 
 
-def test_cancelled_dask_allocation_is_discarded_on_pull():
+def test_cancelled_dask_deployment_fails_on_first_access():
     user = USER_56
     with ExitStack() as stack:
         stack.enter_context(disable_pytest_stdin())
@@ -69,7 +71,7 @@ def test_cancelled_dask_allocation_is_discarded_on_pull():
 
         try:
             deployments = cluster.pull_deployments()
-            assert not deployments.jupyter_deployments
+            assert not deployments.dask_deployments
 
             cluster.push_deployment(deployment=dask)
 
@@ -77,7 +79,12 @@ def test_cancelled_dask_allocation_is_discarded_on_pull():
             dask = None
 
             deployments = cluster.pull_deployments()
-            assert not deployments.jupyter_deployments
+            assert len(deployments.dask_deployments) == 1
+            dask_2 = deployments.dask_deployments[0]
+            with pytest.raises(RuntimeError):
+                dask_2.get_client()
+            with pytest.raises(RuntimeError):
+                dask_2.get_client()
         finally:
             if dask is not None:
                 dask.cancel()
@@ -99,6 +99,13 @@ def get_default_config_contents(user: str) -> List[str]:
             "retries": DEFAULT_RETRIES_JSON,
             "scratch": "$HOME",
             'useJupyterLab': True,
+            'watchSqueue': False,
+            'squeueCacheTtl': 1,
+            'useAgent': False,
+            'remoteShell': '/bin/bash --noprofile -l -c',
+            'shellEnvironment': {},
+            'reservePorts': False,
+            'healthCheckInterval': 0,
             "setupActions": {
                 "dask": [],
                 "jupyter": []
@@ -120,6 +127,13 @@ def get_modified_config_contents() -> List[str]:
             "retries": DEFAULT_RETRIES_JSON,
             "scratch": "$HOME2",
             'useJupyterLab': False,
+            'watchSqueue': False,
+            'squeueCacheTtl': 1,
+            'useAgent': False,
+            'remoteShell': '/bin/bash --noprofile -l -c',
+            'shellEnvironment': {},
+            'reservePorts': False,
+            'healthCheckInterval': 0,
             "setupActions": {
                 "dask": ["abc", "def"],
                 "jupyter": ["abc"]
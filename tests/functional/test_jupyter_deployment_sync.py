@@ -1,5 +1,7 @@
 from contextlib import ExitStack
 
+import pytest
+
 from idact import show_cluster
 from idact.detail.auth.set_password import set_password
 from idact.detail.deployment.cancel_on_exit import cancel_on_exit
@@ -50,7 +52,7 @@ def test_able_to_sync_jupyter():
             jupyter_2.cancel_local()
 
 
-def test_cancelled_jupyter_allocation_is_discarded_on_pull():
+def test_cancelled_jupyter_deployment_fails_on_first_access():
     user = USER_48
     with ExitStack() as stack:
         stack.enter_context(disable_pytest_stdin())
@@ -78,7 +80,12 @@ def test_cancelled_jupyter_allocation_is_discarded_on_pull():
             jupyter = None
 
             deployments = cluster.pull_deployments()
-            assert not deployments.jupyter_deployments
+            assert len(deployments.jupyter_deployments) == 1
+            jupyter_2 = deployments.jupyter_deployments[0]
+            with pytest.raises(RuntimeError):
+                _ = jupyter_2.local_port
+            with pytest.raises(RuntimeError):
+                _ = jupyter_2.local_port
         finally:
             if jupyter is not None:
                 jupyter.cancel()
@@ -5,7 +5,6 @@ import pytest
 import requests
 from bitmath import MiB
 
-import idact.detail.nodes.node_impl
 from idact import show_cluster, Walltime, Nodes, AuthMethod
 from idact.detail.auth.set_password import set_password
 from idact.detail.deployment.cancel_on_exit import cancel_on_exit
@@ -13,6 +12,7 @@ from idact.detail.helper.get_free_local_port import get_free_local_port
 from idact.detail.helper.get_free_remote_port import get_free_remote_port
 from idact.detail.helper.retry import retry
 from idact.detail.tunnel.close_tunnel_on_exit import close_tunnel_on_exit
+from idact.detail.tunnel.get_tunnel_multiplexer import get_tunnel_multiplexer
 from idact.detail.tunnel.tunnel_internal import TunnelInternal
 
 from tests.helpers.disable_pytest_stdin import disable_pytest_stdin
@@ -164,26 +164,27 @@ def test_node_tunnel_fall_back_when_local_port_free_but_fails():
         there = get_free_remote_port(node=node)
         here = get_free_local_port()
 
-        real_build_tunnel = idact.detail.nodes.node_impl.build_tunnel
+        multiplexer = get_tunnel_multiplexer()
+        real_tunnel = multiplexer.tunnel
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 
         tries = [0]
 
-        def fake_build_tunnel(*args, **kwargs) -> TunnelInternal:
+        def fake_tunnel(*args, **kwargs) -> TunnelInternal:
             tries[0] += 1
             if tries[0] == 1:
                 raise RuntimeError("Fake failure.")
             if tries[0] != 2:
                 assert False
 
-            return real_build_tunnel(*args, **kwargs)
+            return real_tunnel(*args, **kwargs)
 
         try:
-            idact.detail.nodes.node_impl.build_tunnel = fake_build_tunnel
+            multiplexer.tunnel = fake_tunnel
             tunnel = node.tunnel(there=there, here=here)
             stack.enter_context(close_tunnel_on_exit(tunnel))
             assert tries[0] == 2
             assert tunnel.here != here
         finally:
-            idact.detail.nodes.node_impl.build_tunnel = real_build_tunnel
+            del multiplexer.tunnel
             sock.close()
@@ -1,7 +1,9 @@
 from contextlib import contextmanager
 
 from idact.detail.deployment_sync.deployment_definitions_serialization import \
-    DEPLOYMENT_DEFINITIONS_PATH, DEPLOYMENT_DEFINITIONS_FILENAME
+    DEPLOYMENT_DEFINITIONS_PATH
+from idact.detail.deployment_sync.deployment_journal_script import \
+    DEPLOYMENT_DEFINITIONS_FILENAME, DEPLOYMENT_JOURNAL_FILENAME
 from tests.helpers.paramiko_connect import paramiko_connect
 
 
@@ -16,6 +18,9 @@ def clear_deployment_sync_data(user: str):
         yield
     finally:
         with paramiko_connect(user=user) as ssh:
-            ssh.exec_command(command="rm -f {}/{}".format(
-                DEPLOYMENT_DEFINITIONS_PATH,
-                DEPLOYMENT_DEFINITIONS_FILENAME))
+            ssh.exec_command(command="rm -f {path}/{definitions}"
+                                     " {path}/{journal}".format(
+                                         path=DEPLOYMENT_DEFINITIONS_PATH,
+                                         definitions=(
+                                             DEPLOYMENT_DEFINITIONS_FILENAME),
+                                         journal=DEPLOYMENT_JOURNAL_FILENAME))
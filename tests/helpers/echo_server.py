@@ -0,0 +1,40 @@
+import socket
+import threading
+from contextlib import contextmanager
+
+
+@contextmanager
+def echo_server():
+    """Runs a TCP server that echoes back each line, and yields its port."""
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(100)
+
+    def echo(client: socket.socket):
+        with client:
+            for line in client.makefile('rb'):
+                client.sendall(line)
+
+    def accept():
+        while True:
+            try:
+                client, _ = server.accept()
+            except OSError:
+                return
+            threading.Thread(target=echo, args=(client,), daemon=True).start()
+
+    thread = threading.Thread(target=accept, daemon=True)
+    thread.start()
+    try:
+        yield server.getsockname()[1]
+    finally:
+        server.shutdown(socket.SHUT_RDWR)
+        server.close()
+        thread.join()
+
+
+def exchange(port: int, message: str) -> str:
+    """Sends a line to the local port and returns the reply."""
+    with socket.create_connection(('127.0.0.1', port)) as sock:
+        sock.sendall("{}\n".format(message).encode())
+        return sock.makefile('rb').readline().decode().strip()
@@ -0,0 +1,112 @@
+from contextlib import ExitStack, contextmanager
+from typing import List
+
+from idact import AuthMethod
+from idact.detail.auth.set_password import set_password
+from idact.detail.config.client.client_cluster_config import ClusterConfigImpl
+from idact.detail.nodes.node_impl import NodeImpl
+from idact.detail.ssh.get_connection_pool import get_connection_pool
+from tests.helpers.local_ssh_server import LocalSshServer, local_ssh_server
+
+USER = 'user'
+PASSWORD = 'password'
+
+
+class CountingNode(NodeImpl):
+    """Node that records the remote commands it runs."""
+
+    def __init__(self, config):
+        super().__init__(config=config)
+        self.commands = []
+
+    def run(self, command, timeout=None):
+        self.commands.append(command)
+        return super().run(command=command, timeout=timeout)
+
+
+@contextmanager
+def local_ssh_servers(count: int) -> List[LocalSshServer]:
+    """Runs local SSH servers accepting :attr:`USER` and :attr:`PASSWORD`.
+        Pooled connections are closed on exit.
+
+        :param count: Number of servers to run.
+
+    """
+    with ExitStack() as stack:
+        stack.enter_context(set_password(PASSWORD))
+        stack.callback(get_connection_pool().close_all)
+        yield [stack.enter_context(local_ssh_server(user=USER,
+                                                    password=PASSWORD))
+               for _ in range(count)]
+
+
+def get_local_config(port: int, **kwargs) -> ClusterConfigImpl:
+    """Returns a config for a local SSH server as the access node.
+
+        :param port: Access node port.
+
+        :param kwargs: Additional config parameters.
+
+    """
+    return ClusterConfigImpl(host='localhost',
+                             port=port,
+                             user=USER,
+                             auth=AuthMethod.ASK,
+                             **kwargs)
+
+
+def allocate_on_local_server(node: NodeImpl, port: int):
+    """Makes the node allocated on a local SSH server.
+
+        :param node: Node to allocate.
+
+        :param port: Node port.
+
+    """
+    node.make_allocated(host='127.0.0.1',
+                        port=port,
+                        cores=None,
+                        memory=None,
+                        allocated_until=None)
+
+
+def get_local_node(config: ClusterConfigImpl, port: int) -> NodeImpl:
+    """Returns a node allocated on a local SSH server.
+
+        :param config: Cluster config.
+
+        :param port: Node port.
+
+    """
+    node = NodeImpl(config=config)
+    allocate_on_local_server(node=node, port=port)
+    return node
+
+
+@contextmanager
+def local_node(**kwargs) -> NodeImpl:
+    """Runs a local SSH server, and yields a node allocated on it.
+        The same server acts as the access node.
+
+        :param kwargs: Additional config parameters.
+
+    """
+    with local_ssh_servers(count=1) as servers:
+        port = servers[0].port
+        yield get_local_node(config=get_local_config(port=port, **kwargs),
+                             port=port)
+
+
+@contextmanager
+def local_counting_node(**kwargs) -> CountingNode:
+    """Runs a local SSH server, and yields a :class:`CountingNode`
+        allocated on it. The same server acts as the access node.
+
+        :param kwargs: Additional config parameters.
+
+    """
+    with local_ssh_servers(count=1) as servers:
+        port = servers[0].port
+        node = CountingNode(config=get_local_config(port=port, **kwargs))
+        allocate_on_local_server(node=node, port=port)
+        yield node
@@ -0,0 +1,120 @@
+import os
+
+import paramiko
+from paramiko import SFTPAttributes, SFTPHandle, SFTPServer
+
+
+class LocalSftpHandle(SFTPHandle):
+    """Handle to a local file.
+
+        :param flags: Flags the file was opened with.
+
+        :param path: Local file path.
+
+        :param file: Opened local file.
+
+    """
+
+    def __init__(self, flags, path, file):
+        super().__init__(flags)
+        self.filename = path
+        self.readfile = file
+        self.writefile = file
+
+    def stat(self):
+        try:
+            return SFTPAttributes.from_stat(os.fstat(self.readfile.fileno()))
+        except OSError as e:
+            return SFTPServer.convert_errno(e.errno)
+
+    def chattr(self, attr):
+        try:
+            SFTPServer.set_file_attr(self.filename, attr)
+            return paramiko.SFTP_OK
+        except OSError as e:
+            return SFTPServer.convert_errno(e.errno)
+
+
+class LocalSftpServerInterface(paramiko.SFTPServerInterface):
+    """Serves the local file system, for unit tests."""
+
+    def open(self, path, flags, attr):
+        try:
+            mode = getattr(attr, 'st_mode', None)
+            descriptor = os.open(path,
+                                 flags,
+                                 mode if mode is not None else 0o666)
+        except OSError as e:
+            return SFTPServer.convert_errno(e.errno)
+        if flags & os.O_WRONLY:
+            file_mode = 'ab' if flags & os.O_APPEND else 'wb'
+        elif flags & os.O_RDWR:
+            file_mode = 'a+b' if flags & os.O_APPEND else 'r+b'
+        else:
+            file_mode = 'rb'
+        return LocalSftpHandle(flags=flags,
+                               path=path,
+                               file=os.fdopen(descriptor, file_mode))
+
+    def list_folder(self, path):
+        try:
+            return [self._attributes(os.path.join(path, name), name)
+                    for name in os.listdir(path)]
+        except OSError as e:
+            return SFTPServer.convert_errno(e.errno)
+
+    @staticmethod
+    def _attributes(path, name):
+        attributes = SFTPAttributes.from_stat(os.stat(path))
+        attributes.filename = name
+        return attributes
+
+    def stat(self, path):
+        try:
+            return SFTPAttributes.from_stat(os.stat(path))
+        except OSError as e:
+            return SFTPServer.convert_errno(e.errno)
+
+    def lstat(self, path):
+        try:
+            return SFTPAttributes.from_stat(os.lstat(path))
+        except OSError as e:
+            return SFTPServer.convert_errno(e.errno)
+
+    def remove(self, path):
+        try:
+            os.remove(path)
+        except OSError as e:
+            return SFTPServer.convert_errno(e.errno)
+        return paramiko.SFTP_OK
+
+    def rename(self, oldpath, newpath):
+        try:
+            os.rename(oldpath, newpath)
+        except OSError as e:
+            return SFTPServer.convert_errno(e.errno)
+        return paramiko.SFTP_OK
+
+    def mkdir(self, path, attr):
+        try:
+            os.mkdir(path)
+        except OSError as e:
+            return SFTPServer.convert_errno(e.errno)
+        return paramiko.SFTP_OK
+
+    def rmdir(self, path):
+        try:
+            os.rmdir(path)
+        except OSError as e:
+            return SFTPServer.convert_errno(e.errno)
+        return paramiko.SFTP_OK
+
+    def chattr(self, path, attr):
+        try:
+            SFTPServer.set_file_attr(path, attr)
+        except OSError as e:
+            return SFTPServer.convert_errno(e.errno)
+        return paramiko.SFTP_OK
+
+    def canonicalize(self, path):
+        return os.path.abspath(path)
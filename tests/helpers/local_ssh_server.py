@@ -0,0 +1,247 @@
+import socket
+import subprocess
+import threading
+from contextlib import contextmanager
+from typing import Tuple
+
+import paramiko
+
+from tests.helpers.local_sftp_server import LocalSftpServerInterface
+
+ACCEPT_TIMEOUT = 0.5
+FORWARD_BUFFER_SIZE = 32 * 1024
+
+
+class LocalSshServerInterface(paramiko.ServerInterface):
+    """Accepts a single user and password, executes commands locally,
+        serves SFTP and forwards direct TCP/IP channels.
+
+        :param user: User to accept.
+
+        :param password: Password to accept.
+
+    """
+
+    def __init__(self, user: str, password: str):
+        self._user = user
+        self._password = password
+        self.destinations = {}
+
+    def get_allowed_auths(self, username):
+        return 'password'
+
+    def check_auth_password(self, username, password):
+        if username == self._user and password == self._password:
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def check_channel_request(self, kind, chanid):
+        if kind == 'session':
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_channel_direct_tcpip_request(self, chanid, origin, destination):
+        self.destinations[chanid] = destination
+        return paramiko.OPEN_SUCCEEDED
+
+    def check_channel_exec_request(self, channel, command):
+        threading.Thread(target=execute_command,
+                         args=(channel, command.decode()),
+                         daemon=True).start()
+        return True
+
+
+def forward_input(channel: paramiko.Channel, stdin):
+    """Copies the channel input to the process until EOF.
+
+        :param channel: Channel to read from.
+
+        :param stdin: Process input.
+
+    """
+    try:
+        while True:
+            data = channel.recv(FORWARD_BUFFER_SIZE)
+            if not data:
+                break
+            stdin.write(data)
+            stdin.flush()
+    except OSError:
+        pass
+    finally:
+        try:
+            stdin.close()
+        except OSError:
+            pass
+
+
+def execute_command(channel: paramiko.Channel, command: str):
+    """Executes the command locally, forwards the input, streams the output
+        and sends the exit status. The channel is left for the client
+        to close, because closing it could race with the reply to the exec
+        request.
+
+        :param channel: Channel to send the output to.
+
+        :param command: Command to execute.
+
+    """
+    try:
+        process = subprocess.Popen(command,
+                                   shell=True,
+                                   stdin=subprocess.PIPE,
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT)
+        threading.Thread(target=forward_input,
+                         args=(channel, process.stdin),
+                         daemon=True).start()
+        try:
+            while True:
+                data = process.stdout.read1(FORWARD_BUFFER_SIZE)
+                if not data:
+                    break
+                channel.sendall(data)
+        except OSError:
+            process.kill()
+        channel.send_exit_status(process.wait())
+    except OSError:
+        pass
+    finally:
+        try:
+            channel.shutdown_write()
+        except OSError:
+            pass
+
+
+def forward(source, destination):
+    """Copies data from source to destination until EOF.
+
+        :param source: Socket or channel to read from.
+
+        :param destination: Socket or channel to write to.
+
+    """
+    try:
+        while True:
+            data = source.recv(FORWARD_BUFFER_SIZE)
+            if not data:
+                break
+            destination.sendall(data)
+    except OSError:
+        pass
+    finally:
+        destination.close()
+        source.close()
+
+
+class LocalSshServer:
+    """SSH server listening on localhost, for unit tests.
+
+        :param user: User to accept.
+
+        :param password: Password to accept.
+
+    """
+
+    def __init__(self, user: str, password: str):
+        self._user = user
+        self._password = password
+        self._host_key = paramiko.RSAKey.generate(bits=1024)
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind(('127.0.0.1', 0))
+        self._socket.listen(100)
+        self._socket.settimeout(ACCEPT_TIMEOUT)
+        self._transports = []
+        self._running = True
+        self._thread = threading.Thread(target=self._accept_connections,
+                                        daemon=True)
+        self._thread.start()
+
+    @property
+    def port(self) -> int:
+        """Port the server is listening on."""
+        return self._socket.getsockname()[1]
+
+    @property
+    def connection_count(self) -> int:
+        """Number of accepted SSH connections."""
+        return len(self._transports)
+
+    def _accept_connections(self):
+        while self._running:
+            try:
+                client, _ = self._socket.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            threading.Thread(target=self._serve,
+                             args=(client,),
+                             daemon=True).start()
+
+    def _serve(self, client: socket.socket):
+        transport = paramiko.Transport(client)
+        transport.add_server_key(self._host_key)
+        transport.set_subsystem_handler('sftp',
+                                        paramiko.SFTPServer,
+                                        LocalSftpServerInterface)
+        interface = LocalSshServerInterface(user=self._user,
+                                            password=self._password)
+        self._transports.append(transport)
+        try:
+            transport.start_server(server=interface)
+        except paramiko.SSHException:
+            return
+        channels = []  # Channels are only weakly referenced by transport.
+        while self._running and transport.is_active():
+            channel = transport.accept(timeout=ACCEPT_TIMEOUT)
+            if channel is None:
+                continue
+            channels.append(channel)
+            destination = interface.destinations.pop(channel.get_id(), None)
+            if destination is not None:
+                self._forward(channel=channel, destination=destination)
+
+    @staticmethod
+    def _forward(channel: paramiko.Channel, destination: Tuple[str, int]):
+        try:
+            target = socket.create_connection(destination)
+        except OSError:
+            channel.close()
+            return
+        threading.Thread(target=forward,
+                         args=(channel, target),
+                         daemon=True).start()
+        threading.Thread(target=forward,
+                         args=(target, channel),
+                         daemon=True).start()
+
+    def close(self):
+        """Stops accepting connections and closes all transports."""
+        self._running = False
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._socket.close()
+        self._thread.join()
+        for transport in self._transports:
+            transport.close()
+
+
+@contextmanager
+def local_ssh_server(user: str, password: str):
+    """Runs an SSH server on localhost that executes commands locally,
+        as the current user.
+
+        :param user: User to accept.
+
+        :param password: Password to accept.
+
+    """
+    server = LocalSshServer(user=user, password=password)
+    try:
+        yield server
+    finally:
+        server.close()
@@ -11,6 +11,7 @@ from idact.detail.config.client.client_cluster_config \
 from idact.detail.config.client.client_config import ClientConfig
 from idact.detail.environment.environment_impl import EnvironmentImpl
 from idact.detail.environment.environment_provider import EnvironmentProvider
+from idact.detail.ssh.get_connection_pool import get_connection_pool
 from tests.helpers.clear_home import clear_home
 from tests.helpers.get_default_retries_heavy_load import \
     get_default_retries_heavy_load
@@ -53,4 +54,5 @@ def reset_environment(user: str, auth: AuthMethod = AuthMethod.ASK):
         yield
     finally:
         EnvironmentProvider._state = saved_state
+        get_connection_pool().close_all()
         clear_home(user=user)